@@ -0,0 +1,129 @@
+"""
+@Time    : 2026.10.17
+@File    : bench_bridge.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 对比“每次调用一个Future + 队列信号”与BridgeChannel的跨线程往返开销。
+
+运行方式（无需显示器）：
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_bridge.py
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtCore import QObject, Signal, QTimer
+from qtpy.QtWidgets import QApplication
+
+# noinspection PyProtectedMember
+from pyguiadapter.adapter._bridge import BridgeChannel
+
+
+def _noop(value):
+    return value
+
+
+class _LegacyBridge(QObject):
+    # the way requests were made before BridgeChannel: one Future per call, carried by a queued signal
+    sig_request = Signal(Future, object, tuple)
+
+    def __init__(self):
+        super().__init__(None)
+        # noinspection PyUnresolvedReferences
+        self.sig_request.connect(self._on_request)
+
+    # noinspection PyMethodMayBeStatic
+    def _on_request(self, future: Future, fn, args: tuple):
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def call(self, fn, *args):
+        future = Future()
+        # noinspection PyUnresolvedReferences
+        self.sig_request.emit(future, fn, args)
+        return future.result()
+
+
+def _run_in_worker(app: QApplication, work: Callable[[], None]) -> float:
+    elapsed = []
+
+    def _target():
+        start = time.perf_counter()
+        try:
+            work()
+        finally:
+            elapsed.append(time.perf_counter() - start)
+            QTimer.singleShot(0, app.quit)
+
+    thread = threading.Thread(target=_target)
+    # the worker starts after the event loop is running
+    QTimer.singleShot(0, thread.start)
+    app.exec_()
+    thread.join()
+    return elapsed[0]
+
+
+def _measure(app: QApplication, work: Callable[[], None], repeat: int) -> float:
+    return statistics.median(_run_in_worker(app, work) for _ in range(repeat))
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        description="compare the round trip cost of per-call futures and BridgeChannel"
+    )
+    parser.add_argument("-n", "--calls", type=int, default=20000)
+    parser.add_argument("-b", "--batch", type=int, default=10)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    options = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    legacy = _LegacyBridge()
+    bridge = BridgeChannel(None)
+    n, batch = options.calls, options.batch
+
+    def legacy_single():
+        for i in range(n):
+            legacy.call(_noop, i)
+
+    def bridge_single():
+        for i in range(n):
+            bridge.call(_noop, i)
+
+    def legacy_batched():
+        for i in range(n // batch):
+            for j in range(batch):
+                legacy.call(_noop, j)
+
+    def bridge_batched():
+        calls = [(_noop, (j,)) for j in range(batch)]
+        for i in range(n // batch):
+            bridge.call_many(calls)
+
+    results = [
+        ("single call, Future + signal", _measure(app, legacy_single, options.repeat)),
+        ("single call, BridgeChannel", _measure(app, bridge_single, options.repeat)),
+        (
+            f"{batch} calls, Future + signal",
+            _measure(app, legacy_batched, options.repeat),
+        ),
+        (
+            f"{batch} calls, BridgeChannel.call_many",
+            _measure(app, bridge_batched, options.repeat),
+        ),
+    ]
+    for name, seconds in results:
+        print(f"{name:<40} {seconds / n * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+@Time    : 2026.10.17
+@File    : bench_import.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 使用`python -X importtime`测量导入pyguiadapter.adapter的耗时，并检查重量级依赖是否被延迟导入。
+
+运行方式（无需显示器）：
+
+    python benchmarks/bench_import.py
+
+若导入`pyguiadapter.adapter`时导入了应被延迟导入的模块，或导入耗时的中位数超过`--max-ms`，则以非零状态码退出。
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# these modules should only be imported when they are used
+LAZY_MODULES = (
+    "yapf",
+    "pyqcodeeditor",
+    "docstring_parser",
+    "tomlkit",
+    "qtawesome",
+    "pyguiadapter.codeeditor.base",
+    "pyguiadapter.itemseditor",
+    "pyguiadapter.utils.inputdialog",
+    "pyguiadapter.utils.editor",
+    "pyguiadapter.widgets.basic.lineedit",
+    "pyguiadapter.widgets.extend.textedit",
+)
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import the module in a fresh interpreter, return module -> (self us, cumulative us).
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (_ROOT_DIR, env.get("PYTHONPATH", "")) if path
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            # the header line
+            continue
+        times[fields[2].strip()] = (self_us, cumulative_us)
+    return times
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="measure the import time of a module with python -X importtime"
+    )
+    parser.add_argument("-m", "--module", default="pyguiadapter.adapter")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-t", "--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None)
+    options = parser.parse_args(argv)
+
+    runs = [import_times(options.module) for _ in range(options.repeat)]
+    total_ms = statistics.median(run[options.module][1] for run in runs) / 1000
+    print(f"import {options.module}: {total_ms:.1f} ms (median of {len(runs)})")
+
+    last_run = runs[-1]
+    print("\nslowest modules (self time, last run):")
+    for name, (self_us, cumulative_us) in sorted(
+        last_run.items(), key=lambda item: item[1][0], reverse=True
+    )[: options.top]:
+        print(f"{self_us / 1000:8.1f} ms {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in last_run]
+    if eager:
+        failed = True
+        print(f"\nFAILED: imported eagerly: {', '.join(eager)}")
+    if options.max_ms is not None and total_ms > options.max_ms:
+        failed = True
+        print(f"\nFAILED: {total_ms:.1f} ms > {options.max_ms:.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
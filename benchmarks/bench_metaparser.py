@@ -0,0 +1,106 @@
+"""
+@Time    : 2026.10.17
+@File    : bench_metaparser.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 对比各元数据解析器（tomllib、flat、tomlkit）解析函数docstring中控件配置块的耗时。
+
+运行方式（无需显示器）：
+
+    python benchmarks/bench_metaparser.py
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from pyguiadapter.parser import FnParser, metadata_parser_names
+from pyguiadapter.parser.metaparser import get_metadata_parser
+
+# a widget metadata block like the ones in the docs and examples, repeated for each parameter
+_PARAM_BLOCK = """
+[{name}]
+widget_class = "IntSpinBox"
+label = "Parameter {index}"
+description = "the {index}th parameter, which is described in the widget config"
+default_value = {index}
+min_value = -100
+max_value = 100
+step = 2
+prefix = "$ "
+suffix = " units"
+enabled = true
+choices = ["a", "b", "c", "d"]
+icons = {{"a"="mdi6.numeric-1-circle", "b"="mdi6.numeric-2-circle"}}
+"""
+
+
+def _make_fn(n_params: int) -> Callable:
+    names = [f"p{i}" for i in range(n_params)]
+    blocks = "".join(
+        _PARAM_BLOCK.format(name=name, index=i) for i, name in enumerate(names)
+    )
+    namespace = {}
+    exec(f"def fn({', '.join(f'{name}: int' for name in names)}): pass", namespace)
+    fn = namespace["fn"]
+    fn.__doc__ = f"""
+    A function with {n_params} parameters.
+
+    Args:
+{"".join(f"        {name}: description of {name}{chr(10)}" for name in names)}
+    @params
+    {blocks}
+    @end
+    """
+    return fn
+
+
+def _measure(work: Callable[[], None], number: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            work()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        description="compare the time each metadata parser takes to parse widget config blocks"
+    )
+    parser.add_argument("-p", "--params", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("-n", "--number", type=int, default=20)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    options = parser.parse_args(argv)
+
+    print(
+        f"{'parser':<10} {'params':>6} {'parse only':>14} {'parse_widget_configs':>22}"
+    )
+    for n_params in options.params:
+        fn = _make_fn(n_params)
+        fn_parser = FnParser()
+        fn_info = fn_parser.parse_fn_info(fn)
+        meta_text = fn.__doc__.split("@params", 1)[1].split("@end", 1)[0].strip()
+        expected = get_metadata_parser("tomlkit")(meta_text)
+        for name in metadata_parser_names():
+            metadata_parser = get_metadata_parser(name)
+            assert metadata_parser(meta_text) == expected, name
+            fn_parser = FnParser(metadata_parsers=(name,))
+            parse_only = _measure(
+                lambda: metadata_parser(meta_text), options.number, options.repeat
+            )
+            parse_configs = _measure(
+                lambda: fn_parser.parse_widget_configs(fn_info),
+                options.number,
+                options.repeat,
+            )
+            print(
+                f"{name:<10} {n_params:>6} {parse_only * 1000:>11.3f} ms "
+                f"{parse_configs * 1000:>19.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
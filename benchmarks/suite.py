@@ -0,0 +1,399 @@
+"""
+@Time    : 2026.10.17
+@File    : suite.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 启动及热点路径的基准测试套件，结果保存为JSON文件，并可与基线结果比较以发现性能回退。
+
+测量的项目：
+    - 导入`pyguiadapter.adapter`的耗时（在新的解释器中测量）
+    - 对拥有10/100/500个参数的函数调用`GUIAdapter.add()`的耗时
+    - `FnExecuteWindow`的构造耗时，以及从显示到首次绘制的耗时
+    - `get_parameter_values()`与`set_parameter_values()`的耗时
+    - `uprint()`与`update_progress()`的吞吐量（以每次调用的平均耗时表示）
+
+运行方式（无需显示器）：
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py -o baseline.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py -b baseline.json
+
+所有结果均为耗时（秒），越小越好。指定基线时，若某项结果比基线慢超过`--tolerance`，则以非零状态码退出。
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy import API_NAME, QT_VERSION
+from qtpy.QtCore import QObject, QEvent
+from qtpy.QtWidgets import QApplication
+
+# bench_import is next to this file, which is not on sys.path when the suite is imported from somewhere else
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_import import import_times
+
+_SUITE_VERSION = 1
+DEFAULT_PARAM_COUNTS = (10, 100, 500)
+DEFAULT_TOLERANCE = 0.25
+
+# a case takes the command line options and returns the timings of its runs in seconds
+Case = Callable[[argparse.Namespace], List[float]]
+
+
+################################################################################################
+# helpers
+################################################################################################
+
+
+_application: Optional[QApplication] = None
+
+
+def _app() -> QApplication:
+    global _application
+    # a reference is kept, or the application would be garbage collected
+    if _application is None:
+        _application = QApplication.instance() or QApplication([])
+    return _application
+
+
+def _make_fn(n_params: int) -> Callable:
+    # a mix of the most common parameter types, all in the default group so that all widgets are created when the
+    # window is shown
+    annotations = ("int", "str", "float", "bool")
+    defaults = ("0", '""', "0.0", "False")
+    params = ", ".join(
+        f"p{i}: {annotations[i % 4]} = {defaults[i % 4]}" for i in range(n_params)
+    )
+    docs = "".join(f"        p{i}: description of p{i}\n" for i in range(n_params))
+    namespace = {}
+    exec(f"def fn_{n_params}({params}):\n    pass\n", namespace)
+    fn = namespace[f"fn_{n_params}"]
+    fn.__doc__ = f"A function with {n_params} parameters.\n\n    Args:\n{docs}"
+    return fn
+
+
+def _make_bundle(fn: Callable, **kwargs):
+    from pyguiadapter.adapter import GUIAdapter
+    from pyguiadapter.windows.fnexec import FnExecuteWindowConfig
+
+    adapter = GUIAdapter()
+    adapter.add(
+        fn,
+        window_config=FnExecuteWindowConfig(
+            show_function_error=False, print_function_result=False
+        ),
+        **kwargs,
+    )
+    # noinspection PyProtectedMember
+    return adapter._bundles[fn]
+
+
+def _create_window(bundle):
+    from pyguiadapter.windows.fnexec import FnExecuteWindow
+
+    return FnExecuteWindow(None, bundle=bundle)
+
+
+def _close_window(window):
+    window.close()
+    window.deleteLater()
+    _app().processEvents()
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 60.0):
+    app = _app()
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("timed out")
+        app.processEvents()
+
+
+class _PaintWatcher(QObject):
+    def __init__(self):
+        super().__init__(None)
+        self.painted = False
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Paint:
+            self.painted = True
+        return False
+
+
+def _show_window(window):
+    # shows the window and waits for its first paint, after which all the parameter widgets have been created
+    watcher = _PaintWatcher()
+    window.installEventFilter(watcher)
+    window.show()
+    _wait_until(lambda: watcher.painted)
+    window.removeEventFilter(watcher)
+
+
+def _time_calls(work: Callable[[], Any], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        work()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _run_in_window(fn: Callable, n_calls: int, repeat: int) -> List[float]:
+    # executes fn in the window (with the default thread executor) and returns the time per call, including the time
+    # for the output and progress updates to be flushed to the window
+    app = _app()
+    window = _create_window(_make_bundle(fn))
+    window.show()
+    timings = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            # noinspection PyProtectedMember
+            window._on_execute_button_clicked()
+            _wait_until(lambda: not window.is_function_executing())
+            app.processEvents()
+            timings.append((time.perf_counter() - start) / n_calls)
+    finally:
+        _close_window(window)
+    return timings
+
+
+################################################################################################
+# cases
+################################################################################################
+
+
+def _import_adapter(options: argparse.Namespace) -> List[float]:
+    return [
+        import_times("pyguiadapter.adapter")["pyguiadapter.adapter"][1] / 1e6
+        for _ in range(options.repeat)
+    ]
+
+
+def _add(options: argparse.Namespace, n_params: int) -> List[float]:
+    from pyguiadapter.adapter import GUIAdapter
+
+    fn = _make_fn(n_params)
+    return _time_calls(lambda: GUIAdapter().add(fn), options.repeat)
+
+
+def _construct_window(options: argparse.Namespace, n_params: int) -> List[float]:
+    # with lazy_parameter_widgets (the default), the parameter widgets are created when the window is shown, so they
+    # are measured by window.first_paint instead
+    bundle = _make_bundle(_make_fn(n_params))
+    timings = []
+    for _ in range(options.repeat):
+        start = time.perf_counter()
+        window = _create_window(bundle)
+        timings.append(time.perf_counter() - start)
+        _close_window(window)
+    return timings
+
+
+def _first_paint(options: argparse.Namespace, n_params: int) -> List[float]:
+    # from show() to the first paint event of the window
+    bundle = _make_bundle(_make_fn(n_params))
+    timings = []
+    for _ in range(options.repeat):
+        window = _create_window(bundle)
+        watcher = _PaintWatcher()
+        window.installEventFilter(watcher)
+        start = time.perf_counter()
+        window.show()
+        _wait_until(lambda: watcher.painted)
+        timings.append(time.perf_counter() - start)
+        window.removeEventFilter(watcher)
+        _close_window(window)
+    return timings
+
+
+def _get_parameter_values(options: argparse.Namespace, n_params: int) -> List[float]:
+    # measured on a shown window, i.e. through the parameter widgets
+    window = _create_window(_make_bundle(_make_fn(n_params)))
+    try:
+        _show_window(window)
+        return _time_calls(window.get_parameter_values, options.repeat)
+    finally:
+        _close_window(window)
+
+
+def _set_parameter_values(options: argparse.Namespace, n_params: int) -> List[float]:
+    # measured on a shown window, i.e. through the parameter widgets
+    window = _create_window(_make_bundle(_make_fn(n_params)))
+    try:
+        _show_window(window)
+        values = window.get_parameter_values()
+        return _time_calls(lambda: window.set_parameter_values(values), options.repeat)
+    finally:
+        _close_window(window)
+
+
+def _uprint(options: argparse.Namespace) -> List[float]:
+    from pyguiadapter.adapter import uoutput
+
+    n_calls = options.calls
+
+    def print_lines():
+        for i in range(n_calls):
+            uoutput.uprint(f"line {i}")
+
+    return _run_in_window(print_lines, n_calls, options.repeat)
+
+
+def _update_progress(options: argparse.Namespace) -> List[float]:
+    from pyguiadapter.adapter import uprogress
+
+    n_calls = options.calls
+
+    def report_progress():
+        uprogress.show_progressbar(0, n_calls)
+        for i in range(n_calls):
+            uprogress.update_progress(i + 1, f"{i + 1}/{n_calls}")
+        uprogress.hide_progressbar()
+
+    return _run_in_window(report_progress, n_calls, options.repeat)
+
+
+################################################################################################
+# results
+################################################################################################
+
+
+def _summary(timings: List[float]) -> Dict[str, Any]:
+    return OrderedDict(
+        median=statistics.median(timings),
+        min=min(timings),
+        max=max(timings),
+        runs=len(timings),
+    )
+
+
+def _environment() -> Dict[str, Any]:
+    return OrderedDict(
+        suite_version=_SUITE_VERSION,
+        created_at=datetime.datetime.now().isoformat(timespec="seconds"),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        qt_api=API_NAME,
+        qt_version=QT_VERSION,
+        qpa_platform=os.environ.get("QT_QPA_PLATFORM", ""),
+    )
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Return (name, baseline median, current median, ratio) of the cases slower than the baseline by more than tolerance.
+    """
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name, None)
+        if previous is None or previous["median"] <= 0:
+            continue
+        ratio = current["median"] / previous["median"]
+        if ratio > 1.0 + tolerance:
+            regressions.append((name, previous["median"], current["median"], ratio))
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    if seconds < 1.0:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def cases(param_counts: List[int]) -> "OrderedDict[str, Case]":
+    all_cases = OrderedDict()
+    all_cases["import.adapter"] = _import_adapter
+    for n_params in param_counts:
+        all_cases[f"adapter.add.{n_params}"] = functools.partial(
+            _add, n_params=n_params
+        )
+    for n_params in param_counts:
+        for name, fn in (
+            ("window.construct", _construct_window),
+            ("window.first_paint", _first_paint),
+            ("window.get_parameter_values", _get_parameter_values),
+            ("window.set_parameter_values", _set_parameter_values),
+        ):
+            all_cases[f"{name}.{n_params}"] = functools.partial(fn, n_params=n_params)
+    all_cases["uprint.per_call"] = _uprint
+    all_cases["update_progress.per_call"] = _update_progress
+    return all_cases
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="startup and hot-path benchmarks of pyguiadapter"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-p", "--params", type=int, nargs="+", default=list(DEFAULT_PARAM_COUNTS)
+    )
+    parser.add_argument(
+        "-n", "--calls", type=int, default=10000, help="uprint/update_progress calls"
+    )
+    parser.add_argument(
+        "-k", "--filter", default=None, help="only run the cases containing this text"
+    )
+    parser.add_argument("-o", "--output", default=None, help="save results as JSON")
+    parser.add_argument(
+        "-b", "--baseline", default=None, help="compare with the results in this file"
+    )
+    parser.add_argument("-t", "--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    options = parser.parse_args(argv)
+
+    _app()
+    baseline = None
+    if options.baseline:
+        with open(options.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = OrderedDict(environment=_environment(), results=OrderedDict())
+    for name, fn in cases(options.params).items():
+        if options.filter and options.filter not in name:
+            continue
+        summary = _summary(fn(options))
+        results["results"][name] = summary
+        line = f"{name:<36} {_format_seconds(summary['median']):>12}"
+        previous = (baseline or {}).get("results", {}).get(name, None)
+        if previous is not None and previous["median"] > 0:
+            line += f"  ({summary['median'] / previous['median']:.2f}x baseline)"
+        print(line, flush=True)
+
+    if options.output:
+        os.makedirs(os.path.dirname(os.path.abspath(options.output)), exist_ok=True)
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nresults saved to {options.output}")
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, options.tolerance)
+    if not regressions:
+        print(f"\nno regression (tolerance {options.tolerance:.0%})")
+        return 0
+    print(f"\nREGRESSIONS (tolerance {options.tolerance:.0%}):")
+    for name, previous, current, ratio in regressions:
+        print(
+            f"  {name}: {_format_seconds(previous)} -> {_format_seconds(current)} ({ratio:.2f}x)"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def import_object(path: str) -> Any:
+    """
+    Import an object from a path like "package.module:name", or a module from a path like "package.module".
+    """
+    module_name, _, attr_name = path.partition(":")
+    module = importlib.import_module(module_name)
+    if not attr_name:
+        return module
+    try:
+        return getattr(module, attr_name)
+    except AttributeError:
+        raise ImportError(f"cannot import name '{attr_name}' from '{module_name}'")
+
+
+def lazy_module_attrs(
+    module_name: str,
+    attrs: Dict[str, str],
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create the module-level __getattr__() and __dir__() of a package whose names are imported on first access (PEP 562).
+
+    Args:
+        module_name: __name__ of the package
+        attrs: name -> relative module path of the name, e.g. {"LineEdit": ".lineedit"}
+        submodules: names of the subpackages or submodules that can be accessed as attributes
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        relative_path: Optional[str] = attrs.get(name, None)
+        if relative_path is not None:
+            module = importlib.import_module(relative_path, module_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", module_name)
+        else:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        # later accesses won't go through __getattr__()
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attrs) | submodules)
+
+    return __getattr__, __dir__
@@ -0,0 +1,181 @@
+"""
+@Time    : 2026.10.17
+@File    : _bridge.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 可复用的跨线程请求/响应通道，用于在GUI线程中执行工作线程发起的调用并返回结果。仅限内部使用。
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Deque
+
+from qtpy.QtCore import QObject, Signal
+
+Call = Tuple[Callable[..., Any], tuple]
+
+
+class _Slot(object):
+    """
+    A request slot. Every thread owns one slot, which is reused by all its requests.
+    """
+
+    __slots__ = ("done", "calls", "results", "error", "abandoned", "submitted_at")
+
+    def __init__(self):
+        # used as a binary semaphore: held while the request is pending, released by the GUI thread
+        # when it is done. A bare lock is much cheaper to wait on than an Event (a Condition plus a lock).
+        self.done = threading.Lock()
+        self.done.acquire()
+        self.calls: List[Call] = []
+        self.results: List[Any] = []
+        self.error: Optional[BaseException] = None
+        self.abandoned: bool = False
+        # only set when profiling
+        self.submitted_at: Optional[float] = None
+
+    def reset(self):
+        self.calls.clear()
+        self.results.clear()
+        self.error = None
+
+
+class BridgeChannel(QObject):
+    """
+    工作线程与GUI线程之间的请求/响应通道。
+
+    与“每次调用都创建一个`Future`并通过队列信号传递”的方式相比：每个线程的请求槽位只在第一次调用时创建，之后被反复复用；
+    信号本身不携带任何参数，无需在线程间封送Python对象；多个线程同时发起的请求只会触发一次信号；
+    并且可以通过`call_many()`在一次往返中执行多个调用。在GUI线程中发起的调用将被直接执行。
+    """
+
+    sig_requests_pending = Signal()
+
+    def __init__(self, parent: Optional[QObject]):
+        super().__init__(parent)
+        self._gui_thread_ident = threading.get_ident()
+        self._lock = threading.Lock()
+        self._pending: Deque[_Slot] = deque()
+        self._local = threading.local()
+        # a SignalProfiler, set by _Context when signal profiling is enabled
+        self._profiler = None
+        # noinspection PyUnresolvedReferences
+        self.sig_requests_pending.connect(self._process_requests)
+
+    def call(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None):
+        """
+        在GUI线程中调用`fn(*args)`，阻塞等待并返回其返回值。`fn`引发的异常将在调用线程中重新引发。
+
+        Args:
+            fn: 要调用的函数
+            *args: 参数
+            timeout: 超时时间（秒），为`None`时一直等待。超时后将引发`TimeoutError`。
+
+        Returns:
+            `fn`的返回值
+        """
+        if threading.get_ident() == self._gui_thread_ident:
+            return fn(*args)
+        slot = self._acquire_slot()
+        slot.calls.append((fn, args))
+        self._submit(slot, timeout)
+        try:
+            if slot.error is not None:
+                raise slot.error
+            return slot.results[0]
+        finally:
+            slot.reset()
+
+    def call_many(
+        self, calls: Sequence[Call], timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        在一次往返中，于GUI线程中依次执行多个调用，并返回它们的返回值。若其中某个调用引发了异常，其后的调用将不再执行，
+        该异常将在调用线程中重新引发。
+
+        Args:
+            calls: 调用列表，每个元素为`(fn, args)`
+            timeout: 超时时间（秒），为`None`时一直等待。超时后将引发`TimeoutError`。
+
+        Returns:
+            各调用的返回值
+        """
+        if not calls:
+            return []
+        if threading.get_ident() == self._gui_thread_ident:
+            return [fn(*args) for fn, args in calls]
+        slot = self._acquire_slot()
+        slot.calls.extend(calls)
+        self._submit(slot, timeout)
+        try:
+            if slot.error is not None:
+                raise slot.error
+            return list(slot.results)
+        finally:
+            slot.reset()
+
+    def set_profiler(self, profiler):
+        self._profiler = profiler
+
+    def _acquire_slot(self) -> _Slot:
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = _Slot()
+            self._local.slot = slot
+        return slot
+
+    # noinspection PyUnresolvedReferences
+    def _submit(self, slot: _Slot, timeout: Optional[float]):
+        if self._profiler is not None:
+            slot.submitted_at = time.perf_counter()
+        with self._lock:
+            self._pending.append(slot)
+            # one signal is enough for all the requests made before the GUI thread gets to them
+            notify = len(self._pending) == 1
+        if notify:
+            self.sig_requests_pending.emit()
+        if slot.done.acquire(timeout=-1 if timeout is None else timeout):
+            return
+        with self._lock:
+            if slot in self._pending:
+                self._pending.remove(slot)
+            # the GUI thread may still be working on it (e.g. a dialog is open), so the slot can't be
+            # reused by this thread any more
+            slot.abandoned = True
+        self._local.slot = None
+        raise TimeoutError(f"no response from the GUI thread within {timeout} seconds")
+
+    def _process_requests(self):
+        # slots are taken one at a time, so that requests coming in while a modal dialog of an
+        # earlier request is open are still handled by the nested event loop
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                slot = self._pending.popleft()
+                if slot.abandoned:
+                    continue
+            profiler = self._profiler
+            start = time.perf_counter() if profiler is not None else 0.0
+            try:
+                for fn, args in slot.calls:
+                    slot.results.append(fn(*args))
+            except BaseException as e:
+                slot.error = e
+            finally:
+                if profiler is not None:
+                    self._record(profiler, slot, start)
+                slot.done.release()
+
+    @staticmethod
+    def _record(profiler, slot: _Slot, start: float):
+        if len(slot.calls) == 1:
+            name = getattr(slot.calls[0][0], "__name__", "call").lstrip("_")
+        else:
+            name = "call_many"
+        latency = None
+        if slot.submitted_at is not None:
+            latency = start - slot.submitted_at
+            slot.submitted_at = None
+        profiler.record(f"request.{name}", latency, time.perf_counter() - start)
@@ -0,0 +1,278 @@
+"""
+@Time    : 2026.10.17
+@File    : _output_buffer.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 线程安全的输出缓冲区，用于合并工作线程中的uprint()、日志和进度更新等调用，减少跨线程信号的数量。仅限内部使用。
+"""
+
+import threading
+from typing import List, Tuple, Optional
+
+# (text, html, scroll_to_bottom)
+OutputChunk = Tuple[str, bool, bool]
+# (timestamp, level, message, color)
+LogRecord = Tuple[float, int, str, str]
+
+_HTML_SEPARATOR = "</div><br /><div>"
+
+
+class OutputBuffer(object):
+    """
+    由工作线程写入、由GUI线程定时读取的输出缓冲区。
+
+    `put()`和`clear()`的返回值表示缓冲区是否由“空”变为“非空”，调用者只需在此时通知GUI线程，
+    因此无论工作线程打印多少条消息，每个刷新周期内最多只会产生一个跨线程信号。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chunks: List[OutputChunk] = []
+        self._cleared: bool = False
+        # statistics of the current execution, see take_stats()
+        self._writes: int = 0
+        self._chars: int = 0
+        # a copy of the first characters of the output, kept for the execution history
+        self._capture_limit: int = 0
+        self._captured: List[Tuple[str, bool]] = []
+        self._captured_chars: int = 0
+        self._capture_truncated: bool = False
+
+    def put(self, text: str, html: bool, scroll_to_bottom: bool) -> bool:
+        with self._lock:
+            was_empty = not self._chunks and not self._cleared
+            self._chunks.append((text, html, scroll_to_bottom))
+            self._writes += 1
+            self._chars += len(text)
+            if self._capture_limit > 0:
+                self._capture(text, html)
+            return was_empty
+
+    def _capture(self, text: str, html: bool):
+        room = self._capture_limit - self._captured_chars
+        if len(text) > room:
+            self._capture_truncated = True
+            # a truncated html chunk may not render, so it is dropped as a whole
+            if html or room <= 0:
+                return
+            text = text[:room]
+        self._captured.append((text, html))
+        self._captured_chars += len(text)
+
+    def set_capture_limit(self, limit: int):
+        """
+        设置要保留副本的输出字符数，小于等于0时表示不保留。
+        """
+        with self._lock:
+            self._capture_limit = limit
+            self._captured = []
+            self._captured_chars = 0
+            self._capture_truncated = False
+
+    def take_captured(self) -> Tuple[List[Tuple[str, bool]], bool]:
+        """
+        返回自上次调用以来保留的输出副本（`(text, html)`的列表）以及输出是否被截断，并将其清空。
+        """
+        with self._lock:
+            captured = self._captured
+            truncated = self._capture_truncated
+            self._captured = []
+            self._captured_chars = 0
+            self._capture_truncated = False
+            return captured, truncated
+
+    def take_stats(self) -> Tuple[int, int]:
+        """
+        返回自上次调用以来写入的次数和字符数，并将其清零。
+        """
+        with self._lock:
+            stats = (self._writes, self._chars)
+            self._writes = 0
+            self._chars = 0
+            return stats
+
+    def clear(self) -> bool:
+        with self._lock:
+            was_empty = not self._chunks and not self._cleared
+            # the pending chunks will be cleared from the output browser anyway,
+            # so there is no need to deliver them at all
+            self._chunks.clear()
+            self._cleared = True
+            return was_empty
+
+    def discard(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self._cleared = False
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._chunks and not self._cleared
+
+    def take(self, max_batch_size: int) -> Tuple[bool, List[OutputChunk], bool]:
+        """
+        取出待输出的内容，并将相邻的同类型（纯文本或html）内容合并为一个批次。
+
+        Args:
+            max_batch_size: 本次最多取出的字符数，小于等于0时表示不限制。至少会取出一条内容。
+
+        Returns:
+            `(cleared, batches, has_more)`。`cleared`表示在这些内容之前是否需要先清空输出浏览器，
+            `batches`为合并后的内容，`has_more`表示缓冲区中是否还有剩余内容。
+        """
+        with self._lock:
+            cleared = self._cleared
+            self._cleared = False
+            if max_batch_size <= 0:
+                count = len(self._chunks)
+            else:
+                count = 0
+                size = 0
+                for text, _, _ in self._chunks:
+                    if count > 0 and size + len(text) > max_batch_size:
+                        break
+                    size += len(text)
+                    count += 1
+            chunks = self._chunks[:count]
+            del self._chunks[:count]
+            has_more = len(self._chunks) > 0
+        return cleared, self._coalesce(chunks), has_more
+
+    @staticmethod
+    def _coalesce(chunks: List[OutputChunk]) -> List[OutputChunk]:
+        batches: List[OutputChunk] = []
+        texts: List[str] = []
+        current_html = False
+        current_scroll = False
+        for text, html, scroll_to_bottom in chunks:
+            if texts and html != current_html:
+                batches.append(_join(texts, current_html, current_scroll))
+                texts = []
+                current_scroll = False
+            texts.append(text)
+            current_html = html
+            current_scroll = current_scroll or scroll_to_bottom
+        if texts:
+            batches.append(_join(texts, current_html, current_scroll))
+        return batches
+
+
+def _join(texts: List[str], html: bool, scroll_to_bottom: bool) -> OutputChunk:
+    # TextBrowser.append_output() wraps every html message in a <div> and appends a <br />
+    # after it, so html messages are joined in a way that renders the same as separate inserts
+    if html:
+        return _HTML_SEPARATOR.join(texts), True, scroll_to_bottom
+    return "".join(texts), False, scroll_to_bottom
+
+
+class LogBuffer(object):
+    """
+    日志记录的缓冲区，与`OutputBuffer`在同一个刷新周期内被读取。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: List[LogRecord] = []
+
+    def put(self, record: LogRecord) -> bool:
+        with self._lock:
+            was_empty = not self._records
+            self._records.append(record)
+            return was_empty
+
+    def discard(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._records
+
+    def take(self) -> List[LogRecord]:
+        with self._lock:
+            records = self._records
+            self._records = []
+            return records
+
+
+class ProgressBuffer(object):
+    """
+    进度信息的缓冲区，只保留最新的进度值，GUI线程以固定的频率读取。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: bool = False
+        self._value: int = 0
+        self._info: Optional[str] = None
+        # number of updates since the last take_stats() call
+        self._updates: int = 0
+
+    def put(self, value: int, info: Optional[str]) -> bool:
+        with self._lock:
+            was_empty = not self._pending
+            self._updates += 1
+            # info=None means "keep the current info", so an earlier info must not be
+            # overwritten by it when the two updates are coalesced
+            if was_empty or info is not None:
+                self._info = info
+            self._value = value
+            self._pending = True
+            return was_empty
+
+    def discard(self) -> None:
+        with self._lock:
+            self._pending = False
+            self._info = None
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._pending
+
+    def take(self) -> Tuple[bool, int, Optional[str]]:
+        with self._lock:
+            pending = self._pending
+            value = self._value
+            info = self._info
+            self._pending = False
+            self._info = None
+            return pending, value, info
+
+    def take_stats(self) -> int:
+        """
+        返回自上次调用以来更新的次数，并将其清零。
+        """
+        with self._lock:
+            updates = self._updates
+            self._updates = 0
+            return updates
+
+
+class CounterBuffer(object):
+    """
+    计数缓冲区，累计工作线程中发生的事件（例如生成器函数产生的结果）的数量，GUI线程定时读取并清零。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count: int = 0
+
+    def put(self, count: int = 1) -> bool:
+        with self._lock:
+            was_empty = self._count == 0
+            self._count += count
+            return was_empty
+
+    def discard(self) -> None:
+        with self._lock:
+            self._count = 0
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._count == 0
+
+    def take(self) -> int:
+        with self._lock:
+            count = self._count
+            self._count = 0
+            return count
@@ -0,0 +1,199 @@
+"""
+@Time    : 2026.10.17
+@File    : _signal_profiler.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 统计工作线程与GUI线程之间的信号流量（发射次数、排队延迟、处理耗时），用于找出使事件循环过载的函数。仅限内部使用。
+"""
+
+import json
+import threading
+import time
+from collections import deque, OrderedDict
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+class SignalStats(object):
+    """
+    某个信号（或请求、远程调用）在一次执行中的统计数据，时间单位均为秒。
+    """
+
+    __slots__ = (
+        "emitted",
+        "handled",
+        "latency_total",
+        "latency_max",
+        "latency_samples",
+        "handler_total",
+        "handler_max",
+    )
+
+    def __init__(self):
+        self.emitted: int = 0
+        self.handled: int = 0
+        self.latency_total: float = 0.0
+        self.latency_max: float = 0.0
+        self.latency_samples: int = 0
+        self.handler_total: float = 0.0
+        self.handler_max: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return OrderedDict(
+            emitted=self.emitted,
+            handled=self.handled,
+            latency_mean=(
+                self.latency_total / self.latency_samples
+                if self.latency_samples
+                else None
+            ),
+            latency_max=self.latency_max if self.latency_samples else None,
+            handler_total=self.handler_total,
+            handler_mean=self.handler_total / self.handled if self.handled else None,
+            handler_max=self.handler_max,
+        )
+
+
+class ExecutionProfile(object):
+    """
+    一次执行的信号流量统计。使用并发执行器时，“一次执行”指从第一个作业开始到所有作业结束的整个忙碌期。
+    """
+
+    def __init__(self, fn_name: str):
+        self.fn_name: str = fn_name
+        self.started_at: float = time.time()
+        self.duration: Optional[float] = None
+        self.signals: Dict[str, SignalStats] = OrderedDict()
+        self._started = time.perf_counter()
+
+    @property
+    def finished(self) -> bool:
+        return self.duration is not None
+
+    def finish(self):
+        self.duration = time.perf_counter() - self._started
+
+    def stats_of(self, name: str) -> SignalStats:
+        stats = self.signals.get(name, None)
+        if stats is None:
+            stats = SignalStats()
+            self.signals[name] = stats
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return OrderedDict(
+            fn_name=self.fn_name,
+            started_at=self.started_at,
+            duration=self.duration,
+            signals=OrderedDict(
+                (name, stats.to_dict()) for name, stats in self.signals.items()
+            ),
+        )
+
+
+class SignalProfiler(object):
+    """
+    信号流量分析器。
+
+    发射时间由一个以`DirectConnection`方式连接的记录函数在发射信号的线程中记录，处理函数被包装后，在GUI线程中被调用时
+    按先进先出的顺序取出对应的发射时间，从而得到排队延迟，并测量处理函数本身的耗时。
+    执行之外产生的统计数据（例如执行结束后才处理的信号）计入最近一次执行。
+    """
+
+    def __init__(self, max_profiles: int = 50):
+        self._lock = threading.Lock()
+        self._emit_times: Dict[str, Deque[float]] = {}
+        self._profiles: Deque[ExecutionProfile] = deque(maxlen=max(max_profiles, 1))
+        self._current: Optional[ExecutionProfile] = None
+
+    def begin_execution(self, fn_name: str) -> ExecutionProfile:
+        with self._lock:
+            profile = ExecutionProfile(fn_name)
+            self._profiles.append(profile)
+            self._current = profile
+            return profile
+
+    def end_execution(self) -> Optional[ExecutionProfile]:
+        with self._lock:
+            profile = self._current
+            if profile is not None and not profile.finished:
+                profile.finish()
+            return profile
+
+    def profiles(self) -> List[ExecutionProfile]:
+        with self._lock:
+            return list(self._profiles)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+            self._current = None
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        with self._lock:
+            data = [profile.to_dict() for profile in self._profiles]
+        return json.dumps(data, indent=indent, ensure_ascii=False)
+
+    def dump(self, filename: str):
+        content = self.to_json()
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def recorder(self, name: str) -> Callable[..., None]:
+        """
+        返回一个记录`name`信号发射时间的函数，该函数应以`Qt.DirectConnection`方式连接到信号上。
+        """
+        emit_times = self._emit_times.setdefault(name, deque())
+
+        def _record(*_):
+            now = time.perf_counter()
+            with self._lock:
+                emit_times.append(now)
+                if self._current is not None:
+                    self._current.stats_of(name).emitted += 1
+
+        return _record
+
+    def wrap(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        包装`name`信号的处理函数，在调用时统计排队延迟和处理耗时。
+        """
+        emit_times = self._emit_times.setdefault(name, deque())
+
+        def _handler(*args):
+            start = time.perf_counter()
+            with self._lock:
+                emitted_at = emit_times.popleft() if emit_times else None
+            try:
+                return handler(*args)
+            finally:
+                end = time.perf_counter()
+                latency = None if emitted_at is None else start - emitted_at
+                self.record(name, latency, end - start, emitted=False)
+
+        return _handler
+
+    def record(
+        self,
+        name: str,
+        latency: Optional[float],
+        duration: float,
+        emitted: bool = True,
+    ):
+        """
+        记录一次处理。`latency`为`None`时表示排队延迟未知。
+        """
+        with self._lock:
+            if self._current is None:
+                return
+            stats = self._current.stats_of(name)
+            if emitted:
+                stats.emitted += 1
+            stats.handled += 1
+            stats.handler_total += duration
+            if duration > stats.handler_max:
+                stats.handler_max = duration
+            if latency is not None:
+                stats.latency_samples += 1
+                stats.latency_total += latency
+                if latency > stats.latency_max:
+                    stats.latency_max = latency
@@ -6,6 +6,8 @@
 @Desc    : 定义了GUI适配器类GUIAdapter，负责管理函数和启动GUI应用。
 """
 
+import functools
+import inspect
 import sys
 import warnings
 from collections import OrderedDict
@@ -27,18 +29,23 @@ from qtpy.QtWidgets import QApplication
 from . import ucontext
 from ..action import Separator
 from ..bundle import FnBundle
+from ..cache import ResultCache, ResultCacheConfig, PATH_TYPES
 from ..exceptions import NotRegisteredError
-from ..fn import ParameterInfo
+from ..executor import BaseFunctionExecutor
+from ..executors import ConcurrentProcessFunctionExecutor, AsyncioFunctionExecutor
+from ..fn import ParameterInfo, FnInfo
+from ..history import function_key
 from ..menu import Menu
 from ..paramwidget import (
     BaseParameterWidget,
     BaseParameterWidgetConfig,
     is_parameter_widget_class,
 )
-from ..parser import FnParser
+from ..parser import FnParser, FnParseCache
 from ..toolbar import ToolBar
 from ..utils import IconType
 from ..widgets import ParameterWidgetFactory
+from ..watchdog import StallWatchdog, StallReport
 from ..window import BaseWindowEventListener
 from ..windows.fnexec import FnExecuteWindow, FnExecuteWindowConfig
 from ..windows.fnselect import FnSelectWindow, FnSelectWindowConfig
@@ -56,6 +63,11 @@ class GUIAdapter(object):
         global_stylesheet: Union[str, Callable[[], str], None] = None,
         on_app_start: Optional[Callable[[QApplication], None]] = None,
         on_app_shutdown: Optional[Callable] = None,
+        stall_watchdog: bool = False,
+        stall_threshold: float = 0.5,
+        on_stall: Optional[Callable[[StallReport], None]] = None,
+        parse_cache: Union[bool, str] = False,
+        lazy_registration: bool = False,
     ):
         """
         `GUIAdapter`构造函数。用于创建`GUIAdapter`实例。
@@ -65,6 +77,16 @@ class GUIAdapter(object):
             global_stylesheet: 应用全局样式。可以为样式表字符串，也可以为一个返回全局样式表字符串的函数。
             on_app_start: 应用启动回调函数。在应用启动时调用。
             on_app_shutdown: 应用停止回调函数。在应用停止时调用。
+            stall_watchdog: 是否启用GUI线程卡顿监视器。启用后，若事件循环超过`stall_threshold`秒没有响应，将对GUI线程的调用栈进行采样，
+                卡顿结束后生成一份`StallReport`，打印到标准错误输出，并显示在执行窗口的`Diagnostics停靠窗口`中。监视器的开销很小，可以在生产环境中启用。
+            stall_threshold: 事件循环超过多少秒没有响应时视为卡顿。
+            on_stall: 卡顿回调函数。每次卡顿结束后在GUI线程中调用，参数为卡顿报告。
+            parse_cache: 是否将函数的解析结果（参数信息、函数文档和docstring中的参数控件配置）缓存到磁盘。可以为`True`（使用默认的缓存文件，
+                参见`pyguiadapter.parser.default_parse_cache_file()`）或缓存文件的路径。启用后，函数所在的源文件、docstring及参数默认值未被修改时，
+                程序再次启动时将跳过函数签名、docstring和TOML的解析，对于添加了大量函数的应用，可以加快启动速度。
+            lazy_registration: 是否延迟解析函数。启用后，`add()`只记录函数及其显示名称、分组和图标，函数签名、docstring和参数控件配置的解析
+                被推迟到函数首次被选中（或打开）时，同时，函数选择窗口显示后，将利用事件循环的空闲时间逐个解析其余的函数。
+                这样，应用的启动时间将不再取决于添加的函数的数量。注意：启用后，函数解析中的错误（例如不支持的参数类型）将在函数被选中时才被报告。
 
         Examples:
             ```python
@@ -82,9 +104,19 @@ class GUIAdapter(object):
         self._global_stylesheet: Optional[str] = global_stylesheet
         self._on_app_start: Optional[Callable[[QApplication], None]] = on_app_start
         self._on_app_shutdown: Optional[Callable] = on_app_shutdown
+        self._stall_watchdog_enabled: bool = stall_watchdog
+        self._stall_threshold: float = stall_threshold
+        self._on_stall: Optional[Callable[[StallReport], None]] = on_stall
+        self._stall_watchdog: Optional[StallWatchdog] = None
 
         self._bundles: Dict[Callable, FnBundle] = OrderedDict()
         self._fn_parser = FnParser()
+        self._lazy_registration: bool = lazy_registration
+        self._parse_cache: Optional[FnParseCache] = None
+        if parse_cache:
+            self._parse_cache = FnParseCache(
+                parse_cache if isinstance(parse_cache, str) else None
+            )
 
         self._application: Optional[QApplication] = None
         self._select_window: Optional[FnSelectWindow] = None
@@ -108,6 +140,9 @@ class GUIAdapter(object):
         window_toolbar: Optional[ToolBar] = None,
         window_menus: Optional[List[Union[Menu, Separator]]] = None,
         capture_system_exit_exception: bool = True,
+        executor: Optional[Type[BaseFunctionExecutor]] = None,
+        batch: bool = False,
+        cache: Union[bool, ResultCacheConfig, None] = None,
     ) -> None:
         """
         添加一个函数。
@@ -126,11 +161,82 @@ class GUIAdapter(object):
             window_toolbar: 窗口的工具栏。
             window_menus: 窗口菜单列表。
             capture_system_exit_exception: 是否捕获用户函数中的SystemExit异常，并将其转换为RuntimeError。
+            executor: 函数执行器的类型。若不指定，则使用默认的`ThreadFunctionExecutor`（`async def`定义的协程函数则使用`AsyncioFunctionExecutor`）。
+                对于CPU密集型的函数，可以指定为`ProcessFunctionExecutor`。
+            batch: 是否启用批量执行模式。启用后，窗口中将出现`批量执行`按钮，用户可以以参数控件的当前值为基础，为各参数指定取值列表（笛卡尔积）或
+                以CSV格式指定参数表，所有参数组合将被并发执行，执行结果汇总在`Jobs停靠窗口`中。批量执行需要支持并发的执行器，
+                若未指定`executor`，将使用`ConcurrentProcessFunctionExecutor`。
+            cache: 是否缓存函数的执行结果，可以为`True`（使用默认配置）或`ResultCacheConfig`对象。适用于确定性的（相同的参数总是得到相同的结果）、
+                耗时的函数。以相同的参数再次执行时，函数将不会被调用，缓存的结果和输出将被直接重放。参数通过稳定的哈希值区分，
+                路径类型（`file_t`、`directory_t`等）参数所指文件的修改时间和大小也会被计入。只缓存成功执行的结果，
+                参数无法生成稳定的哈希值时不缓存。不适用于支持并发执行的执行器。
         Returns:
             无返回值
         """
+        create_fn_info = functools.partial(
+            self._create_fn_info,
+            fn,
+            display_name=display_name,
+            group=group,
+            icon=icon,
+            document=document,
+            document_format=document_format,
+            cancelable=cancelable,
+            widget_configs=widget_configs,
+            capture_system_exit_exception=capture_system_exit_exception,
+            executor=executor,
+            batch=batch,
+            cache=cache,
+        )
+        resolver = None
+        if self._lazy_registration:
+            if not inspect.ismethod(fn) and not inspect.isfunction(fn):
+                raise ValueError("fn must be a function or method")
+            # only the information needed by the function select window, the rest is parsed by the resolver when
+            # the function is selected for the first time
+            fn_info = FnInfo(
+                fn=fn,
+                display_name=display_name or fn.__name__,
+                document_format=document_format,
+                icon=icon,
+                group=group,
+            )
+            widget_configs = OrderedDict()
+            resolver = create_fn_info
+        else:
+            fn_info, widget_configs = create_fn_info()
+
+        window_config = window_config or FnExecuteWindowConfig()
+        bundle = FnBundle(
+            fn_info,
+            widget_configs=widget_configs,
+            window_config=window_config,
+            window_listener=window_listener,
+            window_toolbar=window_toolbar,
+            window_menus=window_menus,
+            resolver=resolver,
+        )
+        self._bundles[fn] = bundle
+
+    def _create_fn_info(
+        self,
+        fn: Callable,
+        display_name: Optional[str],
+        group: Optional[str],
+        icon: IconType,
+        document: Optional[str],
+        document_format: Literal["markdown", "html", "plaintext"],
+        cancelable: bool,
+        widget_configs: Optional[Dict[str, Union[BaseParameterWidgetConfig, dict]]],
+        capture_system_exit_exception: bool,
+        executor: Optional[Type[BaseFunctionExecutor]],
+        batch: bool,
+        cache: Union[bool, ResultCacheConfig, None],
+    ) -> Tuple[
+        FnInfo, Dict[str, Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig]]
+    ]:
         # create the FnInfo from the function and given arguments
-        fn_info = self._fn_parser.parse_fn_info(
+        fn_info, parsed_widget_configs = self._parse_fn(
             fn,
             display_name=display_name,
             document=document,
@@ -140,30 +246,83 @@ class GUIAdapter(object):
             capture_system_exit_exception=capture_system_exit_exception,
         )
         fn_info.cancelable = cancelable
+        if batch and executor is None:
+            executor = ConcurrentProcessFunctionExecutor
+        if executor is None and inspect.iscoroutinefunction(fn):
+            executor = AsyncioFunctionExecutor
+        fn_info.executor = executor
+        fn_info.batch = batch
+        if cache:
+            fn_info.result_cache = self._create_result_cache(fn_info, cache)
         # configs for parameter widget can be from various sources
         # for example, from the function signature or function docstring, those are automatically parsed by FnParser
         # user can override those auto-parsed configs with 'widget_configs' of this method
         # That means the user's 'widget_configs' has a higher priority than the auto-parsed widget configs
         user_widget_configs = widget_configs or {}
-        parsed_widget_configs = self._fn_parser.parse_widget_configs(fn_info)
-        widget_configs: Dict[
-            str, Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig]
-        ] = self._merge_widget_configs(
+        merged_widget_configs = self._merge_widget_configs(
             parameters=fn_info.parameters,
             parsed_configs=parsed_widget_configs,
             user_configs=user_widget_configs,
         )
+        return fn_info, merged_widget_configs
 
-        window_config = window_config or FnExecuteWindowConfig()
-        bundle = FnBundle(
-            fn_info,
-            widget_configs=widget_configs,
-            window_config=window_config,
-            window_listener=window_listener,
-            window_toolbar=window_toolbar,
-            window_menus=window_menus,
+    def _parse_fn(
+        self,
+        fn: Callable,
+        display_name: Optional[str],
+        document: Optional[str],
+        document_format: Literal["markdown", "html", "plaintext"],
+        icon: IconType,
+        group: Optional[str],
+        capture_system_exit_exception: bool,
+    ) -> Tuple[FnInfo, Dict[str, Tuple[Optional[str], dict]]]:
+        # the document given by the user replaces the one parsed from the docstring, so it is a part of the cache key
+        salt = repr((document, self._fn_parser.widget_metadata_markers))
+        if self._parse_cache is not None:
+            parsed = self._parse_cache.get(fn, salt)
+            if parsed is not None:
+                parsed_document, parameters, parsed_widget_configs = parsed
+                fn_info = FnInfo(
+                    fn=fn,
+                    display_name=display_name or fn.__name__,
+                    document=parsed_document,
+                    document_format=document_format,
+                    icon=icon,
+                    group=group,
+                    parameters=parameters,
+                    capture_system_exit_exception=capture_system_exit_exception,
+                )
+                return fn_info, parsed_widget_configs
+
+        fn_info = self._fn_parser.parse_fn_info(
+            fn,
+            display_name=display_name,
+            document=document,
+            document_format=document_format,
+            icon=icon,
+            group=group,
+            capture_system_exit_exception=capture_system_exit_exception,
         )
-        self._bundles[fn] = bundle
+        parsed_widget_configs = self._fn_parser.parse_widget_configs(fn_info)
+        if self._parse_cache is not None:
+            self._parse_cache.put(
+                fn, (fn_info.document, fn_info.parameters, parsed_widget_configs), salt
+            )
+        return fn_info, parsed_widget_configs
+
+    @staticmethod
+    def _create_result_cache(
+        fn_info: FnInfo, cache: Union[bool, ResultCacheConfig]
+    ) -> ResultCache:
+        if not isinstance(cache, ResultCacheConfig):
+            cache = ResultCacheConfig()
+        path_parameters = [
+            name
+            for name, parameter_info in fn_info.parameters.items()
+            if isinstance(parameter_info.type, type)
+            and issubclass(parameter_info.type, PATH_TYPES)
+        ]
+        return ResultCache(function_key(fn_info.fn), cache, path_parameters)
 
     def remove(self, fn: Callable) -> None:
         """
@@ -220,6 +379,8 @@ class GUIAdapter(object):
         Returns:
             无返回值
         """
+        if self._parse_cache is not None:
+            self._parse_cache.save()
         if self._application is None:
             self._start_application(argv)
         # noinspection PyProtectedMember
@@ -272,19 +433,44 @@ class GUIAdapter(object):
             if callable(self._global_stylesheet):
                 self._application.setStyleSheet(self._global_stylesheet())
 
+        if self._stall_watchdog_enabled:
+            self._start_stall_watchdog()
+
         if self._on_app_start:
             self._on_app_start(self._application)
 
+    def _start_stall_watchdog(self):
+        self._stall_watchdog = StallWatchdog(None, threshold=self._stall_threshold)
+        if self._on_stall is not None:
+            # noinspection PyUnresolvedReferences
+            self._stall_watchdog.sig_stall_detected.connect(self._on_stall)
+        # noinspection PyProtectedMember
+        ucontext._set_stall_watchdog(self._stall_watchdog)
+        self._stall_watchdog.start()
+
+    def _stop_stall_watchdog(self):
+        if self._stall_watchdog is None:
+            return
+        self._stall_watchdog.stop()
+        # noinspection PyProtectedMember
+        ucontext._set_stall_watchdog(None)
+        self._stall_watchdog.deleteLater()
+        self._stall_watchdog = None
+
     def _shutdown_application(self):
         if self._application is None:
             warnings.warn("application not started yet")
             return
         # noinspection PyProtectedMember
         ucontext._reset()
+        self._stop_stall_watchdog()
 
         self._application.closeAllWindows()
         self._application.quit()
         self._application = None
+        if self._parse_cache is not None:
+            # functions registered lazily are parsed after run() is called
+            self._parse_cache.save()
 
         if self._on_app_shutdown:
             self._on_app_shutdown()
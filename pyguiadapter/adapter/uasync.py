@@ -0,0 +1,95 @@
+"""
+@Time    : 2026.10.17
+@File    : uasync.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 提供`uinput`、`udialog`中函数的可等待版本，用于`async def`定义的协程函数。
+"""
+
+import asyncio
+import functools
+from typing import Any, Callable, Awaitable
+
+from . import udialog, uinput
+from .ucontext import get_cancellation_token
+
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    在线程池中调用一个阻塞的函数并等待其返回，调用期间事件循环中的其他任务可以继续运行。
+
+    `uinput`、`udialog`中的函数会一直阻塞到用户关闭对话框，在协程函数中直接调用它们将使整个事件循环停顿，
+    本模块中的同名函数正是通过该函数实现的。
+
+    Args:
+        fn: 阻塞的函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        函数的返回值
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+async def sleep(seconds: float) -> bool:
+    """
+    可被取消请求提前唤醒的`asyncio.sleep()`。
+
+    Args:
+        seconds: 等待的时间（秒）
+
+    Returns:
+        因收到取消请求而提前返回时返回`True`，否则返回`False`
+    """
+    token = get_cancellation_token()
+    if token.is_cancelled():
+        return True
+    loop = asyncio.get_running_loop()
+    waiter = loop.create_future()
+
+    def _wakeup():
+        loop.call_soon_threadsafe(
+            lambda: waiter.done() or waiter.set_result(True),
+        )
+
+    token.add_callback(_wakeup)
+    try:
+        return await asyncio.wait_for(waiter, seconds)
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        token.remove_callback(_wakeup)
+
+
+def _awaitable(fn: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(fn)
+    async def _wrapper(*args, **kwargs):
+        return await run_blocking(fn, *args, **kwargs)
+
+    return _wrapper
+
+
+get_string = _awaitable(uinput.get_string)
+get_text = _awaitable(uinput.get_text)
+get_int = _awaitable(uinput.get_int)
+get_float = _awaitable(uinput.get_float)
+get_selected_item = _awaitable(uinput.get_selected_item)
+get_color = _awaitable(uinput.get_color)
+get_json_object = _awaitable(uinput.get_json_object)
+get_py_literal = _awaitable(uinput.get_py_literal)
+get_custom_input = _awaitable(uinput.get_custom_input)
+get_existing_directory = _awaitable(uinput.get_existing_directory)
+get_existing_directory_url = _awaitable(uinput.get_existing_directory_url)
+get_open_file = _awaitable(uinput.get_open_file)
+get_open_files = _awaitable(uinput.get_open_files)
+get_save_file = _awaitable(uinput.get_save_file)
+
+show_custom_dialog = _awaitable(udialog.show_custom_dialog)
+show_info_messagebox = _awaitable(udialog.show_info_messagebox)
+show_warning_messagebox = _awaitable(udialog.show_warning_messagebox)
+show_critical_messagebox = _awaitable(udialog.show_critical_messagebox)
+show_question_messagebox = _awaitable(udialog.show_question_messagebox)
+show_text_content = _awaitable(udialog.show_text_content)
+show_text_file = _awaitable(udialog.show_text_file)
@@ -6,8 +6,6 @@
 @Desc    : 提供了访问系统剪贴板的相关接口
 """
 
-from concurrent.futures import Future
-
 from typing import Optional
 
 from ..window import (
@@ -29,9 +27,7 @@ def get_text() -> Optional[str]:
     Returns:
         系统剪贴板中当前文本，如果剪贴板为空则返回None。
     """
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_GET_TEXT, None)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_GET_TEXT, None)
 
 
 def set_text(text: str) -> None:
@@ -43,36 +39,24 @@ def set_text(text: str) -> None:
     Returns:
         无返回值
     """
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_SET_TEXT, text)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_SET_TEXT, text)
 
 
 def supports_selection() -> bool:
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_SUPPORTS_SELECTION, None)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_SUPPORTS_SELECTION, None)
 
 
 def get_selection_text() -> Optional[str]:
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_GET_SELECTION_TEXT, None)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_GET_SELECTION_TEXT, None)
 
 
 def set_selection_text(text: str):
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_SET_SELECTION_TEXT, text)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_SET_SELECTION_TEXT, text)
 
 
 def owns_clipboard() -> bool:
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_OWNS_CLIPBOARD, None)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_OWNS_CLIPBOARD, None)
 
 
 def owns_selection() -> bool:
-    future = Future()
-    _context.sig_clipboard_operation.emit(future, CLIPBOARD_OWNS_SELECTION, None)
-    return future.result()
+    return _context.request("clipboard_operation", CLIPBOARD_OWNS_SELECTION, None)
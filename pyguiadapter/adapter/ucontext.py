@@ -6,19 +6,59 @@
 @Desc    : 维护全局上下文信息，提供一些核心功能
 """
 
+import time
 import warnings
-from concurrent.futures import Future
-from typing import Any, Type, Optional, Callable, Dict
-
-from qtpy.QtCore import QObject, Signal, QMutex
-
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import (
+    Any,
+    Type,
+    Optional,
+    Callable,
+    Dict,
+    Generator,
+    AsyncGenerator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from qtpy.QtCore import QObject, Signal, QMutex, QTimer, Qt
+
+from ._bridge import BridgeChannel
+from ._output_buffer import OutputBuffer, LogBuffer, ProgressBuffer, CounterBuffer
+from ._signal_profiler import SignalProfiler, ExecutionProfile
+from ..cancellation import CancellationToken, get_current_token
+from ..exceptions import FunctionCancelledError
 from ..utils import BaseCustomDialog
 from ..utils.messagebox import show_messagebox
+from ..watchdog import StallWatchdog, StallReport
 
 # noinspection PyProtectedMember
 from ..windows.fnexec._base import BaseFnExecuteWindow
 
 
+class RemoteChannel(object):
+    """
+    工作进程与GUI进程之间的通信通道。`_Context`处于“远程”模式时，通过该通道将调用转发给GUI进程。
+    """
+
+    @abstractmethod
+    def send(self, name: str, args: tuple) -> None:
+        pass
+
+    @abstractmethod
+    def request(self, name: str, args: tuple) -> Any:
+        pass
+
+    @abstractmethod
+    def is_cancelled(self) -> bool:
+        pass
+
+    def cancellation_token(self) -> Optional[CancellationToken]:
+        return None
+
+
 # noinspection PyMethodMayBeStatic,SpellCheckingInspection
 class _Context(QObject):
 
@@ -28,62 +68,197 @@ class _Context(QObject):
     sig_uprint = Signal(str, bool, bool)
     # noinspection SpellCheckingInspection
     sig_clear_output = Signal()
-    sig_show_messagebox = Signal(Future, dict)
-    sig_show_custom_dialog = Signal(Future, object, dict)
-    sig_get_input = Signal(Future, object)
+    sig_output_pending = Signal()
     sig_show_progressbar = Signal(dict)
     sig_hide_progressbar = Signal()
     sig_update_progressbar = Signal(int, str)
-    sig_clipboard_operation = Signal(Future, int, object)
     sig_show_toast = Signal(str, int, object, bool)
     sig_clear_toasts = Signal()
     sig_highlight_parameter = Signal(str)
     sig_show_progress_dialog = Signal(dict)
     sig_dismiss_progress_dialog = Signal()
     sig_update_progress_dialog = Signal(int, str)
+    sig_progress_pending = Signal()
 
     def __init__(self, parent):
         super().__init__(parent)
 
         self._lock = QMutex()
         self._current_window: Optional[BaseFnExecuteWindow] = None
+        # set in a worker process of ProcessFunctionExecutor, calls are forwarded to the GUI process through it
+        self._remote: Optional[RemoteChannel] = None
+
+        self._output_buffer = OutputBuffer()
+        self._log_buffer = LogBuffer()
+        self._stream_counter = CounterBuffer()
+        self._log_view_enabled: bool = False
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+
+        self._progressbar_buffer = ProgressBuffer()
+        self._progress_dialog_buffer = ProgressBuffer()
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+
+        # calls that need a result from the GUI thread (dialogs, inputs, clipboard...) go through it
+        self._bridge = BridgeChannel(self)
+        self._request_handlers = self._remote_request_handlers()
+        self._call_handlers = self._remote_call_handlers()
+
+        # set when signal profiling is enabled, see set_signal_profiling_enabled()
+        self._profiler: Optional[SignalProfiler] = None
+        # name -> (signal, handlers), connections are made through this table so that they can be
+        # rewired for profiling
+        self._signal_handlers: Dict[str, Tuple[Any, List[Callable[..., Any]]]] = (
+            OrderedDict()
+        )
+        # name -> callables actually connected to the signal
+        self._connected: Dict[str, List[Callable[..., Any]]] = {}
 
-        # noinspection PyUnresolvedReferences
-        self.sig_current_window_created.connect(self._on_current_window_created)
-        # noinspection PyUnresolvedReferences
-        self.sig_current_window_destroyed.connect(self._on_current_window_destroyed)
-        # noinspection PyUnresolvedReferences
-        self.sig_uprint.connect(self._on_uprint)
-        # noinspection PyUnresolvedReferences
-        self.sig_clear_output.connect(self._on_clear_output)
-        # noinspection PyUnresolvedReferences
-        self.sig_show_messagebox.connect(self._on_show_messagebox)
-        # noinspection PyUnresolvedReferences
-        self.sig_show_custom_dialog.connect(self._on_show_custom_dialog)
-        # noinspection PyUnresolvedReferences
-        self.sig_get_input.connect(self._on_get_input)
-        # noinspection PyUnresolvedReferences
-        self.sig_show_progressbar.connect(self._on_show_progressbar)
-        # noinspection PyUnresolvedReferences
-        self.sig_hide_progressbar.connect(self._on_hide_progressbar)
-        # noinspection PyUnresolvedReferences
-        self.sig_update_progressbar.connect(self._on_update_progressbar)
-        # noinspection PyUnresolvedReferences
-        self.sig_clipboard_operation.connect(self._on_clipboard_operation)
-        # noinspection PyUnresolvedReferences
-        self.sig_highlight_parameter.connect(self._on_highlight_parameter)
-        # noinspection PyUnresolvedReferences
-        self.sig_show_progress_dialog.connect(self._on_show_progress_dialog)
-        # noinspection PyUnresolvedReferences
-        self.sig_dismiss_progress_dialog.connect(self._on_dismiss_progress_dialog)
-        # noinspection PyUnresolvedReferences
-        self.sig_update_progress_dialog.connect(self._on_update_progress_dialog)
+        # set by GUIAdapter when the stall watchdog is enabled
+        self._stall_watchdog: Optional[StallWatchdog] = None
+
+        self._add_signal_handler(
+            "sig_current_window_created", self._on_current_window_created
+        )
+        self._add_signal_handler(
+            "sig_current_window_destroyed", self._on_current_window_destroyed
+        )
+        self._add_signal_handler("sig_uprint", self._on_uprint)
+        self._add_signal_handler("sig_clear_output", self._on_clear_output)
+        self._add_signal_handler("sig_output_pending", self._on_output_pending)
+        self._add_signal_handler("sig_show_progressbar", self._on_show_progressbar)
+        self._add_signal_handler("sig_hide_progressbar", self._on_hide_progressbar)
+        self._add_signal_handler("sig_update_progressbar", self._on_update_progressbar)
+        self._add_signal_handler(
+            "sig_highlight_parameter", self._on_highlight_parameter
+        )
+        self._add_signal_handler(
+            "sig_show_progress_dialog", self._on_show_progress_dialog
+        )
+        self._add_signal_handler(
+            "sig_dismiss_progress_dialog", self._on_dismiss_progress_dialog
+        )
+        self._add_signal_handler(
+            "sig_update_progress_dialog", self._on_update_progress_dialog
+        )
+        self._add_signal_handler("sig_progress_pending", self._on_progress_pending)
+        self._add_signal_handler(
+            "flush_output", self._flush_output, self._output_flush_timer.timeout
+        )
+        self._add_signal_handler(
+            "flush_progress", self._flush_progress, self._progress_flush_timer.timeout
+        )
 
     @property
     def current_window(self) -> Optional[BaseFnExecuteWindow]:
         return self._current_window
 
+    @property
+    def signal_profiler(self) -> Optional[SignalProfiler]:
+        return self._profiler
+
+    @property
+    def stall_watchdog(self) -> Optional[StallWatchdog]:
+        return self._stall_watchdog
+
+    @stall_watchdog.setter
+    def stall_watchdog(self, watchdog: Optional[StallWatchdog]):
+        self._stall_watchdog = watchdog
+
+    def is_signal_profiling_enabled(self) -> bool:
+        return self._profiler is not None
+
+    def set_signal_profiling_enabled(self, enabled: bool, max_profiles: int = 50):
+        """
+        启用或禁用信号流量分析。启用后，将统计每个信号的发射次数、排队延迟（从发射到处理函数开始执行）和处理耗时，
+        以及通过请求通道发起的请求和工作进程转发过来的调用，并按执行分别汇总。只能在GUI线程中调用。
+        """
+        if enabled == (self._profiler is not None):
+            return
+        for name in self._signal_handlers.keys():
+            self._disconnect_handlers(name)
+        self._profiler = SignalProfiler(max_profiles) if enabled else None
+        for name in self._signal_handlers.keys():
+            self._connect_handlers(name)
+        self._bridge.set_profiler(self._profiler)
+        # events queued before the connections changed may never reach the new ones
+        self.flush_output()
+        self.flush_progress()
+
+    def begin_signal_profile(self, fn_name: str) -> Optional[ExecutionProfile]:
+        if self._profiler is None:
+            return None
+        return self._profiler.begin_execution(fn_name)
+
+    def end_signal_profile(self) -> Optional[ExecutionProfile]:
+        if self._profiler is None:
+            return None
+        return self._profiler.end_execution()
+
+    def _add_signal_handler(
+        self, name: str, handler: Callable[..., Any], signal: Any = None
+    ):
+        if name not in self._signal_handlers:
+            if signal is None:
+                signal = getattr(self, name)
+            self._signal_handlers[name] = (signal, [])
+        else:
+            self._disconnect_handlers(name)
+        self._signal_handlers[name][1].append(handler)
+        self._connect_handlers(name)
+
+    def _connect_handlers(self, name: str):
+        signal, handlers = self._signal_handlers[name]
+        if self._profiler is None:
+            for handler in handlers:
+                # noinspection PyUnresolvedReferences
+                signal.connect(handler)
+            self._connected[name] = list(handlers)
+            return
+
+        # the recorder runs in the emitting thread, the handlers are called through a single
+        # wrapper, so that every emission is paired with exactly one handler invocation
+        def _call_handlers(*args):
+            for h in handlers:
+                h(*args)
+
+        recorder = self._profiler.recorder(name)
+        wrapper = self._profiler.wrap(name, _call_handlers)
+        # noinspection PyUnresolvedReferences
+        signal.connect(recorder, Qt.DirectConnection)
+        # noinspection PyUnresolvedReferences
+        signal.connect(wrapper)
+        self._connected[name] = [recorder, wrapper]
+
+    def _disconnect_handlers(self, name: str):
+        signal, _ = self._signal_handlers[name]
+        for handler in self._connected.pop(name, []):
+            # noinspection PyUnresolvedReferences
+            signal.disconnect(handler)
+
+    def get_cancellation_token(self) -> Optional[CancellationToken]:
+        token = get_current_token()
+        if token is not None:
+            return token
+        # called from a thread started by the function itself
+        if self._remote is not None:
+            return self._remote.cancellation_token()
+        self._lock.lock()
+        try:
+            if not isinstance(self._current_window, BaseFnExecuteWindow):
+                return None
+            return self._current_window.executor.cancellation_token
+        finally:
+            self._lock.unlock()
+
     def is_function_cancelled(self) -> bool:
+        # fast path: the token of the function running in this thread, no lock is needed
+        token = get_current_token()
+        if token is not None:
+            return token.is_cancelled()
+        if self._remote is not None:
+            return self._remote.is_cancelled()
         self._lock.lock()
         if not isinstance(self._current_window, BaseFnExecuteWindow):
             self._lock.unlock()
@@ -95,7 +270,200 @@ class _Context(QObject):
         self._lock.unlock()
         return cancelled
 
+    # noinspection PyUnresolvedReferences
+    def write_output(self, msg: str, html: bool, scroll_to_bottom: bool):
+        if self._forward("write_output", msg, html, scroll_to_bottom):
+            return
+        if self._output_buffer.put(msg, html, scroll_to_bottom):
+            self.sig_output_pending.emit()
+
+    # noinspection PyUnresolvedReferences
+    def clear_output(self):
+        if self._forward("clear_output"):
+            return
+        # pending log records will be cleared from the log view anyway
+        self._log_buffer.discard()
+        if self._output_buffer.clear():
+            self.sig_output_pending.emit()
+
+    @property
+    def log_view_enabled(self) -> bool:
+        return self._log_view_enabled
+
+    # noinspection PyUnresolvedReferences
+    def write_log(self, level: int, msg: str, color: str):
+        if self._forward("write_log", level, msg, color):
+            return
+        if self._log_buffer.put((time.time(), level, msg, color)):
+            self.sig_output_pending.emit()
+
+    def flush_output(self):
+        self._output_flush_timer.stop()
+        while not (
+            self._output_buffer.is_empty()
+            and self._log_buffer.is_empty()
+            and self._stream_counter.is_empty()
+        ):
+            self._flush_output()
+        self._output_flush_timer.stop()
+
+    # noinspection PyUnresolvedReferences
+    def yield_result(self, item: Any):
+        if self._forward("yield_result", item):
+            return
+        # the item is formatted right away in the calling thread, so that it is printed in order with uprint() calls
+        win = self._current_window
+        if isinstance(win, BaseFnExecuteWindow):
+            text = win.format_stream_item(item)
+        else:
+            text = f"{item}\n"
+        if text is not None:
+            self.write_output(text, False, True)
+        if self._stream_counter.put(1):
+            self.sig_output_pending.emit()
+
+    # noinspection PyUnresolvedReferences
+    def update_progressbar(self, value: int, info: Optional[str]):
+        if self._forward("update_progressbar", value, info):
+            return
+        if self._progressbar_buffer.put(value, info):
+            self.sig_progress_pending.emit()
+
+    # noinspection PyUnresolvedReferences
+    def update_progress_dialog(self, value: int, info: Optional[str]):
+        if self._forward("update_progress_dialog", value, info):
+            return
+        if self._progress_dialog_buffer.put(value, info):
+            self.sig_progress_pending.emit()
+
+    def flush_progress(self):
+        self._progress_flush_timer.stop()
+        self._flush_progress()
+
+    def take_execution_stats(self) -> Tuple[int, int, int]:
+        """
+        返回自上次调用以来的输出次数、输出字符数和进度更新次数，并将其清零。
+        """
+        output_writes, output_chars = self._output_buffer.take_stats()
+        progress_updates = (
+            self._progressbar_buffer.take_stats()
+            + self._progress_dialog_buffer.take_stats()
+        )
+        return output_writes, output_chars, progress_updates
+
+    def set_output_capture_limit(self, limit: int):
+        """
+        设置每次执行要保留副本的输出字符数，小于等于0时表示不保留。
+        """
+        self._output_buffer.set_capture_limit(limit)
+
+    def take_captured_output(self) -> Tuple[List[Tuple[str, bool]], bool]:
+        """
+        返回自上次调用以来保留的输出副本（`(text, html)`的列表）以及输出是否被截断，并将其清空。
+        """
+        return self._output_buffer.take_captured()
+
+    def attach_remote(self, remote: "RemoteChannel", log_view_enabled: bool):
+        """
+        进入“远程”模式，此后的输出、进度、对话框等调用都将通过`remote`转发给GUI进程处理。仅在执行函数的工作进程中调用。
+        """
+        self._remote = remote
+        self._log_view_enabled = log_view_enabled
+
+    def dispatch_remote_call(self, name: str, args: tuple):
+        """
+        在GUI进程中执行由工作进程转发过来的调用。
+        """
+        handler = self._call_handlers.get(name, None)
+        if handler is None:
+            warnings.warn(f"unknown remote call: {name}")
+            return
+        if self._profiler is None:
+            handler(*args)
+            return
+        start = time.perf_counter()
+        try:
+            handler(*args)
+        finally:
+            # time spent in the pipe is unknown
+            self._profiler.record(f"remote.{name}", None, time.perf_counter() - start)
+
+    def dispatch_remote_request(self, name: str, args: tuple) -> Any:
+        """
+        在GUI进程中执行由工作进程转发过来的、需要返回结果的调用，并返回其结果。
+        """
+        handler = self._request_handlers.get(name, None)
+        if handler is None:
+            raise RuntimeError(f"unknown remote request: {name}")
+        if self._profiler is None:
+            return handler(*args)
+        start = time.perf_counter()
+        try:
+            return handler(*args)
+        finally:
+            self._profiler.record(f"remote.{name}", None, time.perf_counter() - start)
+
+    def request(self, name: str, *args, timeout: Optional[float] = None) -> Any:
+        """
+        在GUI线程中执行一个需要返回结果的调用（如弹出对话框、获取用户输入、访问剪贴板等），阻塞等待并返回其结果。
+        处于“远程”模式时，调用将被转发给GUI进程处理。
+        """
+        if self._remote is not None:
+            return self._remote.request(name, args)
+        return self._bridge.call(self._request_handlers[name], *args, timeout=timeout)
+
+    def call_in_gui(
+        self, fn: Callable[..., Any], *args, timeout: Optional[float] = None
+    ) -> Any:
+        if self._remote is not None:
+            return self._remote.request("call_many", ([(fn, args)],))[0]
+        return self._bridge.call(fn, *args, timeout=timeout)
+
+    def call_many_in_gui(
+        self,
+        calls: Sequence[Tuple[Callable[..., Any], tuple]],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        if self._remote is not None:
+            return self._remote.request("call_many", (list(calls),))
+        return self._bridge.call_many(calls, timeout=timeout)
+
+    def _remote_call_handlers(self) -> Dict[str, Callable[..., None]]:
+        # noinspection PyUnresolvedReferences
+        return {
+            "write_output": self.write_output,
+            "clear_output": self.clear_output,
+            "write_log": self.write_log,
+            "yield_result": self.yield_result,
+            "update_progressbar": self.update_progressbar,
+            "update_progress_dialog": self.update_progress_dialog,
+            "show_progressbar": self._on_show_progressbar,
+            "hide_progressbar": self._on_hide_progressbar,
+            "show_progress_dialog": self._on_show_progress_dialog,
+            "dismiss_progress_dialog": self._on_dismiss_progress_dialog,
+            "highlight_parameter": self._on_highlight_parameter,
+            "show_toast": self.sig_show_toast.emit,
+            "clear_toasts": self.sig_clear_toasts.emit,
+        }
+
+    def _remote_request_handlers(self) -> Dict[str, Callable[..., Any]]:
+        return {
+            "show_messagebox": self._show_messagebox,
+            "show_custom_dialog": self._show_custom_dialog,
+            "get_input": self._get_input,
+            "clipboard_operation": self._clipboard_operation,
+            "call_many": self._call_many,
+        }
+
+    def _forward(self, name: str, *args) -> bool:
+        if self._remote is None:
+            return False
+        self._remote.send(name, args)
+        return True
+
     def reset(self):
+        self._discard_output()
+        self._discard_progress()
         self._try_cleanup_old_window()
 
     def _try_cleanup_old_window(self):
@@ -112,13 +480,52 @@ class _Context(QObject):
         if not isinstance(window, BaseFnExecuteWindow):
             raise TypeError(f"FnExecuteWindow expected, got {type(window)}")
         self._try_cleanup_old_window()
+        self._discard_output()
+        self._discard_progress()
         self._current_window = window
+        self._log_view_enabled = window.is_log_view_enabled()
 
     def _on_current_window_destroyed(self):
+        self._discard_output()
+        self._discard_progress()
+        self._log_view_enabled = False
         self._current_window.deleteLater()
         self._current_window = None
 
+    def _discard_output(self):
+        self._output_flush_timer.stop()
+        self._output_buffer.discard()
+        self._log_buffer.discard()
+        self._stream_counter.discard()
+
+    def _discard_progress(self):
+        self._progress_flush_timer.stop()
+        self._progressbar_buffer.discard()
+        self._progress_dialog_buffer.discard()
+
+    def _on_progress_pending(self):
+        if self._progress_flush_timer.isActive():
+            return
+        win = self.current_window
+        if isinstance(win, BaseFnExecuteWindow):
+            interval = win.progress_update_interval
+        else:
+            interval = 0
+        self._progress_flush_timer.start(max(interval, 0))
+
+    def _flush_progress(self):
+        # only the latest value of each progress widget is delivered, no matter how many times
+        # update_progress() or update_progress_dialog() was called during the interval
+        pending, value, info = self._progressbar_buffer.take()
+        if pending:
+            self._on_update_progressbar(value, info)
+        pending, value, info = self._progress_dialog_buffer.take()
+        if pending:
+            self._on_update_progress_dialog(value, info)
+
     def _on_uprint(self, msg: str, html: bool, scroll_to_bottom: bool):
+        if self._forward("write_output", msg, html, scroll_to_bottom):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
@@ -127,57 +534,115 @@ class _Context(QObject):
         win.append_output(msg, html, scroll_to_bottom)
 
     def _on_clear_output(self):
+        if self._forward("clear_output"):
+            return
         wind = self.current_window
         if not isinstance(wind, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             return
         wind.clear_output()
 
-    def _on_show_messagebox(self, future: Future, kwargs: Dict[str, Any]):
+    def _on_output_pending(self):
+        if self._output_flush_timer.isActive():
+            return
+        win = self.current_window
+        if isinstance(win, BaseFnExecuteWindow):
+            interval = win.output_browser_config.flush_interval
+        else:
+            interval = 0
+        self._output_flush_timer.start(max(interval, 0))
+
+    def _flush_output(self):
+        win = self.current_window
+        if isinstance(win, BaseFnExecuteWindow):
+            max_batch_size = win.output_browser_config.max_batch_size
+        else:
+            max_batch_size = 0
+        cleared, batches, has_more = self._output_buffer.take(max_batch_size)
+        log_records = self._log_buffer.take()
+        stream_count = self._stream_counter.take()
+        if not isinstance(win, BaseFnExecuteWindow):
+            if batches or log_records:
+                warnings.warn("current_window is None")
+            for msg, _, _ in batches:
+                print(msg)
+            for _, _, msg, _ in log_records:
+                print(msg)
+            return
+        if cleared:
+            win.clear_output()
+        for msg, html, scroll_to_bottom in batches:
+            win.append_output(msg, html, scroll_to_bottom)
+        if log_records:
+            win.append_logs(log_records)
+        if stream_count:
+            win.on_stream_items(stream_count)
+        if has_more:
+            self._output_flush_timer.start(
+                max(win.output_browser_config.flush_interval, 0)
+            )
+
+    # the request handlers below are called in the GUI thread, by the bridge channel or by the
+    # executor that received the request from a worker process
+
+    def _show_messagebox(self, kwargs: Dict[str, Any]) -> Any:
+        self.flush_output()
+        self.flush_progress()
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             win = None
-        ret = show_messagebox(win, **kwargs)
-        future.set_result(ret)
+        return show_messagebox(win, **kwargs)
 
-    def _on_show_custom_dialog(
-        self,
-        future: Future,
-        dialog_class: Type[BaseCustomDialog],
-        kwargs: Dict[str, Any],
-    ):
+    def _show_custom_dialog(
+        self, dialog_class: Type[BaseCustomDialog], kwargs: Dict[str, Any]
+    ) -> Any:
+        self.flush_output()
+        self.flush_progress()
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             win = None
-        # dialog = dialog_class.new_instance(win, **kwargs)
-        # ret_code = dialog.exec_()
-        # result = dialog.get_result()
-        # dialog.deleteLater()
-        # future.set_result((ret_code, result))
-        result = dialog_class.show_and_get_result(win, **kwargs)
-        future.set_result(result)
-
-    def _on_get_input(
-        self, future: Future, get_input_impl: Callable[[BaseFnExecuteWindow], Any]
-    ):
+        return dialog_class.show_and_get_result(win, **kwargs)
+
+    def _get_input(self, get_input_impl: Callable[[BaseFnExecuteWindow], Any]) -> Any:
+        self.flush_output()
+        self.flush_progress()
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             win = None
-        result = get_input_impl(win)
-        future.set_result(result)
+        return get_input_impl(win)
+
+    def _clipboard_operation(self, operation: int, data: object) -> Any:
+        win = self.current_window
+        if not isinstance(win, BaseFnExecuteWindow):
+            raise RuntimeError("current_window is None")
+        return win.clipboard_operation(operation, data)
+
+    def _call_many(self, calls: List[Tuple[Callable[..., Any], tuple]]) -> List[Any]:
+        # output written before the calls should be visible when they run
+        self.flush_output()
+        self.flush_progress()
+        return [fn(*args) for fn, args in calls]
 
     def _on_show_progressbar(self, config: dict):
+        if self._forward("show_progressbar", config):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             win = None
         win.update_progressbar_config(config)
         win.show_progressbar()
+        # the signal is queued while update_progress() writes to the buffer right away, so the buffered value
+        # may be one set after show_progressbar() and must be applied to the new progress bar
+        self.flush_progress()
 
     def _on_hide_progressbar(self):
+        if self._forward("hide_progressbar"):
+            return
+        self.flush_progress()
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
@@ -186,20 +651,17 @@ class _Context(QObject):
         win.hide_progressbar()
 
     def _on_update_progressbar(self, progress: int, msg: str):
+        if self._forward("update_progressbar", progress, msg):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             win = None
         win.update_progress(progress, msg)
 
-    def _on_clipboard_operation(self, future: Future, operation: int, data: object):
-        win = self.current_window
-        if not isinstance(win, BaseFnExecuteWindow):
-            warnings.warn("current_window is None")
-            return
-        win.on_clipboard_operation(future, operation, data)
-
     def _on_highlight_parameter(self, parameter_name: str):
+        if self._forward("highlight_parameter", parameter_name):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
@@ -207,13 +669,20 @@ class _Context(QObject):
         win.scroll_to_parameter(parameter_name, highlight_effect=True)
 
     def _on_show_progress_dialog(self, config: Dict[str, Any]):
+        if self._forward("show_progress_dialog", config):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
             return
         win.show_progress_dialog(config)
+        # same as _on_show_progressbar(), the buffered value may belong to the new dialog
+        self.flush_progress()
 
     def _on_dismiss_progress_dialog(self):
+        if self._forward("dismiss_progress_dialog"):
+            return
+        self.flush_progress()
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
@@ -221,6 +690,8 @@ class _Context(QObject):
         win.dismiss_progress_dialog()
 
     def _on_update_progress_dialog(self, progress: int, info: str):
+        if self._forward("update_progress_dialog", progress, info):
+            return
         win = self.current_window
         if not isinstance(win, BaseFnExecuteWindow):
             warnings.warn("current_window is None")
@@ -253,11 +724,207 @@ def _current_window_destroyed():
     _context.sig_current_window_destroyed.emit()
 
 
+def _flush_output():
+    global _context
+    _context.flush_output()
+
+
+def _flush_progress():
+    global _context
+    _context.flush_progress()
+
+
+def _set_signal_profiling_enabled(enabled: bool):
+    global _context
+    _context.set_signal_profiling_enabled(enabled)
+
+
+def _begin_signal_profile(fn_name: str):
+    global _context
+    _context.begin_signal_profile(fn_name)
+
+
+def _end_signal_profile() -> Optional[ExecutionProfile]:
+    global _context
+    return _context.end_signal_profile()
+
+
+def _take_execution_stats() -> Tuple[int, int, int]:
+    global _context
+    return _context.take_execution_stats()
+
+
+def _set_output_capture_limit(limit: int):
+    global _context
+    _context.set_output_capture_limit(limit)
+
+
+def _take_captured_output() -> Tuple[List[Tuple[str, bool]], bool]:
+    global _context
+    return _context.take_captured_output()
+
+
+def _set_stall_watchdog(watchdog: Optional[StallWatchdog]):
+    global _context
+    _context.stall_watchdog = watchdog
+
+
+def _get_stall_watchdog() -> Optional[StallWatchdog]:
+    global _context
+    return _context.stall_watchdog
+
+
+def _consume_stream(stream: Generator[Any, Any, Any]) -> int:
+    # the items of a generator function are forwarded to the window one by one and never collected,
+    # the number of items becomes the result of the function
+    token = get_current_token()
+    count = 0
+    try:
+        for item in stream:
+            _context.yield_result(item)
+            count += 1
+            item = None
+            if token is not None and token.is_cancelled():
+                raise FunctionCancelledError()
+    finally:
+        stream.close()
+    return count
+
+
+async def _consume_async_stream(stream: AsyncGenerator[Any, Any]) -> int:
+    token = get_current_token()
+    count = 0
+    try:
+        async for item in stream:
+            _context.yield_result(item)
+            count += 1
+            item = None
+            if token is not None and token.is_cancelled():
+                raise FunctionCancelledError()
+    finally:
+        await stream.aclose()
+    return count
+
+
 def get_current_window() -> Optional[BaseFnExecuteWindow]:
     global _context
     return _context.current_window
 
 
+def get_cancellation_token() -> CancellationToken:
+    """
+    获取当前执行对应的取消令牌。建议在函数开始时获取一次，之后在循环中调用`token.is_cancelled()`或`token.raise_if_cancelled()`，
+    它们不需要加锁，开销远小于`is_function_cancelled()`。也可以通过`token.add_callback()`注册回调函数，在取消请求发出时中断阻塞的I/O操作。
+
+    不在函数执行期间调用时，将返回一个永远不会被取消的令牌。
+
+    Returns:
+        取消令牌
+    """
+    global _context
+    token = _context.get_cancellation_token()
+    if token is None:
+        return CancellationToken()
+    return token
+
+
+def call_in_gui(fn: Callable[..., Any], *args, timeout: Optional[float] = None) -> Any:
+    """
+    在GUI线程中调用`fn(*args)`，阻塞等待并返回其返回值，`fn`引发的异常将在当前线程中重新引发。在GUI线程中调用时，`fn`将被直接调用。
+
+    需要依次执行多个调用时，应使用`call_many_in_gui()`，它只需要与GUI线程往返一次。
+
+    使用`ProcessFunctionExecutor`等进程执行器时，`fn`、参数和返回值都必须是可以被`pickle`的对象，此时`timeout`将被忽略。
+
+    Args:
+        fn: 要调用的函数
+        *args: 参数
+        timeout: 超时时间（秒），为`None`时一直等待。超时后将引发`TimeoutError`。
+
+    Returns:
+        `fn`的返回值
+    """
+    global _context
+    return _context.call_in_gui(fn, *args, timeout=timeout)
+
+
+def call_many_in_gui(
+    calls: Sequence[Tuple[Callable[..., Any], tuple]], timeout: Optional[float] = None
+) -> List[Any]:
+    """
+    在一次往返中，于GUI线程中依次执行多个调用，并返回它们的返回值列表。若某个调用引发了异常，其后的调用将不再执行，
+    该异常将在当前线程中重新引发。
+
+    ```python
+    from pyguiadapter.adapter import ucontext
+
+    def foo():
+        win = ucontext.get_current_window()
+        title, size = ucontext.call_many_in_gui([(win.windowTitle, ()), (win.size, ())])
+    ```
+
+    Args:
+        calls: 调用列表，每个元素为`(fn, args)`
+        timeout: 超时时间（秒），为`None`时一直等待。超时后将引发`TimeoutError`。
+
+    Returns:
+        各调用的返回值
+    """
+    global _context
+    return _context.call_many_in_gui(calls, timeout=timeout)
+
+
+def get_signal_profiles() -> List[Dict[str, Any]]:
+    """
+    获取最近各次执行的信号流量统计（最多50次），未启用信号流量分析（见`FnExecuteWindowConfig.signal_profiling`）时返回空列表。
+
+    每次执行的统计为一个字典，其中`signals`字段以信号、请求（`request.*`）或工作进程转发的调用（`remote.*`）的名称为键，
+    值包括发射次数（`emitted`）、处理次数（`handled`）、排队延迟（`latency_mean`、`latency_max`）和处理耗时（`handler_total`、
+    `handler_mean`、`handler_max`），时间单位均为秒。
+
+    Returns:
+        各次执行的统计，按时间先后排列
+    """
+    global _context
+    profiler = _context.signal_profiler
+    if profiler is None:
+        return []
+    return [profile.to_dict() for profile in profiler.profiles()]
+
+
+def dump_signal_profiles(filename: str) -> None:
+    """
+    将`get_signal_profiles()`的结果以JSON格式写入文件。
+
+    Args:
+        filename: 文件路径
+
+    Returns:
+        无返回值
+    """
+    global _context
+    profiler = _context.signal_profiler
+    if profiler is not None:
+        profiler.dump(filename)
+        return
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("[]")
+
+
+def get_stall_reports() -> List[StallReport]:
+    """
+    获取GUI线程卡顿监视器生成的报告，未启用卡顿监视器（见`GUIAdapter`的`stall_watchdog`参数）时返回空列表。
+
+    Returns:
+        卡顿报告，按时间先后排列
+    """
+    global _context
+    watchdog = _context.stall_watchdog
+    if watchdog is None:
+        return []
+    return watchdog.reports()
+
+
 def is_function_cancelled() -> bool:
     """检测函数是否被用户取消。
 
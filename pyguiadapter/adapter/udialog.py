@@ -6,7 +6,6 @@
 @Desc    : 提供对话框相关的功能
 """
 
-from concurrent.futures import Future
 from typing import Any, Literal, Tuple, Type, Optional, Union
 
 from qtpy.QtGui import QPixmap
@@ -39,10 +38,7 @@ def show_custom_dialog(dialog_class: Type[BaseCustomDialog], **kwargs) -> Any:
     Returns:
         返回自定义对话框`show_and_get_result()`函数的返回值。
     """
-    result_future = Future()
-    # noinspection PyUnresolvedReferences
-    _context.sig_show_custom_dialog.emit(result_future, dialog_class, kwargs)
-    return result_future.result()
+    return _context.request("show_custom_dialog", dialog_class, kwargs)
 
 
 def _show_messagebox(
@@ -53,8 +49,6 @@ def _show_messagebox(
     default_button: Union[StandardButton, int] = NoButton,
     **kwargs,
 ) -> Union[int, StandardButton]:
-    result_future = Future()
-    # noinspection PyUnresolvedReferences
     args = dict(
         text=text,
         title=title,
@@ -63,8 +57,7 @@ def _show_messagebox(
         default_button=default_button,
         **kwargs,
     )
-    _context.sig_show_messagebox.emit(result_future, args)
-    return result_future.result()
+    return _context.request("show_messagebox", args)
 
 
 def show_info_messagebox(
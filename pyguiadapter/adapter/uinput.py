@@ -6,7 +6,6 @@
 @Desc    : 提供输入框相关的功能
 """
 
-from concurrent.futures import Future
 from typing import (
     List,
     Tuple,
@@ -29,10 +28,7 @@ from ..windows.fnexec import FnExecuteWindow
 
 
 def _get_input(get_input_impl: Callable[[FnExecuteWindow], Any]) -> Any:
-    result_future = Future()
-    # noinspection PyUnresolvedReferences
-    _context.sig_get_input.emit(result_future, get_input_impl)
-    return result_future.result()
+    return _context.request("get_input", get_input_impl)
 
 
 def get_string(
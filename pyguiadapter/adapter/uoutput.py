@@ -17,6 +17,13 @@ from ..constants.color import (
     COLOR_FATAL,
     COLOR_CRITICAL,
 )
+from ..constants.log import (
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_INFO,
+    LOG_LEVEL_WARNING,
+    LOG_LEVEL_CRITICAL,
+    LOG_LEVEL_FATAL,
+)
 from ..utils import io, to_base64
 from . import ucontext
 
@@ -45,8 +52,10 @@ def uprint(
 
     """
     text = sep.join([str(arg) for arg in args]) + end
-    # noinspection PyUnresolvedReferences,PyProtectedMember
-    ucontext._context.sig_uprint.emit(text, html, scroll_to_bottom)
+    # the text is written to the output buffer first, and then it will be flushed to the output browser
+    # in batches, so that a function printing lots of messages won't flood the event loop of the GUI thread
+    # noinspection PyProtectedMember
+    ucontext._context.write_output(text, html, scroll_to_bottom)
 
 
 def clear_output() -> None:
@@ -55,8 +64,8 @@ def clear_output() -> None:
     Returns:
         无返回值
     """
-    # noinspection PyUnresolvedReferences,PyProtectedMember
-    ucontext._context.sig_clear_output.emit()
+    # noinspection PyProtectedMember
+    ucontext._context.clear_output()
 
 
 @dataclasses.dataclass
@@ -142,7 +151,7 @@ class Logger(object):
         Returns:
             无返回值
         """
-        uprint(self._message(self._config.info_color, msg), html=True)
+        self._log(LOG_LEVEL_INFO, self._config.info_color, msg)
 
     def debug(self, msg: str) -> None:
         """打印`debug`级别的消息。
@@ -153,7 +162,7 @@ class Logger(object):
         Returns:
             无返回值
         """
-        uprint(self._message(self._config.debug_color, msg), html=True)
+        self._log(LOG_LEVEL_DEBUG, self._config.debug_color, msg)
 
     def warning(self, msg: str) -> None:
         """打印`warning`级别的消息。
@@ -164,7 +173,7 @@ class Logger(object):
         Returns:
             无返回值
         """
-        uprint(self._message(self._config.warning_color, msg), html=True)
+        self._log(LOG_LEVEL_WARNING, self._config.warning_color, msg)
 
     def critical(self, msg: str) -> None:
         """打印`critical`级别的消息。
@@ -175,7 +184,7 @@ class Logger(object):
         Returns:
             无返回值
         """
-        uprint(self._message(self._config.critical_color, msg), html=True)
+        self._log(LOG_LEVEL_CRITICAL, self._config.critical_color, msg)
 
     def fatal(self, msg: str) -> None:
         """打印`fatal`级别的消息。
@@ -186,7 +195,15 @@ class Logger(object):
         Returns:
             无返回值
         """
-        uprint(self._message(self._config.fatal_color, msg), html=True)
+        self._log(LOG_LEVEL_FATAL, self._config.fatal_color, msg)
+
+    def _log(self, level: int, color: str, msg: str):
+        # noinspection PyProtectedMember
+        context = ucontext._context
+        if context.log_view_enabled:
+            context.write_log(level, str(msg), color)
+            return
+        uprint(self._message(color, msg), html=True)
 
     @staticmethod
     def _message(color: str, msg: str):
@@ -80,7 +80,7 @@ def update_progress(value: int, info: Optional[str] = None) -> None:
     Returns:
         无返回值
     """
-    _context.sig_update_progressbar.emit(value, info)
+    _context.update_progressbar(value, info)
 
 
 def show_progress_dialog(
@@ -161,4 +161,4 @@ def update_progress_dialog(value: int, info: Optional[str] = None) -> None:
     Returns:
         无返回值
     """
-    _context.sig_update_progress_dialog.emit(value, info)
+    _context.update_progress_dialog(value, info)
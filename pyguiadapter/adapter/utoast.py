@@ -18,6 +18,9 @@ from ..windows.fnexec._base import BaseFnExecuteWindow
 def _on_show_toast(
     message: str, duration: int, config: Optional[ToastConfig], clear: bool
 ) -> None:
+    # noinspection PyProtectedMember
+    if _context._forward("show_toast", message, duration, config, clear):
+        return
     wind = _context.current_window
     if not isinstance(wind, BaseFnExecuteWindow):
         return
@@ -26,6 +29,9 @@ def _on_show_toast(
 
 
 def _on_clear_toasts() -> None:
+    # noinspection PyProtectedMember
+    if _context._forward("clear_toasts"):
+        return
     wind = _context.current_window
     if not isinstance(wind, BaseFnExecuteWindow):
         return
@@ -33,8 +39,10 @@ def _on_clear_toasts() -> None:
     wind = None
 
 
-_context.sig_show_toast.connect(_on_show_toast)
-_context.sig_clear_toasts.connect(_on_clear_toasts)
+# noinspection PyProtectedMember
+_context._add_signal_handler("sig_show_toast", _on_show_toast)
+# noinspection PyProtectedMember
+_context._add_signal_handler("sig_clear_toasts", _on_clear_toasts)
 
 
 def show_toast(
@@ -7,7 +7,7 @@
 """
 
 import dataclasses
-from typing import Type, Tuple, Dict, Optional, List, Union
+from typing import Type, Tuple, Dict, Optional, List, Union, Callable
 
 from .action import Separator
 from .fn import FnInfo
@@ -28,3 +28,25 @@ class FnBundle(object):
     window_listener: Optional[BaseWindowEventListener]
     window_toolbar: Optional[ToolBar]
     window_menus: Optional[List[Union[Menu, Separator]]]
+    resolver: Optional[
+        Callable[
+            [],
+            Tuple[
+                FnInfo,
+                Dict[str, Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig]],
+            ],
+        ]
+    ] = None
+
+    @property
+    def resolved(self) -> bool:
+        return self.resolver is None
+
+    def resolve(self):
+        """
+        解析延迟注册的函数，得到完整的`fn_info`和`widget_configs`，对于已解析的函数什么也不做。解析失败时异常将被抛出，下次调用时将再次尝试解析。
+        """
+        if self.resolver is None:
+            return
+        self.fn_info, self.widget_configs = self.resolver()
+        self.resolver = None
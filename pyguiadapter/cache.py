@@ -0,0 +1,335 @@
+"""
+@Time    : 2026.10.17
+@File    : cache.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 函数执行结果的缓存（记忆化）。对于确定性的、耗时的函数，以相同的参数再次执行时可以直接重放缓存的结果和输出。
+"""
+
+import dataclasses
+import enum
+import hashlib
+import os
+import pickle
+import time
+import warnings
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .extend_types import (
+    file_t,
+    files_t,
+    directory_t,
+    path_list_t,
+    file_list_t,
+    dir_list_t,
+    paths_t,
+)
+
+# parameters of these types are paths, a cache key made of them includes the mtime and size of the files
+PATH_TYPES = (
+    file_t,
+    files_t,
+    directory_t,
+    path_list_t,
+    file_list_t,
+    dir_list_t,
+    paths_t,
+)
+
+_DISK_SUFFIX = ".pickle"
+
+
+@dataclasses.dataclass(frozen=True)
+class ResultCacheConfig(object):
+    """
+    结果缓存的配置。
+    """
+
+    max_entries: int = 128
+    """内存中最多缓存的结果数，超出时淘汰最久未使用的结果（LRU）。"""
+
+    ttl: Optional[float] = None
+    """缓存结果的有效期（秒），为`None`时永不过期。"""
+
+    disk_dir: Optional[str] = None
+    """磁盘缓存的目录，为`None`时不使用磁盘缓存。启用后，结果还将以`pickle`的形式保存在该目录下，程序重启后依然有效，
+    内存中未命中时将从磁盘中查找。注意：`pickle`文件在加载时可以执行任意代码，请确保该目录不会被他人写入。"""
+
+    max_disk_entries: int = 1024
+    """磁盘中最多缓存的结果数，超出时删除最早写入的结果。"""
+
+    max_output_chars: int = 1_000_000
+    """与结果一起缓存的输出的最大字符数。输出超过该长度的执行将不会被缓存，因为无法完整地重放其输出。"""
+
+    file_stamps: bool = True
+    """是否将路径类型（`file_t`、`directory_t`、`files_t`等）参数所指文件的修改时间和大小计入缓存键。启用后，文件被修改后将不会命中缓存。
+    注意：对于目录，只考虑目录本身的修改时间，目录中已有文件的内容被修改时不会改变目录的修改时间。"""
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry(object):
+    """
+    一条缓存的执行结果。
+    """
+
+    result: Any
+    """函数的返回值。"""
+
+    output: Tuple[Tuple[str, bool], ...]
+    """执行期间输出的内容，每一项为`(text, html)`。"""
+
+    created_at: float
+    """缓存的时间（`time.time()`）。"""
+
+
+class UnstableArgumentError(TypeError):
+    """
+    参数值无法生成稳定的哈希值（例如没有自定义`__repr__()`的任意对象），此时结果不会被缓存。
+    """
+
+    pass
+
+
+def stable_hash(value: Any) -> str:
+    """
+    为参数值生成稳定的哈希值（在不同的进程、不同的运行之间保持一致）。支持`None`、数字、字符串、字节串、列表、元组、字典、集合、枚举
+    和路径，字典和集合与元素的顺序无关。其他类型的值使用`repr()`，若`repr()`中包含内存地址，则抛出`UnstableArgumentError`。
+    """
+    digest = hashlib.sha256()
+    _feed(digest, value)
+    return digest.hexdigest()
+
+
+def _feed(digest, value: Any):
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        # type names keep 1, 1.0 and True apart
+        digest.update(f"{type(value).__name__}:{value!r};".encode("utf-8"))
+    elif isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        digest.update(f"str:{len(data)}:".encode("utf-8"))
+        digest.update(data)
+    elif isinstance(value, (bytes, bytearray)):
+        digest.update(f"bytes:{len(value)}:".encode("utf-8"))
+        digest.update(value)
+    elif isinstance(value, enum.Enum):
+        cls = type(value)
+        digest.update(
+            f"enum:{cls.__module__}.{cls.__qualname__}.{value.name};".encode("utf-8")
+        )
+    elif isinstance(value, os.PathLike):
+        digest.update(b"path:")
+        _feed(digest, os.fspath(value))
+    elif isinstance(value, dict):
+        items = sorted((stable_hash(k), stable_hash(v)) for k, v in value.items())
+        digest.update(f"dict:{len(items)}:".encode("utf-8"))
+        for key_hash, value_hash in items:
+            digest.update(f"{key_hash}={value_hash};".encode("utf-8"))
+    elif isinstance(value, (set, frozenset)):
+        hashes = sorted(stable_hash(item) for item in value)
+        digest.update(f"set:{len(hashes)}:{','.join(hashes)};".encode("utf-8"))
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}:{len(value)}:".encode("utf-8"))
+        for item in value:
+            _feed(digest, item)
+    else:
+        text = repr(value)
+        if " at 0x" in text:
+            raise UnstableArgumentError(
+                f"cannot make a stable hash of {type(value).__name__} value"
+            )
+        cls = type(value)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}:".encode("utf-8"))
+        _feed(digest, text)
+
+
+def _path_stamps(value: Any) -> List[Tuple[str, int, int]]:
+    if isinstance(value, (str, os.PathLike)):
+        paths = [value]
+    elif isinstance(value, (list, tuple, set)):
+        paths = [item for item in value if isinstance(item, (str, os.PathLike))]
+    else:
+        return []
+    stamps = []
+    for path in paths:
+        path = os.fspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append((path, -1, -1))
+        else:
+            stamps.append((path, stat.st_mtime_ns, stat.st_size))
+    return stamps
+
+
+class ResultCache(object):
+    """
+    函数执行结果的缓存，包括一个LRU的内存缓存以及一个可选的磁盘缓存。所有方法都应在GUI线程中调用。
+
+    Args:
+        fn_key: 函数的标识，参见`pyguiadapter.history.function_key()`
+        config: 缓存配置
+        path_parameters: 路径类型参数的名称
+    """
+
+    def __init__(
+        self,
+        fn_key: str,
+        config: ResultCacheConfig,
+        path_parameters: Iterable[str] = (),
+    ):
+        self._fn_key = fn_key
+        self._config = config
+        self._path_parameters = frozenset(path_parameters)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._disk_dir: Optional[str] = None
+        if config.disk_dir:
+            fn_dir = hashlib.sha256(fn_key.encode("utf-8")).hexdigest()[:32]
+            self._disk_dir = os.path.join(config.disk_dir, fn_dir)
+
+    @property
+    def config(self) -> ResultCacheConfig:
+        return self._config
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def make_key(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """
+        为一组参数生成缓存键，参数无法生成稳定的哈希值时（包括`repr()`引发异常、列表引用自身等情况）返回`None`。
+        """
+        digest = hashlib.sha256()
+        _feed(digest, self._fn_key)
+        try:
+            for name in sorted(arguments.keys()):
+                value = arguments[name]
+                _feed(digest, name)
+                _feed(digest, value)
+                if self._config.file_stamps and name in self._path_parameters:
+                    _feed(digest, _path_stamps(value))
+        except Exception:
+            # UnstableArgumentError, an error raised by a __repr__() of the user, RecursionError of a
+            # self-referencing container... such arguments are just not cached
+            return None
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            if self._is_expired(entry):
+                del self._entries[key]
+                entry = None
+            else:
+                self._entries.move_to_end(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return entry
+
+    def put(self, key: str, result: Any, output: List[Tuple[str, bool]]):
+        entry = CacheEntry(result=result, output=tuple(output), created_at=time.time())
+        self._remember(key, entry)
+        self._store(key, entry)
+
+    def clear(self):
+        """
+        清空内存缓存和磁盘缓存。
+        """
+        self._entries.clear()
+        for path in self._disk_files():
+            _remove(path)
+
+    def _remember(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(self._config.max_entries, 1):
+            self._entries.popitem(last=False)
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        ttl = self._config.ttl
+        return ttl is not None and time.time() - entry.created_at > ttl
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self._disk_dir, key + _DISK_SUFFIX)
+
+    def _disk_files(self) -> List[str]:
+        if self._disk_dir is None:
+            return []
+        try:
+            names = os.listdir(self._disk_dir)
+        except OSError:
+            return []
+        return [
+            os.path.join(self._disk_dir, name)
+            for name in names
+            if name.endswith(_DISK_SUFFIX)
+        ]
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        if self._disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            warnings.warn(f"failed to load cached result {path}: {e}")
+            _remove(path)
+            return None
+        if not isinstance(entry, CacheEntry) or self._is_expired(entry):
+            _remove(path)
+            return None
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry):
+        if self._disk_dir is None:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._disk_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # results that can't be pickled stay in the memory cache only
+            warnings.warn(f"failed to write cached result to disk: {e}")
+            _remove(tmp_path)
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        files = self._disk_files()
+        excess = len(files) - max(self._config.max_disk_entries, 1)
+        if excess <= 0:
+            return
+        stamped = []
+        for path in files:
+            try:
+                stamped.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        stamped.sort()
+        for _, path in stamped[:excess]:
+            _remove(path)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
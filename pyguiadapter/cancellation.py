@@ -0,0 +1,186 @@
+"""
+@Time    : 2026.10.17
+@File    : cancellation.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 定义了协作式取消令牌CancellationToken。
+"""
+
+import threading
+import traceback
+from typing import Callable, List, Optional
+
+from .exceptions import FunctionCancelledError
+
+CancelCallback = Callable[[], None]
+
+# interval (in seconds) at which the watcher thread polls an event set by another process
+_WATCH_INTERVAL = 0.05
+
+_local = threading.local()
+
+
+class CancellationToken(object):
+    """
+    协作式取消令牌。每次执行函数时，执行器都会创建一个新的令牌，当用户请求取消函数的执行时，令牌将被置为“已取消”状态。
+
+    令牌基于`threading.Event`实现，`is_cancelled()`和`raise_if_cancelled()`不需要加锁，适合在紧凑的循环中频繁调用。
+    在函数中，可以通过`ucontext.get_cancellation_token()`获取当前执行对应的令牌：
+
+    ```python
+    from pyguiadapter.adapter import ucontext
+
+    def foo(files: list):
+        token = ucontext.get_cancellation_token()
+        for file in files:
+            token.raise_if_cancelled()
+            process(file)
+    ```
+
+    对于阻塞式的I/O操作，可以通过`add_callback()`注册回调函数，在取消请求发出时关闭连接或文件等，从而尽早地中断阻塞的调用。
+    """
+
+    __slots__ = ("_event", "_callbacks", "_lock", "_watched", "_watcher", "__weakref__")
+
+    def __init__(self, event: Optional[threading.Event] = None, watched: bool = False):
+        """
+        Args:
+            event: 令牌所基于的事件对象，可以为`threading.Event`或`multiprocessing.Event`。为`None`时创建一个新的`threading.Event`。
+            watched: 事件是否会在其他进程中被直接设置（而不是通过`cancel()`）。为`True`时，注册回调函数后将启动一个后台线程监视事件。
+        """
+        self._event = event if event is not None else threading.Event()
+        self._callbacks: List[CancelCallback] = []
+        self._lock = threading.Lock()
+        self._watched = watched
+        self._watcher: Optional[threading.Thread] = None
+
+    def is_cancelled(self) -> bool:
+        """
+        是否已请求取消。
+
+        Returns:
+            已请求取消时返回`True`，否则返回`False`
+        """
+        return self._event.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        同`is_cancelled()`。
+        """
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        若已请求取消，则引发`FunctionCancelledError`异常。该异常不会被视为函数的错误，窗口只会提示函数已被取消。
+
+        Returns:
+            无返回值
+        """
+        if self._event.is_set():
+            raise FunctionCancelledError()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        阻塞等待取消请求，可用来代替`time.sleep()`，以便在等待期间及时响应取消请求。
+
+        Args:
+            timeout: 超时时间（秒），为`None`时一直等待
+
+        Returns:
+            在超时前收到取消请求时返回`True`，否则返回`False`
+        """
+        return self._event.wait(timeout)
+
+    def add_callback(self, callback: CancelCallback) -> None:
+        """
+        注册回调函数，在取消请求发出时调用。若此时已请求取消，回调函数将被立即调用。
+
+        回调函数将在发出取消请求的线程（使用线程执行器时，通常为GUI线程）或后台监视线程中调用，因此不应执行耗时的操作，
+        其中引发的异常将被打印，而不会向外传播。
+
+        Args:
+            callback: 回调函数，不接受任何参数
+
+        Returns:
+            无返回值
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                if self._watched and self._watcher is None:
+                    self._start_watcher()
+                return
+        _invoke(callback)
+
+    def remove_callback(self, callback: CancelCallback) -> None:
+        """
+        移除已注册的回调函数。
+
+        Args:
+            callback: 回调函数
+
+        Returns:
+            无返回值
+        """
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def cancel(self) -> None:
+        """
+        请求取消，并调用已注册的回调函数。由函数执行器调用。
+
+        Returns:
+            无返回值
+        """
+        self._event.set()
+        self._fire()
+
+    def _fire(self):
+        with self._lock:
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            _invoke(callback)
+
+    def _start_watcher(self):
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+
+    def _watch(self):
+        event = self._event
+        while self._watched:
+            if event.wait(_WATCH_INTERVAL):
+                self._fire()
+                return
+
+    def _detach(self):
+        # the event of a process worker is reused by its next job, so when a job is done its token keeps
+        # its final state in an event of its own instead of following the shared one
+        cancelled = self._event.is_set()
+        self._watched = False
+        event = threading.Event()
+        if cancelled:
+            event.set()
+        self._event = event
+        with self._lock:
+            self._callbacks = []
+
+
+def _invoke(callback: CancelCallback):
+    try:
+        callback()
+    except BaseException:
+        traceback.print_exc()
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    """
+    获取当前线程中正在执行的函数对应的取消令牌，不在函数执行期间时返回`None`。
+    """
+    return getattr(_local, "token", None)
+
+
+def _set_current_token(token: Optional[CancellationToken]):
+    _local.token = token
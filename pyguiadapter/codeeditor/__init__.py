@@ -1,12 +1,36 @@
-from .base import (
-    LineWrapMode,
-    WordWrapMode,
-    BaseCodeEditorWindow,
-    BaseCodeFormatter,
-    create_highlighter,
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .base import (
+        LineWrapMode,
+        WordWrapMode,
+        BaseCodeEditorWindow,
+        BaseCodeFormatter,
+        create_highlighter,
+    )
+    from .editor import CodeEditorWindow, CodeEditorConfig
+    from .formatters import JsonFormatter, PythonFormatter
+
+# the code editor depends on pyqcodeeditor, its modules are imported on first access to their names
+_LAZY_ATTRS = {
+    "LineWrapMode": ".base",
+    "WordWrapMode": ".base",
+    "BaseCodeEditorWindow": ".base",
+    "BaseCodeFormatter": ".base",
+    "create_highlighter": ".base",
+    "CodeEditorWindow": ".editor",
+    "CodeEditorConfig": ".editor",
+    "JsonFormatter": ".formatters",
+    "PythonFormatter": ".formatters",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(
+    __name__,
+    _LAZY_ATTRS,
+    submodules=("actions", "base", "constants", "editor", "formatters"),
 )
-from .editor import CodeEditorWindow, CodeEditorConfig
-from .formatters import JsonFormatter, PythonFormatter
 
 __all__ = [
     "LineWrapMode",
@@ -1,13 +1,14 @@
 import warnings
 from typing import Optional
 
-from yapf.yapflib.yapf_api import FormatCode
-
 from ..base import BaseCodeFormatter
 
 
 class PythonFormatter(BaseCodeFormatter):
     def format_code(self, text: str) -> Optional[str]:
+        # yapf takes a long time to import, it is imported only when some code is to be formatted
+        from yapf.yapflib.yapf_api import FormatCode
+
         try:
             formatted, changed = FormatCode(text)
         except Exception as e:
@@ -0,0 +1,7 @@
+LOG_LEVEL_DEBUG = 0
+LOG_LEVEL_INFO = 1
+LOG_LEVEL_WARNING = 2
+LOG_LEVEL_CRITICAL = 3
+LOG_LEVEL_FATAL = 4
+
+LOG_LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "CRITICAL", "FATAL")
@@ -6,6 +6,8 @@
 @Desc    : 自定义异常类。
 """
 
+from typing import Optional
+
 
 class ParameterError(Exception):
     def __init__(self, parameter_name: str, message: str):
@@ -13,6 +15,9 @@ class ParameterError(Exception):
         self._message: str = message
         super().__init__(message)
 
+    def __reduce__(self):
+        return self.__class__, (self._parameter_name, self._message)
+
     @property
     def parameter_name(self) -> str:
         return self._parameter_name
@@ -42,6 +47,21 @@ class FunctionNotExecutingError(RuntimeError):
     pass
 
 
+class FunctionCancelledError(RuntimeError):
+    def __init__(self, message: str = "function cancelled"):
+        super().__init__(message)
+
+
+class FunctionTerminatedError(RuntimeError):
+    def __init__(self, message: str, exitcode: Optional[int] = None):
+        self._exitcode: Optional[int] = exitcode
+        super().__init__(message)
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        return self._exitcode
+
+
 class ParameterAlreadyExistError(RuntimeError):
     def __init__(self, parameter_name: str):
         self._parameter_name: str = parameter_name
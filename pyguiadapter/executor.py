@@ -11,7 +11,9 @@ from typing import Any, Dict, Optional
 
 from qtpy.QtCore import QObject
 
+from .cancellation import CancellationToken
 from .fn import FnInfo
+from .metrics import ResourceUsage
 
 
 class ExecuteStateListener(object):
@@ -65,3 +67,31 @@ class BaseFunctionExecutor(QObject):
     @abstractmethod
     def is_cancelled(self) -> bool:
         pass
+
+    @property
+    def cancellation_token(self) -> Optional[CancellationToken]:
+        """
+        当前执行对应的取消令牌，未在执行或执行器不支持时为`None`。
+        """
+        return None
+
+    @property
+    def last_resource_usage(self) -> Optional[ResourceUsage]:
+        """
+        最近一次执行的资源占用（CPU时间、内存峰值增长），在执行结束时（`on_execute_finish()`被调用前）更新。
+        执行器不支持测量时为`None`。
+        """
+        return None
+
+    @property
+    def is_concurrent(self) -> bool:
+        """
+        是否支持并发执行。支持并发执行的执行器在函数执行期间仍可接受新的执行请求，默认为`False`。
+        """
+        return False
+
+    def shutdown(self):
+        """
+        释放执行器持有的资源（例如常驻的工作线程或工作进程）。在所属窗口关闭时调用，默认实现不做任何事情。
+        """
+        pass
@@ -1,3 +1,14 @@
-from .thread import ThreadFunctionExecutor
+from .thread import ThreadFunctionExecutor, PersistentThreadFunctionExecutor
+from .process import ProcessFunctionExecutor, PersistentProcessFunctionExecutor
+from .pool import ConcurrentProcessFunctionExecutor, Job
+from .aio import AsyncioFunctionExecutor
 
-__all__ = ["ThreadFunctionExecutor"]
+__all__ = [
+    "ThreadFunctionExecutor",
+    "PersistentThreadFunctionExecutor",
+    "ProcessFunctionExecutor",
+    "PersistentProcessFunctionExecutor",
+    "ConcurrentProcessFunctionExecutor",
+    "Job",
+    "AsyncioFunctionExecutor",
+]
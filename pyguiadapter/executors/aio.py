@@ -0,0 +1,183 @@
+"""
+@Time    : 2026.10.17
+@File    : aio.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 实现了基于asyncio的函数执行器，用于执行`async def`定义的协程函数。
+"""
+
+import asyncio
+import functools
+import inspect
+import traceback
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from qtpy.QtCore import QObject, QThread, Signal
+
+from .thread import PersistentThreadFunctionExecutor
+from ..cancellation import CancellationToken, _set_current_token
+from ..exceptions import FunctionCancelledError
+from ..fn import FnInfo
+from ..metrics import ResourceUsage, UsageProbe
+
+
+class _EventLoopThread(QThread):
+    """
+    Runs an asyncio event loop forever, has the same interface as `_PersistentWorkerThread`.
+    """
+
+    sig_job_started = Signal(int)
+    sig_result_ready = Signal(int, object)
+    sig_error_raised = Signal(int, object)
+    sig_job_finished = Signal(int)
+
+    def __init__(self, parent: Optional[QObject]):
+        super().__init__(parent)
+        self._loop = asyncio.new_event_loop()
+        self._cancel_token = CancellationToken()
+        # accessed in the loop thread only
+        self._task: Optional[asyncio.Task] = None
+        self._probe: Optional[UsageProbe] = None
+        # usage of the last job, set before sig_job_finished is emitted. The CPU time is that of the
+        # loop thread while the job was running, so it includes other tasks running in the loop
+        self.resource_usage: Optional[ResourceUsage] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def cancellation_token(self) -> CancellationToken:
+        return self._cancel_token
+
+    def is_cancel_event_set(self) -> bool:
+        return self._cancel_token.is_cancelled()
+
+    def set_cancel_event(self):
+        self._cancel_token.cancel()
+        self._loop.call_soon_threadsafe(self._cancel_task)
+
+    def submit(self, job_id: int, fn_info: FnInfo, arguments: Dict[str, Any]):
+        self._cancel_token = CancellationToken()
+        self._loop.call_soon_threadsafe(
+            self._start_job,
+            job_id,
+            fn_info,
+            OrderedDict(arguments),
+            self._cancel_token,
+        )
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def run(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # tasks left behind by the functions (e.g. fire-and-forget ones) are cancelled
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self._loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            asyncio.set_event_loop(None)
+            self._loop.close()
+
+    # noinspection PyUnresolvedReferences
+    def _start_job(
+        self,
+        job_id: int,
+        fn_info: FnInfo,
+        arguments: Dict[str, Any],
+        token: CancellationToken,
+    ):
+        self.sig_job_started.emit(job_id)
+        _set_current_token(token)
+        self._probe = UsageProbe()
+        self._task = self._loop.create_task(_call_async_fn(fn_info, arguments))
+        # results are reported by a done callback, so that a task cancelled before its first step
+        # (in which case its body never runs) is reported as well
+        self._task.add_done_callback(functools.partial(self._on_task_done, job_id))
+
+    def _cancel_task(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    # noinspection PyUnresolvedReferences
+    def _on_task_done(self, job_id: int, task: asyncio.Task):
+        if self._task is task:
+            self._task = None
+            _set_current_token(None)
+            if self._probe is not None:
+                self.resource_usage = self._probe.stop()
+                self._probe = None
+        try:
+            if task.cancelled():
+                self.sig_error_raised.emit(job_id, FunctionCancelledError())
+                return
+            error = task.exception()
+            if error is not None:
+                if not isinstance(error, FunctionCancelledError):
+                    traceback.print_exception(type(error), error, error.__traceback__)
+                self.sig_error_raised.emit(job_id, error)
+            else:
+                self.sig_result_ready.emit(job_id, task.result())
+        finally:
+            task = error = None
+            self.sig_job_finished.emit(job_id)
+
+
+async def _call_async_fn(fn_info: FnInfo, arguments: Dict[str, Any]) -> Any:
+    # ucontext can't be imported at module level, because it imports this module indirectly
+    from ..adapter import ucontext
+
+    func = fn_info.fn
+    try:
+        result = func(**arguments)
+        # the items of an async generator function are streamed to the window as they are produced
+        if inspect.isasyncgen(result):
+            # noinspection PyProtectedMember
+            return await ucontext._consume_async_stream(result)
+        if inspect.isgenerator(result):
+            # noinspection PyProtectedMember
+            return ucontext._consume_stream(result)
+        # plain functions are accepted too, they are simply called in the loop thread
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    except SystemExit as e:
+        if fn_info.capture_system_exit_exception:
+            raise RuntimeError("SystemExit") from e
+        else:
+            raise e
+
+
+class AsyncioFunctionExecutor(PersistentThreadFunctionExecutor):
+    """
+    基于asyncio的函数执行器，用于执行`async def`定义的协程函数。执行器在一个常驻的工作线程中运行asyncio事件循环，
+    每次执行时，函数将作为一个`Task`在该事件循环中运行，因此函数内部可以使用`asyncio.gather()`等方式并发地执行大量I/O操作，
+    而无需为每个操作创建线程。以`GUIAdapter.add()`添加协程函数且未指定`executor`时，将默认使用该执行器。
+
+    请求取消时，除了将取消令牌置为“已取消”状态外，执行器还会调用函数对应`Task`的`cancel()`方法，函数将在下一个`await`处收到
+    `asyncio.CancelledError`。若函数未捕获该异常，本次执行将被视为已取消，窗口不会显示错误。
+
+    在协程函数中，应使用`uasync`模块中的可等待版本代替`uinput`、`udialog`中的函数，以免在等待用户输入时阻塞事件循环。
+    """
+
+    # noinspection PyUnresolvedReferences
+    def _ensure_persistent_worker(self) -> _EventLoopThread:
+        if self._persistent_worker is not None:
+            return self._persistent_worker
+        worker = _EventLoopThread(None)
+        worker.sig_job_started.connect(self._on_job_started)
+        worker.sig_result_ready.connect(self._on_job_result_ready)
+        worker.sig_error_raised.connect(self._on_job_error_raised)
+        worker.sig_job_finished.connect(self._on_job_finished)
+        worker.start()
+        self._persistent_worker = worker
+        return worker
@@ -0,0 +1,528 @@
+"""
+@Time    : 2026.10.17
+@File    : pool.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 实现了基于进程池的并发函数执行器，可同时执行多组参数。
+"""
+
+import dataclasses
+import os
+import time
+import traceback
+import warnings
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional, List, Tuple, Deque, Set, Iterable
+
+from qtpy.QtCore import QObject, Signal, QTimer
+
+from .process import (
+    _WorkerProcess,
+    _dispatch_request,
+    _MSG_STARTED,
+    _MSG_CALL,
+    _MSG_REQUEST,
+    _MSG_RESULT,
+    _MSG_ERROR,
+    _MSG_DONE,
+)
+from ..exceptions import FunctionTerminatedError, FunctionCancelledError
+from ..executor import BaseFunctionExecutor, ExecuteStateListener
+from ..fn import FnInfo
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_FINISHED = "finished"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+@dataclasses.dataclass
+class Job(object):
+    """
+    一次函数执行（作业）的状态。
+    """
+
+    job_id: int
+    """作业ID。"""
+
+    arguments: Dict[str, Any]
+    """函数参数。"""
+
+    state: str = JOB_QUEUED
+    """作业状态，可能为`queued`、`running`、`finished`、`failed`、`cancelled`。"""
+
+    result: Any = None
+    """函数的返回值。"""
+
+    error: Optional[BaseException] = None
+    """函数执行过程中引发的异常。"""
+
+    output: List[Tuple[str, bool]] = dataclasses.field(default_factory=list)
+    """函数打印的消息，格式为`(message, html)`。"""
+
+    progress_range: Tuple[int, int] = (0, 100)
+    """进度值的范围。"""
+
+    progress: Optional[int] = None
+    """当前进度值，函数未报告过进度时为`None`。"""
+
+    progress_info: Optional[str] = None
+    """当前进度的info信息。"""
+
+    item_count: int = 0
+    """生成器函数已产生的结果的数量。"""
+
+    cancel_requested: bool = False
+    """是否已请求取消该作业。"""
+
+    start_time: Optional[float] = None
+    """开始执行的时间。"""
+
+    end_time: Optional[float] = None
+    """结束执行的时间。"""
+
+    @property
+    def is_done(self) -> bool:
+        return self.state in (JOB_FINISHED, JOB_FAILED, JOB_CANCELLED)
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        if self.start_time is None:
+            return None
+        end_time = self.end_time if self.end_time is not None else time.time()
+        return end_time - self.start_time
+
+
+class ConcurrentProcessFunctionExecutor(BaseFunctionExecutor):
+    """
+    基于进程池的并发函数执行器。每次点击`执行`按钮（或调用`submit()`）都将提交一个作业，作业在有界的工作进程池中并发执行，
+    因此批量执行的吞吐量可以随CPU核心数增长。工作进程常驻，在作业之间复用。
+
+    每个作业打印的消息和进度都记录在该作业的`Job`对象中，可以在窗口的`Jobs停靠窗口`中查看，
+    而对话框、toast等调用仍将转发到窗口中。每个作业都可以单独取消，取消方式与`ProcessFunctionExecutor`相同。
+
+    对`ExecuteStateListener`而言，从提交第一个作业到所有作业执行完毕被视为一次执行：`before_execute()`和`on_execute_finish()`
+    各调用一次，而`on_execute_result()`和`on_execute_error()`将针对每个作业调用。
+
+    使用该执行器时的注意事项与`ProcessFunctionExecutor`相同。
+    """
+
+    start_method: str = "spawn"
+    """工作进程的启动方式，可选`"spawn"`、`"forkserver"`（仅Unix系统可用）。"""
+
+    terminate_timeout: int = 1000
+    """请求取消后等待作业退出的时间（毫秒），超时后执行该作业的工作进程将被强制终止。小于0时表示不强制终止。"""
+
+    max_workers: Optional[int] = None
+    """同时执行的作业的最大数量（并行度），也即工作进程的最大数量，为`None`时使用CPU核心数。可通过`set_max_workers()`在运行时修改。"""
+
+    sig_job_added = Signal(int)
+    sig_job_updated = Signal(int)
+    sig_job_output = Signal(int)
+    sig_jobs_removed = Signal()
+
+    def __init__(
+        self, parent: Optional[QObject], listener: Optional[ExecuteStateListener]
+    ):
+        super().__init__(parent, listener)
+
+        self._fn_info: Optional[FnInfo] = None
+        self._jobs: Dict[int, Job] = OrderedDict()
+        self._next_job_id: int = 0
+        self._queue: Deque[int] = deque()
+
+        self._workers: Dict[QObject, _WorkerProcess] = {}
+        self._idle_workers: List[_WorkerProcess] = []
+        self._running: Dict[_WorkerProcess, int] = {}
+
+        self._busy: bool = False
+        self._start_notified: bool = False
+        self._cancel_all_requested: bool = False
+        self._last_job: Optional[Job] = None
+
+        self._pending_messages: Deque[Tuple[_WorkerProcess, tuple]] = deque()
+        self._dispatching: bool = False
+        self._touched_jobs: Set[int] = set()
+        self._touched_outputs: Set[int] = set()
+
+    @property
+    def is_concurrent(self) -> bool:
+        return True
+
+    @property
+    def is_executing(self) -> bool:
+        return self._busy
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._busy and self._cancel_all_requested
+
+    @property
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def get_job(self, job_id: int) -> Optional[Job]:
+        return self._jobs.get(job_id, None)
+
+    def execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        self.submit(fn_info, arguments)
+
+    def submit(self, fn_info: FnInfo, arguments: Dict[str, Any]) -> int:
+        """
+        提交一个作业。
+
+        Args:
+            fn_info: 函数信息
+            arguments: 函数参数
+
+        Returns:
+            作业ID
+        """
+        return self.submit_many(fn_info, [arguments])[0]
+
+    # noinspection PyUnresolvedReferences
+    def submit_many(
+        self, fn_info: FnInfo, arguments_list: Iterable[Dict[str, Any]]
+    ) -> List[int]:
+        """
+        批量提交作业。
+
+        Args:
+            fn_info: 函数信息
+            arguments_list: 各作业的函数参数
+
+        Returns:
+            作业ID列表
+        """
+        job_ids = []
+        for arguments in arguments_list:
+            job = Job(self._next_job_id, OrderedDict(arguments))
+            self._next_job_id += 1
+            self._jobs[job.job_id] = job
+            job_ids.append(job.job_id)
+        if not job_ids:
+            return job_ids
+        self._fn_info = fn_info
+        if not self._busy:
+            self._busy = True
+            self._start_notified = False
+            self._cancel_all_requested = False
+            self._before_execute(fn_info, self._jobs[job_ids[0]].arguments)
+        for job_id in job_ids:
+            self._queue.append(job_id)
+            self.sig_job_added.emit(job_id)
+        self._schedule()
+        return job_ids
+
+    def cancel_job(self, job_id: int):
+        """
+        取消指定作业。排队中的作业将被直接移除，正在执行的作业将收到取消请求，
+        若在`terminate_timeout`毫秒内未退出，执行该作业的工作进程将被强制终止。
+
+        Args:
+            job_id: 作业ID
+
+        Returns:
+            无返回值
+        """
+        job = self._jobs.get(job_id, None)
+        if job is None or job.is_done or job.cancel_requested:
+            return
+        job.cancel_requested = True
+        if job.state == JOB_QUEUED:
+            self._queue.remove(job_id)
+            self._set_job_done(job, JOB_CANCELLED)
+            self._notify_job_updated(job_id)
+            self._check_drained()
+            return
+        worker = self._find_worker(job_id)
+        if worker is None:
+            return
+        worker.cancel_event.set()
+        self._notify_job_updated(job_id)
+        if self.terminate_timeout >= 0:
+            QTimer.singleShot(
+                self.terminate_timeout, lambda: self._terminate_job(job_id)
+            )
+
+    def try_cancel(self):
+        if not self._busy or self._cancel_all_requested:
+            return
+        self._cancel_all_requested = True
+        for job_id in list(self._queue) + list(self._running.values()):
+            self.cancel_job(job_id)
+
+    # noinspection PyUnresolvedReferences
+    def clear_finished_jobs(self):
+        """
+        移除所有已结束的作业。
+
+        Returns:
+            无返回值
+        """
+        for job_id in [job.job_id for job in self._jobs.values() if job.is_done]:
+            del self._jobs[job_id]
+        self.sig_jobs_removed.emit()
+
+    def set_max_workers(self, max_workers: Optional[int]):
+        """
+        设置同时执行的作业的最大数量（并行度）。减小并行度不会影响正在执行的作业，多余的工作进程将保持空闲。
+
+        Args:
+            max_workers: 并行度，为`None`时使用CPU核心数。
+
+        Returns:
+            无返回值
+        """
+        self.max_workers = max_workers
+        self._schedule()
+
+    def shutdown(self):
+        for worker in list(self._workers.values()):
+            self._release_worker(worker)
+
+    def _max_workers(self) -> int:
+        if self.max_workers is not None:
+            return max(self.max_workers, 1)
+        return os.cpu_count() or 1
+
+    def _find_worker(self, job_id: int) -> Optional[_WorkerProcess]:
+        for worker, running_job_id in self._running.items():
+            if running_job_id == job_id:
+                return worker
+        return None
+
+    def _terminate_job(self, job_id: int):
+        worker = self._find_worker(job_id)
+        if worker is not None:
+            worker.terminate()
+
+    def _schedule(self):
+        # the parallelism is bounded by the number of running jobs rather than the number of workers,
+        # so that it can be lowered at any time without terminating any worker
+        while self._queue and len(self._running) < self._max_workers():
+            if self._idle_workers:
+                worker = self._idle_workers.pop()
+            else:
+                try:
+                    worker = self._spawn_worker()
+                except BaseException as e:
+                    traceback.print_exc()
+                    self._fail_job(self._jobs[self._queue.popleft()], e)
+                    continue
+            job = self._jobs[self._queue.popleft()]
+            try:
+                worker.submit(
+                    self._fn_info.fn,
+                    job.arguments,
+                    self._fn_info.capture_system_exit_exception,
+                    False,
+                )
+            except BaseException as e:
+                traceback.print_exc()
+                self._idle_workers.append(worker)
+                self._fail_job(job, e)
+                continue
+            self._running[worker] = job.job_id
+        # jobs failed above are not reported by _on_messages_received() or _on_worker_exited()
+        self._flush_notifications()
+        self._check_drained()
+
+    # noinspection PyUnresolvedReferences
+    def _spawn_worker(self) -> _WorkerProcess:
+        worker = _WorkerProcess(self, self.start_method)
+        worker.reader_thread.sig_messages_received.connect(self._on_messages_received)
+        worker.reader_thread.finished.connect(self._on_worker_exited)
+        worker.reader_thread.start()
+        self._workers[worker.reader_thread] = worker
+        return worker
+
+    def _release_worker(self, worker: _WorkerProcess):
+        self._workers.pop(worker.reader_thread, None)
+        if worker in self._idle_workers:
+            self._idle_workers.remove(worker)
+        self._running.pop(worker, None)
+        worker.shutdown(max(self.terminate_timeout, 0) / 1000)
+
+    def _on_messages_received(self, messages: List[tuple]):
+        # noinspection PyProtectedMember
+        from ..adapter import ucontext
+
+        # noinspection PyProtectedMember
+        context = ucontext._context
+        worker = self._workers.get(self.sender(), None)
+        if worker is None:
+            return
+        self._pending_messages.extend((worker, message) for message in messages)
+        # messages received in the nested event loop of a modal dialog are handled after it is closed
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            while self._pending_messages:
+                worker, message = self._pending_messages.popleft()
+                self._dispatch_message(context, worker, message)
+        finally:
+            self._dispatching = False
+            self._flush_notifications()
+
+    def _dispatch_message(self, context, worker: _WorkerProcess, message: tuple):
+        job_id = self._running.get(worker, None)
+        if job_id is None:
+            return
+        job = self._jobs.get(job_id, None)
+        kind = message[0]
+        if kind == _MSG_DONE:
+            self._running.pop(worker, None)
+            self._idle_workers.append(worker)
+            if job is not None and not job.is_done:
+                self._set_job_done(job, JOB_FINISHED)
+                self._touched_jobs.add(job_id)
+            self._schedule()
+            return
+        if job is None:
+            # removed by clear_finished_jobs()
+            return
+        if kind == _MSG_STARTED:
+            job.state = JOB_RUNNING
+            job.start_time = time.time()
+            self._touched_jobs.add(job_id)
+            if not self._start_notified:
+                self._start_notified = True
+                self._on_execute_start(self._fn_info, job.arguments)
+        elif kind == _MSG_CALL:
+            self._on_job_call(context, job, message[1], message[2])
+        elif kind == _MSG_REQUEST:
+            _dispatch_request(context, worker, message[1], message[2], message[3])
+        elif kind == _MSG_RESULT:
+            job.result = message[1]
+            self._set_job_done(job, JOB_FINISHED)
+            self._touched_jobs.add(job_id)
+            self._on_execute_result(self._fn_info, job.arguments, job.result)
+        elif kind == _MSG_ERROR:
+            self._fail_job(job, message[1])
+        else:
+            warnings.warn(f"unknown message from worker process: {kind}")
+
+    def _on_job_call(self, context, job: Job, name: str, args: tuple):
+        # output and progress of a job are kept in the job, other calls go to the window as usual
+        if name == "write_output":
+            msg, html, _ = args
+            job.output.append((msg, html))
+            self._touched_outputs.add(job.job_id)
+        elif name == "clear_output":
+            job.output.clear()
+            self._touched_outputs.add(job.job_id)
+        elif name == "write_log":
+            _, msg, _ = args
+            job.output.append((msg + "\n", False))
+            self._touched_outputs.add(job.job_id)
+        elif name in ("show_progressbar", "show_progress_dialog"):
+            config = args[0]
+            job.progress_range = (config["min_value"], config["max_value"])
+            job.progress = config["min_value"]
+            job.progress_info = config.get("initial_info", None) or None
+            self._touched_jobs.add(job.job_id)
+        elif name in ("update_progressbar", "update_progress_dialog"):
+            value, info = args
+            job.progress = value
+            if info is not None:
+                job.progress_info = info
+            self._touched_jobs.add(job.job_id)
+        elif name == "yield_result":
+            (item,) = args
+            job.item_count += 1
+            win = context.current_window
+            text = win.format_stream_item(item) if win is not None else f"{item}\n"
+            if text is not None:
+                job.output.append((text, False))
+                self._touched_outputs.add(job.job_id)
+            if job.progress is not None:
+                job.progress = min(job.progress + 1, job.progress_range[1])
+            self._touched_jobs.add(job.job_id)
+        elif name in ("hide_progressbar", "dismiss_progress_dialog"):
+            pass
+        else:
+            context.dispatch_remote_call(name, args)
+
+    def _on_worker_exited(self):
+        worker = self._workers.pop(self.sender(), None)
+        if worker is None:
+            # released on purpose
+            return
+        if worker in self._idle_workers:
+            self._idle_workers.remove(worker)
+        job_id = self._running.pop(worker, None)
+        cancelled = worker.cancel_event.is_set()
+        exitcode = worker.shutdown(0)
+        job = self._jobs.get(job_id, None) if job_id is not None else None
+        if job is not None and not job.is_done:
+            if cancelled:
+                self._set_job_done(job, JOB_CANCELLED)
+                self._notify_job_updated(job.job_id)
+            else:
+                message = f"worker process exited unexpectedly (exit code: {exitcode})"
+                self._fail_job(job, FunctionTerminatedError(message, exitcode))
+                self._flush_notifications()
+        self._schedule()
+
+    def _fail_job(self, job: Job, error: BaseException):
+        job.error = error
+        # a job that stopped by raise_if_cancelled() is cancelled rather than failed
+        if isinstance(error, FunctionCancelledError):
+            self._set_job_done(job, JOB_CANCELLED)
+        else:
+            self._set_job_done(job, JOB_FAILED)
+        self._touched_jobs.add(job.job_id)
+        self._on_execute_error(self._fn_info, job.arguments, error)
+
+    def _set_job_done(self, job: Job, state: str):
+        job.state = state
+        job.end_time = time.time()
+        self._last_job = job
+
+    def _check_drained(self):
+        if not self._busy or self._queue or self._running:
+            return
+        self._busy = False
+        self._cancel_all_requested = False
+        arguments = self._last_job.arguments if self._last_job else {}
+        self._on_execute_finish(self._fn_info, arguments)
+
+    # noinspection PyUnresolvedReferences
+    def _notify_job_updated(self, job_id: int):
+        self.sig_job_updated.emit(job_id)
+
+    # noinspection PyUnresolvedReferences
+    def _flush_notifications(self):
+        touched_jobs, self._touched_jobs = self._touched_jobs, set()
+        touched_outputs, self._touched_outputs = self._touched_outputs, set()
+        for job_id in touched_jobs:
+            self.sig_job_updated.emit(job_id)
+        for job_id in touched_outputs:
+            self.sig_job_output.emit(job_id)
+
+    def _before_execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self._listener:
+            self._listener.before_execute(fn_info, arguments)
+
+    def _on_execute_error(
+        self, fn_info: FnInfo, arguments: Dict[str, Any], error: BaseException
+    ):
+        if self._listener:
+            self._listener.on_execute_error(fn_info, arguments, error)
+
+    def _on_execute_start(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self._listener:
+            self._listener.on_execute_start(fn_info, arguments)
+
+    def _on_execute_finish(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self._listener:
+            self._listener.on_execute_finish(fn_info, arguments)
+
+    def _on_execute_result(
+        self, fn_info: FnInfo, arguments: Dict[str, Any], result: Any
+    ):
+        if self._listener:
+            self._listener.on_execute_result(fn_info, arguments, result)
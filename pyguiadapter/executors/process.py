@@ -0,0 +1,617 @@
+"""
+@Time    : 2026.10.17
+@File    : process.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 实现了基于进程的函数执行器，适用于CPU密集型的函数。
+"""
+
+import functools
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import traceback
+import warnings
+from collections import OrderedDict, deque
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, List, Tuple, Deque
+
+from qtpy.QtCore import QObject, QThread, Signal, QTimer
+
+from .thread import _resolve_result
+from ..cancellation import CancellationToken, _set_current_token
+from ..exceptions import (
+    FunctionExecutingError,
+    FunctionTerminatedError,
+    FunctionCancelledError,
+)
+from ..executor import BaseFunctionExecutor, ExecuteStateListener
+from ..fn import FnInfo
+from ..metrics import ResourceUsage, UsageProbe
+
+# messages from the worker process to the GUI process
+_MSG_STARTED = "started"
+_MSG_CALL = "call"
+_MSG_REQUEST = "request"
+_MSG_RESULT = "result"
+_MSG_ERROR = "error"
+# carries the ResourceUsage of the job
+_MSG_DONE = "done"
+
+# messages from the GUI process to the worker process
+_MSG_JOB = "job"
+_MSG_RESPONSE = "response"
+
+# max number of messages delivered to the GUI thread at once
+_MAX_BATCH_SIZE = 1024
+
+
+class _WorkerChannel(object):
+    """
+    Worker side of the pipes, implements `ucontext.RemoteChannel`.
+    """
+
+    def __init__(
+        self,
+        message_conn: Connection,
+        job_conn: Connection,
+        cancel_event: threading.Event,
+    ):
+        self._message_conn = message_conn
+        self._job_conn = job_conn
+        self._cancel_event = cancel_event
+        self._lock = threading.Lock()
+        self._next_request_id = 0
+        self._current_token: Optional[CancellationToken] = None
+
+    def send(self, name: str, args: tuple) -> None:
+        try:
+            with self._lock:
+                self._message_conn.send((_MSG_CALL, name, args))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            warnings.warn(f"unable to forward {name}() to the GUI process: {e}")
+        except OSError:
+            _exit_orphaned()
+
+    def request(self, name: str, args: tuple) -> Any:
+        with self._lock:
+            request_id = self._next_request_id
+            self._next_request_id += 1
+            try:
+                self._message_conn.send((_MSG_REQUEST, request_id, name, args))
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise RuntimeError(
+                    f"{name}() is not supported in a worker process: {e}"
+                ) from e
+            except OSError:
+                _exit_orphaned()
+            while True:
+                try:
+                    message = self._job_conn.recv()
+                except (EOFError, OSError):
+                    _exit_orphaned()
+                # the GUI process sends nothing but responses while a job is running
+                _, response_id, ok, value = message
+                if response_id == request_id:
+                    break
+        if not ok:
+            raise value
+        return value
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancellation_token(self) -> Optional[CancellationToken]:
+        return self._current_token
+
+    def run_job(self, fn, arguments: Dict[str, Any], capture_system_exit_exception):
+        # the cancel event is set by the GUI process directly, so callbacks of the token are fired by a watcher
+        token = CancellationToken(self._cancel_event, watched=True)
+        self._current_token = token
+        _set_current_token(token)
+        self._send_message((_MSG_STARTED,))
+        # the whole worker process is dedicated to the function, so its CPU time is measured
+        probe = UsageProbe(time.process_time)
+        try:
+            try:
+                result = _resolve_result(fn(**arguments))
+            except SystemExit as e:
+                if capture_system_exit_exception:
+                    raise RuntimeError("SystemExit") from e
+                else:
+                    raise e
+        except BaseException as e:
+            if not isinstance(e, FunctionCancelledError):
+                traceback.print_exc()
+            self._send_error(e)
+        else:
+            self._send_result(result)
+        finally:
+            _set_current_token(None)
+            self._current_token = None
+            token._detach()
+            self._send_message((_MSG_DONE, probe.stop()))
+
+    def _send_message(self, message: tuple):
+        try:
+            with self._lock:
+                self._message_conn.send(message)
+        except OSError:
+            _exit_orphaned()
+
+    def _send_result(self, result: Any) -> None:
+        try:
+            pickle.dumps(result)
+        except Exception as e:
+            self._send_message(
+                (_MSG_ERROR, RuntimeError(f"unable to pickle the result: {e}"))
+            )
+            return
+        self._send_message((_MSG_RESULT, result))
+
+    def _send_error(self, error: BaseException) -> None:
+        # an exception that pickles fine may still fail to unpickle in the GUI process (e.g. when its
+        # __init__() takes more than one argument), so a round trip is made before sending it
+        try:
+            pickle.loads(pickle.dumps(error))
+        except Exception:
+            error = RuntimeError(f"{type(error).__name__}: {error}")
+        self._send_message((_MSG_ERROR, error))
+
+
+def _exit_orphaned():
+    # the GUI process has gone, so nobody is waiting for the function any more
+    os._exit(1)
+
+
+def _worker_main(
+    message_conn: Connection,
+    job_conn: Connection,
+    cancel_event: threading.Event,
+):
+    # ucontext can't be imported at module level, because it imports this module indirectly
+    from ..adapter import ucontext
+
+    channel = _WorkerChannel(message_conn, job_conn, cancel_event)
+    try:
+        while True:
+            try:
+                message = job_conn.recv()
+            except (EOFError, OSError):
+                # closed by the GUI process, no more jobs
+                break
+            if message[0] != _MSG_JOB:
+                continue
+            _, fn, arguments, capture_system_exit_exception, log_view_enabled = message
+            # noinspection PyProtectedMember
+            ucontext._context.attach_remote(channel, log_view_enabled)
+            channel.run_job(fn, arguments, capture_system_exit_exception)
+    finally:
+        message_conn.close()
+        job_conn.close()
+
+
+class _ReaderThread(QThread):
+    """
+    Delivers the messages of a worker process to the GUI thread. After EOF, it also waits for the worker process to
+    exit, so that nobody needs to block the GUI thread for that.
+    """
+
+    sig_messages_received = Signal(list)
+
+    def __init__(
+        self,
+        parent: Optional[QObject],
+        conn: Connection,
+        process: multiprocessing.Process,
+    ):
+        super().__init__(parent)
+        self._conn = conn
+        self._process = process
+
+    # noinspection PyUnresolvedReferences
+    def run(self):
+        eof = False
+        while not eof:
+            messages = []
+            while len(messages) < _MAX_BATCH_SIZE:
+                try:
+                    if messages and not self._conn.poll():
+                        break
+                    messages.append(self._conn.recv())
+                except (EOFError, OSError):
+                    eof = True
+                    break
+                except Exception as e:
+                    warnings.warn(f"unable to receive message from worker process: {e}")
+            if messages:
+                self.sig_messages_received.emit(messages)
+        self._conn.close()
+        # EOF is seen when the worker process closes its end of the pipe, which it does right before exiting,
+        # unless something (e.g. a non-daemon thread) keeps it alive, see _WorkerProcess.release()
+        self._process.join()
+
+
+class _WorkerProcess(object):
+    """
+    GUI side of a worker process. The reader thread ends when the worker process exits.
+
+    The worker process is a daemon process, so that it is terminated if the GUI process exits without shutting it down.
+    """
+
+    def __init__(self, parent: Optional[QObject], start_method: str):
+        context = multiprocessing.get_context(start_method)
+        message_reader, message_writer = context.Pipe(duplex=False)
+        job_reader, job_writer = context.Pipe(duplex=False)
+        self.cancel_event = context.Event()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(message_writer, job_reader, self.cancel_event),
+            daemon=True,
+        )
+        try:
+            self._process.start()
+        except BaseException:
+            for conn in (message_reader, message_writer, job_reader, job_writer):
+                conn.close()
+            raise
+        # the ends owned by the worker process must be closed here, otherwise the reader thread
+        # would never see EOF after the worker process exits
+        message_writer.close()
+        job_reader.close()
+
+        self._job_conn: Optional[Connection] = job_writer
+        self.reader_thread = _ReaderThread(parent, message_reader, self._process)
+
+    def is_alive(self) -> bool:
+        return self._job_conn is not None and self._process.is_alive()
+
+    def submit(
+        self,
+        fn,
+        arguments: Dict[str, Any],
+        capture_system_exit_exception: bool,
+        log_view_enabled: bool,
+    ):
+        self.cancel_event.clear()
+        self._job_conn.send(
+            (
+                _MSG_JOB,
+                fn,
+                OrderedDict(arguments),
+                capture_system_exit_exception,
+                log_view_enabled,
+            )
+        )
+
+    def respond(self, request_id: int, ok: bool, value: Any):
+        if self._job_conn is None:
+            return
+        try:
+            self._job_conn.send((_MSG_RESPONSE, request_id, ok, value))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self._job_conn.send(
+                (
+                    _MSG_RESPONSE,
+                    request_id,
+                    False,
+                    RuntimeError(f"unable to pickle the result: {e}"),
+                )
+            )
+        except OSError:
+            # the worker process has gone
+            pass
+
+    def terminate(self):
+        if self._process.is_alive():
+            self._process.terminate()
+
+    def release(self):
+        """
+        Ask the worker process to exit without waiting for it. The reader thread finishes once it has exited, then
+        `shutdown()` can be called without blocking.
+        """
+        if self._job_conn is not None:
+            # the worker process exits once it sees EOF
+            self._job_conn.close()
+            self._job_conn = None
+
+    def shutdown(self, timeout: float) -> Optional[int]:
+        self.release()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            # something (e.g. a non-daemon thread) keeps the process alive
+            self._process.terminate()
+            self._process.join()
+        self.reader_thread.wait()
+        self.reader_thread.setParent(None)
+        self.reader_thread.deleteLater()
+        exitcode = self._process.exitcode
+        self._process.close()
+        return exitcode
+
+
+def _dispatch_request(
+    context, worker: _WorkerProcess, request_id: int, name: str, args: tuple
+):
+    try:
+        result = context.dispatch_remote_request(name, args)
+    except BaseException as e:
+        worker.respond(request_id, False, e)
+    else:
+        worker.respond(request_id, True, result)
+
+
+class ProcessFunctionExecutor(BaseFunctionExecutor):
+    """
+    基于进程的函数执行器。函数将在一个独立的工作进程中执行，因此CPU密集型的函数不会因GIL而导致界面卡顿。
+
+    工作进程中的`uprint()`、`uprogress`、`udialog`、`utoast`等函数的调用，以及`is_function_cancelled()`，
+    将通过管道转发至GUI进程处理。取消函数时，首先会设置取消标志，若函数在`terminate_timeout`毫秒内仍未退出，
+    工作进程将被强制终止，此时`on_execute_error()`将收到一个`FunctionTerminatedError`异常。
+
+    使用该执行器时需要注意：
+
+    - 函数及其参数、返回值必须能够被`pickle`序列化，函数必须定义在模块的顶层；
+    - 在`spawn`或`forkserver`模式下，工作进程会重新导入主模块，因此启动GUI的代码必须位于`if __name__ == "__main__":`之下；
+    - `uinput`中的函数无法在工作进程中使用；
+    - 工作进程是守护进程（daemon），以保证GUI进程异常退出时工作进程也会被终止，因此函数中无法使用`multiprocessing`
+      （包括`concurrent.futures.ProcessPoolExecutor`）创建子进程，如有需要，可以使用`subprocess`模块。
+
+    可以通过派生子类并覆盖`start_method`和`terminate_timeout`属性来修改工作进程的启动方式和强制终止的等待时间。
+    """
+
+    start_method: str = "spawn"
+    """工作进程的启动方式，可选`"spawn"`、`"forkserver"`（仅Unix系统可用）。不建议使用`"fork"`。"""
+
+    terminate_timeout: int = 1000
+    """请求取消后等待函数退出的时间（毫秒），超时后工作进程将被强制终止。小于0时表示不强制终止。"""
+
+    persistent: bool = False
+    """函数执行完毕后是否保留工作进程，以便在下次执行时复用。"""
+
+    def __init__(
+        self, parent: Optional[QObject], listener: Optional[ExecuteStateListener]
+    ):
+        super().__init__(parent, listener)
+
+        self._worker: Optional[_WorkerProcess] = None
+        self._current: Optional[Tuple[FnInfo, Dict[str, Any]]] = None
+        self._outcome_received: bool = False
+        self._pending_messages: Deque[tuple] = deque()
+        self._dispatching: bool = False
+        self._last_resource_usage: Optional[ResourceUsage] = None
+        # workers that have been asked to exit, but whose reader threads have not finished yet
+        self._released_workers: List[_WorkerProcess] = []
+
+        self._terminate_timer = QTimer(self)
+        self._terminate_timer.setSingleShot(True)
+        # noinspection PyUnresolvedReferences
+        self._terminate_timer.timeout.connect(self._terminate_worker)
+
+    @property
+    def is_executing(self) -> bool:
+        return self._current is not None
+
+    @property
+    def is_cancelled(self) -> bool:
+        if not self.is_executing:
+            return False
+        return self._worker.cancel_event.is_set()
+
+    @property
+    def last_resource_usage(self) -> Optional[ResourceUsage]:
+        return self._last_resource_usage
+
+    def execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self.is_executing:
+            raise FunctionExecutingError("function is executing")
+
+        self._before_execute(fn_info, arguments)
+        try:
+            worker = self._ensure_worker()
+            worker.submit(
+                fn_info.fn,
+                arguments,
+                fn_info.capture_system_exit_exception,
+                self._is_log_view_enabled(),
+            )
+        except BaseException as e:
+            traceback.print_exc()
+            if not self.persistent:
+                self._release_worker()
+            self._on_execute_error(fn_info, arguments, e)
+            self._on_execute_finish(fn_info, arguments)
+            return
+        self._current = (fn_info, arguments)
+        self._outcome_received = False
+
+    def try_cancel(self):
+        if not self.is_executing:
+            return
+        if self.is_cancelled:
+            return
+        self._worker.cancel_event.set()
+        if self.terminate_timeout >= 0:
+            self._terminate_timer.start(self.terminate_timeout)
+
+    def shutdown(self):
+        self._terminate_timer.stop()
+        if self._worker is not None:
+            self._released_workers.append(self._worker)
+            self._worker = None
+            self._pending_messages.clear()
+        # the executor is going away, so the worker processes are waited for here
+        released_workers = self._released_workers
+        self._released_workers = []
+        for worker in released_workers:
+            worker.shutdown(max(self.terminate_timeout, 0) / 1000)
+
+    # noinspection PyUnresolvedReferences
+    def _ensure_worker(self) -> _WorkerProcess:
+        if self._worker is not None and self._worker.is_alive():
+            return self._worker
+        self._release_worker()
+        worker = _WorkerProcess(self, self.start_method)
+        worker.reader_thread.sig_messages_received.connect(self._on_messages_received)
+        worker.reader_thread.finished.connect(self._on_worker_exited)
+        worker.reader_thread.start()
+        self._worker = worker
+        return worker
+
+    def _release_worker(self):
+        if self._worker is None:
+            return
+        worker = self._worker
+        self._worker = None
+        self._pending_messages.clear()
+        # the worker process is not waited for in the GUI thread, _on_worker_exited() cleans it up once its reader
+        # thread has finished
+        worker.release()
+        self._released_workers.append(worker)
+        QTimer.singleShot(
+            max(self.terminate_timeout, 0),
+            functools.partial(self._terminate_released_worker, worker),
+        )
+
+    def _terminate_released_worker(self, worker: _WorkerProcess):
+        # still running after terminate_timeout, something (e.g. a non-daemon thread) keeps the process alive
+        if worker in self._released_workers:
+            worker.terminate()
+
+    def _terminate_worker(self):
+        if self._worker is not None and self.is_executing:
+            self._worker.terminate()
+
+    def _is_current_reader(self, reader_thread: QObject) -> bool:
+        return self._worker is not None and self._worker.reader_thread is reader_thread
+
+    def _on_messages_received(self, messages: List[tuple]):
+        # noinspection PyProtectedMember
+        from ..adapter import ucontext
+
+        # noinspection PyProtectedMember
+        context = ucontext._context
+        if not self._is_current_reader(self.sender()):
+            # messages of a released worker
+            return
+        self._pending_messages.extend(messages)
+        # a modal dialog (e.g. the error dialog) runs a nested event loop, messages received in it
+        # are queued, so that they are handled in order after the dialog is closed
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            while self._pending_messages:
+                self._dispatch_message(context, self._pending_messages.popleft())
+        finally:
+            self._dispatching = False
+
+    def _dispatch_message(self, context, message: tuple):
+        worker = self._worker
+        if worker is None or self._current is None:
+            self._pending_messages.clear()
+            return
+        fn_info, arguments = self._current
+        kind = message[0]
+        if kind == _MSG_STARTED:
+            self._on_execute_start(fn_info, arguments)
+        elif kind == _MSG_CALL:
+            context.dispatch_remote_call(message[1], message[2])
+        elif kind == _MSG_REQUEST:
+            _dispatch_request(context, worker, message[1], message[2], message[3])
+        elif kind == _MSG_RESULT:
+            self._outcome_received = True
+            self._on_execute_result(fn_info, arguments, message[1])
+        elif kind == _MSG_ERROR:
+            self._outcome_received = True
+            self._on_execute_error(fn_info, arguments, message[1])
+        elif kind == _MSG_DONE:
+            self._last_resource_usage = message[1]
+            self._on_job_done()
+        else:
+            warnings.warn(f"unknown message from worker process: {kind}")
+
+    def _on_job_done(self):
+        fn_info, arguments = self._current
+        self._current = None
+        self._terminate_timer.stop()
+        if not self.persistent:
+            self._release_worker()
+        self._on_execute_finish(fn_info, arguments)
+
+    def _on_worker_exited(self):
+        reader_thread = self.sender()
+        if not self._is_current_reader(reader_thread):
+            # released on purpose, the process has exited, so this won't block
+            for worker in self._released_workers:
+                if worker.reader_thread is reader_thread:
+                    self._released_workers.remove(worker)
+                    worker.shutdown(0)
+                    break
+            return
+        worker = self._worker
+        self._worker = None
+        self._pending_messages.clear()
+        cancelled = worker.cancel_event.is_set()
+        exitcode = worker.shutdown(0)
+        if self._current is None:
+            return
+        fn_info, arguments = self._current
+        self._current = None
+        self._terminate_timer.stop()
+        if not self._outcome_received:
+            if cancelled:
+                message = "the function was terminated"
+            else:
+                message = f"worker process exited unexpectedly (exit code: {exitcode})"
+            self._on_execute_error(
+                fn_info, arguments, FunctionTerminatedError(message, exitcode)
+            )
+        self._on_execute_finish(fn_info, arguments)
+
+    def _is_log_view_enabled(self) -> bool:
+        # noinspection PyProtectedMember
+        from ..adapter import ucontext
+
+        # noinspection PyProtectedMember
+        return ucontext._context.log_view_enabled
+
+    def _before_execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        # stays None if the worker process exits before the job is done
+        self._last_resource_usage = None
+        if self._listener:
+            self._listener.before_execute(fn_info, arguments)
+
+    def _on_execute_error(
+        self, fn_info: FnInfo, arguments: Dict[str, Any], error: BaseException
+    ):
+        if self._listener:
+            self._listener.on_execute_error(fn_info, arguments, error)
+
+    def _on_execute_start(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self._listener:
+            self._listener.on_execute_start(fn_info, arguments)
+
+    def _on_execute_finish(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self._listener:
+            self._listener.on_execute_finish(fn_info, arguments)
+
+    def _on_execute_result(
+        self, fn_info: FnInfo, arguments: Dict[str, Any], result: Any
+    ):
+        if self._listener:
+            self._listener.on_execute_result(fn_info, arguments, result)
+
+
+class PersistentProcessFunctionExecutor(ProcessFunctionExecutor):
+    """
+    常驻工作进程的`ProcessFunctionExecutor`。工作进程在第一次执行函数时启动，并在之后的每次执行中复用，直到窗口关闭，
+    从而省去了每次执行时启动进程、导入模块的开销。工作进程被强制终止后，将在下次执行时重新启动。
+
+    注意：由于工作进程被复用，函数在上一次执行中对模块级状态的修改将保留到下一次执行中。
+    """
+
+    persistent: bool = True
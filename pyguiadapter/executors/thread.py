@@ -6,16 +6,55 @@
 @Desc    : 实现了基于线程的函数执行器，是目前的默认实现。
 """
 
-import threading
+import asyncio
+import inspect
+import queue
 import traceback
 from collections import OrderedDict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from qtpy.QtCore import QObject, QThread, Signal
 
-from ..exceptions import FunctionExecutingError
+from ..cancellation import CancellationToken, _set_current_token
+from ..exceptions import FunctionExecutingError, FunctionCancelledError
 from ..executor import BaseFunctionExecutor, ExecuteStateListener
 from ..fn import FnInfo
+from ..metrics import ResourceUsage, UsageProbe
+
+
+def _resolve_result(result: Any) -> Any:
+    # ucontext can't be imported at module level, because it imports this module indirectly
+    from ..adapter import ucontext
+
+    # a coroutine function run by a thread-based executor gets an event loop of its own
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+    # the items of a generator function are streamed to the window as they are produced
+    if inspect.isgenerator(result):
+        # noinspection PyProtectedMember
+        return ucontext._consume_stream(result)
+    if inspect.isasyncgen(result):
+        # noinspection PyProtectedMember
+        return asyncio.run(ucontext._consume_async_stream(result))
+    return result
+
+
+def _call_fn(
+    fn_info: FnInfo, arguments: Dict[str, Any], token: CancellationToken
+) -> Any:
+    func = fn_info.fn
+    _set_current_token(token)
+    try:
+        return _resolve_result(func(**arguments))
+    except SystemExit as e:
+        if fn_info.capture_system_exit_exception:
+            raise RuntimeError("SystemExit") from e
+        else:
+            raise e
+    except BaseException as e:
+        raise e
+    finally:
+        _set_current_token(None)
 
 
 class _WorkerThread(QThread):
@@ -35,46 +74,38 @@ class _WorkerThread(QThread):
         self._fn_info = fn_info
         self._arguments = OrderedDict(arguments)
 
-        self._cancel_event = threading.Event()
+        # a new worker thread is created for every execution, so is the token
+        self._cancel_token = CancellationToken()
         self.sig_cancel_requested.connect(self._on_cancel_requested)
+        # set before the thread finishes
+        self.resource_usage: Optional[ResourceUsage] = None
+
+    @property
+    def cancellation_token(self) -> CancellationToken:
+        return self._cancel_token
 
     def is_cancel_event_set(self) -> bool:
-        return self._cancel_event.is_set()
+        return self._cancel_token.is_cancelled()
 
     # noinspection PyUnresolvedReferences
     def run(self):
+        probe = UsageProbe()
         try:
-            self._cancel_event.clear()
             result = self._on_execute()
         except BaseException as e:
-            traceback.print_exc()
+            self.resource_usage = probe.stop()
+            if not isinstance(e, FunctionCancelledError):
+                traceback.print_exc()
             self.sig_error_raised.emit(self._fn_info, self._arguments, e)
         else:
+            self.resource_usage = probe.stop()
             self.sig_result_ready.emit(self._fn_info, self._arguments, result)
-        finally:
-            self._cancel_event.clear()
 
     def _on_execute(self) -> Any:
-        arguments = self._arguments.copy()
-        func = self._fn_info.fn
-
-        def _func():
-            try:
-                return func(**arguments)
-            except SystemExit as e:
-                if self._fn_info.capture_system_exit_exception:
-                    raise RuntimeError("SystemExit") from e
-                else:
-                    raise e
-            except BaseException as e:
-                raise e
-
-        # result = func(**arguments)
-        result = _func()
-        return result
+        return _call_fn(self._fn_info, self._arguments.copy(), self._cancel_token)
 
     def _on_cancel_requested(self):
-        self._cancel_event.set()
+        self._cancel_token.cancel()
 
 
 class ThreadFunctionExecutor(BaseFunctionExecutor):
@@ -85,17 +116,28 @@ class ThreadFunctionExecutor(BaseFunctionExecutor):
         super().__init__(parent, listener)
 
         self._worker_thread: Optional[_WorkerThread] = None
+        self._last_resource_usage: Optional[ResourceUsage] = None
 
     @property
     def is_executing(self) -> bool:
         return self._worker_thread is not None
 
+    @property
+    def last_resource_usage(self) -> Optional[ResourceUsage]:
+        return self._last_resource_usage
+
     @property
     def is_cancelled(self) -> bool:
         if not self.is_executing:
             return False
         return self._worker_thread.is_cancel_event_set()
 
+    @property
+    def cancellation_token(self) -> Optional[CancellationToken]:
+        if not self.is_executing:
+            return None
+        return self._worker_thread.cancellation_token
+
     # noinspection PyUnresolvedReferences
     def execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
         if self.is_executing:
@@ -105,6 +147,7 @@ class ThreadFunctionExecutor(BaseFunctionExecutor):
             self._on_execute_start(fn_info, arguments)
 
         def _callback_on_execute_finish():
+            self._last_resource_usage = self._worker_thread.resource_usage
             self._on_execute_finish(fn_info, arguments)
 
         self._reset_worker_thread()
@@ -118,6 +161,7 @@ class ThreadFunctionExecutor(BaseFunctionExecutor):
             self._worker_thread.start()
         except BaseException as e:
             traceback.print_exc()
+            self._last_resource_usage = None
             self._on_execute_error(fn_info, arguments, e)
             self._on_execute_finish(fn_info, arguments)
 
@@ -159,3 +203,175 @@ class ThreadFunctionExecutor(BaseFunctionExecutor):
             self._worker_thread.setParent(None)
             self._worker_thread.deleteLater()
             self._worker_thread = None
+
+
+# (job_id, fn_info, arguments, cancel_token)
+_Job = Tuple[int, FnInfo, Dict[str, Any], CancellationToken]
+
+
+class _PersistentWorkerThread(QThread):
+
+    sig_job_started = Signal(int)
+    sig_result_ready = Signal(int, object)
+    sig_error_raised = Signal(int, object)
+    sig_job_finished = Signal(int)
+
+    def __init__(self, parent: Optional[QObject]):
+        super().__init__(parent)
+        # usage of the last job, set before sig_job_finished is emitted
+        self.resource_usage: Optional[ResourceUsage] = None
+        # None asks the thread to quit
+        self._jobs: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._cancel_token = CancellationToken()
+
+    @property
+    def cancellation_token(self) -> CancellationToken:
+        return self._cancel_token
+
+    def is_cancel_event_set(self) -> bool:
+        return self._cancel_token.is_cancelled()
+
+    def set_cancel_event(self):
+        self._cancel_token.cancel()
+
+    def submit(self, job_id: int, fn_info: FnInfo, arguments: Dict[str, Any]):
+        # every job gets a token of its own, so that a token kept by a finished job
+        # won't be cancelled by a cancel request of the next one
+        self._cancel_token = CancellationToken()
+        self._jobs.put((job_id, fn_info, OrderedDict(arguments), self._cancel_token))
+
+    def stop(self):
+        self._jobs.put(None)
+
+    # noinspection PyUnresolvedReferences
+    def run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            job_id, fn_info, arguments, token = job
+            self.sig_job_started.emit(job_id)
+            probe = UsageProbe()
+            try:
+                result = _call_fn(fn_info, arguments.copy(), token)
+            except BaseException as e:
+                self.resource_usage = probe.stop()
+                if not isinstance(e, FunctionCancelledError):
+                    traceback.print_exc()
+                self.sig_error_raised.emit(job_id, e)
+            else:
+                self.resource_usage = probe.stop()
+                self.sig_result_ready.emit(job_id, result)
+            finally:
+                # drop the references, so the arguments and result of the last execution
+                # won't be kept alive until the next one
+                job = fn_info = arguments = result = token = None
+                self.sig_job_finished.emit(job_id)
+
+
+class PersistentThreadFunctionExecutor(ThreadFunctionExecutor):
+    """
+    常驻工作线程的`ThreadFunctionExecutor`。工作线程在第一次执行函数时启动，并在之后的每次执行中复用，直到窗口关闭，
+    从而避免了每次执行时创建和销毁线程的开销。适用于需要频繁、反复执行的函数。
+    """
+
+    def __init__(
+        self, parent: Optional[QObject], listener: Optional[ExecuteStateListener]
+    ):
+        super().__init__(parent, listener)
+
+        self._persistent_worker: Optional[_PersistentWorkerThread] = None
+        self._current_job: Optional[Tuple[int, FnInfo, Dict[str, Any]]] = None
+        self._next_job_id: int = 0
+
+    @property
+    def is_executing(self) -> bool:
+        return self._current_job is not None
+
+    @property
+    def is_cancelled(self) -> bool:
+        if not self.is_executing:
+            return False
+        return self._persistent_worker.is_cancel_event_set()
+
+    @property
+    def cancellation_token(self) -> Optional[CancellationToken]:
+        if not self.is_executing:
+            return None
+        return self._persistent_worker.cancellation_token
+
+    def execute(self, fn_info: FnInfo, arguments: Dict[str, Any]):
+        if self.is_executing:
+            raise FunctionExecutingError("function is executing")
+
+        self._before_execute(fn_info, arguments)
+        try:
+            worker = self._ensure_persistent_worker()
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            self._current_job = (job_id, fn_info, arguments)
+            worker.submit(job_id, fn_info, arguments)
+        except BaseException as e:
+            traceback.print_exc()
+            self._current_job = None
+            self._last_resource_usage = None
+            self._on_execute_error(fn_info, arguments, e)
+            self._on_execute_finish(fn_info, arguments)
+
+    def try_cancel(self):
+        if not self.is_executing:
+            return
+        if self.is_cancelled:
+            return
+        self._persistent_worker.set_cancel_event()
+
+    def shutdown(self):
+        if self._persistent_worker is None:
+            return
+        worker = self._persistent_worker
+        self._persistent_worker = None
+        worker.stop()
+        worker.wait()
+        worker.deleteLater()
+
+    # noinspection PyUnresolvedReferences
+    def _ensure_persistent_worker(self) -> _PersistentWorkerThread:
+        if self._persistent_worker is not None:
+            return self._persistent_worker
+        worker = _PersistentWorkerThread(None)
+        worker.sig_job_started.connect(self._on_job_started)
+        worker.sig_result_ready.connect(self._on_job_result_ready)
+        worker.sig_error_raised.connect(self._on_job_error_raised)
+        worker.sig_job_finished.connect(self._on_job_finished)
+        worker.start()
+        self._persistent_worker = worker
+        return worker
+
+    def _is_current_job(self, job_id: int) -> bool:
+        return self._current_job is not None and self._current_job[0] == job_id
+
+    def _on_job_started(self, job_id: int):
+        if not self._is_current_job(job_id):
+            return
+        _, fn_info, arguments = self._current_job
+        self._on_execute_start(fn_info, arguments)
+
+    def _on_job_result_ready(self, job_id: int, result: Any):
+        if not self._is_current_job(job_id):
+            return
+        _, fn_info, arguments = self._current_job
+        self._on_execute_result(fn_info, arguments, result)
+
+    def _on_job_error_raised(self, job_id: int, error: BaseException):
+        if not self._is_current_job(job_id):
+            return
+        _, fn_info, arguments = self._current_job
+        self._on_execute_error(fn_info, arguments, error)
+
+    def _on_job_finished(self, job_id: int):
+        if not self._is_current_job(job_id):
+            return
+        _, fn_info, arguments = self._current_job
+        self._current_job = None
+        self._last_resource_usage = self._persistent_worker.resource_usage
+        self._on_execute_finish(fn_info, arguments)
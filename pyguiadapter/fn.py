@@ -33,3 +33,5 @@ class FnInfo(object):
     cancelable: bool = False
     executor: Optional[ForwardRef("BaseFunctionExecutor")] = None
     capture_system_exit_exception: bool = True
+    batch: bool = False
+    result_cache: Optional[ForwardRef("ResultCache")] = None
@@ -0,0 +1,353 @@
+"""
+@Time    : 2026.10.17
+@File    : history.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 持久化的函数执行历史。每次执行的参数快照、耗时、执行状态、结果及（截断后的）输出被保存在SQLite数据库中。
+"""
+
+import ast
+import dataclasses
+import inspect
+import json
+import os
+import queue
+import reprlib
+import sqlite3
+import threading
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qtpy.QtCore import QStandardPaths
+
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+DEFAULT_HISTORY_FILENAME = "history.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        fn_key TEXT NOT NULL,
+        fn_name TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        wall_time REAL,
+        cpu_time REAL,
+        status TEXT NOT NULL,
+        error TEXT,
+        arguments TEXT NOT NULL,
+        result TEXT,
+        output TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_history_time ON history (fn_key, started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_history_status ON history (fn_key, status, started_at)",
+)
+_COLUMNS = (
+    "id",
+    "fn_key",
+    "fn_name",
+    "started_at",
+    "wall_time",
+    "cpu_time",
+    "status",
+    "error",
+    "arguments",
+    "result",
+    "output",
+)
+# records written by the writer thread in one transaction at most
+_MAX_WRITE_BATCH = 100
+
+# results can be huge, only the beginning of them is kept
+_result_repr = reprlib.Repr()
+_result_repr.maxstring = 1000
+_result_repr.maxother = 1000
+_result_repr.maxlong = 1000
+
+
+@dataclasses.dataclass(frozen=True)
+class HistoryRecord(object):
+    """
+    一次执行的历史记录。
+    """
+
+    fn_key: str
+    """函数的标识，参见`function_key()`。"""
+
+    fn_name: str
+    """函数的显示名称。"""
+
+    started_at: float
+    """开始执行的时间（`time.time()`）。"""
+
+    wall_time: Optional[float]
+    """执行耗时（秒）。"""
+
+    cpu_time: Optional[float]
+    """执行函数消耗的CPU时间（秒），未知时为`None`。"""
+
+    status: str
+    """执行状态，`"succeeded"`、`"failed"`或`"cancelled"`。"""
+
+    error: Optional[str]
+    """执行失败时的异常信息。"""
+
+    arguments: Dict[str, str]
+    """参数快照，参数名到参数值`repr()`的映射。"""
+
+    result: Optional[str]
+    """函数返回值的`repr()`（可能被截断）。"""
+
+    output: str
+    """执行期间输出的内容（可能被截断）。"""
+
+    id: Optional[int] = None
+    """记录在数据库中的id，尚未写入的记录为`None`。"""
+
+    def restore_arguments(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        从参数快照中还原参数值。参数值通过`ast.literal_eval()`还原，因此只有字面量（数字、字符串、列表、字典等）可以被还原。
+
+        Returns:
+            `(values, unrestorable)`，`values`为还原出的参数值，`unrestorable`为无法还原的参数的名称。
+        """
+        values = {}
+        unrestorable = []
+        for name, text in self.arguments.items():
+            try:
+                values[name] = ast.literal_eval(text)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                unrestorable.append(name)
+        return values, unrestorable
+
+
+def function_key(fn: Callable[..., Any]) -> str:
+    """
+    返回函数的标识，由定义函数的源文件（无法获取时为模块名）和函数的限定名组成。
+    """
+    try:
+        source = inspect.getsourcefile(fn)
+    except TypeError:
+        source = None
+    if source:
+        source = os.path.normcase(os.path.abspath(source))
+    else:
+        source = getattr(fn, "__module__", None) or "<unknown>"
+    qualname = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", repr(fn))
+    return f"{source}:{qualname}"
+
+
+def snapshot_arguments(arguments: Dict[str, Any]) -> Dict[str, str]:
+    """
+    生成参数快照。
+    """
+    snapshot = {}
+    for name, value in arguments.items():
+        try:
+            snapshot[name] = repr(value)
+        except Exception as e:
+            snapshot[name] = f"<unrepresentable {type(value).__name__}: {e}>"
+    return snapshot
+
+
+def snapshot_result(result: Any) -> str:
+    """
+    生成函数返回值的快照，过长的内容将被截断。
+    """
+    try:
+        return _result_repr.repr(result)
+    except Exception as e:
+        return f"<unrepresentable {type(result).__name__}: {e}>"
+
+
+def default_history_file() -> str:
+    """
+    返回默认的历史数据库文件路径，位于用户配置目录下的`PyGUIAdapter`目录中。
+    """
+    config_dir = QStandardPaths.writableLocation(
+        QStandardPaths.GenericConfigLocation
+    ) or os.path.expanduser("~")
+    return os.path.join(config_dir, "PyGUIAdapter", DEFAULT_HISTORY_FILENAME)
+
+
+class ExecutionHistory(object):
+    """
+    执行历史数据库。
+
+    写入是异步的：`record()`只是将记录放入队列，由后台的写线程批量写入数据库，因此记录执行历史不会拖慢窗口对执行结束的处理。
+    查询在调用者的线程中同步进行，数据库启用了WAL模式，查询不会被写入阻塞。每个函数最多保留`max_records`条记录，
+    更早的记录在写入时被删除。
+    """
+
+    def __init__(self, filename: Optional[str] = None, max_records: int = 1000):
+        """
+        Args:
+            filename: 数据库文件路径，为`None`时使用`default_history_file()`
+            max_records: 每个函数最多保留的记录数，小于等于0时表示不限制
+        """
+        self._filename = filename or default_history_file()
+        self._max_records = max_records
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = self._connect()
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+        self._queue: "queue.Queue[Optional[HistoryRecord]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    def record(self, record: HistoryRecord):
+        """
+        异步写入一条记录。
+        """
+        if self._closed:
+            raise RuntimeError("history is closed")
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_records, name="ExecutionHistoryWriter", daemon=True
+            )
+            self._writer.start()
+        self._queue.put(record)
+
+    def flush(self):
+        """
+        等待已提交的记录全部写入数据库。
+        """
+        if self._writer is not None:
+            self._queue.join()
+
+    def query(
+        self, fn_key: str, limit: int = 100, status: Optional[str] = None
+    ) -> List[HistoryRecord]:
+        """
+        查询指定函数的历史记录，最新的记录在前。
+
+        Args:
+            fn_key: 函数的标识
+            limit: 最多返回的记录数
+            status: 只返回指定状态的记录，为`None`时返回所有记录
+
+        Returns:
+            历史记录
+        """
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM history WHERE fn_key = ?"
+        params: list = [fn_key]
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        rows = self._conn.execute(sql, params).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def delete(self, record_id: int):
+        self.flush()
+        with self._conn:
+            self._conn.execute("DELETE FROM history WHERE id = ?", (record_id,))
+
+    def clear(self, fn_key: Optional[str] = None):
+        """
+        删除指定函数的所有记录，`fn_key`为`None`时删除所有记录。
+        """
+        self.flush()
+        with self._conn:
+            if fn_key is None:
+                self._conn.execute("DELETE FROM history")
+            else:
+                self._conn.execute("DELETE FROM history WHERE fn_key = ?", (fn_key,))
+
+    def close(self):
+        """
+        等待已提交的记录写入完毕，然后关闭数据库。
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # the writer thread has a connection of its own, the one created in __init__() is for queries
+        conn = sqlite3.connect(self._filename, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write_records(self):
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < _MAX_WRITE_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                records = [record for record in batch if record is not None]
+                try:
+                    if records:
+                        self._insert(conn, records)
+                except sqlite3.Error as e:
+                    warnings.warn(f"failed to write execution history: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def _insert(self, conn: sqlite3.Connection, records: List[HistoryRecord]):
+        with conn:
+            conn.executemany(
+                f"INSERT INTO history ({', '.join(_COLUMNS[1:])}) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) - 1))})",
+                [_to_row(record) for record in records],
+            )
+            if self._max_records <= 0:
+                return
+            for fn_key in {record.fn_key for record in records}:
+                conn.execute(
+                    "DELETE FROM history WHERE fn_key = ? AND started_at < ("
+                    "SELECT started_at FROM history WHERE fn_key = ? "
+                    "ORDER BY started_at DESC LIMIT 1 OFFSET ?)",
+                    (fn_key, fn_key, self._max_records - 1),
+                )
+
+
+def _to_row(record: HistoryRecord) -> tuple:
+    return (
+        record.fn_key,
+        record.fn_name,
+        record.started_at,
+        record.wall_time,
+        record.cpu_time,
+        record.status,
+        record.error,
+        json.dumps(record.arguments, ensure_ascii=False),
+        record.result,
+        record.output,
+    )
+
+
+def _to_record(row: tuple) -> HistoryRecord:
+    values = dict(zip(_COLUMNS, row))
+    try:
+        arguments = json.loads(values["arguments"])
+    except ValueError:
+        arguments = {}
+    values["arguments"] = arguments
+    values["output"] = values["output"] or ""
+    return HistoryRecord(**values)
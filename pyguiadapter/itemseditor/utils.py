@@ -10,8 +10,6 @@ from qtpy.QtWidgets import (
     QLayout,
     QBoxLayout,
 )
-from yapf.yapflib.yapf_api import FormatCode
-
 
 # Type definitions
 # in the context of this module, the concept of `Widget` is used to refer to any item that can be added to a layout, like:
@@ -195,4 +193,7 @@ def result_or_none(func, *args, **kwargs) -> Optional[Any]:
 
 
 def format_py_code(code: str, style_config: Optional[str] = None) -> Tuple[str, bool]:
+    # yapf takes a long time to import, it is imported only when some code is to be formatted
+    from yapf.yapflib.yapf_api import FormatCode
+
     return FormatCode(code, style_config=style_config)
@@ -0,0 +1,148 @@
+"""
+@Time    : 2026.10.17
+@File    : metrics.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : 函数单次执行的耗时与资源占用指标。
+"""
+
+import dataclasses
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # not available on Windows
+    resource = None
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    try:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+    except (OSError, ValueError):
+        return None
+
+
+@dataclasses.dataclass(frozen=True)
+class ResourceUsage(object):
+    """
+    函数执行期间的资源占用，在执行函数的线程（或进程）中测量。
+    """
+
+    cpu_time: float
+    """执行函数消耗的CPU时间（秒）。"""
+
+    peak_rss_delta: Optional[int]
+    """执行期间进程物理内存峰值（peak RSS）的增长量（字节），当前平台不支持时为`None`。注意：峰值只增不减，因此若进程此前
+    已达到过更高的峰值，该值可能为0。"""
+
+
+class UsageProbe(object):
+    """
+    在创建时和调用`stop()`时分别采样，得到两次采样之间的`ResourceUsage`。
+
+    Args:
+        clock: CPU时间的时钟，测量单个线程时使用`time.thread_time`（默认），测量整个进程时使用`time.process_time`
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.thread_time):
+        self._clock = clock
+        self._cpu_start = clock()
+        self._rss_start = _peak_rss()
+
+    def stop(self) -> ResourceUsage:
+        cpu_time = self._clock() - self._cpu_start
+        rss_end = _peak_rss()
+        if self._rss_start is None or rss_end is None:
+            rss_delta = None
+        else:
+            rss_delta = rss_end - self._rss_start
+        return ResourceUsage(cpu_time=cpu_time, peak_rss_delta=rss_delta)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutionMetrics(object):
+    """
+    函数单次执行的指标，在每次执行结束后生成，并被显示在窗口的状态栏和执行历史中，同时会被传递给
+    `FnExecuteWindowEventListener.on_execute_finish()`。
+    """
+
+    fn_name: str
+    """函数名称。"""
+
+    started_at: float
+    """开始执行的时间（`time.time()`）。"""
+
+    wall_time: float
+    """从开始执行到执行结束经过的时间（秒）。"""
+
+    cpu_time: Optional[float]
+    """执行函数消耗的CPU时间（秒），执行器无法测量时为`None`。"""
+
+    peak_rss_delta: Optional[int]
+    """执行期间物理内存峰值的增长量（字节），无法测量时为`None`。参见`ResourceUsage.peak_rss_delta`。"""
+
+    output_writes: int
+    """向输出浏览器写入内容的次数（包括`uprint()`和生成器函数产生的结果）。"""
+
+    output_chars: int
+    """向输出浏览器写入的字符数。"""
+
+    progress_updates: int
+    """更新进度（进度条和进度对话框）的次数。"""
+
+    error: Optional[str] = None
+    """执行失败时为异常的类型名称，成功时为`None`。"""
+
+    cached: bool = False
+    """本次执行是否命中了结果缓存（函数没有被实际调用，结果和输出来自缓存）。"""
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def summary(self) -> str:
+        """
+        返回指标的简短文本描述。
+        """
+        parts = [f"{self.fn_name}: {_format_seconds(self.wall_time)}"]
+        if self.cached:
+            parts.append("cached")
+        if self.cpu_time is not None:
+            parts.append(f"CPU {_format_seconds(self.cpu_time)}")
+        if self.peak_rss_delta is not None:
+            parts.append(f"peak RSS +{format_bytes(self.peak_rss_delta)}")
+        parts.append(f"{self.output_writes} output(s), {self.output_chars} char(s)")
+        parts.append(f"{self.progress_updates} progress update(s)")
+        if self.error is not None:
+            parts.append(f"failed ({self.error})")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return OrderedDict(
+            (field.name, getattr(self, field.name))
+            for field in dataclasses.fields(self)
+        )
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1.0:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
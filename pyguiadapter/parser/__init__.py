@@ -1,2 +1,9 @@
 from .fnparser import FnParser, WidgetMeta
+from .fncache import FnParseCache, default_parse_cache_file
+from .metaparser import (
+    parse_metadata,
+    register_metadata_parser,
+    default_metadata_parsers,
+    metadata_parser_names,
+)
 from . import typenames
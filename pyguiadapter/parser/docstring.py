@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import docstring_parser
+if TYPE_CHECKING:
+    import docstring_parser
 
 
 class FnDocstring(object):
@@ -8,6 +9,10 @@ class FnDocstring(object):
     def __init__(self, fn_docstring: str):
         self._fn_docstring: str = fn_docstring
 
+        # imported here so that importing the parser doesn't import docstring_parser, which is not needed when the
+        # parsed functions are loaded from the parse cache or their parsing is deferred
+        import docstring_parser
+
         try:
             self._docstring = docstring_parser.parse(fn_docstring)
         except docstring_parser.ParseError:
@@ -48,7 +53,7 @@ class FnDocstring(object):
 
     def _find_parameter(
         self, parameter_name: str
-    ) -> Optional[docstring_parser.DocstringParam]:
+    ) -> Optional["docstring_parser.DocstringParam"]:
         if self._docstring is None:
             return None
         for param in self._docstring.params:
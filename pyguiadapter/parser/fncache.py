@@ -0,0 +1,212 @@
+import dataclasses
+import hashlib
+import inspect
+import os
+import pickle
+import warnings
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from qtpy.QtCore import QStandardPaths
+
+from .. import utils
+from ..fn import ParameterInfo
+from ..history import function_key
+
+DEFAULT_PARSE_CACHE_FILENAME = "fncache.pickle"
+
+_FORMAT_VERSION = 1
+# entries not used in this run are dropped when there are more entries than this
+_MAX_ENTRIES = 1000
+
+# (document, parameters, parsed widget configs)
+ParsedFn = Tuple[str, Dict[str, ParameterInfo], Dict[str, Tuple[Optional[str], dict]]]
+
+
+def default_parse_cache_file() -> str:
+    """
+    返回默认的解析缓存文件路径，位于用户缓存目录下的`PyGUIAdapter`目录中。
+    """
+    cache_dir = QStandardPaths.writableLocation(
+        QStandardPaths.GenericCacheLocation
+    ) or os.path.expanduser("~")
+    return os.path.join(cache_dir, "PyGUIAdapter", DEFAULT_PARSE_CACHE_FILENAME)
+
+
+class FnParseCache(object):
+    """
+    函数解析结果的磁盘缓存。
+
+    保存`FnParser`从函数签名和docstring中解析出的参数信息、函数文档和参数控件配置，使程序再次启动时可以跳过签名、docstring及TOML的解析。
+    缓存以函数所在的源文件和限定名为键，并以函数源文件、docstring、文档以及参数默认值和类型注解的`repr()`的指纹判断缓存是否仍然有效
+    （源文件被修改后，其中所有函数的缓存都将失效）。默认值在导入模块时求值，可能在源文件不变的情况下发生变化（例如`datetime.now()`、
+    `os.getcwd()`、环境变量或从其他模块导入的常量），因此也是指纹的一部分。
+    找不到源文件，或者解析结果无法被`pickle`（例如默认值为lambda函数）的函数不会被缓存。
+
+    注意：缓存文件通过`pickle`加载，加载时可以执行任意代码，请确保该文件不会被他人写入。
+    """
+
+    def __init__(self, filename: Optional[str] = None):
+        """
+        Args:
+            filename: 缓存文件路径，为`None`时使用`default_parse_cache_file()`
+        """
+        self._filename = filename or default_parse_cache_file()
+        # key -> (fingerprint, pickled ParsedFn)
+        self._entries: Optional[Dict[str, Tuple[str, bytes]]] = None
+        self._used = set()
+        self._source_fingerprints: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, fn: Callable, salt: str = "") -> Optional[ParsedFn]:
+        """
+        返回函数缓存的解析结果，没有缓存或缓存已失效时返回`None`。`salt`为影响解析结果的其他输入。
+        """
+        key, fingerprint = self._key_of(fn, salt)
+        if fingerprint is None:
+            return None
+        entry = self._load().get(key, None)
+        if entry is None or entry[0] != fingerprint:
+            self._misses += 1
+            return None
+        try:
+            parsed = pickle.loads(entry[1])
+        except Exception:
+            # for example, a type used in the annotations has been moved or removed
+            self._misses += 1
+            return None
+        self._used.add(key)
+        self._hits += 1
+        return parsed
+
+    def put(self, fn: Callable, parsed: ParsedFn, salt: str = ""):
+        key, fingerprint = self._key_of(fn, salt)
+        if fingerprint is None:
+            return
+        try:
+            data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        self._load()[key] = (fingerprint, data)
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self):
+        """
+        将新的解析结果写入缓存文件，没有新的解析结果时什么也不做。
+        """
+        if not self._dirty:
+            return
+        entries = self._load()
+        if len(entries) > _MAX_ENTRIES:
+            entries = {
+                key: entry for key, entry in entries.items() if key in self._used
+            }
+            self._entries = entries
+        tmp_filename = f"{self._filename}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self._filename)), exist_ok=True)
+            with open(tmp_filename, "wb") as f:
+                pickle.dump((_schema(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, self._filename)
+        except Exception as e:
+            warnings.warn(f"failed to write parse cache {self._filename}: {e}")
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+    def clear(self):
+        self._entries = {}
+        self._used.clear()
+        self._dirty = False
+        try:
+            os.remove(self._filename)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict[str, Tuple[str, bytes]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            with open(self._filename, "rb") as f:
+                schema, entries = pickle.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except Exception as e:
+            warnings.warn(f"failed to load parse cache {self._filename}: {e}")
+            return self._entries
+        if schema == _schema() and isinstance(entries, dict):
+            self._entries = entries
+        return self._entries
+
+    def _key_of(self, fn: Callable, salt: str) -> Tuple[str, Optional[str]]:
+        key = function_key(fn)
+        try:
+            filename = inspect.getsourcefile(fn)
+        except TypeError:
+            filename = None
+        source_fingerprint = self._source_fingerprint(filename) if filename else None
+        if source_fingerprint is None:
+            return key, None
+        live_inputs = _live_inputs(fn)
+        if live_inputs is None:
+            return key, None
+        return key, utils.fingerprint(
+            "\0".join((source_fingerprint, fn.__doc__ or "", live_inputs, salt))
+        )
+
+    def _source_fingerprint(self, filename: str) -> Optional[str]:
+        # the whole source file is fingerprinted instead of the source of each function, which is much cheaper than
+        # inspect.getsource(), but any change to the file invalidates the cache of all functions in it
+        if filename not in self._source_fingerprints:
+            try:
+                with open(filename, "rb") as f:
+                    fingerprint = hashlib.md5(f.read()).hexdigest()
+            except OSError:
+                fingerprint = None
+            self._source_fingerprints[filename] = fingerprint
+        return self._source_fingerprints[filename]
+
+
+def _live_inputs(fn: Callable) -> Optional[str]:
+    # the defaults and annotations are evaluated when the module is imported, they may change while the source file
+    # stays the same, so their current values are part of the fingerprint. a default without a stable repr()
+    # (e.g. an object whose repr() contains its address) just makes the function miss the cache every time
+    fn = getattr(fn, "__func__", fn)
+    try:
+        text = repr(
+            (
+                getattr(fn, "__defaults__", None),
+                getattr(fn, "__kwdefaults__", None),
+                getattr(fn, "__annotations__", None),
+            )
+        )
+        # make sure the text can be fingerprinted
+        text.encode("utf-8")
+    except Exception:
+        return None
+    return text
+
+
+def _schema() -> Tuple[Any, ...]:
+    # the cached objects are pickled ParameterInfo, the cache is invalid if its fields have been changed
+    return _FORMAT_VERSION, tuple(
+        field.name for field in dataclasses.fields(ParameterInfo)
+    )
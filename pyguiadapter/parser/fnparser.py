@@ -2,13 +2,22 @@ import dataclasses
 import inspect
 import warnings
 from collections import OrderedDict
-from typing import Callable, Literal, List, Tuple, Set, Dict, Any, Type, Union, Optional
-
-# fix issue: https://github.com/zimolab/PyGUIAdapter/issues/4
-# import tomli
-import tomlkit
+from typing import (
+    Callable,
+    Literal,
+    List,
+    Tuple,
+    Set,
+    Dict,
+    Any,
+    Type,
+    Union,
+    Optional,
+    Sequence,
+)
 
 from .docstring import FnDocstring
+from .metaparser import parse_metadata
 from .typenames import get_typename, get_type_args
 from .. import utils
 from ..fn import FnInfo, ParameterInfo
@@ -54,6 +63,7 @@ class FnParser(object):
         widget_metadata_end: Union[
             str, List[str], Tuple[str], Set[str]
         ] = PARAM_WIDGET_METADATA_END,
+        metadata_parsers: Optional[Sequence[str]] = None,
     ):
         self._widget_metadata_start: Union[str, List[str], Tuple[str], Set[str]] = (
             widget_metadata_start
@@ -61,6 +71,14 @@ class FnParser(object):
         self._widget_metadata_end: Union[str, List[str], Tuple[str], Set[str]] = (
             widget_metadata_end
         )
+        # names of the metadata parsers to try in order, see metaparser.default_metadata_parsers()
+        self._metadata_parsers: Optional[Tuple[str, ...]] = (
+            tuple(metadata_parsers) if metadata_parsers is not None else None
+        )
+
+    @property
+    def widget_metadata_markers(self) -> Tuple[Any, Any]:
+        return self._widget_metadata_start, self._widget_metadata_end
 
     def parse_fn_info(
         self,
@@ -146,10 +164,9 @@ class FnParser(object):
         meta_text = meta_text.strip()
 
         try:
-            # metadata = tomli.loads(meta_text)
-            metadata = tomlkit.parse(meta_text).unwrap()
-            if not isinstance(metadata, dict):
-                raise ValueError("invalid widget configs text")
+            # fix issue: https://github.com/zimolab/PyGUIAdapter/issues/4
+            # the fast read-only parsers are tried first, tomlkit is kept as the compatible fallback
+            metadata = parse_metadata(meta_text, self._metadata_parsers)
         except Exception as e:
             warnings.warn(f"failed to parse widget configs in docstring: {e}")
             return OrderedDict()
@@ -0,0 +1,317 @@
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    # python < 3.11
+    tomllib = None
+
+# a metadata parser reads the text of a widget metadata block (in TOML) and returns a dict of plain python objects
+MetadataParser = Callable[[str], Dict[str, Any]]
+
+TOMLLIB = "tomllib"
+FLAT = "flat"
+TOMLKIT = "tomlkit"
+
+_METADATA_PARSERS: Dict[str, MetadataParser] = OrderedDict()
+
+
+class UnsupportedSyntaxError(ValueError):
+    """
+    元数据文本中使用了`flat`解析器不支持的TOML语法（如多行字符串、日期时间、点分键、表数组等）。
+    """
+
+    pass
+
+
+def register_metadata_parser(name: str, parser: MetadataParser):
+    """
+    注册一个元数据解析器。解析器接收控件元数据块的文本，返回由普通python对象（`dict`、`list`、`str`、数字等）构成的`dict`，
+    文本无效时应抛出异常。同名的解析器将被替换。
+    """
+    _METADATA_PARSERS[name] = parser
+
+
+def get_metadata_parser(name: str) -> Optional[MetadataParser]:
+    return _METADATA_PARSERS.get(name, None)
+
+
+def metadata_parser_names() -> List[str]:
+    """
+    返回所有已注册的元数据解析器的名称。
+    """
+    return list(_METADATA_PARSERS.keys())
+
+
+def default_metadata_parsers() -> Tuple[str, ...]:
+    """
+    返回默认的元数据解析器链：首先使用最快的`flat`解析器，遇到其不支持的语法时，python 3.11及以上版本使用`tomllib`，
+    最后使用`tomlkit`。
+    """
+    if TOMLLIB in _METADATA_PARSERS:
+        return FLAT, TOMLLIB, TOMLKIT
+    return FLAT, TOMLKIT
+
+
+def parse_metadata(
+    text: str, parsers: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    依次使用`parsers`中的解析器解析元数据文本，返回第一个成功的解析结果。若所有解析器均失败，则抛出最后一个解析器的异常。
+
+    Args:
+        text: 元数据文本
+        parsers: 解析器名称，为`None`时使用`default_metadata_parsers()`。未注册的名称将被忽略。
+
+    Returns:
+        解析结果
+    """
+    if parsers is None:
+        parsers = default_metadata_parsers()
+    error: Optional[Exception] = None
+    for name in parsers:
+        parser = _METADATA_PARSERS.get(name, None)
+        if parser is None:
+            continue
+        try:
+            metadata = parser(text)
+        except Exception as e:
+            error = e
+            continue
+        if not isinstance(metadata, dict):
+            error = ValueError(f"invalid metadata returned by parser: {name}")
+            continue
+        return metadata
+    if error is None:
+        error = ValueError(f"no available metadata parser in: {list(parsers)}")
+    raise error
+
+
+def _parse_with_tomllib(text: str) -> Dict[str, Any]:
+    return tomllib.loads(text)
+
+
+def _parse_with_tomlkit(text: str) -> Dict[str, Any]:
+    # tomlkit is a style-preserving parser, which is much slower than the others, it is only imported when needed
+    import tomlkit
+
+    return tomlkit.parse(text).unwrap()
+
+
+################################################################################################
+# the "flat" parser
+# it reads the subset of TOML used in the widget metadata blocks: [parameter] tables of
+# key = value pairs, whose values are single-line strings, numbers, booleans, and single-line
+# arrays or inline tables of them. anything else raises UnsupportedSyntaxError, so that the
+# next parser in the chain can take over.
+################################################################################################
+
+_WS = " \t"
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+_BASIC_STRING = re.compile(r'"((?:[^"\\\x00-\x08\x0a-\x1f\x7f]|\\.)*)"')
+_LITERAL_STRING = re.compile(r"'([^'\x00-\x08\x0a-\x1f\x7f]*)'")
+_DEC_INT = re.compile(r"[+-]?(?:0|[1-9](?:_?[0-9])*)")
+_FLOAT = re.compile(
+    r"[+-]?(?:0|[1-9](?:_?[0-9])*)"
+    r"(?:\.[0-9](?:_?[0-9])*(?:[eE][+-]?[0-9](?:_?[0-9])*)?|[eE][+-]?[0-9](?:_?[0-9])*)"
+)
+_PREFIXED_INT = re.compile(
+    r"0x[0-9A-Fa-f](?:_?[0-9A-Fa-f])*|0o[0-7](?:_?[0-7])*|0b[01](?:_?[01])*"
+)
+_SPECIAL_FLOAT = re.compile(r"[+-]?(?:inf|nan)")
+_VALUE_END = re.compile(r"[ \t,\]}#]|$")
+_ESCAPES = {
+    "b": "\b",
+    "t": "\t",
+    "n": "\n",
+    "f": "\f",
+    "r": "\r",
+    '"': '"',
+    "\\": "\\",
+}
+
+
+def _skip_ws(line: str, pos: int) -> int:
+    while pos < len(line) and line[pos] in _WS:
+        pos += 1
+    return pos
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    chars = []
+    pos = 0
+    while pos < len(text):
+        char = text[pos]
+        if char != "\\":
+            chars.append(char)
+            pos += 1
+            continue
+        escape = text[pos + 1]
+        if escape in _ESCAPES:
+            chars.append(_ESCAPES[escape])
+            pos += 2
+        elif escape in "uU":
+            size = 4 if escape == "u" else 8
+            code = text[pos + 2 : pos + 2 + size]
+            if len(code) != size or not all(
+                c in "0123456789abcdefABCDEF" for c in code
+            ):
+                raise ValueError(f"invalid unicode escape: \\{escape}{code}")
+            value = int(code, 16)
+            # only unicode scalar values are allowed, i.e. no surrogates and nothing beyond U+10FFFF
+            if 0xD800 <= value <= 0xDFFF or value > 0x10FFFF:
+                raise ValueError(f"invalid unicode escape: \\{escape}{code}")
+            chars.append(chr(value))
+            pos += 2 + size
+        else:
+            raise ValueError(f"invalid escape sequence: \\{escape}")
+    return "".join(chars)
+
+
+def _parse_key(line: str, pos: int) -> Tuple[str, int]:
+    if line.startswith(('"""', "'''"), pos):
+        raise UnsupportedSyntaxError("multi-line string keys are not supported")
+    char = line[pos : pos + 1]
+    if char == '"':
+        match = _BASIC_STRING.match(line, pos)
+        if match is None:
+            raise ValueError(f"invalid key: {line[pos:]}")
+        key = _unescape(match.group(1))
+    elif char == "'":
+        match = _LITERAL_STRING.match(line, pos)
+        if match is None:
+            raise ValueError(f"invalid key: {line[pos:]}")
+        key = match.group(1)
+    else:
+        match = _BARE_KEY.match(line, pos)
+        if match is None:
+            raise ValueError(f"invalid key: {line[pos:]}")
+        key = match.group(0)
+    pos = _skip_ws(line, match.end())
+    if line[pos : pos + 1] == ".":
+        raise UnsupportedSyntaxError("dotted keys are not supported")
+    return key, pos
+
+
+def _parse_value(line: str, pos: int) -> Tuple[Any, int]:
+    char = line[pos : pos + 1]
+    if char == '"' or char == "'":
+        if line.startswith(('"""', "'''"), pos):
+            raise UnsupportedSyntaxError("multi-line strings are not supported")
+        if char == '"':
+            match = _BASIC_STRING.match(line, pos)
+            if match is None:
+                raise ValueError(f"invalid string: {line[pos:]}")
+            return _unescape(match.group(1)), match.end()
+        match = _LITERAL_STRING.match(line, pos)
+        if match is None:
+            raise ValueError(f"invalid string: {line[pos:]}")
+        return match.group(1), match.end()
+    if char == "[":
+        return _parse_array(line, pos)
+    if char == "{":
+        return _parse_inline_table(line, pos)
+    for literal, value in (("true", True), ("false", False)):
+        if line.startswith(literal, pos) and _VALUE_END.match(line, pos + len(literal)):
+            return value, pos + len(literal)
+    for pattern, convert in (
+        (_FLOAT, lambda s: float(s.replace("_", ""))),
+        (_PREFIXED_INT, lambda s: int(s.replace("_", ""), 0)),
+        (_DEC_INT, lambda s: int(s.replace("_", ""))),
+        (_SPECIAL_FLOAT, float),
+    ):
+        match = pattern.match(line, pos)
+        if match is not None and _VALUE_END.match(line, match.end()):
+            return convert(match.group(0)), match.end()
+    # dates, times and anything else
+    raise UnsupportedSyntaxError(f"unsupported value: {line[pos:]}")
+
+
+def _parse_array(line: str, pos: int) -> Tuple[list, int]:
+    values = []
+    pos = _skip_ws(line, pos + 1)
+    while True:
+        if pos >= len(line) or line[pos] == "#":
+            raise UnsupportedSyntaxError("multi-line arrays are not supported")
+        if line[pos] == "]":
+            return values, pos + 1
+        value, pos = _parse_value(line, pos)
+        values.append(value)
+        pos = _skip_ws(line, pos)
+        if line[pos : pos + 1] == ",":
+            pos = _skip_ws(line, pos + 1)
+        elif line[pos : pos + 1] != "]":
+            if pos >= len(line) or line[pos] == "#":
+                raise UnsupportedSyntaxError("multi-line arrays are not supported")
+            raise ValueError(f"invalid array: {line}")
+
+
+def _parse_inline_table(line: str, pos: int) -> Tuple[dict, int]:
+    table = {}
+    pos = _skip_ws(line, pos + 1)
+    if line[pos : pos + 1] == "}":
+        return table, pos + 1
+    while True:
+        key, pos = _parse_key(line, pos)
+        if line[pos : pos + 1] != "=":
+            raise ValueError(f"invalid inline table: {line}")
+        value, pos = _parse_value(line, _skip_ws(line, pos + 1))
+        if key in table:
+            raise ValueError(f"duplicate key: {key}")
+        table[key] = value
+        pos = _skip_ws(line, pos)
+        char = line[pos : pos + 1]
+        if char == "}":
+            return table, pos + 1
+        if char != ",":
+            raise ValueError(f"invalid inline table: {line}")
+        pos = _skip_ws(line, pos + 1)
+
+
+def _check_line_end(line: str, pos: int):
+    pos = _skip_ws(line, pos)
+    if pos < len(line) and line[pos] != "#":
+        raise ValueError(f"unexpected text: {line[pos:]}")
+
+
+def parse_flat_toml(text: str) -> Dict[str, Any]:
+    """
+    解析控件元数据中使用的TOML子集：由`[参数名]`表和`key = value`键值对构成，值可以是单行字符串、数字、布尔值，以及由它们
+    构成的单行数组或内联表。遇到该子集之外的语法时抛出`UnsupportedSyntaxError`。
+    """
+    root: Dict[str, Any] = {}
+    current = root
+    for line in text.splitlines():
+        pos = _skip_ws(line, 0)
+        if pos >= len(line) or line[pos] == "#":
+            continue
+        if line[pos] == "[":
+            if line.startswith("[[", pos):
+                raise UnsupportedSyntaxError("arrays of tables are not supported")
+            key, pos = _parse_key(line, _skip_ws(line, pos + 1))
+            if line[pos : pos + 1] != "]":
+                raise ValueError(f"invalid table header: {line}")
+            _check_line_end(line, pos + 1)
+            if key in root:
+                raise ValueError(f"duplicate table: {key}")
+            current = root[key] = {}
+            continue
+        key, pos = _parse_key(line, pos)
+        if line[pos : pos + 1] != "=":
+            raise ValueError(f"invalid key/value pair: {line}")
+        value, pos = _parse_value(line, _skip_ws(line, pos + 1))
+        _check_line_end(line, pos)
+        if key in current:
+            raise ValueError(f"duplicate key: {key}")
+        current[key] = value
+    return root
+
+
+if tomllib is not None:
+    register_metadata_parser(TOMLLIB, _parse_with_tomllib)
+register_metadata_parser(FLAT, parse_flat_toml)
+register_metadata_parser(TOMLKIT, _parse_with_tomlkit)
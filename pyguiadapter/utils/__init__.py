@@ -1,8 +1,81 @@
+from typing import TYPE_CHECKING
+
 from ._core import *
 from ._ui import *
 from .io import *
 from .dialog import BaseCustomDialog
 from .messagebox import *
 from .filedialog import *
-from .inputdialog import *
-from .editor import *
+from .._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .inputdialog import *
+    from .editor import *
+
+# inputdialog and editor pull in the code editor and the items editor, they are imported on first access to their names
+_LAZY_ATTRS = {
+    **{
+        name: ".inputdialog"
+        for name in (
+            "EchoMode",
+            "PasswordEchoMode",
+            "PasswordEchoOnEdit",
+            "NormalEchoMode",
+            "NoEcho",
+            "input_integer",
+            "input_float",
+            "input_text",
+            "input_string",
+            "select_item",
+            "input_color",
+            "LineWrapMode",
+            "UniversalInputDialog",
+            "CodeEditDialog",
+            "ObjectInputDialog",
+            "JsonInputDialog",
+            "PyLiteralInputDialog",
+            "input_json_object",
+            "input_py_literal",
+            "get_custom_input",
+        )
+    },
+    **{
+        name: ".editor"
+        for name in (
+            "CommonEditorConfig",
+            "ObjectItemEditor",
+            "ObjectEditorConfig",
+            "ObjectEditor",
+            "ValueType",
+            "remove_unknown_keys",
+            "fill_keys",
+            "validate_object",
+            "ValidationResult",
+            "MissingKeysError",
+            "UnknownKeysError",
+            "InvalidValueError",
+            "SchemaObjectEditorConfig",
+            "SchemaObjectPanelConfig",
+            "normalize_schema_object",
+            "validate_schema_object",
+            "show_schema_object_editor",
+            "show_schema_object_panel",
+        )
+    },
+}
+
+__getattr__, __dir__ = lazy_module_attrs(
+    __name__, _LAZY_ATTRS, submodules=("inputdialog", "editor")
+)
+
+# keep "from pyguiadapter.utils import *" exporting the lazily imported names, but not the
+# helpers needed by the lazy imports themselves
+__all__ = [
+    name
+    for name in globals()
+    if not name.startswith("_") and name not in ("TYPE_CHECKING", "lazy_module_attrs")
+] + [
+    *_LAZY_ATTRS,
+    "inputdialog",
+    "editor",
+]
@@ -10,7 +10,6 @@ import os.path
 import warnings
 from typing import Literal, Tuple, Union, Optional
 
-import qtawesome as qta
 from qtpy.QtCore import Qt
 from qtpy.QtCore import QSize
 from qtpy.QtGui import QColor
@@ -30,6 +29,13 @@ _LABEL_TEXT_FORMATS = {
 }
 
 
+def _qta():
+    # qtawesome loads its icon fonts when imported, it is imported only when an icon font is actually used
+    import qtawesome
+
+    return qtawesome
+
+
 # noinspection PyArgumentList
 def get_icon(src: IconType, *args, **kwargs) -> Optional[QIcon]:
     if src is None:
@@ -41,10 +47,11 @@ def get_icon(src: IconType, *args, **kwargs) -> Optional[QIcon]:
     if isinstance(src, str):
         if os.path.isfile(src) or src.startswith(":/"):
             return QIcon(src)
-        return qta.icon(src, *args, **kwargs)
+        return _qta().icon(src, *args, **kwargs)
     if isinstance(src, tuple):
         assert len(src) >= 2
         assert isinstance(src[0], str) and isinstance(src[1], (dict, list))
+        qta = _qta()
         if isinstance(src[1], dict):
             return qta.icon(src[0], **src[1])
         else:
@@ -0,0 +1,225 @@
+"""
+@Time    : 2026.10.17
+@File    : watchdog.py
+@Author  : zimolab
+@Project : PyGUIAdapter
+@Desc    : GUI线程卡顿监视器。当事件循环在指定时间内没有响应时，对GUI线程的调用栈进行采样，以便找出导致界面卡顿的代码。
+"""
+
+import dataclasses
+import sys
+import threading
+import time
+import traceback
+from collections import deque, OrderedDict
+from typing import Deque, Dict, List, Optional, Tuple
+
+from qtpy.QtCore import QObject, QTimer, Signal
+
+# the heartbeat timer fires at most this often (seconds)
+_MAX_HEARTBEAT_INTERVAL = 0.1
+# frames kept in a stack sample
+_STACK_LIMIT = 50
+# a stall lasting longer than this (seconds) is printed before it ends, in case it never does
+_HANG_REPORT_AFTER = 5.0
+
+
+@dataclasses.dataclass(frozen=True)
+class StallReport(object):
+    """
+    一次GUI线程卡顿的报告。
+    """
+
+    started_at: float
+    """卡顿开始的时间（`time.time()`）。"""
+
+    duration: float
+    """卡顿持续的时间（秒）。"""
+
+    samples: Tuple[Tuple[str, int], ...]
+    """卡顿期间采集到的GUI线程调用栈及其被采集到的次数，按次数从多到少排列。被采集到次数最多的调用栈通常就是导致卡顿的代码。"""
+
+    @property
+    def sample_count(self) -> int:
+        """采样的总次数。"""
+        return sum(count for _, count in self.samples)
+
+    @property
+    def hottest_stack(self) -> str:
+        """被采集到次数最多的调用栈。"""
+        return self.samples[0][0] if self.samples else ""
+
+    def format(self) -> str:
+        """将报告格式化为文本。"""
+        lines = [
+            f"GUI thread stalled for {self.duration:.3f}s "
+            f"at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}, "
+            f"{self.sample_count} stack sample(s):"
+        ]
+        for stack, count in self.samples:
+            lines.append(f"--- {count} sample(s) ---")
+            lines.append(stack.rstrip("\n"))
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        return OrderedDict(
+            started_at=self.started_at,
+            duration=self.duration,
+            samples=[
+                OrderedDict(stack=stack, count=count) for stack, count in self.samples
+            ],
+        )
+
+
+class StallWatchdog(QObject):
+    """
+    GUI线程卡顿监视器。
+
+    GUI线程中的一个定时器会定期更新“心跳”时间，一个后台线程则检查心跳是否按时到来。若事件循环超过`threshold`秒没有响应，
+    后台线程将开始通过`sys._current_frames()`对GUI线程的调用栈进行采样，直到事件循环恢复响应，然后生成一份`StallReport`。
+    报告将被打印到标准错误输出，并通过`sig_stall_detected`信号（在GUI线程中）发出。
+
+    模态对话框运行着自己的事件循环，因此等待用户关闭对话框不会被视为卡顿。
+
+    通常无需直接使用该类，只需在创建`GUIAdapter`时指定`stall_watchdog=True`即可。
+    """
+
+    sig_stall_detected = Signal(object)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        threshold: float = 0.5,
+        print_reports: bool = True,
+        max_reports: int = 100,
+    ):
+        """
+        Args:
+            parent: 父对象
+            threshold: 事件循环超过多少秒没有响应时视为卡顿
+            print_reports: 是否将报告打印到标准错误输出
+            max_reports: 最多保留多少份报告
+        """
+        super().__init__(parent)
+        if threshold <= 0:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+        self._threshold = threshold
+        self._interval = min(threshold / 4, _MAX_HEARTBEAT_INTERVAL)
+        self._print_reports = print_reports
+        self._reports: Deque[StallReport] = deque(maxlen=max(max_reports, 1))
+        self._reports_lock = threading.Lock()
+
+        self._gui_thread_ident: Optional[int] = None
+        # written by the GUI thread, read by the watchdog thread, a float assignment is atomic
+        self._last_beat: float = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.setInterval(max(int(self._interval * 1000), 1))
+        # noinspection PyUnresolvedReferences
+        self._heartbeat_timer.timeout.connect(self._beat)
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def reports(self) -> List[StallReport]:
+        """
+        获取已生成的卡顿报告。
+        """
+        with self._reports_lock:
+            return list(self._reports)
+
+    def start(self):
+        """
+        开始监视。必须在GUI线程中调用。
+        """
+        if self._thread is not None:
+            return
+        self._gui_thread_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._heartbeat_timer.start()
+        self._thread = threading.Thread(
+            target=self._watch, name="StallWatchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        停止监视。
+        """
+        if self._thread is None:
+            return
+        self._heartbeat_timer.stop()
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    def _watch(self):
+        samples: Dict[str, int] = OrderedDict()
+        stall_beat: Optional[float] = None
+        stall_started_at = 0.0
+        hang_reported = False
+        while not self._stop_event.wait(self._interval):
+            last_beat = self._last_beat
+            if stall_beat is not None and last_beat != stall_beat:
+                # the event loop is responsive again
+                self._report(stall_started_at, last_beat - stall_beat, samples)
+                samples = OrderedDict()
+                stall_beat = None
+                hang_reported = False
+                continue
+            if stall_beat is None:
+                if time.monotonic() - last_beat <= self._threshold:
+                    continue
+                stall_beat = last_beat
+                stall_started_at = time.time() - (time.monotonic() - last_beat)
+            stack = self._sample()
+            if stack is not None:
+                samples[stack] = samples.get(stack, 0) + 1
+            stalled_for = time.monotonic() - stall_beat
+            if (
+                self._print_reports
+                and not hang_reported
+                and stalled_for > _HANG_REPORT_AFTER
+            ):
+                hang_reported = True
+                hottest = (
+                    max(samples.items(), key=lambda item: item[1])[0] if samples else ""
+                )
+                print(
+                    f"GUI thread has not responded for {stalled_for:.1f}s, most sampled stack:\n"
+                    f"{hottest}",
+                    file=sys.stderr,
+                )
+
+    def _sample(self) -> Optional[str]:
+        # noinspection PyProtectedMember
+        frame = sys._current_frames().get(self._gui_thread_ident, None)
+        if frame is None:
+            return None
+        try:
+            return "".join(traceback.format_stack(frame, limit=_STACK_LIMIT))
+        finally:
+            del frame
+
+    # noinspection PyUnresolvedReferences
+    def _report(self, started_at: float, duration: float, samples: Dict[str, int]):
+        report = StallReport(
+            started_at=started_at,
+            duration=duration,
+            samples=tuple(sorted(samples.items(), key=lambda item: -item[1])),
+        )
+        with self._reports_lock:
+            self._reports.append(report)
+        if self._print_reports:
+            print(report.format(), file=sys.stderr)
+        self.sig_stall_detected.emit(report)
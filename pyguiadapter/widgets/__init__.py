@@ -1,4 +1,27 @@
-from .basic import *
-from .extend import *
+from typing import TYPE_CHECKING
+
+from . import basic, extend
 from .common import CommonParameterWidgetConfig, CommonParameterWidget
 from .factory import ParameterWidgetFactory
+from .._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .basic import *
+    from .extend import *
+
+# the widget classes of basic and extend are imported on first access, see basic._LAZY_ATTRS and extend._LAZY_ATTRS
+# noinspection PyProtectedMember
+_LAZY_ATTRS = {
+    **{name: ".basic" for name in basic._LAZY_ATTRS},
+    **{name: ".extend" for name in extend._LAZY_ATTRS},
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
+
+__all__ = [
+    *basic.__all__,
+    *extend.__all__,
+    "CommonParameterWidgetConfig",
+    "CommonParameterWidget",
+    "ParameterWidgetFactory",
+]
@@ -1,23 +1,67 @@
-from .base import StandaloneCodeEditorConfig
-from .intspin import IntSpinBoxConfig, IntSpinBox
-from .boolbox import BoolBoxConfig, BoolBox
-from .floatspin import FloatSpinBoxConfig, FloatSpinBox
-from .pyliteraledit import (
-    PyLiteralEdit,
-    PyLiteralEditConfig,
-    PyLiteralType,
-)
-from .dictedit import DictEdit, DictEditConfig
-from .listedit import ListEdit, ListEditConfig
-from .tupleedit import TupleEdit, TupleEditConfig
-from .setedit import SetEdit, SetEditConfig
-from .enumselect import EnumSelect, EnumSelectConfig
-from .base import BaseCodeEdit, BaseCodeEditConfig, BaseCodeFormatter
-from .lineedit import LineEdit, LineEditConfig
-from .exclusivechoice import ExclusiveChoiceBox, ExclusiveChoiceBoxConfig
-from .datetimeedit import DateTimeEdit, DateTimeEditConfig
-from .dateedit import DateEdit, DateEditConfig
-from .timeedit import TimeEdit, TimeEditConfig
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .base import StandaloneCodeEditorConfig
+    from .intspin import IntSpinBoxConfig, IntSpinBox
+    from .boolbox import BoolBoxConfig, BoolBox
+    from .floatspin import FloatSpinBoxConfig, FloatSpinBox
+    from .pyliteraledit import (
+        PyLiteralEdit,
+        PyLiteralEditConfig,
+        PyLiteralType,
+    )
+    from .dictedit import DictEdit, DictEditConfig
+    from .listedit import ListEdit, ListEditConfig
+    from .tupleedit import TupleEdit, TupleEditConfig
+    from .setedit import SetEdit, SetEditConfig
+    from .enumselect import EnumSelect, EnumSelectConfig
+    from .base import BaseCodeEdit, BaseCodeEditConfig, BaseCodeFormatter
+    from .lineedit import LineEdit, LineEditConfig
+    from .exclusivechoice import ExclusiveChoiceBox, ExclusiveChoiceBoxConfig
+    from .datetimeedit import DateTimeEdit, DateTimeEditConfig
+    from .dateedit import DateEdit, DateEditConfig
+    from .timeedit import TimeEdit, TimeEditConfig
+
+# the widget modules are imported on first access to their names
+_LAZY_ATTRS = {
+    "StandaloneCodeEditorConfig": ".base",
+    "IntSpinBoxConfig": ".intspin",
+    "IntSpinBox": ".intspin",
+    "BoolBoxConfig": ".boolbox",
+    "BoolBox": ".boolbox",
+    "FloatSpinBoxConfig": ".floatspin",
+    "FloatSpinBox": ".floatspin",
+    "PyLiteralEdit": ".pyliteraledit",
+    "PyLiteralEditConfig": ".pyliteraledit",
+    "PyLiteralType": ".pyliteraledit",
+    "DictEdit": ".dictedit",
+    "DictEditConfig": ".dictedit",
+    "ListEdit": ".listedit",
+    "ListEditConfig": ".listedit",
+    "TupleEdit": ".tupleedit",
+    "TupleEditConfig": ".tupleedit",
+    "SetEdit": ".setedit",
+    "SetEditConfig": ".setedit",
+    "EnumSelect": ".enumselect",
+    "EnumSelectConfig": ".enumselect",
+    "BaseCodeEdit": ".base",
+    "BaseCodeEditConfig": ".base",
+    "BaseCodeFormatter": ".base",
+    "LineEdit": ".lineedit",
+    "LineEditConfig": ".lineedit",
+    "ExclusiveChoiceBox": ".exclusivechoice",
+    "ExclusiveChoiceBoxConfig": ".exclusivechoice",
+    "DateTimeEdit": ".datetimeedit",
+    "DateTimeEditConfig": ".datetimeedit",
+    "DateEdit": ".dateedit",
+    "DateEditConfig": ".dateedit",
+    "TimeEdit": ".timeedit",
+    "TimeEditConfig": ".timeedit",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
 
 __all__ = [
     "LineEdit",
@@ -1,51 +1,8 @@
 from datetime import datetime, date, time
+from typing import Dict, Optional, Type
 
 from qtpy.QtGui import QColor
 
-from .basic import (
-    PyLiteralEdit,
-    PyLiteralType,
-    DictEdit,
-    ListEdit,
-    TupleEdit,
-    SetEdit,
-    LineEdit,
-    IntSpinBox,
-    FloatSpinBox,
-    BoolBox,
-    EnumSelect,
-    ExclusiveChoiceBox,
-    DateTimeEdit,
-    DateEdit,
-    TimeEdit,
-)
-from .extend import (
-    IntLineEdit,
-    FloatLineEdit,
-    JsonEdit,
-    TextEdit,
-    ChoiceBox,
-    MultiChoiceBox,
-    Slider,
-    Dial,
-    ColorTuplePicker,
-    ColorHexPicker,
-    ColorPicker,
-    KeySequenceEdit,
-    StringListEdit,
-    PlainDictEdit,
-    DirSelect,
-    FileSelect,
-    MultiFileSelect,
-    PathListEdit,
-    FileListEdit,
-    DirectoryListEdit,
-    FontSelect,
-    IntQuantityBox,
-    FloatQuantityBox,
-    StringDictEdit,
-    PathsEditor,
-)
 from ..parser.typenames import (
     TYPE_STR,
     TYPE_INT,
@@ -69,6 +26,7 @@ from ..parser.typenames import (
     TYPE_MUTABLE_SET,
     TYPING_TYPED_DICT,
 )
+from .._lazy import import_object
 from ..extend_types import (
     text_t,
     int_t,
@@ -96,6 +54,8 @@ from ..extend_types import (
     string_dict_t,
     paths_t,
 )
+from ..fn import ParameterInfo
+from ..utils import PyLiteralType
 
 TYPE_TEXT = text_t.__name__
 TYPE_INT_T = int_t.__name__
@@ -130,62 +90,81 @@ TYPE_STRING_DICT_T = string_dict_t.__name__
 TYPE_PATHS_T = paths_t.__name__
 
 
-BUILTIN_WIDGETS_MAP = {
-    TYPE_STR: LineEdit,
-    TYPE_TEXT: TextEdit,
-    TYPE_INT: IntSpinBox,
-    TYPE_BOOL: BoolBox,
-    TYPE_INT_T: IntLineEdit,
-    TYPE_FLOAT: FloatSpinBox,
-    TYPE_FLOAT_T: FloatLineEdit,
-    TYPE_DIR_T: DirSelect,
-    TYPE_FILE_T: FileSelect,
-    TYPE_FILES_T: MultiFileSelect,
-    TYPE_JSON_OBJ_T: JsonEdit,
-    TYPE_ANY: PyLiteralEdit,
-    TYPING_ANY: PyLiteralEdit,
-    TYPE_PY_LITERAL: PyLiteralEdit,
-    TYPING_UNION: PyLiteralEdit,
-    TYPE_OBJECT: PyLiteralEdit,
-    TYPE_DICT: DictEdit,
-    TYPING_DICT: DictEdit,
-    TYPE_MAPPING: DictEdit,
-    TYPE_MUTABLE_MAPPING: DictEdit,
-    TYPING_TYPED_DICT: DictEdit,
-    TYPE_LIST: ListEdit,
-    TYPING_LIST: ListEdit,
-    TYPE_TUPLE: TupleEdit,
-    TYPING_TUPLE: TupleEdit,
-    TYPE_SET: SetEdit,
-    TYPING_SET: SetEdit,
-    TYPE_MUTABLE_SET: SetEdit,
-    TYPING_LITERAL: ExclusiveChoiceBox,
-    TYPE_CHOICE_T: ChoiceBox,
-    TYPE_CHOICES_T: MultiChoiceBox,
-    TYPE_SLIDER_INT_T: Slider,
-    TYPE_DIAL_INT_T: Dial,
-    TYPE_DATETIME: DateTimeEdit,
-    TYPE_DATE: DateEdit,
-    TYPE_TIME: TimeEdit,
-    TYPE_COLOR_TUPLE: ColorTuplePicker,
-    TYPE_COLOR_HEX: ColorHexPicker,
-    TYPE_QCOLOR: ColorPicker,
-    TYPE_COLOR_T: ColorPicker,
-    TYPE_KEY_SEQUENCE_T: KeySequenceEdit,
-    TYPE_STRING_LIST_T: StringListEdit,
-    TYPE_PLAIN_DICT_T: PlainDictEdit,
-    TYPE_PATH_LIST_T: PathListEdit,
-    TYPE_FILE_LIST_T: FileListEdit,
-    TYPE_DIR_LIST_T: DirectoryListEdit,
-    TYPE_FONT_T: FontSelect,
-    TYPE_INT_QUANTITY: IntQuantityBox,
-    TYPE_FLOAT_QUANTITY: FloatQuantityBox,
-    TYPE_STRING_DICT_T: StringDictEdit,
-    TYPE_PATHS_T: PathsEditor,
+_BASIC = f"{__package__}.basic"
+_EXTEND = f"{__package__}.extend"
+
+# typename -> "module:class" of the builtin widgets, the widget modules are imported when the typename is looked up
+# for the first time, see ParameterWidgetRegistry.register_lazy()
+BUILTIN_WIDGETS_MAP: Dict[str, str] = {
+    TYPE_STR: f"{_BASIC}.lineedit:LineEdit",
+    TYPE_TEXT: f"{_EXTEND}.textedit:TextEdit",
+    TYPE_INT: f"{_BASIC}.intspin:IntSpinBox",
+    TYPE_BOOL: f"{_BASIC}.boolbox:BoolBox",
+    TYPE_INT_T: f"{_EXTEND}.intedit:IntLineEdit",
+    TYPE_FLOAT: f"{_BASIC}.floatspin:FloatSpinBox",
+    TYPE_FLOAT_T: f"{_EXTEND}.floatedit:FloatLineEdit",
+    TYPE_DIR_T: f"{_EXTEND}.dirselect:DirSelect",
+    TYPE_FILE_T: f"{_EXTEND}.fileselect:FileSelect",
+    TYPE_FILES_T: f"{_EXTEND}.fileselect:MultiFileSelect",
+    TYPE_JSON_OBJ_T: f"{_EXTEND}.jsonedit:JsonEdit",
+    TYPE_ANY: f"{_BASIC}.pyliteraledit:PyLiteralEdit",
+    TYPING_ANY: f"{_BASIC}.pyliteraledit:PyLiteralEdit",
+    TYPE_PY_LITERAL: f"{_BASIC}.pyliteraledit:PyLiteralEdit",
+    TYPING_UNION: f"{_BASIC}.pyliteraledit:PyLiteralEdit",
+    TYPE_OBJECT: f"{_BASIC}.pyliteraledit:PyLiteralEdit",
+    TYPE_DICT: f"{_BASIC}.dictedit:DictEdit",
+    TYPING_DICT: f"{_BASIC}.dictedit:DictEdit",
+    TYPE_MAPPING: f"{_BASIC}.dictedit:DictEdit",
+    TYPE_MUTABLE_MAPPING: f"{_BASIC}.dictedit:DictEdit",
+    TYPING_TYPED_DICT: f"{_BASIC}.dictedit:DictEdit",
+    TYPE_LIST: f"{_BASIC}.listedit:ListEdit",
+    TYPING_LIST: f"{_BASIC}.listedit:ListEdit",
+    TYPE_TUPLE: f"{_BASIC}.tupleedit:TupleEdit",
+    TYPING_TUPLE: f"{_BASIC}.tupleedit:TupleEdit",
+    TYPE_SET: f"{_BASIC}.setedit:SetEdit",
+    TYPING_SET: f"{_BASIC}.setedit:SetEdit",
+    TYPE_MUTABLE_SET: f"{_BASIC}.setedit:SetEdit",
+    TYPING_LITERAL: f"{_BASIC}.exclusivechoice:ExclusiveChoiceBox",
+    TYPE_CHOICE_T: f"{_EXTEND}.choicebox:ChoiceBox",
+    TYPE_CHOICES_T: f"{_EXTEND}.multichoice:MultiChoiceBox",
+    TYPE_SLIDER_INT_T: f"{_EXTEND}.slider:Slider",
+    TYPE_DIAL_INT_T: f"{_EXTEND}.dial:Dial",
+    TYPE_DATETIME: f"{_BASIC}.datetimeedit:DateTimeEdit",
+    TYPE_DATE: f"{_BASIC}.dateedit:DateEdit",
+    TYPE_TIME: f"{_BASIC}.timeedit:TimeEdit",
+    TYPE_COLOR_TUPLE: f"{_EXTEND}.colorpicker:ColorTuplePicker",
+    TYPE_COLOR_HEX: f"{_EXTEND}.colorpicker:ColorHexPicker",
+    TYPE_QCOLOR: f"{_EXTEND}.colorpicker:ColorPicker",
+    TYPE_COLOR_T: f"{_EXTEND}.colorpicker:ColorPicker",
+    TYPE_KEY_SEQUENCE_T: f"{_EXTEND}.keysequenceedit:KeySequenceEdit",
+    TYPE_STRING_LIST_T: f"{_EXTEND}.stringlist:StringListEdit",
+    TYPE_PLAIN_DICT_T: f"{_EXTEND}.plaindict:PlainDictEdit",
+    TYPE_PATH_LIST_T: f"{_EXTEND}.pathlist:PathListEdit",
+    TYPE_FILE_LIST_T: f"{_EXTEND}.pathlist:FileListEdit",
+    TYPE_DIR_LIST_T: f"{_EXTEND}.pathlist:DirectoryListEdit",
+    TYPE_FONT_T: f"{_EXTEND}.fontselect:FontSelect",
+    TYPE_INT_QUANTITY: f"{_EXTEND}.quantitybox:IntQuantityBox",
+    TYPE_FLOAT_QUANTITY: f"{_EXTEND}.quantitybox:FloatQuantityBox",
+    TYPE_STRING_DICT_T: f"{_EXTEND}.stringdict:StringDictEdit",
+    TYPE_PATHS_T: f"{_EXTEND}.pathseditor:PathsEditor",
 }
 
-# noinspection PyProtectedMember
+
+def _enum_type_mapping_rule(parameter_info: ParameterInfo) -> Optional[Type]:
+    # noinspection PyProtectedMember
+    return import_object(f"{_BASIC}.enumselect:EnumSelect")._enum_type_mapping_rule(
+        parameter_info
+    )
+
+
+def _dict_mapping_rule(parameter_info: ParameterInfo) -> Optional[Type]:
+    # noinspection PyProtectedMember
+    return import_object(f"{_BASIC}.dictedit:DictEdit")._dict_mapping_rule(
+        parameter_info
+    )
+
+
 BUILTIN_WIDGETS_MAPPING_RULES = [
-    EnumSelect._enum_type_mapping_rule,
-    DictEdit._dict_mapping_rule,
+    _enum_type_mapping_rule,
+    _dict_mapping_rule,
 ]
@@ -1,52 +1,129 @@
-from .choicebox import ChoiceBox, ChoiceBoxConfig
-from .multichoice import MultiChoiceBox, MultiChoiceBoxConfig
-from .slider import Slider, SliderConfig
-from .dial import Dial, DialConfig
-from .colorpicker import (
-    ColorType,
-    ColorPicker,
-    ColorPickerConfig,
-    ColorTuplePicker,
-    ColorTuplePickerConfig,
-    ColorHexPickerConfig,
-    ColorHexPicker,
-)
-from .keysequenceedit import KeySequenceEdit, KeySequenceEditConfig, KeySequenceFormat
-from .stringlist import StringListEdit, StringListEditConfig
-from .plaindict import PlainDictEdit, PlainDictEditConfig
-from .fileselect import (
-    FileSelectConfig,
-    FileSelect,
-    MultiFileSelectConfig,
-    MultiFileSelect,
-)
-from .dirselect import DirSelectConfig, DirSelect
-from .intedit import IntLineEditConfig, IntLineEdit
-from .floatedit import FloatLineEditConfig, FloatLineEdit
-from .jsonedit import JsonEditConfig, JsonEdit
-from .textedit import TextEdit, TextEditConfig
-from .pathlist import (
-    PathListEdit,
-    PathListEditConfig,
-    FileListEdit,
-    DirectoryListEdit,
-    PathEditDialogConfig,
-    FileListEditConfig,
-    DirectoryListEditConfig,
-)
-from .fontselect import FontSelect, FontSelectConfig
-from .quantitybox import (
-    IntQuantityBox,
-    IntQuantityBoxConfig,
-    FloatQuantityBox,
-    FloatQuantityBoxConfig,
-)
+from typing import TYPE_CHECKING
 
-from .stringdict import StringDictEdit, StringDictEditConfig, StringDictItemEditorConfig
-from .pathseditor import PathsEditor, PathsEditorConfig
+from ..._lazy import lazy_module_attrs
 
-from .objecteditor import SchemaObjectEditorConfig, SchemaObjectEditor
-from .objectseditor import SchemaObjectsEditorConfig, SchemaObjectsEditor
+if TYPE_CHECKING:
+    from .choicebox import ChoiceBox, ChoiceBoxConfig
+    from .multichoice import MultiChoiceBox, MultiChoiceBoxConfig
+    from .slider import Slider, SliderConfig
+    from .dial import Dial, DialConfig
+    from .colorpicker import (
+        ColorType,
+        ColorPicker,
+        ColorPickerConfig,
+        ColorTuplePicker,
+        ColorTuplePickerConfig,
+        ColorHexPickerConfig,
+        ColorHexPicker,
+    )
+    from .keysequenceedit import (
+        KeySequenceEdit,
+        KeySequenceEditConfig,
+        KeySequenceFormat,
+    )
+    from .stringlist import StringListEdit, StringListEditConfig
+    from .plaindict import PlainDictEdit, PlainDictEditConfig
+    from .fileselect import (
+        FileSelectConfig,
+        FileSelect,
+        MultiFileSelectConfig,
+        MultiFileSelect,
+    )
+    from .dirselect import DirSelectConfig, DirSelect
+    from .intedit import IntLineEditConfig, IntLineEdit
+    from .floatedit import FloatLineEditConfig, FloatLineEdit
+    from .jsonedit import JsonEditConfig, JsonEdit
+    from .textedit import TextEdit, TextEditConfig
+    from .pathlist import (
+        PathListEdit,
+        PathListEditConfig,
+        FileListEdit,
+        DirectoryListEdit,
+        PathEditDialogConfig,
+        FileListEditConfig,
+        DirectoryListEditConfig,
+    )
+    from .fontselect import FontSelect, FontSelectConfig
+    from .quantitybox import (
+        IntQuantityBox,
+        IntQuantityBoxConfig,
+        FloatQuantityBox,
+        FloatQuantityBoxConfig,
+    )
+
+    from .stringdict import (
+        StringDictEdit,
+        StringDictEditConfig,
+        StringDictItemEditorConfig,
+    )
+    from .pathseditor import PathsEditor, PathsEditorConfig
+
+    from .objecteditor import SchemaObjectEditorConfig, SchemaObjectEditor
+    from .objectseditor import SchemaObjectsEditorConfig, SchemaObjectsEditor
+
+# the widget modules are imported on first access to their names
+_LAZY_ATTRS = {
+    "ChoiceBox": ".choicebox",
+    "ChoiceBoxConfig": ".choicebox",
+    "MultiChoiceBox": ".multichoice",
+    "MultiChoiceBoxConfig": ".multichoice",
+    "Slider": ".slider",
+    "SliderConfig": ".slider",
+    "Dial": ".dial",
+    "DialConfig": ".dial",
+    "ColorType": ".colorpicker",
+    "ColorPicker": ".colorpicker",
+    "ColorPickerConfig": ".colorpicker",
+    "ColorTuplePicker": ".colorpicker",
+    "ColorTuplePickerConfig": ".colorpicker",
+    "ColorHexPickerConfig": ".colorpicker",
+    "ColorHexPicker": ".colorpicker",
+    "KeySequenceEdit": ".keysequenceedit",
+    "KeySequenceEditConfig": ".keysequenceedit",
+    "KeySequenceFormat": ".keysequenceedit",
+    "StringListEdit": ".stringlist",
+    "StringListEditConfig": ".stringlist",
+    "PlainDictEdit": ".plaindict",
+    "PlainDictEditConfig": ".plaindict",
+    "FileSelectConfig": ".fileselect",
+    "FileSelect": ".fileselect",
+    "MultiFileSelectConfig": ".fileselect",
+    "MultiFileSelect": ".fileselect",
+    "DirSelectConfig": ".dirselect",
+    "DirSelect": ".dirselect",
+    "IntLineEditConfig": ".intedit",
+    "IntLineEdit": ".intedit",
+    "FloatLineEditConfig": ".floatedit",
+    "FloatLineEdit": ".floatedit",
+    "JsonEditConfig": ".jsonedit",
+    "JsonEdit": ".jsonedit",
+    "TextEdit": ".textedit",
+    "TextEditConfig": ".textedit",
+    "PathListEdit": ".pathlist",
+    "PathListEditConfig": ".pathlist",
+    "FileListEdit": ".pathlist",
+    "DirectoryListEdit": ".pathlist",
+    "PathEditDialogConfig": ".pathlist",
+    "FileListEditConfig": ".pathlist",
+    "DirectoryListEditConfig": ".pathlist",
+    "FontSelect": ".fontselect",
+    "FontSelectConfig": ".fontselect",
+    "IntQuantityBox": ".quantitybox",
+    "IntQuantityBoxConfig": ".quantitybox",
+    "FloatQuantityBox": ".quantitybox",
+    "FloatQuantityBoxConfig": ".quantitybox",
+    "StringDictEdit": ".stringdict",
+    "StringDictEditConfig": ".stringdict",
+    "StringDictItemEditorConfig": ".stringdict",
+    "PathsEditor": ".pathseditor",
+    "PathsEditorConfig": ".pathseditor",
+    "SchemaObjectEditorConfig": ".objecteditor",
+    "SchemaObjectEditor": ".objecteditor",
+    "SchemaObjectsEditorConfig": ".objectseditor",
+    "SchemaObjectsEditor": ".objectseditor",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
 
 __all__ = [
     "IntLineEdit",
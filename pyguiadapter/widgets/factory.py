@@ -2,6 +2,7 @@ import warnings
 from typing import Dict, Type, List, Optional, Callable, Union
 
 from .builtin import BUILTIN_WIDGETS_MAP, BUILTIN_WIDGETS_MAPPING_RULES
+from .._lazy import import_object
 from ..exceptions import AlreadyRegisteredError
 from ..fn import ParameterInfo
 from ..paramwidget import (
@@ -13,7 +14,8 @@ from ..parser import typenames
 
 class ParameterWidgetRegistry(object):
     def __init__(self):
-        self._registry: Dict[str, Type[BaseParameterWidget]] = {}
+        # typename -> widget class, or "module:class" of a widget class that has not been imported yet
+        self._registry: Dict[str, Union[Type[BaseParameterWidget], str]] = {}
 
         self.register_all(BUILTIN_WIDGETS_MAP)
 
@@ -23,28 +25,42 @@ class ParameterWidgetRegistry(object):
         widget_class: Type[BaseParameterWidget],
         replace: bool = False,
     ):
-        typ = self._to_typename(typ)
         if not is_parameter_widget_class(widget_class):
             raise TypeError(
                 f"widget_class is not a subclass of BaseParameterWidget: {widget_class}"
             )
-        old_widget_class = self._registry.get(typ, None)
-        if old_widget_class is not None:
-            if not replace:
-                raise AlreadyRegisteredError(
-                    f"typename has been registered already: {typ} -> {old_widget_class}"
-                )
-            else:
-                self._registry[typ] = widget_class
-            return
-        self._registry[typ] = widget_class
+        self._register(typ, widget_class, replace)
 
-    def register_all(self, mapping: Dict[Union[str, Type], Type[BaseParameterWidget]]):
+    def register_lazy(
+        self,
+        typ: Union[str, Type],
+        widget_class_path: str,
+        replace: bool = False,
+    ):
+        """
+        注册一个控件类的导入路径（形如`"package.module:ClassName"`），控件类所在的模块将在首次查找该类型时才被导入。
+        """
+        module_name, _, class_name = widget_class_path.partition(":")
+        if not module_name or not class_name:
+            raise ValueError(
+                f"widget_class_path must be in the form of 'module:class': {widget_class_path}"
+            )
+        self._register(typ, widget_class_path, replace)
+
+    def register_all(
+        self, mapping: Dict[Union[str, Type], Union[Type[BaseParameterWidget], str]]
+    ):
         for typename, widget_class in mapping.items():
-            self.register(typename, widget_class)
+            if isinstance(widget_class, str):
+                self.register_lazy(typename, widget_class)
+            else:
+                self.register(typename, widget_class)
 
     def unregister(self, typ: Union[str, Type]) -> Optional[Type[BaseParameterWidget]]:
-        return self._registry.pop(self._to_typename(typ), None)
+        typename = self._to_typename(typ)
+        widget_class = self._resolve(typename)
+        self._registry.pop(typename, None)
+        return widget_class
 
     def unregister_all(self, typs: List[Union[str, Type]]):
         for typ in typs:
@@ -56,19 +72,49 @@ class ParameterWidgetRegistry(object):
     def find_by_typename(
         self, typ: Union[str, Type]
     ) -> Optional[Type[BaseParameterWidget]]:
-        return self._registry.get(self._to_typename(typ), None)
+        return self._resolve(self._to_typename(typ))
 
     def find_by_widget_class_name(
         self, widget_class_name: str
     ) -> Optional[Type[BaseParameterWidget]]:
-        return next(
-            (
-                widget_class
-                for widget_class in self._registry.values()
-                if widget_class.__name__ == widget_class_name
-            ),
-            None,
-        )
+        for typename, widget_class in self._registry.items():
+            if isinstance(widget_class, str):
+                # compare the class name in the path to avoid importing all the widget modules
+                if widget_class.rpartition(":")[2] == widget_class_name:
+                    return self._resolve(typename)
+            elif widget_class.__name__ == widget_class_name:
+                return widget_class
+        return None
+
+    def _register(
+        self,
+        typ: Union[str, Type],
+        widget_class: Union[Type[BaseParameterWidget], str],
+        replace: bool,
+    ):
+        typ = self._to_typename(typ)
+        old_widget_class = self._registry.get(typ, None)
+        if old_widget_class is not None and not replace:
+            raise AlreadyRegisteredError(
+                f"typename has been registered already: {typ} -> {old_widget_class}"
+            )
+        self._registry[typ] = widget_class
+
+    def _resolve(self, typename: str) -> Optional[Type[BaseParameterWidget]]:
+        widget_class = self._registry.get(typename, None)
+        if not isinstance(widget_class, str):
+            return widget_class
+        widget_class_path = widget_class
+        widget_class = import_object(widget_class_path)
+        if not is_parameter_widget_class(widget_class):
+            raise TypeError(
+                f"widget class imported from '{widget_class_path}' is not a subclass of BaseParameterWidget: {widget_class}"
+            )
+        # the same class may be registered for several typenames, all of them are resolved at once
+        for key, value in self._registry.items():
+            if value == widget_class_path:
+                self._registry[key] = widget_class
+        return widget_class
 
     @staticmethod
     def _to_typename(typ: Union[str, Type]) -> str:
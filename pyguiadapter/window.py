@@ -9,7 +9,7 @@
 import dataclasses
 from abc import abstractmethod
 from concurrent.futures import Future
-from typing import Tuple, Dict, List, Optional, Union, Sequence, Callable
+from typing import Tuple, Dict, List, Optional, Union, Sequence, Callable, Any
 
 from qtpy.QtCore import QSize, Qt, Signal
 from qtpy.QtGui import QAction, QIcon, QActionGroup, QClipboard
@@ -629,11 +629,9 @@ class BaseWindow(QMainWindow):
     def owns_selection() -> bool:
         return QApplication.clipboard().ownsSelection()
 
-    def on_clipboard_operation(self, future: Future, operation: int, data: object):
+    def clipboard_operation(self, operation: int, data: object) -> Any:
         if operation == CLIPBOARD_GET_TEXT:
-            text = self.get_clipboard_text()
-            future.set_result(text)
-            return
+            return self.get_clipboard_text()
 
         if operation == CLIPBOARD_SET_TEXT:
             if not isinstance(data, str):
@@ -641,13 +639,10 @@ class BaseWindow(QMainWindow):
                     operation, f"data must be a str, got {data}"
                 )
             self.set_clipboard_text(data)
-            future.set_result(None)
-            return
+            return None
 
         if operation == CLIPBOARD_GET_SELECTION_TEXT:
-            text = self.get_selection_text()
-            future.set_result(text)
-            return
+            return self.get_selection_text()
 
         if operation == CLIPBOARD_SET_SELECTION_TEXT:
             if not isinstance(data, str):
@@ -655,25 +650,28 @@ class BaseWindow(QMainWindow):
                     operation, f"data must be a str, got {data}"
                 )
             self.set_selection_text(data)
-            future.set_result(None)
-            return
+            return None
 
         if operation == CLIPBOARD_SUPPORTS_SELECTION:
-            future.set_result(self.supports_selection())
-            return
+            return self.supports_selection()
 
         if operation == CLIPBOARD_OWNS_CLIPBOARD:
-            future.set_result(self.owns_clipboard())
-            return
+            return self.owns_clipboard()
 
         if operation == CLIPBOARD_OWNS_SELECTION:
-            future.set_result(self.owns_selection())
-            return
+            return self.owns_selection()
 
         raise ClipboardOperationError(
             operation, f"invalid clipboard operation: {operation}"
         )
 
+    def on_clipboard_operation(self, future: Future, operation: int, data: object):
+        try:
+            future.set_result(self.clipboard_operation(operation, data))
+        except ClipboardOperationError as e:
+            future.set_exception(e)
+            raise
+
     def show_toast(
         self,
         message: str,
@@ -11,6 +11,8 @@ from ._base import (
     FnExecuteWindowEventListener,
     SimpleFnExecuteWindowEventListener,
 )
+from ._job_area import JobViewConfig
+from ._log_area import LogViewConfig
 from ._output_area import ProgressBarConfig, OutputBrowserConfig
 from ._window import FnExecuteWindow
 
@@ -19,6 +21,8 @@ __all__ = [
     "FnExecuteWindow",
     "ProgressBarConfig",
     "OutputBrowserConfig",
+    "LogViewConfig",
+    "JobViewConfig",
     "DockWidgetArea",
     "TopDockWidgetArea",
     "BottomDockWidgetArea",
@@ -1,14 +1,18 @@
 import dataclasses
+import inspect
 from abc import abstractmethod
 from typing import Tuple, Dict, Union, Type, Optional, Literal, Any, Callable, List
 
 from qtpy.QtCore import QSize, Qt
 
+from ._job_area import JobViewConfig
+from ._log_area import LogViewConfig, LogRecord
 from ._output_area import OutputBrowserConfig, ProgressBarConfig
 from ..document_browser import DocumentBrowserConfig
 from ...exceptions import ParameterError
 from ...executor import ExecuteStateListener
 from ...executors import ThreadFunctionExecutor
+from ...metrics import ExecutionMetrics
 from ...paramwidget import (
     BaseParameterWidget,
     BaseParameterWidgetConfig,
@@ -55,6 +59,12 @@ class FnExecuteWindowConfig(BaseWindowConfig):
     clear_button_text: str = "Clear"
     """清除按钮文本。"""
 
+    batch_button_text: str = "Batch..."
+    """批量执行按钮文本。仅在以`batch=True`添加函数时显示该按钮。"""
+
+    batch_dialog_title: str = "Batch Execution"
+    """批量执行对话框的标题。"""
+
     clear_button_visible: bool = True
     """是否显示清除按钮。"""
 
@@ -121,6 +131,72 @@ class FnExecuteWindowConfig(BaseWindowConfig):
     )
     """`文档浏览器`的配置。"""
 
+    log_view_config: Optional[LogViewConfig] = None
+    """`日志视图`的配置。若指定，窗口将创建一个`Logs停靠窗口`，`uoutput.Logger`及`uoutput.info()`等函数输出的日志将显示在其中，
+    而不是以html的形式打印到`输出浏览器`中。日志视图只渲染可见的行，并支持按日志级别过滤和搜索。"""
+
+    log_dock_title: str = "Logs"
+    """`Logs停靠窗口`的标题。"""
+
+    job_view_config: Optional[JobViewConfig] = None
+    """`作业视图`的配置。仅在函数执行器支持并发执行（例如`ConcurrentProcessFunctionExecutor`）时，窗口才会创建`Jobs停靠窗口`，
+    用于查看排队中、执行中和已结束的作业，查看各作业的输出，以及取消指定的作业。为`None`时使用默认配置。"""
+
+    job_dock_title: str = "Jobs"
+    """`Jobs停靠窗口`的标题。"""
+
+    signal_profiling: bool = False
+    """是否启用信号流量分析。启用后，将统计每次执行期间工作线程（或工作进程）向GUI线程发出的各类信号、请求和调用的次数、排队延迟和处理耗时，
+    并在`Diagnostics停靠窗口`中按执行显示，汇总结果可以导出为JSON文件，用于找出使事件循环过载的函数。分析本身会带来少量的额外开销，
+    建议仅在排查界面卡顿问题时启用。"""
+
+    diagnostics_dock_title: str = "Diagnostics"
+    """`Diagnostics停靠窗口`的标题。"""
+
+    execution_metrics_in_statusbar: bool = True
+    """执行结束后是否在状态栏中显示本次执行的指标（耗时、CPU时间、内存峰值增长、输出次数及字符数、进度更新次数）。
+    仅在状态栏可见（`statusbar_visible=True`）时才能看到。"""
+
+    metrics_dock_visible: bool = False
+    """是否创建`Metrics停靠窗口`。该窗口以表格形式列出每次执行的指标，最新的记录位于最上方，记录可以导出为CSV文件，
+    便于跟踪函数性能的变化。"""
+
+    metrics_dock_title: str = "Metrics"
+    """`Metrics停靠窗口`的标题。"""
+
+    max_metrics_records: int = 1000
+    """`Metrics停靠窗口`中最多保留的记录数。"""
+
+    execution_history: bool = False
+    """是否记录执行历史。启用后，每次执行的参数快照、耗时、执行状态、结果（或异常）以及截断后的输出将被异步写入一个SQLite数据库
+    （参见`pyguiadapter.history.ExecutionHistory`），窗口关闭后依然保留，并按函数区分。"""
+
+    history_file: Optional[str] = None
+    """执行历史数据库文件的路径，为`None`时使用用户配置目录下的`PyGUIAdapter/history.sqlite3`。"""
+
+    history_max_records: int = 1000
+    """数据库中每个函数最多保留的记录数，更早的记录将被删除。"""
+
+    history_max_output_chars: int = 4096
+    """每条记录最多保存的输出字符数。"""
+
+    history_dock_visible: bool = True
+    """启用执行历史时，是否创建`History停靠窗口`。在该窗口中可以按执行状态筛选记录，查看记录的详细信息，将记录中的参数填入参数控件，
+    或者以记录中的参数重新执行函数。"""
+
+    history_dock_title: str = "History"
+    """`History停靠窗口`的标题。"""
+
+    history_dock_max_rows: int = 200
+    """`History停靠窗口`中最多显示的记录数。"""
+
+    history_unrestorable_message: str = "The following arguments cannot be restored: {}"
+    """历史记录中的部分参数无法还原时显示的消息。"""
+
+    progress_update_interval: int = 50
+    """进度条及进度对话框的最小刷新间隔（毫秒）。在一个刷新间隔内多次调用`update_progress()`或`update_progress_dialog()`时，
+    只有最后一次的进度值会被显示（未指定info时沿用此前的info），最终的进度值总会被显示。设置为`0`时，将在事件循环空闲时尽快刷新。"""
+
     default_parameter_group_name: str = "Main Parameters"
     """默认函数参数分组的名称。"""
 
@@ -130,6 +206,15 @@ class FnExecuteWindowConfig(BaseWindowConfig):
     parameter_group_icons: Dict[str, IconType] = dataclasses.field(default_factory=dict)
     """除默认函数参数分组外其他函数参数分组的图标"""
 
+    lazy_parameter_widgets: bool = True
+    """是否延迟创建参数控件。启用后，每个参数分组中的参数控件在该分组首次被展开（显示）时才被创建，对于参数较多的函数，可以显著加快窗口的打开速度。
+    读取或设置某个参数的值（例如执行函数时调用`get_parameter_values()`）时，其所在分组的参数控件也会被创建，因此得到的值与不延迟创建时完全相同。"""
+
+    virtual_parameter_page_threshold: Optional[int] = None
+    """参数分组使用虚拟化页面的参数数量阈值。一次添加的参数中，某个分组的参数数量达到该值时，该分组将使用虚拟化的参数页面：只为当前可见的参数创建控件，
+    滚动时释放移出视图的控件并为移入视图的参数创建新的控件，未显示的参数的值被保存在字典中。这样，无论参数有多少，打开和滚动页面的开销都基本不变。
+    为`None`时不使用虚拟化页面。"""
+
     disable_widgets_on_execute: bool = False
     """是否在函数执行期间使参数控件处于不可输入状态。"""
 
@@ -160,9 +245,23 @@ class FnExecuteWindowConfig(BaseWindowConfig):
     function_result_message: str = "function result: {}\n"
     """函数调用结果的消息模板，模板变量（`{}`）为函数的返回值。"""
 
+    stream_item_message: str = "{}\n"
+    """生成器函数（包括异步生成器函数）产生的每个结果的消息模板，模板变量（`{}`）为产生的结果。生成器函数的结果将在产生时立即打印到`输出浏览器`中，
+    而不是在函数结束后一次性显示，并且不会被收集起来，因此无论产生多少结果，内存占用都不会随之增长。仅在`print_function_result`为`True`时打印。"""
+
+    stream_result_message: str = "function yielded {} item(s)\n"
+    """生成器函数结束时的消息模板，模板变量（`{}`）为其产生的结果的数量。对于生成器函数，该消息将代替`function_result_message`。"""
+
+    stream_progress: bool = True
+    """进度条可见时，生成器函数每产生一个结果，是否将进度条前进一步。这样，生成器函数只需在开始时调用`show_progressbar()`指定结果的总数，
+    而无需自行更新进度。"""
+
     function_error_message: str = "{}: {}\n"
     """函数异常或错误的消息模板，模板第一个变量（`{}`）为`异常的类型`，第二个变量(`{}`)为`异常的消息（message）`。"""
 
+    function_cancelled_message: str = "function cancelled\n"
+    """函数通过`CancellationToken.raise_if_cancelled()`响应取消请求时打印的消息。此时不会弹窗显示错误。"""
+
     function_executing_message: str = "A function is executing now!"
     """提示消息，用以提示“函数正在执行”。"""
 
@@ -179,6 +278,16 @@ class BaseFnExecuteWindow(BaseWindow, ExecuteStateListener):
     def _create_ui(self):
         pass
 
+    @property
+    def output_browser_config(self) -> OutputBrowserConfig:
+        self._config: FnExecuteWindowConfig
+        return self._config.output_browser_config or OutputBrowserConfig()
+
+    @property
+    def progress_update_interval(self) -> int:
+        self._config: FnExecuteWindowConfig
+        return self._config.progress_update_interval
+
     @abstractmethod
     def update_progressbar_config(
         self, config: Union[ProgressBarConfig, dict, None]
@@ -209,6 +318,18 @@ class BaseFnExecuteWindow(BaseWindow, ExecuteStateListener):
     def clear_output(self) -> None:
         pass
 
+    @abstractmethod
+    def is_log_view_enabled(self) -> bool:
+        pass
+
+    @abstractmethod
+    def append_logs(self, records: List[LogRecord]) -> None:
+        pass
+
+    @abstractmethod
+    def clear_logs(self) -> None:
+        pass
+
     @abstractmethod
     def set_document(
         self, document: str, document_format: Literal["markdown", "html", "plaintext"]
@@ -471,6 +592,18 @@ class BaseFnExecuteWindow(BaseWindow, ExecuteStateListener):
     def show_progress_dialog(self, config: Dict[str, Any]) -> None:
         pass
 
+    def format_stream_item(self, item: Any) -> Optional[str]:
+        """
+        将生成器函数产生的结果格式化为要打印的文本，返回`None`时不打印。该方法在执行函数的线程中调用，不应访问任何控件。
+        """
+        self._config: FnExecuteWindowConfig
+        if not self._config.print_function_result:
+            return None
+        return self._config.stream_item_message.format(item)
+
+    def on_stream_items(self, count: int) -> None:
+        pass
+
     def dismiss_progress_dialog(self) -> None:
         pass
 
@@ -519,12 +652,16 @@ class FnExecuteWindowEventListener(BaseWindowEventListener):
         """
         return True
 
-    def on_execute_finish(self, window: BaseFnExecuteWindow) -> None:
+    def on_execute_finish(
+        self, window: BaseFnExecuteWindow, metrics: Optional[ExecutionMetrics] = None
+    ) -> None:
         """
         在函数执行结束时回调，无论函数执行是否成功，该回调函数都会被调用。
 
         Args:
             window: 当前窗口实例
+            metrics: 本次执行的指标（耗时、CPU时间、内存峰值增长、输出及进度更新次数等）。为了兼容旧代码，
+                只有在子类覆盖的方法接受该参数时才会传入。
 
         Returns:
             无返回值
@@ -547,7 +684,10 @@ class SimpleFnExecuteWindowEventListener(FnExecuteWindowEventListener):
         on_execute_start: Callable[[BaseFnExecuteWindow], None] = None,
         on_execute_result: Callable[[BaseFnExecuteWindow, Any], bool] = None,
         on_execute_error: Callable[[BaseFnExecuteWindow, BaseException], bool] = None,
-        on_execute_finish: Callable[[BaseFnExecuteWindow], None] = None,
+        on_execute_finish: Union[
+            Callable[[BaseFnExecuteWindow], None],
+            Callable[[BaseFnExecuteWindow, ExecutionMetrics], None],
+        ] = None,
     ):
         """
         构造函数。
@@ -561,7 +701,7 @@ class SimpleFnExecuteWindowEventListener(FnExecuteWindowEventListener):
             on_execute_start: `on_execute_start`回调函数
             on_execute_result: `on_execute_result`回调函数
             on_execute_error:  `on_execute_error`回调函数
-            on_execute_finish:  `on_execute_finish`回调函数
+            on_execute_finish:  `on_execute_finish`回调函数，若其接受第二个参数，则本次执行的指标（`ExecutionMetrics`）将被传入
         """
         self._on_create = on_create
         self._on_show = on_show
@@ -615,7 +755,21 @@ class SimpleFnExecuteWindowEventListener(FnExecuteWindowEventListener):
             return self._on_execute_error(window, error)
         return super().on_execute_error(window, error)
 
-    def on_execute_finish(self, window: BaseFnExecuteWindow) -> None:
+    def on_execute_finish(
+        self, window: BaseFnExecuteWindow, metrics: Optional[ExecutionMetrics] = None
+    ) -> None:
         if self._on_execute_finish is not None:
+            if _accepts_metrics(self._on_execute_finish):
+                return self._on_execute_finish(window, metrics)
             return self._on_execute_finish(window)
-        return super().on_execute_finish(window)
+        return super().on_execute_finish(window, metrics)
+
+
+def _accepts_metrics(on_execute_finish: Callable[..., None]) -> bool:
+    # on_execute_finish() used to take the window only, callbacks and overrides written that way
+    # are still called without the metrics
+    try:
+        inspect.signature(on_execute_finish).bind(None, None)
+    except (TypeError, ValueError):
+        return False
+    return True
@@ -0,0 +1,277 @@
+import ast
+import csv
+import io
+import itertools
+import os
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Callable
+
+from qtpy.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QTabWidget,
+    QWidget,
+    QLineEdit,
+    QPlainTextEdit,
+    QPushButton,
+    QSpinBox,
+    QLabel,
+    QDialogButtonBox,
+    QScrollArea,
+)
+
+from ...exceptions import ParameterError
+from ...utils import filedialog, messagebox
+
+GRID_PLACEHOLDER = "current value"
+CSV_PLACEHOLDER = "name_a,name_b\n1,'x'\n2,'y'"
+
+MODE_GRID = 0
+MODE_CSV = 1
+
+# converts and validates the arguments of the runs, raises ParameterError for an invalid argument
+ArgumentsValidator = Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+
+def parse_value(text: str) -> Any:
+    """
+    将文本解析为Python字面量，无法解析时将其视为字符串。
+    """
+    text = text.strip()
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return text
+
+
+def expand_grid(
+    base_arguments: Dict[str, Any], grid: Dict[str, Sequence[Any]]
+) -> List[Dict[str, Any]]:
+    """
+    以`base_arguments`为基础，生成`grid`中各参数取值的笛卡尔积。
+    """
+    names = list(grid.keys())
+    arguments_list = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        arguments = OrderedDict(base_arguments)
+        arguments.update(zip(names, values))
+        arguments_list.append(arguments)
+    return arguments_list
+
+
+def parse_grid(texts: Dict[str, str]) -> Dict[str, List[Any]]:
+    """
+    解析各参数的取值列表。文本为空的参数将被忽略（使用当前值），列表或元组字面量将被展开为多个取值，其他文本将被视为单个取值。
+    """
+    grid = OrderedDict()
+    for name, text in texts.items():
+        if not text.strip():
+            continue
+        value = parse_value(text)
+        if isinstance(value, (list, tuple)):
+            if not value:
+                raise ValueError(f"empty value list for parameter '{name}'")
+            grid[name] = list(value)
+        else:
+            grid[name] = [value]
+    return grid
+
+
+def parse_csv(
+    base_arguments: Dict[str, Any], text: str, parameter_names: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    解析CSV格式的参数表。第一行为参数名称，其余每一行为一组参数，空单元格将使用当前值。
+    """
+    rows = [row for row in csv.reader(io.StringIO(text)) if any(c.strip() for c in row)]
+    if not rows:
+        return []
+    header = [name.strip() for name in rows[0]]
+    unknown = [name for name in header if name not in parameter_names]
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(unknown)}")
+    arguments_list = []
+    for line, row in enumerate(rows[1:], start=2):
+        if len(row) > len(header):
+            raise ValueError(f"line {line}: too many values")
+        arguments = OrderedDict(base_arguments)
+        for name, cell in zip(header, row):
+            if cell.strip():
+                arguments[name] = parse_value(cell)
+        arguments_list.append(arguments)
+    return arguments_list
+
+
+class BatchDialog(QDialog):
+    """
+    批量执行对话框。用户可以为各参数指定取值列表（笛卡尔积），或以CSV格式指定参数表，未指定的参数将使用参数控件的当前值。
+    点击`OK`时，各组参数将交由`validator`转换和校验，校验失败时对话框不会关闭，错误信息将显示在对话框中。
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QWidget],
+        base_arguments: Dict[str, Any],
+        parallelism: int,
+        *,
+        title: str = "Batch Execution",
+        max_parallelism: Optional[int] = None,
+        validator: Optional[ArgumentsValidator] = None,
+    ):
+        super().__init__(parent)
+        self._base_arguments = base_arguments
+        self._validator = validator
+        self._arguments_list: List[Dict[str, Any]] = []
+        self._grid_editors: Dict[str, QLineEdit] = OrderedDict()
+
+        self.setWindowTitle(title)
+        self.resize(560, 420)
+
+        self._layout = QVBoxLayout()
+        self.setLayout(self._layout)
+
+        self._tab_widget = QTabWidget(self)
+        self._layout.addWidget(self._tab_widget)
+
+        # grid page
+        grid_page = QScrollArea(self._tab_widget)
+        grid_page.setWidgetResizable(True)
+        grid_content = QWidget(grid_page)
+        grid_layout = QFormLayout()
+        grid_content.setLayout(grid_layout)
+        for name in base_arguments.keys():
+            editor = QLineEdit(grid_content)
+            editor.setPlaceholderText(GRID_PLACEHOLDER)
+            editor.setToolTip(f"current value: {base_arguments[name]!r}")
+            # noinspection PyUnresolvedReferences
+            editor.textChanged.connect(self._update_arguments)
+            grid_layout.addRow(name, editor)
+            self._grid_editors[name] = editor
+        grid_page.setWidget(grid_content)
+        self._tab_widget.addTab(grid_page, "Grid")
+
+        # csv page
+        csv_page = QWidget(self._tab_widget)
+        csv_layout = QVBoxLayout()
+        csv_page.setLayout(csv_layout)
+        self._csv_editor = QPlainTextEdit(csv_page)
+        self._csv_editor.setPlaceholderText(CSV_PLACEHOLDER)
+        # noinspection PyUnresolvedReferences
+        self._csv_editor.textChanged.connect(self._update_arguments)
+        csv_layout.addWidget(self._csv_editor)
+        load_button = QPushButton("Load...", csv_page)
+        # noinspection PyUnresolvedReferences
+        load_button.clicked.connect(self._on_load_button_clicked)
+        csv_layout.addWidget(load_button)
+        self._tab_widget.addTab(csv_page, "CSV")
+        # noinspection PyUnresolvedReferences
+        self._tab_widget.currentChanged.connect(self._update_arguments)
+
+        # noinspection PyArgumentList
+        bottom_layout = QHBoxLayout()
+        self._layout.addLayout(bottom_layout)
+        bottom_layout.addWidget(QLabel("Parallelism:", self))
+        self._parallelism_spinbox = QSpinBox(self)
+        self._parallelism_spinbox.setRange(1, max(max_parallelism or 1, parallelism))
+        self._parallelism_spinbox.setValue(parallelism)
+        bottom_layout.addWidget(self._parallelism_spinbox)
+        bottom_layout.addStretch(1)
+        self._summary_label = QLabel(self)
+        bottom_layout.addWidget(self._summary_label)
+
+        self._button_box = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self
+        )
+        # noinspection PyUnresolvedReferences
+        self._button_box.accepted.connect(self.accept)
+        # noinspection PyUnresolvedReferences
+        self._button_box.rejected.connect(self.reject)
+        self._layout.addWidget(self._button_box)
+
+        self._update_arguments()
+
+    @property
+    def arguments_list(self) -> List[Dict[str, Any]]:
+        return self._arguments_list
+
+    @property
+    def parallelism(self) -> int:
+        return self._parallelism_spinbox.value()
+
+    def accept(self):
+        if self._validator is not None and self._arguments_list:
+            try:
+                self._arguments_list = self._validator(self._arguments_list)
+            except ParameterError as e:
+                self._show_error(f"{e.parameter_name}: {e.message}")
+                return
+        super().accept()
+
+    def _show_error(self, message: str):
+        self._summary_label.setText(message)
+        self._summary_label.setStyleSheet("color: red")
+
+    def _update_arguments(self):
+        try:
+            if self._tab_widget.currentIndex() == MODE_CSV:
+                self._arguments_list = parse_csv(
+                    self._base_arguments,
+                    self._csv_editor.toPlainText(),
+                    list(self._base_arguments.keys()),
+                )
+            else:
+                grid = parse_grid(
+                    {name: editor.text() for name, editor in self._grid_editors.items()}
+                )
+                self._arguments_list = expand_grid(self._base_arguments, grid)
+        except ValueError as e:
+            self._arguments_list = []
+            self._show_error(str(e))
+        else:
+            self._summary_label.setText(f"{len(self._arguments_list)} run(s)")
+            self._summary_label.setStyleSheet("")
+        ok_button = self._button_box.button(QDialogButtonBox.Ok)
+        ok_button.setEnabled(len(self._arguments_list) > 0)
+
+    def _on_load_button_clicked(self):
+        filename = filedialog.get_open_file(
+            self, "Load CSV", "", "CSV files (*.csv);;All files (*)"
+        )
+        if not filename:
+            return
+        try:
+            with open(filename, "r", encoding="utf-8", newline="") as f:
+                self._csv_editor.setPlainText(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.show_exception_messagebox(
+                self,
+                exception=e,
+                message=f"failed to load {os.path.basename(filename)}: ",
+            )
+
+    @staticmethod
+    def get_batch(
+        parent: Optional[QWidget],
+        base_arguments: Dict[str, Any],
+        parallelism: int,
+        *,
+        title: str = "Batch Execution",
+        max_parallelism: Optional[int] = None,
+        validator: Optional[ArgumentsValidator] = None,
+    ) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        dialog = BatchDialog(
+            parent,
+            base_arguments,
+            parallelism,
+            title=title,
+            max_parallelism=max_parallelism,
+            validator=validator,
+        )
+        try:
+            if dialog.exec_() != QDialog.Accepted:
+                return None
+            return dialog.arguments_list, dialog.parallelism
+        finally:
+            dialog.deleteLater()
@@ -0,0 +1,303 @@
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QComboBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
+    QHeaderView,
+    QLabel,
+    QTabWidget,
+    QSplitter,
+    QPlainTextEdit,
+)
+
+from ...utils import filedialog, messagebox
+from ...watchdog import StallReport
+
+COLUMNS = (
+    "Signal",
+    "Emitted",
+    "Handled",
+    "Latency mean (ms)",
+    "Latency max (ms)",
+    "Handler total (ms)",
+    "Handler max (ms)",
+)
+# keys of the per-signal summary shown in columns 1...
+_COLUMN_KEYS = (
+    "emitted",
+    "handled",
+    "latency_mean",
+    "latency_max",
+    "handler_total",
+    "handler_max",
+)
+_MS_KEYS = {"latency_mean", "latency_max", "handler_total", "handler_max"}
+
+
+class _NumericItem(QTableWidgetItem):
+    # sorts by the number, not by the displayed text
+    def __init__(self, value: Optional[float], text: str):
+        super().__init__(text)
+        self._value = -1.0 if value is None else value
+        self.setTextAlignment(int(Qt.AlignRight | Qt.AlignVCenter))
+
+    def __lt__(self, other):
+        if isinstance(other, _NumericItem):
+            return self._value < other._value
+        return super().__lt__(other)
+
+
+class _SignalPage(QWidget):
+    """
+    显示各次执行的信号流量统计。每次执行结束后，其汇总结果将被添加到列表中。
+    """
+
+    def __init__(self, parent: Optional[QWidget]):
+        super().__init__(parent)
+        self._profiles: List[Dict[str, Any]] = []
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        top_layout = QHBoxLayout()
+        self._layout.addLayout(top_layout)
+        self._profile_combobox = QComboBox(self)
+        # noinspection PyUnresolvedReferences
+        self._profile_combobox.currentIndexChanged.connect(self._show_profile)
+        top_layout.addWidget(self._profile_combobox, 1)
+        self._export_button = QPushButton("Export...", self)
+        # noinspection PyUnresolvedReferences
+        self._export_button.clicked.connect(self._on_export_button_clicked)
+        top_layout.addWidget(self._export_button)
+        self._clear_button = QPushButton("Clear", self)
+        # noinspection PyUnresolvedReferences
+        self._clear_button.clicked.connect(self.clear_profiles)
+        top_layout.addWidget(self._clear_button)
+
+        self._table = QTableWidget(0, len(COLUMNS), self)
+        self._table.setHorizontalHeaderLabels(COLUMNS)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self._table.setSortingEnabled(True)
+        self._layout.addWidget(self._table)
+
+        self._summary_label = QLabel(self)
+        self._layout.addWidget(self._summary_label)
+
+    def add_profile(self, profile: Dict[str, Any]):
+        """
+        添加一次执行的汇总结果（`ExecutionProfile.to_dict()`的返回值），并显示它。
+        """
+        self._profiles.append(profile)
+        duration = profile.get("duration", None)
+        duration = "?" if duration is None else f"{duration:.3f}s"
+        self._profile_combobox.addItem(
+            f"#{len(self._profiles)} {profile.get('fn_name', '')} ({duration})"
+        )
+        self._profile_combobox.setCurrentIndex(self._profile_combobox.count() - 1)
+
+    def clear_profiles(self):
+        self._profiles.clear()
+        self._profile_combobox.clear()
+        self._table.setRowCount(0)
+        self._summary_label.clear()
+
+    def export_profiles(self, filename: str):
+        """
+        将所有汇总结果导出为JSON文件。
+        """
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self._profiles, f, indent=2, ensure_ascii=False)
+
+    def _show_profile(self, index: int):
+        self._table.setSortingEnabled(False)
+        self._table.setRowCount(0)
+        if index < 0 or index >= len(self._profiles):
+            self._summary_label.clear()
+            self._table.setSortingEnabled(True)
+            return
+        signals: Dict[str, Dict[str, Any]] = self._profiles[index].get("signals", {})
+        self._table.setRowCount(len(signals))
+        total_emitted = 0
+        total_handler = 0.0
+        for row, (name, stats) in enumerate(signals.items()):
+            self._table.setItem(row, 0, QTableWidgetItem(name))
+            for column, key in enumerate(_COLUMN_KEYS, start=1):
+                value = stats.get(key, None)
+                if value is None:
+                    text = "-"
+                elif key in _MS_KEYS:
+                    value *= 1000
+                    text = f"{value:.3f}"
+                else:
+                    text = str(value)
+                self._table.setItem(row, column, _NumericItem(value, text))
+            total_emitted += stats.get("emitted", 0)
+            total_handler += stats.get("handler_total", 0.0)
+        self._table.setSortingEnabled(True)
+        # the heaviest handlers first
+        self._table.sortItems(COLUMNS.index("Handler total (ms)"), Qt.DescendingOrder)
+        self._summary_label.setText(
+            f"{total_emitted} emission(s), {total_handler * 1000:.1f} ms in handlers"
+        )
+
+    def _on_export_button_clicked(self):
+        _export_json(self, "Export Signal Profiles", self.export_profiles)
+
+
+class _StallPage(QWidget):
+    """
+    显示GUI线程卡顿监视器生成的报告。
+    """
+
+    def __init__(self, parent: Optional[QWidget]):
+        super().__init__(parent)
+        self._reports: List[StallReport] = []
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        top_layout = QHBoxLayout()
+        self._layout.addLayout(top_layout)
+        self._summary_label = QLabel(self)
+        top_layout.addWidget(self._summary_label, 1)
+        self._export_button = QPushButton("Export...", self)
+        # noinspection PyUnresolvedReferences
+        self._export_button.clicked.connect(self._on_export_button_clicked)
+        top_layout.addWidget(self._export_button)
+        self._clear_button = QPushButton("Clear", self)
+        # noinspection PyUnresolvedReferences
+        self._clear_button.clicked.connect(self.clear_reports)
+        top_layout.addWidget(self._clear_button)
+
+        self._splitter = QSplitter(Qt.Vertical, self)
+        self._layout.addWidget(self._splitter)
+        self._table = QTableWidget(0, 3, self._splitter)
+        self._table.setHorizontalHeaderLabels(["Time", "Duration (ms)", "Samples"])
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setStretchLastSection(True)
+        # noinspection PyUnresolvedReferences
+        self._table.currentCellChanged.connect(self._on_current_cell_changed)
+        self._stack_view = QPlainTextEdit(self._splitter)
+        self._stack_view.setReadOnly(True)
+        self._stack_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._update_summary()
+
+    def add_report(self, report: StallReport):
+        self._reports.append(report)
+        row = self._table.rowCount()
+        self._table.insertRow(row)
+        started_at = time.strftime("%H:%M:%S", time.localtime(report.started_at))
+        self._table.setItem(row, 0, QTableWidgetItem(started_at))
+        self._table.setItem(
+            row, 1, _NumericItem(report.duration, f"{report.duration * 1000:.0f}")
+        )
+        self._table.setItem(
+            row, 2, _NumericItem(report.sample_count, str(report.sample_count))
+        )
+        self._update_summary()
+
+    def clear_reports(self):
+        self._reports.clear()
+        self._table.setRowCount(0)
+        self._stack_view.clear()
+        self._update_summary()
+
+    def export_reports(self, filename: str):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(
+                [report.to_dict() for report in self._reports],
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+
+    def _update_summary(self):
+        total = sum(report.duration for report in self._reports)
+        self._summary_label.setText(
+            f"{len(self._reports)} stall(s), {total * 1000:.0f} ms in total"
+        )
+
+    def _on_current_cell_changed(self, row: int, *_):
+        if 0 <= row < len(self._reports):
+            self._stack_view.setPlainText(self._reports[row].format())
+        else:
+            self._stack_view.clear()
+
+    def _on_export_button_clicked(self):
+        _export_json(self, "Export Stall Reports", self.export_reports)
+
+
+def _export_json(parent: QWidget, title: str, export):
+    filename = filedialog.get_save_file(
+        parent, title, "", "JSON files (*.json);;All files (*)"
+    )
+    if not filename:
+        return
+    try:
+        export(filename)
+    except OSError as e:
+        messagebox.show_exception_messagebox(
+            parent,
+            exception=e,
+            message=f"failed to export {os.path.basename(filename)}: ",
+        )
+
+
+class DiagnosticsArea(QWidget):
+    """
+    诊断信息区域，包括信号流量统计（启用`signal_profiling`时）和GUI线程卡顿报告（启用卡顿监视器时）。
+    """
+
+    def __init__(self, parent: Optional[QWidget], signals: bool, stalls: bool):
+        super().__init__(parent)
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+        self._tab_widget = QTabWidget(self)
+        self._layout.addWidget(self._tab_widget)
+
+        self._signal_page: Optional[_SignalPage] = None
+        self._stall_page: Optional[_StallPage] = None
+        if signals:
+            self._signal_page = _SignalPage(self._tab_widget)
+            self._tab_widget.addTab(self._signal_page, "Signals")
+        if stalls:
+            self._stall_page = _StallPage(self._tab_widget)
+            self._tab_widget.addTab(self._stall_page, "Stalls")
+
+    def add_profile(self, profile: Dict[str, Any]):
+        """
+        添加一次执行的信号流量统计（`ExecutionProfile.to_dict()`的返回值）。
+        """
+        if self._signal_page is not None:
+            self._signal_page.add_profile(profile)
+
+    def add_stall_report(self, report: StallReport):
+        """
+        添加一份GUI线程卡顿报告。
+        """
+        if self._stall_page is not None:
+            self._stall_page.add_report(report)
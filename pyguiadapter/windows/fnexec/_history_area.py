@@ -0,0 +1,230 @@
+import time
+from typing import List, Optional
+
+from qtpy.QtCore import Qt, Signal
+from qtpy.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QComboBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
+    QHeaderView,
+    QSplitter,
+    QPlainTextEdit,
+)
+
+from ._diagnostics_area import _NumericItem
+from ...history import (
+    ExecutionHistory,
+    HistoryRecord,
+    STATUS_SUCCEEDED,
+    STATUS_FAILED,
+    STATUS_CANCELLED,
+)
+from ...utils import messagebox
+
+COLUMNS = ("Time", "Status", "Wall (ms)", "Arguments", "Result / Error")
+# (text, status) of the items of the status filter
+_STATUS_FILTERS = (
+    ("All", None),
+    ("Succeeded", STATUS_SUCCEEDED),
+    ("Failed", STATUS_FAILED),
+    ("Cancelled", STATUS_CANCELLED),
+)
+# characters of the arguments and the result shown in the table
+_MAX_CELL_TEXT = 200
+
+
+class HistoryArea(QWidget):
+    """
+    显示当前函数的执行历史。选中一条记录后，可以将其参数填入参数控件，或者直接以其参数重新执行函数。
+    """
+
+    sig_fill_requested = Signal(object)
+    sig_rerun_requested = Signal(object)
+
+    def __init__(
+        self,
+        parent: Optional[QWidget],
+        history: ExecutionHistory,
+        fn_key: str,
+        max_rows: int,
+    ):
+        super().__init__(parent)
+        self._history = history
+        self._fn_key = fn_key
+        self._max_rows = max(max_rows, 1)
+        self._records: List[HistoryRecord] = []
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        top_layout = QHBoxLayout()
+        self._layout.addLayout(top_layout)
+        self._status_combobox = QComboBox(self)
+        for text, _ in _STATUS_FILTERS:
+            self._status_combobox.addItem(text)
+        # noinspection PyUnresolvedReferences
+        self._status_combobox.currentIndexChanged.connect(self.reload)
+        top_layout.addWidget(self._status_combobox, 1)
+        self._fill_button = QPushButton("Fill", self)
+        self._fill_button.setToolTip("Fill the parameters with the selected arguments")
+        # noinspection PyUnresolvedReferences
+        self._fill_button.clicked.connect(self._on_fill_button_clicked)
+        top_layout.addWidget(self._fill_button)
+        self._rerun_button = QPushButton("Re-run", self)
+        self._rerun_button.setToolTip("Execute again with the selected arguments")
+        # noinspection PyUnresolvedReferences
+        self._rerun_button.clicked.connect(self._on_rerun_button_clicked)
+        top_layout.addWidget(self._rerun_button)
+        self._clear_button = QPushButton("Clear", self)
+        # noinspection PyUnresolvedReferences
+        self._clear_button.clicked.connect(self._on_clear_button_clicked)
+        top_layout.addWidget(self._clear_button)
+
+        self._splitter = QSplitter(Qt.Vertical, self)
+        self._layout.addWidget(self._splitter)
+        self._table = QTableWidget(0, len(COLUMNS), self._splitter)
+        self._table.setHorizontalHeaderLabels(COLUMNS)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(
+            COLUMNS.index("Arguments"), QHeaderView.Stretch
+        )
+        # noinspection PyUnresolvedReferences
+        self._table.currentCellChanged.connect(self._on_current_cell_changed)
+        # noinspection PyUnresolvedReferences
+        self._table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self._detail_view = QPlainTextEdit(self._splitter)
+        self._detail_view.setReadOnly(True)
+        self._detail_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+
+        self._update_buttons()
+        self.reload()
+
+    def reload(self):
+        """
+        从数据库中重新读取记录。
+        """
+        status = self._current_status_filter()
+        self._records = self._history.query(self._fn_key, self._max_rows, status)
+        self._table.setRowCount(0)
+        self._table.setRowCount(len(self._records))
+        for row, record in enumerate(self._records):
+            self._set_row(row, record)
+        self._detail_view.clear()
+        self._update_buttons()
+
+    def add_record(self, record: HistoryRecord):
+        """
+        在最上方添加一条刚刚执行的记录，该记录可能尚未被写入数据库。
+        """
+        status = self._current_status_filter()
+        if status is not None and record.status != status:
+            return
+        self._records.insert(0, record)
+        self._table.insertRow(0)
+        self._set_row(0, record)
+        if len(self._records) > self._max_rows:
+            self._records.pop()
+            self._table.removeRow(self._table.rowCount() - 1)
+        self._update_buttons()
+
+    def _set_row(self, row: int, record: HistoryRecord):
+        started_at = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(record.started_at)
+        )
+        self._table.setItem(row, 0, QTableWidgetItem(started_at))
+        self._table.setItem(row, 1, QTableWidgetItem(record.status))
+        if record.wall_time is None:
+            wall_time_item = _NumericItem(None, "-")
+        else:
+            wall_time_item = _NumericItem(
+                record.wall_time, f"{record.wall_time * 1000:.1f}"
+            )
+        self._table.setItem(row, 2, wall_time_item)
+        arguments = ", ".join(
+            f"{name}={value}" for name, value in record.arguments.items()
+        )
+        self._table.setItem(row, 3, QTableWidgetItem(_shorten(arguments)))
+        outcome = record.error if record.error is not None else record.result
+        self._table.setItem(row, 4, QTableWidgetItem(_shorten(outcome or "")))
+
+    def _current_status_filter(self) -> Optional[str]:
+        index = self._status_combobox.currentIndex()
+        if index < 0:
+            return None
+        return _STATUS_FILTERS[index][1]
+
+    def _current_record(self) -> Optional[HistoryRecord]:
+        row = self._table.currentRow()
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+
+    def _update_buttons(self):
+        selected = self._current_record() is not None
+        self._fill_button.setEnabled(selected)
+        self._rerun_button.setEnabled(selected)
+
+    def _on_current_cell_changed(self, row: int, *_):
+        self._update_buttons()
+        record = self._current_record()
+        if record is None:
+            self._detail_view.clear()
+            return
+        lines = ["Arguments:"]
+        lines.extend(f"  {name} = {value}" for name, value in record.arguments.items())
+        if record.cpu_time is not None:
+            lines.append(f"CPU time: {record.cpu_time * 1000:.1f} ms")
+        if record.error is not None:
+            lines.append(f"Error: {record.error}")
+        elif record.result is not None:
+            lines.append(f"Result: {record.result}")
+        if record.output:
+            lines.append("Output:")
+            lines.append(record.output)
+        self._detail_view.setPlainText("\n".join(lines))
+
+    def _on_cell_double_clicked(self, row: int, *_):
+        if 0 <= row < len(self._records):
+            # noinspection PyUnresolvedReferences
+            self.sig_fill_requested.emit(self._records[row])
+
+    def _on_fill_button_clicked(self):
+        record = self._current_record()
+        if record is not None:
+            # noinspection PyUnresolvedReferences
+            self.sig_fill_requested.emit(record)
+
+    def _on_rerun_button_clicked(self):
+        record = self._current_record()
+        if record is not None:
+            # noinspection PyUnresolvedReferences
+            self.sig_rerun_requested.emit(record)
+
+    def _on_clear_button_clicked(self):
+        ret = messagebox.show_question_message(
+            self,
+            message="Delete all history records of this function?",
+            buttons=messagebox.Yes | messagebox.No,
+        )
+        if ret != messagebox.Yes:
+            return
+        self._history.clear(self._fn_key)
+        self.reload()
+
+
+def _shorten(text: str) -> str:
+    text = text.replace("\n", " ")
+    if len(text) > _MAX_CELL_TEXT:
+        return text[: _MAX_CELL_TEXT - 3] + "..."
+    return text
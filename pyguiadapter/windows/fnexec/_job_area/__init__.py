@@ -0,0 +1,2 @@
+from .area import JobArea, JobViewConfig
+from .model import JobListModel
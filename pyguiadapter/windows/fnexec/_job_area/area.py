@@ -0,0 +1,323 @@
+import csv
+import dataclasses
+import os
+from typing import Optional, Tuple, Set, List
+
+from qtpy.QtCore import Qt, QModelIndex
+from qtpy.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QTableView,
+    QPushButton,
+    QSplitter,
+    QAbstractItemView,
+    QHeaderView,
+    QProgressBar,
+    QLabel,
+)
+
+from .model import JobListModel, COLUMN_ARGUMENTS
+from .._output_area.browser import OutputBrowser, OutputBrowserConfig
+from ....executors.pool import (
+    ConcurrentProcessFunctionExecutor,
+    JOB_FINISHED,
+    JOB_FAILED,
+    JOB_CANCELLED,
+)
+from ....utils import filedialog, messagebox
+
+
+@dataclasses.dataclass
+class JobViewConfig(object):
+    """作业视图配置类。"""
+
+    column_titles: Tuple[str, str, str, str, str, str] = (
+        "#",
+        "State",
+        "Progress",
+        "Arguments",
+        "Result",
+        "Time",
+    )
+    """作业列表各列的标题。"""
+
+    cancel_button_text: str = "Cancel"
+    """取消选中作业按钮的文本。"""
+
+    cancel_all_button_text: str = "Cancel All"
+    """取消所有作业按钮的文本。"""
+
+    clear_button_text: str = "Clear Finished"
+    """移除已结束作业按钮的文本。"""
+
+    export_button_text: str = "Export..."
+    """导出按钮的文本。作业列表（参数、状态、结果及耗时）将被导出为CSV文件。"""
+
+    batch_summary_format: str = (
+        "{done}/{total} done, {failed} failed, {cancelled} cancelled"
+    )
+    """批量执行进度的消息模板，可用的模板变量有`done`、`total`、`finished`、`failed`、`cancelled`。"""
+
+    auto_select: bool = True
+    """未选中任何作业时，是否自动选中新提交的作业，以便查看其输出。"""
+
+
+class JobArea(QWidget):
+    def __init__(
+        self,
+        parent: QWidget,
+        config: Optional[JobViewConfig],
+        executor: ConcurrentProcessFunctionExecutor,
+        output_browser_config: Optional[OutputBrowserConfig],
+    ):
+        super().__init__(parent)
+        self._config: JobViewConfig = config or JobViewConfig()
+        self._executor = executor
+        self._current_job_id: Optional[int] = None
+        self._rendered_output_count: int = 0
+        self._batch_total: int = 0
+        self._batch_pending: Set[int] = set()
+        # a batch is being submitted, see begin_batch()
+        self._batch_submitting: bool = False
+        self._batch_counts = {JOB_FINISHED: 0, JOB_FAILED: 0, JOB_CANCELLED: 0}
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        self._layout_buttons = QHBoxLayout()
+        self._layout.addLayout(self._layout_buttons)
+        self._cancel_button = QPushButton(self._config.cancel_button_text, self)
+        self._cancel_all_button = QPushButton(self._config.cancel_all_button_text, self)
+        self._clear_button = QPushButton(self._config.clear_button_text, self)
+        self._export_button = QPushButton(self._config.export_button_text, self)
+        self._layout_buttons.addWidget(self._cancel_button)
+        self._layout_buttons.addWidget(self._cancel_all_button)
+        self._layout_buttons.addStretch(1)
+        self._layout_buttons.addWidget(self._clear_button)
+        self._layout_buttons.addWidget(self._export_button)
+
+        # noinspection PyArgumentList
+        self._layout_batch = QHBoxLayout()
+        self._layout.addLayout(self._layout_batch)
+        self._batch_progressbar = QProgressBar(self)
+        self._batch_progressbar.setFormat("%p%")
+        self._batch_label = QLabel(self)
+        self._layout_batch.addWidget(self._batch_progressbar, 1)
+        self._layout_batch.addWidget(self._batch_label)
+        self._batch_progressbar.setVisible(False)
+        self._batch_label.setVisible(False)
+
+        self._splitter = QSplitter(Qt.Vertical, self)
+        self._layout.addWidget(self._splitter)
+
+        self._model = JobListModel(
+            self, self._executor.get_job, self._config.column_titles
+        )
+        self._table_view = QTableView(self._splitter)
+        self._table_view.setModel(self._model)
+        self._table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self._table_view.verticalHeader().setVisible(False)
+        header = self._table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COLUMN_ARGUMENTS, QHeaderView.Stretch)
+        self._splitter.addWidget(self._table_view)
+
+        self._output_browser = OutputBrowser(self._splitter, output_browser_config)
+        self._splitter.addWidget(self._output_browser)
+
+        # noinspection PyUnresolvedReferences
+        self._cancel_button.clicked.connect(self._on_cancel_button_clicked)
+        # noinspection PyUnresolvedReferences
+        self._cancel_all_button.clicked.connect(self._executor.try_cancel)
+        # noinspection PyUnresolvedReferences
+        self._clear_button.clicked.connect(self._executor.clear_finished_jobs)
+        # noinspection PyUnresolvedReferences
+        self._export_button.clicked.connect(self._on_export_button_clicked)
+        # noinspection PyUnresolvedReferences
+        self._table_view.selectionModel().currentRowChanged.connect(
+            self._on_current_row_changed
+        )
+        # noinspection PyUnresolvedReferences
+        self._executor.sig_job_added.connect(self._on_job_added)
+        # noinspection PyUnresolvedReferences
+        self._executor.sig_job_updated.connect(self._on_job_updated)
+        # noinspection PyUnresolvedReferences
+        self._executor.sig_job_output.connect(self._on_job_output)
+        # noinspection PyUnresolvedReferences
+        self._executor.sig_jobs_removed.connect(self._on_jobs_removed)
+
+    @property
+    def model(self) -> JobListModel:
+        return self._model
+
+    def select_job(self, job_id: int):
+        for row in range(self._model.rowCount()):
+            if self._model.job_id_at(row) == job_id:
+                self._table_view.selectRow(row)
+                return
+
+    def begin_batch(self):
+        """
+        标记即将提交一批作业。从调用该方法到调用`start_batch()`期间，`is_batch_running()`也将返回`True`，
+        因此在提交过程中即已失败的作业同样被视为批量执行的一部分。
+        """
+        if not self._batch_pending and not self._batch_submitting:
+            self._reset_batch()
+        self._batch_submitting = True
+
+    def start_batch(self, job_ids: List[int]):
+        """
+        开始跟踪一批作业的整体进度。若上一批作业尚未全部结束，新的作业将被合并到其中。
+        """
+        if not self._batch_pending and not self._batch_submitting:
+            self._reset_batch()
+        self._batch_submitting = False
+        for job_id in job_ids:
+            job = self._executor.get_job(job_id)
+            if job is None:
+                continue
+            self._batch_total += 1
+            if job.is_done:
+                self._batch_counts[job.state] += 1
+            else:
+                self._batch_pending.add(job_id)
+        self._batch_progressbar.setVisible(True)
+        self._batch_label.setVisible(True)
+        self._update_batch_summary()
+
+    def is_batch_running(self) -> bool:
+        return self._batch_submitting or len(self._batch_pending) > 0
+
+    def export_jobs(self, filename: str):
+        """
+        将作业列表导出为CSV文件。
+        """
+        jobs = [self._model.job_at(row) for row in range(self._model.rowCount())]
+        jobs = [job for job in jobs if job is not None]
+        argument_names = []
+        for job in jobs:
+            for name in job.arguments.keys():
+                if name not in argument_names:
+                    argument_names.append(name)
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["id", "state", *argument_names, "result", "error", "elapsed"]
+            )
+            for job in jobs:
+                elapsed = job.elapsed
+                writer.writerow(
+                    [
+                        job.job_id,
+                        job.state,
+                        *(repr(job.arguments.get(name, "")) for name in argument_names),
+                        repr(job.result) if job.state == JOB_FINISHED else "",
+                        f"{type(job.error).__name__}: {job.error}" if job.error else "",
+                        "" if elapsed is None else f"{elapsed:.3f}",
+                    ]
+                )
+
+    def _on_job_updated(self, job_id: int):
+        self._model.update_job(job_id)
+        if job_id not in self._batch_pending:
+            return
+        job = self._executor.get_job(job_id)
+        if job is None or not job.is_done:
+            return
+        self._batch_pending.discard(job_id)
+        self._batch_counts[job.state] += 1
+        self._update_batch_summary()
+
+    def _reset_batch(self):
+        self._batch_total = 0
+        for state in self._batch_counts:
+            self._batch_counts[state] = 0
+
+    def _update_batch_summary(self):
+        finished = self._batch_counts[JOB_FINISHED]
+        failed = self._batch_counts[JOB_FAILED]
+        cancelled = self._batch_counts[JOB_CANCELLED]
+        done = finished + failed + cancelled
+        self._batch_progressbar.setRange(0, max(self._batch_total, 1))
+        self._batch_progressbar.setValue(done)
+        self._batch_label.setText(
+            self._config.batch_summary_format.format(
+                done=done,
+                total=self._batch_total,
+                finished=finished,
+                failed=failed,
+                cancelled=cancelled,
+            )
+        )
+
+    def _on_export_button_clicked(self):
+        filename = filedialog.get_save_file(
+            self, "Export Jobs", "", "CSV files (*.csv);;All files (*)"
+        )
+        if not filename:
+            return
+        try:
+            self.export_jobs(filename)
+        except OSError as e:
+            messagebox.show_exception_messagebox(
+                self,
+                exception=e,
+                message=f"failed to export {os.path.basename(filename)}: ",
+            )
+
+    def _on_job_added(self, job_id: int):
+        self._model.add_job(job_id)
+        if self._config.auto_select and self._current_job_id is None:
+            self.select_job(job_id)
+
+    def _on_jobs_removed(self):
+        self._model.remove_missing_jobs()
+        if self._executor.get_job(self._current_job_id) is None:
+            self._show_job_output(None)
+
+    def _on_cancel_button_clicked(self):
+        rows = {
+            index.row() for index in self._table_view.selectionModel().selectedRows()
+        }
+        for row in sorted(rows):
+            job_id = self._model.job_id_at(row)
+            if job_id is not None:
+                self._executor.cancel_job(job_id)
+
+    def _on_current_row_changed(self, current: QModelIndex, _: QModelIndex):
+        self._show_job_output(self._model.job_id_at(current.row()))
+
+    def _on_job_output(self, job_id: int):
+        if job_id != self._current_job_id:
+            return
+        job = self._executor.get_job(job_id)
+        if job is None:
+            return
+        if len(job.output) < self._rendered_output_count:
+            # the job cleared its output
+            self._show_job_output(job_id)
+            return
+        self._render_output(job.output[self._rendered_output_count :])
+        self._rendered_output_count = len(job.output)
+
+    def _show_job_output(self, job_id: Optional[int]):
+        self._current_job_id = job_id
+        self._rendered_output_count = 0
+        self._output_browser.clear()
+        job = self._executor.get_job(job_id) if job_id is not None else None
+        if job is None:
+            return
+        self._render_output(job.output)
+        self._rendered_output_count = len(job.output)
+
+    def _render_output(self, chunks):
+        for text, html in chunks:
+            self._output_browser.append_output(text, html)
+        scroll_bar = self._output_browser.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
@@ -0,0 +1,153 @@
+from typing import List, Dict, Optional, Any, Callable, Sequence
+
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt
+from qtpy.QtGui import QColor
+
+from ....executors.pool import Job, JOB_FAILED, JOB_CANCELLED
+
+COLUMN_ID = 0
+COLUMN_STATE = 1
+COLUMN_PROGRESS = 2
+COLUMN_ARGUMENTS = 3
+COLUMN_RESULT = 4
+COLUMN_ELAPSED = 5
+
+# long reprs of arguments and results are cut to keep the rows cheap to render
+_MAX_TEXT_LENGTH = 200
+
+
+class JobListModel(QAbstractTableModel):
+    """
+    作业列表的数据模型。模型只保存作业ID，作业的状态从`ConcurrentProcessFunctionExecutor`中实时读取。
+    """
+
+    def __init__(
+        self,
+        parent: Optional[Any],
+        get_job: Callable[[int], Optional[Job]],
+        column_titles: Sequence[str],
+    ):
+        super().__init__(parent)
+        self._get_job = get_job
+        self._column_titles = list(column_titles)
+        self._job_ids: List[int] = []
+        self._rows: Dict[int, int] = {}
+
+    # noinspection PyMethodOverriding
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._job_ids)
+
+    # noinspection PyMethodOverriding
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._column_titles)
+
+    # noinspection PyMethodOverriding
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and 0 <= section < len(self._column_titles):
+            return self._column_titles[section]
+        return None
+
+    # noinspection PyMethodOverriding
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        job = self.job_at(index.row())
+        if job is None:
+            return None
+        if role == Qt.DisplayRole:
+            return self._format(job, index.column())
+        if role == Qt.ForegroundRole:
+            if job.state == JOB_FAILED:
+                return QColor("red")
+            if job.state == JOB_CANCELLED:
+                return QColor("gray")
+            return None
+        if role == Qt.ToolTipRole and index.column() in (
+            COLUMN_ARGUMENTS,
+            COLUMN_RESULT,
+        ):
+            return self._format(job, index.column(), full=True)
+        return None
+
+    def job_id_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._job_ids):
+            return self._job_ids[row]
+        return None
+
+    def job_at(self, row: int) -> Optional[Job]:
+        job_id = self.job_id_at(row)
+        if job_id is None:
+            return None
+        return self._get_job(job_id)
+
+    def add_job(self, job_id: int):
+        row = len(self._job_ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._job_ids.append(job_id)
+        self._rows[job_id] = row
+        self.endInsertRows()
+
+    def update_job(self, job_id: int):
+        row = self._rows.get(job_id, None)
+        if row is None:
+            return
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1)
+        )
+
+    def remove_missing_jobs(self):
+        self.beginResetModel()
+        self._job_ids = [
+            job_id for job_id in self._job_ids if self._get_job(job_id) is not None
+        ]
+        self._rows = {job_id: row for row, job_id in enumerate(self._job_ids)}
+        self.endResetModel()
+
+    @staticmethod
+    def _format(job: Job, column: int, full: bool = False) -> str:
+        if column == COLUMN_ID:
+            return str(job.job_id)
+        if column == COLUMN_STATE:
+            return job.state
+        if column == COLUMN_PROGRESS:
+            return _format_progress(job)
+        if column == COLUMN_ARGUMENTS:
+            text = ", ".join(f"{k}={v!r}" for k, v in job.arguments.items())
+        elif column == COLUMN_RESULT:
+            if job.state == JOB_FAILED:
+                text = f"{type(job.error).__name__}: {job.error}"
+            elif job.is_done and job.state != JOB_CANCELLED:
+                text = repr(job.result)
+            else:
+                text = ""
+        elif column == COLUMN_ELAPSED:
+            elapsed = job.elapsed
+            return "" if elapsed is None else f"{elapsed:.2f}s"
+        else:
+            return ""
+        if not full and len(text) > _MAX_TEXT_LENGTH:
+            text = text[:_MAX_TEXT_LENGTH] + "..."
+        return text
+
+
+def _format_progress(job: Job) -> str:
+    if job.progress is None:
+        return f"{job.item_count} item(s)" if job.item_count else ""
+    min_value, max_value = job.progress_range
+    if max_value > min_value:
+        percent = (job.progress - min_value) * 100 // (max_value - min_value)
+        text = f"{percent}%"
+    else:
+        text = str(job.progress)
+    if job.progress_info:
+        text += f" {job.progress_info}"
+    return text
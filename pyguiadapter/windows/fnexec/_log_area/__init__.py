@@ -0,0 +1,2 @@
+from .area import LogArea, LogViewConfig
+from .model import LogListModel, LogStore, LogRecord
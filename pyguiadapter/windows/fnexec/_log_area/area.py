@@ -0,0 +1,147 @@
+import dataclasses
+from typing import Optional, Union, Sequence, Iterable, Dict
+
+from qtpy.QtCore import QTimer
+from qtpy.QtGui import QPalette, QColor
+from qtpy.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QListView,
+    QLineEdit,
+    QCheckBox,
+    QAbstractItemView,
+)
+
+from .model import LogListModel, LogRecord
+from ....constants.color import (
+    COLOR_TERMINAL_BACKGROUND_CLASSIC,
+    COLOR_TERMINAL_TEXT_CLASSIC,
+)
+from ....constants.font import FONT_FAMILY
+from ....constants.log import LOG_LEVEL_NAMES
+
+
+@dataclasses.dataclass
+class LogViewConfig(object):
+    """日志视图配置类。"""
+
+    text_color: str = COLOR_TERMINAL_TEXT_CLASSIC
+    """默认文本颜色。"""
+
+    background_color: str = COLOR_TERMINAL_BACKGROUND_CLASSIC
+    """背景颜色。"""
+
+    font_family: Union[Sequence[str], str, None] = FONT_FAMILY
+    """字体系列。"""
+
+    font_size: Optional[int] = None
+    """字体大小（px）。"""
+
+    search_placeholder: str = "Search..."
+    """搜索框的占位文本。"""
+
+    search_delay: int = 200
+    """输入搜索关键字后，延迟多少毫秒进行过滤。"""
+
+    auto_scroll: bool = True
+    """当视图位于底部时，是否在新日志到达后自动滚动到底部。"""
+
+
+class LogArea(QWidget):
+    def __init__(self, parent: QWidget, config: Optional[LogViewConfig]):
+        super().__init__(parent)
+        self._config: LogViewConfig = config or LogViewConfig()
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        self._layout_filters = QHBoxLayout()
+        self._layout.addLayout(self._layout_filters)
+
+        self._model = LogListModel(self)
+
+        self._level_checkboxes: Dict[int, QCheckBox] = {}
+        for level, level_name in enumerate(LOG_LEVEL_NAMES):
+            checkbox = QCheckBox(level_name, self)
+            checkbox.setChecked(True)
+            # noinspection PyUnresolvedReferences
+            checkbox.toggled.connect(
+                lambda checked, lv=level: self._model.set_level_visible(lv, checked)
+            )
+            self._layout_filters.addWidget(checkbox)
+            self._level_checkboxes[level] = checkbox
+
+        self._search_edit = QLineEdit(self)
+        self._search_edit.setPlaceholderText(self._config.search_placeholder)
+        self._search_edit.setClearButtonEnabled(True)
+        self._layout_filters.addWidget(self._search_edit, 1)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        # noinspection PyUnresolvedReferences
+        self._search_timer.timeout.connect(self._on_search)
+        # noinspection PyUnresolvedReferences
+        self._search_edit.textChanged.connect(self._on_search_text_changed)
+
+        self._list_view = QListView(self)
+        # with uniform item sizes the view never measures off-screen rows,
+        # so only the visible rows are ever formatted
+        self._list_view.setUniformItemSizes(True)
+        self._list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._list_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self._list_view.setModel(self._model)
+        self._layout.addWidget(self._list_view)
+
+        self._apply_config()
+
+    @property
+    def model(self) -> LogListModel:
+        return self._model
+
+    def append_logs(self, records: Iterable[LogRecord]):
+        scroll_bar = self._list_view.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+        self._model.append_records(records)
+        if self._config.auto_scroll and at_bottom:
+            self._list_view.scrollToBottom()
+
+    def clear_logs(self):
+        self._model.clear()
+
+    def set_level_visible(self, level: int, visible: bool):
+        checkbox = self._level_checkboxes.get(level, None)
+        if checkbox is not None:
+            checkbox.setChecked(visible)
+
+    def set_keyword(self, keyword: str):
+        self._search_edit.setText(keyword)
+        self._search_timer.stop()
+        self._on_search()
+
+    def _on_search_text_changed(self, _: str):
+        self._search_timer.start(max(self._config.search_delay, 0))
+
+    def _on_search(self):
+        self._model.set_keyword(self._search_edit.text())
+
+    def _apply_config(self):
+        palette = self._list_view.palette()
+        if self._config.background_color:
+            palette.setColor(QPalette.Base, QColor(self._config.background_color))
+        if self._config.text_color:
+            palette.setColor(QPalette.Text, QColor(self._config.text_color))
+        self._list_view.setPalette(palette)
+
+        font = self._list_view.font()
+        if self._config.font_family:
+            if isinstance(self._config.font_family, str):
+                font.setFamily(self._config.font_family)
+            else:
+                font.setFamilies(self._config.font_family)
+        if self._config.font_size:
+            font.setPixelSize(self._config.font_size)
+        self._list_view.setFont(font)
@@ -0,0 +1,187 @@
+import time
+from array import array
+from typing import List, Tuple, Dict, Iterable, Optional, Set, Any
+
+from qtpy.QtCore import QAbstractListModel, QModelIndex, Qt
+from qtpy.QtGui import QColor
+
+from ....constants.log import LOG_LEVEL_NAMES
+
+# (timestamp, level, message, color)
+LogRecord = Tuple[float, int, str, str]
+
+
+class LogStore(object):
+    """
+    以列式数组保存日志记录。时间戳、级别和颜色分别保存在紧凑的`array`中，颜色值只保存一份，
+    每条记录仅额外占用一个消息字符串对象。
+    """
+
+    def __init__(self):
+        self._timestamps = array("d")
+        self._levels = array("B")
+        self._colors = array("H")
+        self._messages: List[str] = []
+        self._color_table: List[str] = []
+        self._color_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def append(self, record: LogRecord) -> int:
+        timestamp, level, message, color = record
+        color_id = self._color_ids.get(color, None)
+        if color_id is None:
+            color_id = len(self._color_table)
+            self._color_table.append(color)
+            self._color_ids[color] = color_id
+        self._timestamps.append(timestamp)
+        self._levels.append(level)
+        self._colors.append(color_id)
+        self._messages.append(message)
+        return len(self._messages) - 1
+
+    def clear(self):
+        self._timestamps = array("d")
+        self._levels = array("B")
+        self._colors = array("H")
+        self._messages.clear()
+
+    def timestamp(self, index: int) -> float:
+        return self._timestamps[index]
+
+    def level(self, index: int) -> int:
+        return self._levels[index]
+
+    def message(self, index: int) -> str:
+        return self._messages[index]
+
+    def color_id(self, index: int) -> int:
+        return self._colors[index]
+
+    def color(self, color_id: int) -> str:
+        return self._color_table[color_id]
+
+    def filter(self, levels: Set[int], keyword: str, start: int = 0) -> array:
+        levels_ = self._levels
+        messages = self._messages
+        if keyword:
+            keyword = keyword.casefold()
+            return array(
+                "L",
+                (
+                    i
+                    for i in range(start, len(messages))
+                    if levels_[i] in levels and keyword in messages[i].casefold()
+                ),
+            )
+        return array(
+            "L", (i for i in range(start, len(messages)) if levels_[i] in levels)
+        )
+
+
+class LogListModel(QAbstractListModel):
+    """
+    日志视图的数据模型。只保存经过过滤的记录的下标，文本只在视图请求可见行时才进行格式化。
+    """
+
+    def __init__(self, parent: Optional[Any] = None):
+        super().__init__(parent)
+        self._store = LogStore()
+        self._rows = array("L")
+        self._levels: Set[int] = set(range(len(LOG_LEVEL_NAMES)))
+        self._keyword: str = ""
+        self._qcolors: List[QColor] = []
+
+    @property
+    def store(self) -> LogStore:
+        return self._store
+
+    def record_count(self) -> int:
+        return len(self._store)
+
+    # noinspection PyMethodOverriding
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    # noinspection PyMethodOverriding
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= len(self._rows):
+            return None
+        i = self._rows[row]
+        if role == Qt.DisplayRole:
+            return self._format_record(i)
+        if role == Qt.ForegroundRole:
+            return self._qcolor(self._store.color_id(i))
+        if role == Qt.ToolTipRole:
+            return self._store.message(i)
+        return None
+
+    def append_records(self, records: Iterable[LogRecord]):
+        start = len(self._store)
+        for record in records:
+            self._store.append(record)
+        matched = self._store.filter(self._levels, self._keyword, start)
+        if not matched:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(matched) - 1)
+        self._rows.extend(matched)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._store.clear()
+        self._rows = array("L")
+        self.endResetModel()
+
+    def is_level_visible(self, level: int) -> bool:
+        return level in self._levels
+
+    def set_level_visible(self, level: int, visible: bool):
+        if visible == (level in self._levels):
+            return
+        if visible:
+            self._levels.add(level)
+        else:
+            self._levels.discard(level)
+        self._refilter()
+
+    @property
+    def keyword(self) -> str:
+        return self._keyword
+
+    def set_keyword(self, keyword: str):
+        keyword = keyword or ""
+        if keyword == self._keyword:
+            return
+        self._keyword = keyword
+        self._refilter()
+
+    def _refilter(self):
+        self.beginResetModel()
+        self._rows = self._store.filter(self._levels, self._keyword)
+        self.endResetModel()
+
+    def _format_record(self, index: int) -> str:
+        timestamp = self._store.timestamp(index)
+        level = self._store.level(index)
+        message = self._store.message(index)
+        if "\n" in message:
+            message = message.rstrip("\n").replace("\n", " ↵ ")
+        return "{}.{:03d} [{:<8}] {}".format(
+            time.strftime("%H:%M:%S", time.localtime(timestamp)),
+            int((timestamp % 1) * 1000),
+            LOG_LEVEL_NAMES[level],
+            message,
+        )
+
+    def _qcolor(self, color_id: int) -> QColor:
+        while len(self._qcolors) <= color_id:
+            self._qcolors.append(QColor(self._store.color(len(self._qcolors))))
+        return self._qcolors[color_id]
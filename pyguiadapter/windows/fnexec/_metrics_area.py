@@ -0,0 +1,157 @@
+import csv
+import dataclasses
+import os
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from qtpy.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
+    QHeaderView,
+    QLabel,
+)
+
+from ._diagnostics_area import _NumericItem
+from ...metrics import ExecutionMetrics, format_bytes
+from ...utils import filedialog, messagebox
+
+COLUMNS = (
+    "Time",
+    "Function",
+    "Wall (ms)",
+    "CPU (ms)",
+    "Peak RSS delta",
+    "Outputs",
+    "Output chars",
+    "Progress updates",
+    "Status",
+)
+
+
+class MetricsArea(QWidget):
+    """
+    显示各次执行的指标（`ExecutionMetrics`），最新的记录位于最上方，可以导出为CSV文件。
+    """
+
+    def __init__(self, parent: Optional[QWidget], max_records: int):
+        super().__init__(parent)
+        self._max_records = max(max_records, 1)
+        # oldest first, the rows of the table are in the reverse order
+        self._records: Deque[ExecutionMetrics] = deque()
+
+        # noinspection PyArgumentList
+        self._layout = QVBoxLayout()
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+
+        # noinspection PyArgumentList
+        top_layout = QHBoxLayout()
+        self._layout.addLayout(top_layout)
+        self._summary_label = QLabel(self)
+        top_layout.addWidget(self._summary_label, 1)
+        self._export_button = QPushButton("Export...", self)
+        # noinspection PyUnresolvedReferences
+        self._export_button.clicked.connect(self._on_export_button_clicked)
+        top_layout.addWidget(self._export_button)
+        self._clear_button = QPushButton("Clear", self)
+        # noinspection PyUnresolvedReferences
+        self._clear_button.clicked.connect(self.clear_records)
+        top_layout.addWidget(self._clear_button)
+
+        self._table = QTableWidget(0, len(COLUMNS), self)
+        self._table.setHorizontalHeaderLabels(COLUMNS)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(
+            COLUMNS.index("Function"), QHeaderView.Stretch
+        )
+        self._layout.addWidget(self._table)
+        self._update_summary()
+
+    def add_record(self, metrics: ExecutionMetrics):
+        self._records.append(metrics)
+        if len(self._records) > self._max_records:
+            self._records.popleft()
+            self._table.removeRow(self._table.rowCount() - 1)
+        self._table.insertRow(0)
+        started_at = time.strftime("%H:%M:%S", time.localtime(metrics.started_at))
+        self._table.setItem(0, 0, QTableWidgetItem(started_at))
+        self._table.setItem(0, 1, QTableWidgetItem(metrics.fn_name))
+        self._table.setItem(0, 2, _seconds_item(metrics.wall_time))
+        self._table.setItem(0, 3, _seconds_item(metrics.cpu_time))
+        if metrics.peak_rss_delta is None:
+            rss_item = _NumericItem(None, "-")
+        else:
+            rss_item = _NumericItem(
+                metrics.peak_rss_delta, format_bytes(metrics.peak_rss_delta)
+            )
+        self._table.setItem(0, 4, rss_item)
+        for column, value in enumerate(
+            (metrics.output_writes, metrics.output_chars, metrics.progress_updates),
+            start=5,
+        ):
+            self._table.setItem(0, column, _NumericItem(value, str(value)))
+        status = "OK" if metrics.succeeded else metrics.error
+        if metrics.cached:
+            status += " (cached)"
+        self._table.setItem(0, 8, QTableWidgetItem(status))
+        self._update_summary()
+
+    def clear_records(self):
+        self._records.clear()
+        self._table.setRowCount(0)
+        self._update_summary()
+
+    def export_records(self, filename: str):
+        """
+        将所有记录导出为CSV文件。
+        """
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=[
+                    field.name for field in dataclasses.fields(ExecutionMetrics)
+                ],
+            )
+            writer.writeheader()
+            for metrics in self._records:
+                writer.writerow(metrics.to_dict())
+
+    def _update_summary(self):
+        if not self._records:
+            self._summary_label.setText("0 execution(s)")
+            return
+        mean = sum(metrics.wall_time for metrics in self._records) / len(self._records)
+        slowest = max(metrics.wall_time for metrics in self._records)
+        self._summary_label.setText(
+            f"{len(self._records)} execution(s), wall time mean {mean * 1000:.1f} ms, "
+            f"max {slowest * 1000:.1f} ms"
+        )
+
+    def _on_export_button_clicked(self):
+        filename = filedialog.get_save_file(
+            self, "Export Execution Metrics", "", "CSV files (*.csv);;All files (*)"
+        )
+        if not filename:
+            return
+        try:
+            self.export_records(filename)
+        except OSError as e:
+            messagebox.show_exception_messagebox(
+                self,
+                exception=e,
+                message=f"failed to export {os.path.basename(filename)}: ",
+            )
+
+
+def _seconds_item(seconds: Optional[float]) -> QTableWidgetItem:
+    if seconds is None:
+        return _NumericItem(None, "-")
+    return _NumericItem(seconds, f"{seconds * 1000:.1f}")
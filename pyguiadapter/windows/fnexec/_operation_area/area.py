@@ -11,6 +11,7 @@ class OperationArea(QWidget):
     sig_execute_requested = Signal()
     sig_cancel_requested = Signal()
     sig_clear_requested = Signal()
+    sig_batch_requested = Signal()
 
     def __init__(self, parent: Optional[QWidget], config: FnExecuteWindowConfig):
         self._config: FnExecuteWindowConfig = config
@@ -19,6 +20,7 @@ class OperationArea(QWidget):
         self._execute_button: Optional[QPushButton] = None
         self._clear_button: Optional[QPushButton] = None
         self._cancel_button: Optional[QPushButton] = None
+        self._batch_button: Optional[QPushButton] = None
         self._clear_checkbox: Optional[QCheckBox] = None
 
         super().__init__(parent)
@@ -29,11 +31,13 @@ class OperationArea(QWidget):
 
         self._execute_button = QPushButton(self)
         self._cancel_button = QPushButton(self)
+        self._batch_button = QPushButton(self)
         self._clear_button = QPushButton(self)
         self._clear_checkbox = QCheckBox(self)
 
         self._button_layout.addWidget(self._execute_button)
         self._button_layout.addWidget(self._cancel_button)
+        self._button_layout.addWidget(self._batch_button)
         self._button_layout.addWidget(self._clear_button)
 
         self._layout.addWidget(self._clear_checkbox)
@@ -45,6 +49,8 @@ class OperationArea(QWidget):
         # noinspection PyUnresolvedReferences
         self._cancel_button.clicked.connect(self.sig_cancel_requested)
         # noinspection PyUnresolvedReferences
+        self._batch_button.clicked.connect(self.sig_batch_requested)
+        # noinspection PyUnresolvedReferences
         self._clear_button.clicked.connect(self.sig_clear_requested)
 
         self.setLayout(self._layout)
@@ -55,6 +61,8 @@ class OperationArea(QWidget):
         self._execute_button.setText(self._config.execute_button_text or "Execute")
         self._cancel_button.setText(self._config.cancel_button_text or "Cancel")
         self._clear_button.setText(self._config.clear_button_text or "Clear")
+        self._batch_button.setText(self._config.batch_button_text or "Batch...")
+        self._batch_button.setVisible(False)
         self._clear_checkbox.setText(self._config.clear_checkbox_text or "clear output")
 
         self._clear_button.setVisible(self._config.clear_checkbox_visible)
@@ -82,6 +90,10 @@ class OperationArea(QWidget):
         if self._cancel_button is not None:
             self._cancel_button.setVisible(visible)
 
+    def set_batch_button_visible(self, visible: bool):
+        if self._batch_button is not None:
+            self._batch_button.setVisible(visible)
+
     def set_clear_checkbox_visible(self, visible: bool):
         if self._clear_checkbox is not None:
             self._clear_checkbox.setVisible(visible)
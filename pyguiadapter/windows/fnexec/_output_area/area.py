@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import Optional, Union
 
 from qtpy.QtWidgets import QWidget, QVBoxLayout
 
-from .browser import OutputBrowserConfig, OutputBrowser
+from .browser import (
+    OutputBrowserConfig,
+    OutputBrowser,
+    PlainOutputBrowser,
+    _Scrollback,
+)
 from .progressbar import ProgressBarConfig, ProgressBar
 
 
@@ -11,16 +16,23 @@ class OutputArea(QWidget):
         self, parent: QWidget, output_browser_config: Optional[OutputBrowserConfig]
     ):
         self._progressbar: Optional[ProgressBar] = None
-        self._output_browser: Optional[OutputBrowser] = None
+        self._output_browser: Union[OutputBrowser, PlainOutputBrowser, None] = None
+        self._output_browser_config: OutputBrowserConfig = (
+            output_browser_config or OutputBrowserConfig()
+        )
 
         super().__init__(parent)
 
+        # shared by all the output browsers created by this area, so that switching between them in auto mode
+        # does not open the spill file again
+        self._scrollback = _Scrollback(self, self._output_browser_config)
+
         # noinspection PyArgumentList
         self._layout = QVBoxLayout()
         self._layout.setContentsMargins(0, 0, 0, 0)
 
-        self._output_browser = OutputBrowser(
-            self, output_browser_config or OutputBrowserConfig()
+        self._output_browser = self._create_output_browser(
+            plaintext=self._output_browser_config.backend != "richtext"
         )
         self._layout.addWidget(self._output_browser)
 
@@ -40,13 +52,51 @@ class OutputArea(QWidget):
     def update_progress(self, current_value: int, message: Optional[str] = None):
         self._progressbar.update_progress(current_value, message)
 
+    def advance_progress(self, steps: int):
+        self._progressbar.advance(steps)
+
+    def is_progressbar_visible(self) -> bool:
+        return self._progressbar.isVisible()
+
     def clear_output(self):
         self._output_browser.clear()
+        # nothing needs the rich text browser after the output is cleared
+        if self._output_browser_config.backend == "auto" and isinstance(
+            self._output_browser, OutputBrowser
+        ):
+            self._replace_output_browser(plaintext=True)
 
     def append_output(self, text: str, html: bool = False):
+        if (
+            html
+            and self._output_browser_config.backend == "auto"
+            and isinstance(self._output_browser, PlainOutputBrowser)
+        ):
+            self._replace_output_browser(plaintext=False)
         self._output_browser.append_output(text, html)
 
     def scroll_to_bottom(self):
         scroll_bar = self._output_browser.verticalScrollBar()
         if scroll_bar:
             scroll_bar.setValue(scroll_bar.maximum())
+
+    def _create_output_browser(
+        self, plaintext: bool
+    ) -> Union[OutputBrowser, PlainOutputBrowser]:
+        if plaintext:
+            return PlainOutputBrowser(
+                self, self._output_browser_config, self._scrollback
+            )
+        return OutputBrowser(self, self._output_browser_config, self._scrollback)
+
+    def _replace_output_browser(self, plaintext: bool):
+        old_browser = self._output_browser
+        new_browser = self._create_output_browser(plaintext)
+        # carry over what has been printed so far
+        content = old_browser.toPlainText()
+        if content:
+            new_browser.append_output(content, False)
+        self._layout.replaceWidget(old_browser, new_browser)
+        old_browser.hide()
+        old_browser.deleteLater()
+        self._output_browser = new_browser
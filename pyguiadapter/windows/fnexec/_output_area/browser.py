@@ -1,14 +1,19 @@
 import dataclasses
-from typing import Optional, Union, Sequence
+import logging
+import warnings
+from logging.handlers import RotatingFileHandler
+from typing import Optional, Union, Sequence, Literal
 
-from qtpy.QtWidgets import QWidget
+from qtpy.QtGui import QTextCursor, QTextDocument, QPalette, QColor
+from qtpy.QtGui import QTextDocumentFragment
+from qtpy.QtWidgets import QWidget, QPlainTextEdit
 
 from ....constants.color import (
     COLOR_TERMINAL_BACKGROUND_CLASSIC,
     COLOR_TERMINAL_TEXT_CLASSIC,
 )
 from ....constants.font import FONT_FAMILY
-from ....textbrowser import TextBrowserConfig, TextBrowser
+from ....textbrowser import TextBrowserConfig, TextBrowser, LineWrapMode
 
 
 @dataclasses.dataclass
@@ -19,10 +24,175 @@ class OutputBrowserConfig(TextBrowserConfig):
     font_family: Union[Sequence[str], str, None] = FONT_FAMILY
     background_color: str = COLOR_TERMINAL_BACKGROUND_CLASSIC
 
+    flush_interval: int = 40
+    """输出缓冲区的刷新间隔（毫秒）。函数中`uprint()`打印的内容会先写入缓冲区，然后每隔`flush_interval`毫秒合并写入输出浏览器一次。"""
+
+    max_batch_size: int = 64 * 1024
+    """每次刷新时写入输出浏览器的最大字符数，超出部分将在下一个刷新周期写入。小于等于0时表示不限制。"""
+
+    max_blocks: int = 0
+    """输出浏览器最多保留的文本块（行）数，小于等于0时表示不限制。超出限制时，最早的文本块将被成批移除，以保持内存占用和输出速度的稳定。"""
+
+    spill_file: Optional[str] = None
+    """被移除的文本块的转储文件路径。若指定，则超出`max_blocks`限制而被移除的内容将以纯文本的形式追加到该文件中。"""
+
+    spill_file_max_bytes: int = 10 * 1024 * 1024
+    """转储文件的最大字节数，超出后将进行轮转。"""
+
+    spill_file_backup_count: int = 3
+    """转储文件轮转时保留的历史文件数量。"""
+
+    backend: Literal["richtext", "plaintext", "auto"] = "auto"
+    """输出浏览器的实现方式。`richtext`：基于`QTextBrowser`，支持html输出；`plaintext`：基于`QPlainTextEdit`的纯文本视图，
+    输出速度更快，html内容将被转换为纯文本；`auto`（默认）：默认使用纯文本视图，在第一次输出html内容（例如使用`Logger`、`print_image()`）时
+    自动切换为`richtext`，清除输出后再切换回纯文本视图。"""
+
+
+# blocks will be trimmed only when the block count exceeds max_blocks by this ratio,
+# so that the (relatively expensive) removal is done in bulk instead of on every append
+_TRIM_SLACK_RATIO = 0.1
+
+
+class _Scrollback(object):
+    """
+    负责移除超出`max_blocks`的文本块，并将其转储到`spill_file`中。转储文件的handler在`owner`销毁时关闭，
+    因此`OutputArea`切换输出浏览器时可以共享同一个实例。
+    """
+
+    def __init__(self, owner: QWidget, config: OutputBrowserConfig):
+        self._config = config
+        self._spill_handler: Optional[RotatingFileHandler] = None
+        if self._config.max_blocks > 0 and self._config.spill_file:
+            self._spill_handler = self._create_spill_handler(owner)
+
+    @property
+    def spill_enabled(self) -> bool:
+        return self._spill_handler is not None
+
+    def trim(self, document: QTextDocument):
+        max_blocks = self._config.max_blocks
+        if max_blocks <= 0:
+            return
+        block_count = document.blockCount()
+        if block_count <= max_blocks + int(max_blocks * _TRIM_SLACK_RATIO):
+            return
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.Start)
+        cursor.movePosition(
+            QTextCursor.NextBlock, QTextCursor.KeepAnchor, block_count - max_blocks
+        )
+        if self._spill_handler is not None:
+            self._spill(cursor.selection().toPlainText())
+        cursor.removeSelectedText()
+
+    def _spill(self, text: str):
+        if not text:
+            return
+        record = logging.makeLogRecord({"msg": text.rstrip("\n")})
+        self._spill_handler.handle(record)
+
+    def _create_spill_handler(self, owner: QWidget) -> Optional[RotatingFileHandler]:
+        try:
+            handler = RotatingFileHandler(
+                self._config.spill_file,
+                maxBytes=self._config.spill_file_max_bytes,
+                backupCount=self._config.spill_file_backup_count,
+                encoding="utf-8",
+                delay=True,
+            )
+        except OSError as e:
+            warnings.warn(f"unable to open spill file '{self._config.spill_file}': {e}")
+            return None
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        # noinspection PyUnresolvedReferences
+        owner.destroyed.connect(handler.close)
+        return handler
+
 
 class OutputBrowser(TextBrowser):
     def __init__(
-        self, parent: Optional[QWidget], config: Optional[OutputBrowserConfig]
+        self,
+        parent: Optional[QWidget],
+        config: Optional[OutputBrowserConfig],
+        scrollback: Optional[_Scrollback] = None,
     ):
         config = config or OutputBrowserConfig()
         super().__init__(parent, config)
+        self._config: OutputBrowserConfig
+
+        # the output browser is read-only, keeping an undo stack only wastes memory
+        self.document().setUndoRedoEnabled(False)
+        self._scrollback = scrollback or _Scrollback(self, self._config)
+
+    def append_output(self, content: str, html: bool = False, html_tag: str = "div"):
+        super().append_output(content, html, html_tag)
+        self._scrollback.trim(self.document())
+
+
+class PlainOutputBrowser(QPlainTextEdit):
+    """
+    基于`QPlainTextEdit`的纯文本输出浏览器，与`OutputBrowser`具有相同的输出接口。
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QWidget],
+        config: Optional[OutputBrowserConfig],
+        scrollback: Optional[_Scrollback] = None,
+    ):
+        self._config: OutputBrowserConfig = config or OutputBrowserConfig()
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self._scrollback = scrollback or _Scrollback(self, self._config)
+        self._apply_config()
+
+    def move_cursor_to_end(self):
+        cursor = self.textCursor()
+        cursor.clearSelection()
+        cursor.movePosition(QTextCursor.End)
+        self.setTextCursor(cursor)
+
+    def append_output(self, content: str, html: bool = False, html_tag: str = "div"):
+        _ = html_tag
+        if html:
+            content = QTextDocumentFragment.fromHtml(content).toPlainText() + "\n"
+        if not content:
+            return
+        self.move_cursor_to_end()
+        self.insertPlainText(content)
+        if self._scrollback.spill_enabled:
+            self._scrollback.trim(self.document())
+
+    def _apply_config(self):
+        palette = self.palette()
+        if self._config.background_color:
+            palette.setColor(QPalette.Base, QColor(self._config.background_color))
+        if self._config.text_color:
+            palette.setColor(QPalette.Text, QColor(self._config.text_color))
+        self.setPalette(palette)
+
+        font = self.font()
+        if self._config.font_family:
+            if isinstance(self._config.font_family, str):
+                font.setFamily(self._config.font_family)
+            else:
+                font.setFamilies(self._config.font_family)
+        if self._config.font_size:
+            font.setPixelSize(self._config.font_size)
+        self.setFont(font)
+
+        # QPlainTextEdit only supports wrapping at the widget width
+        if self._config.line_wrap_mode == LineWrapMode.NoWrap:
+            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        else:
+            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self.setWordWrapMode(self._config.word_wrap_mode)
+
+        # without a spill file, let QPlainTextEdit drop the oldest blocks by itself,
+        # which is much cheaper than removing them through a cursor
+        if self._config.max_blocks > 0 and not self._scrollback.spill_enabled:
+            self.setMaximumBlockCount(self._config.max_blocks)
+
+        if self._config.stylesheet:
+            self.setStyleSheet(self._config.stylesheet)
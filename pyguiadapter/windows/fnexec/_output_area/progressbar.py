@@ -63,6 +63,11 @@ class ProgressBar(QWidget):
         self._progressbar.setValue(current_value)
         self._update_info(info)
 
+    def advance(self, steps: int):
+        # value() is minimum() - 1 before the first setValue() call
+        value = max(self._progressbar.value(), self._progressbar.minimum())
+        self._progressbar.setValue(min(value + steps, self._progressbar.maximum()))
+
     def _update_info(self, info: Optional[str]):
         if info is None:
             return
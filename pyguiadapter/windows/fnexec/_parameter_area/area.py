@@ -1,5 +1,6 @@
 import dataclasses
 import traceback
+from collections import Counter
 from typing import Optional, Any, Dict, List, Tuple, Type
 
 from qtpy.QtWidgets import QWidget, QVBoxLayout
@@ -43,7 +44,7 @@ class ParameterArea(BaseParameterArea):
         self,
         parameter_name: str,
         config: Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig],
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         if parameter_name.strip() == "":
             raise ValueError("parameter name cannot be empty.")
         param_info = self._bundle.fn_info.parameters.get(parameter_name)
@@ -55,7 +56,10 @@ class ParameterArea(BaseParameterArea):
             widget = self._groupbox.add_parameter(
                 parameter_name, widget_class, widget_config
             )
-            if isinstance(widget_config, CommonParameterWidgetConfig):
+            # widget is None if it will be created lazily, the default value is kept until then
+            if widget is not None and isinstance(
+                widget_config, CommonParameterWidgetConfig
+            ):
                 # apply set_default_value_on_init
                 # set_value() may raise exceptions, we need to catch ParameterValidationError of them
                 # typically, this kind of exception is not fatal, it unnecessary to exit the whole program
@@ -79,6 +83,18 @@ class ParameterArea(BaseParameterArea):
         else:
             return widget
 
+    def add_parameters(
+        self,
+        configs: Dict[str, Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig]],
+    ):
+        threshold = self._config.virtual_parameter_page_threshold
+        if threshold is not None:
+            group_sizes = Counter(config[1].group for config in configs.values())
+            for group_name, size in group_sizes.items():
+                if size >= threshold:
+                    self._groupbox.use_virtual_page(group_name)
+        super().add_parameters(configs)
+
     def remove_parameter(
         self, parameter_name: str, ignore_unknown_parameter: bool = True
     ):
@@ -1,3 +1,6 @@
+import copy
+import dataclasses
+import traceback
 from abc import abstractmethod
 from typing import Dict, Any, List, Tuple, Type, Optional
 
@@ -7,6 +10,20 @@ from qtpy.QtWidgets import QWidget, QToolBox
 
 from ....exceptions import ParameterError
 from ....paramwidget import BaseParameterWidget, BaseParameterWidgetConfig
+from ....utils import messagebox
+
+
+@dataclasses.dataclass
+class _UnbuiltParameter(object):
+    """
+    A parameter whose widget has not been created yet. It keeps the value of the parameter until the widget is
+    created.
+    """
+
+    widget_class: Type[BaseParameterWidget]
+    widget_config: BaseParameterWidgetConfig
+    value: Any = None
+    has_value: bool = False
 
 
 class BaseParameterPage(QWidget):
@@ -41,7 +58,7 @@ class BaseParameterPage(QWidget):
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
         index: Optional[int] = None,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         pass
 
     @abstractmethod
@@ -51,7 +68,7 @@ class BaseParameterPage(QWidget):
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
         index: int = -1,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         pass
 
     @abstractmethod
@@ -60,7 +77,7 @@ class BaseParameterPage(QWidget):
         parameter_name: str,
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         pass
 
     @abstractmethod
@@ -108,6 +125,12 @@ class BaseParameterPage(QWidget):
     def disable_parameter_widgets(self, disabled: bool):
         pass
 
+    def build_parameter_widgets(self):
+        """
+        创建尚未创建的参数控件。延迟创建参数控件时，参数控件在页面首次显示时才被创建。
+        """
+        pass
+
     # noinspection SpellCheckingInspection
     @abstractmethod
     def _add_to_scrollarea(self, widget: BaseParameterWidget, index: int):
@@ -130,6 +153,13 @@ class BaseParameterGroupBox(QToolBox):
     def add_default_group(self) -> BaseParameterPage:
         pass
 
+    @abstractmethod
+    def use_virtual_page(self, group_name: Optional[str]):
+        """
+        指定分组使用虚拟化的参数页面（只为可见的参数创建控件），需要在向该分组添加参数之前调用。
+        """
+        pass
+
     @abstractmethod
     def has_parameter_group(self, group_name: Optional[str]) -> bool:
         pass
@@ -164,7 +194,7 @@ class BaseParameterGroupBox(QToolBox):
         parameter_name: str,
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         pass
 
     @abstractmethod
@@ -264,7 +294,7 @@ class BaseParameterArea(QWidget):
         self,
         parameter_name: str,
         config: Tuple[Type[BaseParameterWidget], BaseParameterWidgetConfig],
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         pass
 
     def add_parameters(
@@ -345,3 +375,21 @@ class BaseParameterArea(QWidget):
     @abstractmethod
     def disable_parameter_widgets(self, disabled: bool):
         pass
+
+
+def _unbuilt_value(unbuilt: _UnbuiltParameter) -> Any:
+    if getattr(unbuilt.widget_config, "get_deepcopy", False):
+        return copy.deepcopy(unbuilt.value)
+    return unbuilt.value
+
+
+def _exit_on_creation_error(page: BaseParameterPage, parameter_name: str, e: Exception):
+    # same as creating the widget when the parameter is added, see ParameterArea.add_parameter()
+    traceback.print_exc()
+    messagebox.show_exception_messagebox(
+        page,
+        message=f"cannot create parameter widget for parameter '{parameter_name}':",
+        exception=e,
+        title=page.parent().error_dialog_title,
+    )
+    exit(-1)
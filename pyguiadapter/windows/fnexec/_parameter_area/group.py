@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import Dict, Any, List, Tuple, Type, Optional
+from typing import Dict, Any, List, Tuple, Type, Optional, Set
 
 from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import (
@@ -10,20 +10,36 @@ from qtpy.QtWidgets import (
     QSizePolicy,
 )
 
-from .base import BaseParameterPage, BaseParameterGroupBox
+from .base import (
+    BaseParameterPage,
+    BaseParameterGroupBox,
+    _UnbuiltParameter,
+    _exit_on_creation_error,
+)
+from .virtual import VirtualParameterGroupPage
 from .._base import FnExecuteWindowConfig
-from ....exceptions import ParameterAlreadyExistError, ParameterNotFoundError
+from ....exceptions import (
+    ParameterError,
+    ParameterAlreadyExistError,
+    ParameterNotFoundError,
+)
 from ....paramwidget import BaseParameterWidget, BaseParameterWidgetConfig
 from ....utils import get_icon
-from ....widgets import CommonParameterWidget
+from ....widgets import CommonParameterWidget, CommonParameterWidgetConfig
 
 
 class ParameterGroupPage(BaseParameterPage):
     # noinspection SpellCheckingInspection
-    def __init__(self, parent: "ParameterGroupBox", group_name: str):
+    def __init__(
+        self, parent: "ParameterGroupBox", group_name: str, lazy: bool = False
+    ):
         super().__init__(parent, group_name)
 
         self._parameters: Dict[str, BaseParameterWidget] = OrderedDict()
+        # in lazy mode, widgets are created when the page is shown for the first time, or when the value of one
+        # of its parameters is read or set, before that, parameters added to the page are kept here
+        self._unbuilt_parameters: Dict[str, _UnbuiltParameter] = OrderedDict()
+        self._built = not lazy
 
         # noinspection PyArgumentList
         self._layout_main = QVBoxLayout()
@@ -63,9 +79,14 @@ class ParameterGroupPage(BaseParameterPage):
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
         index: Optional[int] = None,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         if parameter_name.strip() == "":
             raise ValueError("parameter_name is an empty-string")
+        if not self._built:
+            self._upsert_unbuilt_parameter(
+                parameter_name, widget_class, widget_config, index
+            )
+            return None
         # if there is an old widget for the parameter, remove it from the layout
         # and then release it
         if parameter_name in self._parameters:
@@ -101,11 +122,11 @@ class ParameterGroupPage(BaseParameterPage):
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
         index: int = -1,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         if parameter_name.strip() == "":
             raise ValueError("invalid parameter_name: empty-string")
 
-        if parameter_name in self._parameters:
+        if self.has_parameter_widget(parameter_name):
             raise ParameterAlreadyExistError(parameter_name)
 
         return self.upsert_parameter_widget(
@@ -117,10 +138,10 @@ class ParameterGroupPage(BaseParameterPage):
         parameter_name: str,
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         if parameter_name.strip() == "":
             raise ValueError("parameter_name is an empty-string")
-        if parameter_name not in self._parameters:
+        if not self.has_parameter_widget(parameter_name):
             raise ParameterNotFoundError(parameter_name)
         return self.upsert_parameter_widget(
             parameter_name, widget_class, widget_config, None
@@ -129,16 +150,22 @@ class ParameterGroupPage(BaseParameterPage):
     def get_parameter_widget(
         self, parameter_name: str
     ) -> Optional[BaseParameterWidget]:
+        if parameter_name in self._unbuilt_parameters:
+            self.build_parameter_widgets()
         return self._parameters.get(parameter_name, None)
 
     def has_parameter_widget(self, parameter_name: str) -> bool:
-        if not self._parameters:
-            return False
-        return parameter_name in self._parameters
+        return (
+            parameter_name in self._parameters
+            or parameter_name in self._unbuilt_parameters
+        )
 
     def remove_parameter_widget(self, parameter_name: str):
         if parameter_name.strip() == "":
             raise ValueError("invalid parameter_name: empty parameter_name")
+        if parameter_name in self._unbuilt_parameters:
+            del self._unbuilt_parameters[parameter_name]
+            return
         if parameter_name not in self._parameters:
             return
         widget = self._parameters[parameter_name]
@@ -154,17 +181,19 @@ class ParameterGroupPage(BaseParameterPage):
         del self._parameters[parameter_name]
 
     def clear_parameter_widgets(self):
+        self._unbuilt_parameters.clear()
         param_names = list(self._parameters.keys())
         for param_name in param_names:
             self.remove_parameter_widget(param_name)
 
     def parameter_count(self) -> int:
-        return len(self._parameters)
+        return len(self._parameters) + len(self._unbuilt_parameters)
 
     def get_parameter_names(self) -> List[str]:
-        return list(self._parameters.keys())
+        return list(self._unbuilt_parameters.keys()) + list(self._parameters.keys())
 
     def get_parameter_value(self, parameter_name: str) -> Any:
+        # values always go through the widgets, which convert and validate them
         widget = self.get_parameter_widget(parameter_name)
         if widget is None:
             raise ParameterNotFoundError(parameter_name)
@@ -177,6 +206,7 @@ class ParameterGroupPage(BaseParameterPage):
         widget.set_value(value)
 
     def get_parameter_values(self) -> Dict[str, Any]:
+        self.build_parameter_widgets()
         params = OrderedDict()
         for param_name, param_widget in self._parameters.items():
             if not param_widget:
@@ -187,14 +217,68 @@ class ParameterGroupPage(BaseParameterPage):
 
     def set_parameter_values(self, values: Dict[str, Any]):
         for param_name, param_value in values.items():
-            widget = self.get_parameter_widget(param_name)
-            if widget is None:
+            if not self.has_parameter_widget(param_name):
                 continue
-            widget.set_value(param_value)
+            self.set_parameter_value(param_name, param_value)
 
     def disable_parameter_widgets(self, disabled: bool):
         self._scrollarea_content.setDisabled(disabled)
 
+    def build_parameter_widgets(self):
+        if self._built:
+            return
+        self._built = True
+        unbuilt_parameters = list(self._unbuilt_parameters.items())
+        self._unbuilt_parameters.clear()
+        self._scrollarea_content.setUpdatesEnabled(False)
+        try:
+            for param_name, unbuilt in unbuilt_parameters:
+                self._build_parameter_widget(param_name, unbuilt)
+        finally:
+            self._scrollarea_content.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        self.build_parameter_widgets()
+        super().showEvent(event)
+
+    def _build_parameter_widget(self, parameter_name: str, unbuilt: _UnbuiltParameter):
+        try:
+            widget = self.upsert_parameter_widget(
+                parameter_name, unbuilt.widget_class, unbuilt.widget_config, -1
+            )
+        except Exception as e:
+            _exit_on_creation_error(self, parameter_name, e)
+        if not unbuilt.has_value:
+            return
+        try:
+            widget.set_value(unbuilt.value)
+        except ParameterError as e:
+            # the rejected default value never reaches the function, the widget keeps its own value
+            self._parent.notify_parameter_error(parameter_name, e.message)
+
+    def _upsert_unbuilt_parameter(
+        self,
+        parameter_name: str,
+        widget_class: Type[BaseParameterWidget],
+        widget_config: BaseParameterWidgetConfig,
+        index: Optional[int],
+    ):
+        # the default value is set to the widget when it is created, see ParameterArea.add_parameter()
+        unbuilt = _UnbuiltParameter(widget_class, widget_config)
+        if (
+            isinstance(widget_config, CommonParameterWidgetConfig)
+            and widget_config.set_default_value_on_init
+        ):
+            unbuilt.value = widget_config.default_value
+            unbuilt.has_value = True
+        if parameter_name in self._unbuilt_parameters or index is None or index < 0:
+            # an existing parameter keeps its position
+            self._unbuilt_parameters[parameter_name] = unbuilt
+            return
+        items = list(self._unbuilt_parameters.items())
+        items.insert(index, (parameter_name, unbuilt))
+        self._unbuilt_parameters = OrderedDict(items)
+
     # noinspection SpellCheckingInspection
     def _add_to_scrollarea(self, widget: BaseParameterWidget, index: int):
         self._layout_scrollerea_content.removeItem(self._bottom_spacer)
@@ -206,18 +290,35 @@ class ParameterGroupBox(BaseParameterGroupBox):
     def __init__(self, parent: QWidget, config: FnExecuteWindowConfig):
         self._config = config
         self._group_pages: Dict[str, BaseParameterPage] = OrderedDict()
+        # groups that use VirtualParameterGroupPage
+        self._virtual_groups: Set[str] = set()
         super().__init__(parent)
 
+    @property
+    def error_dialog_title(self) -> str:
+        return self._config.error_dialog_title
+
     def upsert_parameter_group(self, group_name: Optional[str]) -> BaseParameterPage:
         group_name = self._group_name(group_name)
         if group_name in self._group_pages:
             return self._group_pages[group_name]
 
-        page = ParameterGroupPage(self, group_name=group_name)
-        icon = self._group_icon(group_name)
-        self.addItem(page, icon, group_name)
-        self._group_pages[group_name] = page
-        return page
+        return self._create_group_page(group_name, -1)
+
+    def use_virtual_page(self, group_name: Optional[str]):
+        group_name = self._group_name(group_name)
+        self._virtual_groups.add(group_name)
+        page = self._group_pages.get(group_name, None)
+        if (
+            page is None
+            or isinstance(page, VirtualParameterGroupPage)
+            or page.parameter_count() > 0
+        ):
+            return
+        # replace the empty page, typically the default group created in advance
+        index = self.indexOf(page)
+        self._remove_group(page)
+        self._create_group_page(group_name, index)
 
     def add_default_group(self) -> BaseParameterPage:
         return self.upsert_parameter_group(None)
@@ -260,7 +361,7 @@ class ParameterGroupBox(BaseParameterGroupBox):
         parameter_name: str,
         widget_class: Type[BaseParameterWidget],
         widget_config: BaseParameterWidgetConfig,
-    ) -> BaseParameterWidget:
+    ) -> Optional[BaseParameterWidget]:
         if self.has_parameter(parameter_name):
             raise ParameterAlreadyExistError(parameter_name)
         group_page = self.upsert_parameter_group(widget_config.group)
@@ -271,8 +372,8 @@ class ParameterGroupBox(BaseParameterGroupBox):
     def remove_parameter(
         self, parameter_name: str, ignore_unknown_parameter: bool = True
     ):
-        group, widget = self._get_group_and_widget(parameter_name)
-        if group is None or widget is None:
+        group = self._get_parameter_group_of(parameter_name)
+        if group is None:
             if ignore_unknown_parameter:
                 return
             raise ParameterNotFoundError(parameter_name)
@@ -284,12 +385,13 @@ class ParameterGroupBox(BaseParameterGroupBox):
         for group in list(self._group_pages.values()):
             self._remove_group(group)
         self._group_pages.clear()
+        self._virtual_groups.clear()
 
     def get_parameter_value(self, parameter_name: str) -> Any:
-        _, widget = self._get_group_and_widget(parameter_name)
-        if widget is None:
+        group = self._get_parameter_group_of(parameter_name)
+        if group is None:
             raise ParameterNotFoundError(parameter_name)
-        return widget.get_value()
+        return group.get_parameter_value(parameter_name)
 
     def get_parameter_values(self) -> Dict[str, Any]:
         params = OrderedDict()
@@ -318,10 +420,10 @@ class ParameterGroupBox(BaseParameterGroupBox):
         return group.get_parameter_names()
 
     def set_parameter_value(self, parameter_name: str, value: Any):
-        _, widget = self._get_group_and_widget(parameter_name)
-        if widget is None:
+        group = self._get_parameter_group_of(parameter_name)
+        if group is None:
             raise ParameterNotFoundError(parameter_name)
-        widget.set_value(value)
+        group.set_parameter_value(parameter_name, value)
 
     def set_parameter_values(self, params: Dict[str, Any]):
         for group_page in self._group_pages.values():
@@ -344,8 +446,8 @@ class ParameterGroupBox(BaseParameterGroupBox):
         y: int = 50,
         highlight_effect: bool = False,
     ):
-        group, widget = self._get_group_and_widget(parameter_name)
-        if group is None or widget is None:
+        group = self._get_parameter_group_of(parameter_name)
+        if group is None:
             return
         if not self.active_parameter_group(group_name=group.group_name):
             return
@@ -355,6 +457,13 @@ class ParameterGroupBox(BaseParameterGroupBox):
         for page in self._group_pages.values():
             page.disable_parameter_widgets(disabled)
 
+    def notify_parameter_error(self, parameter_name: str, error: Any):
+        # the widget must exist to receive the error
+        group = self._get_parameter_group_of(parameter_name)
+        if group is not None:
+            group.build_parameter_widgets()
+        super().notify_parameter_error(parameter_name, error)
+
     def _get_group_and_widget(
         self, parameter_name: str
     ) -> Tuple[Optional[BaseParameterPage], Optional[BaseParameterWidget]]:
@@ -377,6 +486,23 @@ class ParameterGroupBox(BaseParameterGroupBox):
         if group.group_name in self._group_pages:
             del self._group_pages[group.group_name]
 
+    def _create_group_page(self, group_name: str, index: int) -> BaseParameterPage:
+        if group_name in self._virtual_groups:
+            page = VirtualParameterGroupPage(self, group_name=group_name)
+        else:
+            page = ParameterGroupPage(
+                self, group_name=group_name, lazy=self._config.lazy_parameter_widgets
+            )
+        icon = self._group_icon(group_name)
+        index = self.insertItem(index, page, icon, group_name)
+        self._group_pages[group_name] = page
+        if index != self.count() - 1:
+            # keep the order of the groups, which is the order of the parameter values
+            self._group_pages = OrderedDict(
+                sorted(self._group_pages.items(), key=lambda kv: self.indexOf(kv[1]))
+            )
+        return page
+
     def _group_name(self, name: Optional[str]) -> str:
         if name is None:
             return self._config.default_parameter_group_name
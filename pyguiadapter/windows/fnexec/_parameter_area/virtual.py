@@ -0,0 +1,391 @@
+from collections import OrderedDict
+from typing import Dict, Any, List, Type, Optional, Set
+
+from qtpy.QtCore import Qt, QSize, QTimer
+from qtpy.QtWidgets import (
+    QVBoxLayout,
+    QListWidget,
+    QListWidgetItem,
+    QAbstractItemView,
+    QListView,
+)
+
+from .base import (
+    BaseParameterPage,
+    BaseParameterGroupBox,
+    _UnbuiltParameter,
+    _unbuilt_value,
+    _exit_on_creation_error,
+)
+from ....exceptions import (
+    ParameterError,
+    ParameterAlreadyExistError,
+    ParameterNotFoundError,
+)
+from ....paramwidget import BaseParameterWidget, BaseParameterWidgetConfig
+from ....widgets import CommonParameterWidget, CommonParameterWidgetConfig
+
+# row height used for a widget class before any widget of it has been created
+_DEFAULT_ROW_HEIGHT = 80
+# rows above and below the viewport that also get an editor, so that the editors are ready before they are
+# scrolled into view
+_OVERSCAN_ROWS = 2
+
+
+class VirtualParameterGroupPage(BaseParameterPage):
+    """
+    A parameter page that creates parameter widgets (editors) only for the rows that are visible in the view. The
+    editor of a row scrolled out of the view is released after its value is saved, and a new one is created when the
+    row is scrolled back, so the number of existing editors doesn't depend on the number of parameters. The values of
+    the parameters without an editor are kept in a dict. Like the values of the editors, they are converted and
+    validated by a widget of the parameter, a temporary one is created for that when the row has no editor.
+    """
+
+    def __init__(self, parent: BaseParameterGroupBox, group_name: str):
+        super().__init__(parent, group_name)
+
+        self._parameters: Dict[str, _UnbuiltParameter] = OrderedDict()
+        self._items: Dict[str, QListWidgetItem] = {}
+        self._editors: Dict[str, BaseParameterWidget] = {}
+        # parameters whose kept value (the default value) has not been passed through a widget yet
+        self._raw_values: Set[str] = set()
+        # errors of the parameters are re-applied when their editors are created
+        self._errors: Dict[str, Any] = {}
+        # the height of the last widget created for each widget class
+        self._row_heights: Dict[Type[BaseParameterWidget], int] = {}
+        self._disabled = False
+
+        # noinspection PyArgumentList
+        self._layout_main = QVBoxLayout()
+        self._layout_main.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout_main)
+
+        self._list = QListWidget(self)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._list.setSelectionMode(QAbstractItemView.NoSelection)
+        self._list.setResizeMode(QListView.Adjust)
+        self._list.setFocusPolicy(Qt.NoFocus)
+        self._layout_main.addWidget(self._list)
+
+        # updating the editors is deferred, so that it happens once for a burst of scroll and resize events
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        # noinspection PyUnresolvedReferences
+        self._update_timer.timeout.connect(self._update_editors)
+        # noinspection PyUnresolvedReferences
+        self._list.verticalScrollBar().valueChanged.connect(self._schedule_update)
+
+        # noinspection PyUnresolvedReferences
+        parent.sig_parameter_error.connect(self._on_parameter_error)
+        # noinspection PyUnresolvedReferences
+        parent.sig_clear_parameter_error.connect(self._on_clear_parameter_error)
+
+    def scroll_to(
+        self,
+        parameter_name: str,
+        x: int = 50,
+        y: int = 50,
+        highlight_effect: bool = False,
+    ) -> None:
+        item = self._items.get(parameter_name, None)
+        if item is None:
+            return
+        self._list.scrollToItem(item, QAbstractItemView.PositionAtCenter)
+        self._update_editors()
+        editor = self._editors.get(parameter_name, None)
+        if highlight_effect and isinstance(editor, CommonParameterWidget):
+            editor.play_highlight_effect()
+
+    def upsert_parameter_widget(
+        self,
+        parameter_name: str,
+        widget_class: Type[BaseParameterWidget],
+        widget_config: BaseParameterWidgetConfig,
+        index: Optional[int] = None,
+    ) -> Optional[BaseParameterWidget]:
+        if parameter_name.strip() == "":
+            raise ValueError("parameter_name is an empty-string")
+        parameter = _UnbuiltParameter(widget_class, widget_config)
+        if (
+            isinstance(widget_config, CommonParameterWidgetConfig)
+            and widget_config.set_default_value_on_init
+        ):
+            parameter.value = widget_config.default_value
+            parameter.has_value = True
+            self._raw_values.add(parameter_name)
+        else:
+            self._raw_values.discard(parameter_name)
+        if parameter_name in self._parameters:
+            # the old editor was created with the old config
+            self._release_editor(parameter_name, save_value=False)
+            self._parameters[parameter_name] = parameter
+            item = self._items[parameter_name]
+        else:
+            self._parameters[parameter_name] = parameter
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, parameter_name)
+            if index is None or index < 0 or index >= self._list.count():
+                self._list.addItem(item)
+            else:
+                self._list.insertItem(index, item)
+                self._sort_parameters()
+            self._items[parameter_name] = item
+        item.setSizeHint(
+            QSize(0, self._row_heights.get(widget_class, _DEFAULT_ROW_HEIGHT))
+        )
+        self._schedule_update()
+        # editors are created when their rows become visible
+        return None
+
+    def insert_parameter_widget(
+        self,
+        parameter_name: str,
+        widget_class: Type[BaseParameterWidget],
+        widget_config: BaseParameterWidgetConfig,
+        index: int = -1,
+    ) -> Optional[BaseParameterWidget]:
+        if parameter_name.strip() == "":
+            raise ValueError("invalid parameter_name: empty-string")
+        if parameter_name in self._parameters:
+            raise ParameterAlreadyExistError(parameter_name)
+        return self.upsert_parameter_widget(
+            parameter_name, widget_class, widget_config, index
+        )
+
+    def update_parameter_widget(
+        self,
+        parameter_name: str,
+        widget_class: Type[BaseParameterWidget],
+        widget_config: BaseParameterWidgetConfig,
+    ) -> Optional[BaseParameterWidget]:
+        if parameter_name.strip() == "":
+            raise ValueError("parameter_name is an empty-string")
+        if parameter_name not in self._parameters:
+            raise ParameterNotFoundError(parameter_name)
+        return self.upsert_parameter_widget(
+            parameter_name, widget_class, widget_config, None
+        )
+
+    def get_parameter_widget(
+        self, parameter_name: str
+    ) -> Optional[BaseParameterWidget]:
+        """
+        返回参数当前的控件，参数所在的行不可见时返回`None`。
+        """
+        return self._editors.get(parameter_name, None)
+
+    def has_parameter_widget(self, parameter_name: str) -> bool:
+        return parameter_name in self._parameters
+
+    def remove_parameter_widget(self, parameter_name: str):
+        if parameter_name.strip() == "":
+            raise ValueError("invalid parameter_name: empty parameter_name")
+        if parameter_name not in self._parameters:
+            return
+        self._release_editor(parameter_name, save_value=False)
+        item = self._items.pop(parameter_name)
+        self._list.takeItem(self._list.row(item))
+        del self._parameters[parameter_name]
+        self._raw_values.discard(parameter_name)
+        self._errors.pop(parameter_name, None)
+        self._schedule_update()
+
+    def clear_parameter_widgets(self):
+        self._editors.clear()
+        # the editors are deleted together with the items
+        self._list.clear()
+        self._parameters.clear()
+        self._items.clear()
+        self._raw_values.clear()
+        self._errors.clear()
+
+    def parameter_count(self) -> int:
+        return len(self._parameters)
+
+    def get_parameter_names(self) -> List[str]:
+        return list(self._parameters.keys())
+
+    def get_parameter_value(self, parameter_name: str) -> Any:
+        parameter = self._parameters.get(parameter_name, None)
+        if parameter is None:
+            raise ParameterNotFoundError(parameter_name)
+        editor = self._editors.get(parameter_name, None)
+        if editor is not None:
+            return editor.get_value()
+        if not parameter.has_value or parameter_name in self._raw_values:
+            try:
+                value = self._convert_value(
+                    parameter_name, parameter, parameter.has_value, parameter.value
+                )
+            except ParameterError as e:
+                # same as building a lazy page, the rejected default value never reaches the function, the widget
+                # keeps its own value
+                self._parent.notify_parameter_error(parameter_name, e.message)
+                value = self._convert_value(parameter_name, parameter, False, None)
+            parameter.value = value
+            parameter.has_value = True
+            self._raw_values.discard(parameter_name)
+        return _unbuilt_value(parameter)
+
+    def set_parameter_value(self, parameter_name: str, value: Any):
+        parameter = self._parameters.get(parameter_name, None)
+        if parameter is None:
+            raise ParameterNotFoundError(parameter_name)
+        editor = self._editors.get(parameter_name, None)
+        if editor is not None:
+            editor.set_value(value)
+            return
+        # raises ParameterError for an invalid value, as an editor would do, the kept value is not changed then
+        parameter.value = self._convert_value(parameter_name, parameter, True, value)
+        parameter.has_value = True
+        self._raw_values.discard(parameter_name)
+
+    def get_parameter_values(self) -> Dict[str, Any]:
+        params = OrderedDict()
+        for param_name in self._parameters.keys():
+            params[param_name] = self.get_parameter_value(param_name)
+        return params
+
+    def set_parameter_values(self, values: Dict[str, Any]):
+        for param_name, param_value in values.items():
+            if param_name not in self._parameters:
+                continue
+            self.set_parameter_value(param_name, param_value)
+
+    def disable_parameter_widgets(self, disabled: bool):
+        # the view itself stays enabled, so that it can still be scrolled
+        self._disabled = disabled
+        for editor in self._editors.values():
+            editor.setDisabled(disabled)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_update()
+
+    def _schedule_update(self):
+        self._update_timer.start()
+
+    def _visible_parameter_names(self) -> List[str]:
+        count = self._list.count()
+        if count <= 0 or not self.isVisible():
+            return []
+        viewport = self._list.viewport().rect()
+        first = self._list.indexAt(viewport.topLeft()).row()
+        last = self._list.indexAt(viewport.bottomLeft()).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            # the rows don't fill the viewport
+            last = count - 1
+        first = max(first - _OVERSCAN_ROWS, 0)
+        last = min(last + _OVERSCAN_ROWS, count - 1)
+        return [
+            self._list.item(row).data(Qt.UserRole) for row in range(first, last + 1)
+        ]
+
+    def _update_editors(self):
+        visible_names = self._visible_parameter_names()
+        visible = set(visible_names)
+        for param_name in list(self._editors.keys()):
+            if param_name not in visible:
+                self._release_editor(param_name, save_value=True)
+        created = False
+        for param_name in visible_names:
+            if param_name not in self._editors:
+                self._create_editor(param_name)
+                created = True
+        if created:
+            # the actual heights of the new editors may differ from the estimated ones, which changes the rows in
+            # the viewport
+            self._schedule_update()
+
+    def _create_editor(self, parameter_name: str):
+        parameter = self._parameters[parameter_name]
+        item = self._items[parameter_name]
+        try:
+            editor = parameter.widget_class.new(
+                self._list.viewport(), parameter_name, parameter.widget_config
+            )
+        except Exception as e:
+            _exit_on_creation_error(self, parameter_name, e)
+            return
+        if parameter.has_value:
+            try:
+                editor.set_value(parameter.value)
+            except ParameterError as e:
+                self._errors[parameter_name] = e.message
+        if parameter_name in self._errors:
+            editor.on_parameter_error(parameter_name, self._errors[parameter_name])
+        editor.setDisabled(self._disabled)
+        self._list.setItemWidget(item, editor)
+        self._editors[parameter_name] = editor
+        height = editor.sizeHint().height()
+        self._row_heights[parameter.widget_class] = height
+        if item.sizeHint().height() != height:
+            item.setSizeHint(QSize(0, height))
+
+    def _convert_value(
+        self,
+        parameter_name: str,
+        parameter: _UnbuiltParameter,
+        has_value: bool,
+        value: Any,
+    ) -> Any:
+        # passes the value through a temporary widget of the parameter, which converts and validates it
+        widget = parameter.widget_class.new(
+            self, parameter_name, parameter.widget_config
+        )
+        try:
+            if has_value:
+                widget.set_value(value)
+            return widget.get_value()
+        finally:
+            widget.hide()
+            widget.deleteLater()
+
+    def _release_editor(self, parameter_name: str, save_value: bool):
+        editor = self._editors.get(parameter_name, None)
+        if editor is None:
+            return
+        if save_value:
+            try:
+                value = editor.get_value()
+            except ParameterError as e:
+                # keep the editor until the user fixes the invalid input
+                self._errors[parameter_name] = e.message
+                editor.on_parameter_error(parameter_name, e.message)
+                return
+            parameter = self._parameters[parameter_name]
+            parameter.value = value
+            parameter.has_value = True
+        del self._editors[parameter_name]
+        # the editor is deleted by the view
+        self._list.removeItemWidget(self._items[parameter_name])
+
+    def _sort_parameters(self):
+        names = [
+            self._list.item(row).data(Qt.UserRole) for row in range(self._list.count())
+        ]
+        self._parameters = OrderedDict((name, self._parameters[name]) for name in names)
+
+    def _on_parameter_error(self, parameter_name: str, error: Any):
+        if parameter_name not in self._parameters:
+            return
+        self._errors[parameter_name] = error
+        editor = self._editors.get(parameter_name, None)
+        if editor is not None:
+            editor.on_parameter_error(parameter_name, error)
+
+    def _on_clear_parameter_error(self, parameter_name: Optional[str]):
+        if parameter_name is None:
+            self._errors.clear()
+        else:
+            self._errors.pop(parameter_name, None)
+        for editor in self._editors.values():
+            editor.on_clear_parameter_error(parameter_name)
@@ -1,6 +1,13 @@
+import copy
+import inspect
+import os
+import sqlite3
+import time
+import warnings
 from typing import Tuple, Literal, Dict, Union, Type, Any, List, Optional
 
 from qtpy.QtCore import Qt
+from qtpy.QtGui import QTextDocumentFragment
 from qtpy.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,8 +21,15 @@ from ._base import (
     FnExecuteWindowEventListener,
     DockWidgetArea,
     DockWidgetAreas,
+    _accepts_metrics,
 )
+from ._batch_dialog import BatchDialog
 from ._document_area import DocumentArea
+from ._history_area import HistoryArea
+from ._diagnostics_area import DiagnosticsArea
+from ._job_area import JobArea
+from ._log_area import LogArea, LogRecord
+from ._metrics_area import MetricsArea
 from ._operation_area import OperationArea
 from ._output_area import OutputArea, ProgressBarConfig
 from ._parameter_area import ParameterArea
@@ -23,22 +37,38 @@ from ._progress_dialog import ProgressDialog
 from ...adapter import ucontext
 from ...adapter import uoutput
 from ...bundle import FnBundle
+from ...cache import ResultCache, CacheEntry
 from ...exceptions import (
     ParameterError,
+    FunctionCancelledError,
     FunctionNotCancellableError,
     FunctionNotExecutingError,
 )
 from ...executor import BaseFunctionExecutor
 from ...fn import FnInfo
+from ...history import (
+    ExecutionHistory,
+    HistoryRecord,
+    function_key,
+    snapshot_arguments,
+    snapshot_result,
+    STATUS_SUCCEEDED,
+    STATUS_FAILED,
+    STATUS_CANCELLED,
+)
+from ...metrics import ExecutionMetrics
 from ...paramwidget import (
     BaseParameterWidget,
     BaseParameterWidgetConfig,
 )
 from ...utils import messagebox, get_traceback
+from ...watchdog import StallWatchdog
 
 
 class FnExecuteWindow(BaseFnExecuteWindow):
     def __init__(self, parent: Optional[QWidget], bundle: FnBundle):
+        # parse the function if it was registered lazily
+        bundle.resolve()
         self._bundle: FnBundle = bundle
 
         self._center_widget: Optional[QWidget] = None
@@ -47,11 +77,44 @@ class FnExecuteWindow(BaseFnExecuteWindow):
         self._parameter_area: Optional[ParameterArea] = None
         self._document_area: Optional[DocumentArea] = None
         self._output_area: Optional[OutputArea] = None
+        self._log_area: Optional[LogArea] = None
+        self._job_area: Optional[JobArea] = None
+        self._diagnostics_area: Optional[DiagnosticsArea] = None
+        self._metrics_area: Optional[MetricsArea] = None
+        self._history_area: Optional[HistoryArea] = None
 
         self._document_dock: Optional[QDockWidget] = None
         self._output_dock: Optional[QDockWidget] = None
+        self._log_dock: Optional[QDockWidget] = None
+        self._job_dock: Optional[QDockWidget] = None
+        self._diagnostics_dock: Optional[QDockWidget] = None
+        self._metrics_dock: Optional[QDockWidget] = None
+        self._history_dock: Optional[QDockWidget] = None
 
         self._progress_dialog: Optional[ProgressDialog] = None
+        self._stream_item_count: int = 0
+
+        # (time.time(), time.perf_counter()) when the current execution started, with a concurrent executor
+        # an "execution" is the whole busy period from the first job to the last one
+        self._execution_started_at: Optional[Tuple[float, float]] = None
+        self._execution_error: Optional[str] = None
+        self._last_execution_metrics: Optional[ExecutionMetrics] = None
+
+        # set when the execution history is enabled
+        self._history: Optional[ExecutionHistory] = None
+        self._history_fn_key: str = ""
+        # outcome of the current execution, recorded in the history
+        self._execution_status: str = STATUS_SUCCEEDED
+        self._execution_result: Optional[str] = None
+        self._execution_error_detail: Optional[str] = None
+
+        # set when the result cache of the function is usable
+        self._result_cache: Optional[ResultCache] = None
+        # cache key of the current execution, the result is stored under it if the execution succeeds
+        self._pending_cache_key: Optional[str] = None
+        self._pending_cache_result: Any = None
+        # a cached result is being replayed
+        self._replaying: bool = False
 
         super().__init__(
             parent,
@@ -63,6 +126,16 @@ class FnExecuteWindow(BaseFnExecuteWindow):
         executor_class = self._bundle.fn_info.executor or DEFAULT_EXECUTOR_CLASS
         # noinspection PyTypeChecker
         self._executor = executor_class(self, self)
+        if self._executor.is_concurrent:
+            self._create_job_dock()
+        if self._bundle.fn_info.batch:
+            if self._executor.is_concurrent:
+                self._operation_area.set_batch_button_visible(True)
+            else:
+                warnings.warn(
+                    f"batch execution requires a concurrent executor, "
+                    f"but {executor_class.__name__} is not concurrent"
+                )
 
         try:
             self.add_parameters(self._bundle.widget_configs)
@@ -74,6 +147,20 @@ class FnExecuteWindow(BaseFnExecuteWindow):
                 detail=True,
             )
             exit(-1)
+        self._config: FnExecuteWindowConfig
+        # noinspection PyProtectedMember
+        stall_watchdog = ucontext._get_stall_watchdog()
+        if self._config.signal_profiling or stall_watchdog is not None:
+            self._create_diagnostics_dock(stall_watchdog)
+        if self._config.metrics_dock_visible:
+            self._create_metrics_dock()
+        if self._config.execution_history:
+            self._open_history()
+        self._setup_result_cache()
+        # noinspection PyProtectedMember
+        ucontext._set_output_capture_limit(self._output_capture_limit())
+        # noinspection PyProtectedMember
+        ucontext._set_signal_profiling_enabled(self._config.signal_profiling)
         # noinspection PyProtectedMember
         ucontext._current_window_created(self)
 
@@ -81,6 +168,119 @@ class FnExecuteWindow(BaseFnExecuteWindow):
     def executor(self) -> BaseFunctionExecutor:
         return self._executor
 
+    @property
+    def last_execution_metrics(self) -> Optional[ExecutionMetrics]:
+        """
+        最近一次执行的指标，尚未执行过时为`None`。
+        """
+        return self._last_execution_metrics
+
+    def _create_job_dock(self):
+        self._config: FnExecuteWindowConfig
+        self._job_dock = QDockWidget(self)
+        self._job_area = JobArea(
+            self._job_dock,
+            self._config.job_view_config,
+            self._executor,
+            self.output_browser_config,
+        )
+        self._job_dock.setWidget(self._job_area)
+        self._job_dock.setWindowTitle(self._config.job_dock_title)
+        self.addDockWidget(self.get_output_dock_area(), self._job_dock)
+        self.tabifyDockWidget(self._output_dock, self._job_dock)
+        self._job_dock.raise_()
+
+    def _create_diagnostics_dock(self, stall_watchdog: Optional[StallWatchdog]):
+        self._config: FnExecuteWindowConfig
+        self._diagnostics_dock = QDockWidget(self)
+        self._diagnostics_area = DiagnosticsArea(
+            self._diagnostics_dock,
+            signals=self._config.signal_profiling,
+            stalls=stall_watchdog is not None,
+        )
+        if stall_watchdog is not None:
+            for report in stall_watchdog.reports():
+                self._diagnostics_area.add_stall_report(report)
+            # noinspection PyUnresolvedReferences
+            stall_watchdog.sig_stall_detected.connect(
+                self._diagnostics_area.add_stall_report
+            )
+        self._diagnostics_dock.setWidget(self._diagnostics_area)
+        self._diagnostics_dock.setWindowTitle(self._config.diagnostics_dock_title)
+        self.addDockWidget(self.get_output_dock_area(), self._diagnostics_dock)
+        self.tabifyDockWidget(self._output_dock, self._diagnostics_dock)
+        self._output_dock.raise_()
+
+    def _create_metrics_dock(self):
+        self._config: FnExecuteWindowConfig
+        self._metrics_dock = QDockWidget(self)
+        self._metrics_area = MetricsArea(
+            self._metrics_dock, self._config.max_metrics_records
+        )
+        self._metrics_dock.setWidget(self._metrics_area)
+        self._metrics_dock.setWindowTitle(self._config.metrics_dock_title)
+        self.addDockWidget(self.get_output_dock_area(), self._metrics_dock)
+        self.tabifyDockWidget(self._output_dock, self._metrics_dock)
+        self._output_dock.raise_()
+
+    def _open_history(self):
+        self._config: FnExecuteWindowConfig
+        try:
+            self._history = ExecutionHistory(
+                self._config.history_file, self._config.history_max_records
+            )
+        except (OSError, sqlite3.Error) as e:
+            warnings.warn(f"failed to open execution history: {e}")
+            return
+        self._history_fn_key = function_key(self._bundle.fn_info.fn)
+        if not self._config.history_dock_visible:
+            return
+        self._history_dock = QDockWidget(self)
+        self._history_area = HistoryArea(
+            self._history_dock,
+            self._history,
+            self._history_fn_key,
+            self._config.history_dock_max_rows,
+        )
+        # noinspection PyUnresolvedReferences
+        self._history_area.sig_fill_requested.connect(self._fill_history_arguments)
+        # noinspection PyUnresolvedReferences
+        self._history_area.sig_rerun_requested.connect(self._rerun_history_arguments)
+        self._history_dock.setWidget(self._history_area)
+        self._history_dock.setWindowTitle(self._config.history_dock_title)
+        self.addDockWidget(self.get_output_dock_area(), self._history_dock)
+        self.tabifyDockWidget(self._output_dock, self._history_dock)
+        self._output_dock.raise_()
+
+    def _setup_result_cache(self):
+        result_cache = self._bundle.fn_info.result_cache
+        if result_cache is None:
+            return
+        if self._executor.is_concurrent:
+            warnings.warn(
+                f"result cache is not supported by a concurrent executor "
+                f"({type(self._executor).__name__}), it is ignored"
+            )
+            return
+        self._result_cache = result_cache
+
+    def _output_capture_limit(self) -> int:
+        self._config: FnExecuteWindowConfig
+        limit = 0
+        if self._history is not None:
+            limit = self._config.history_max_output_chars
+        if self._result_cache is not None:
+            # one more character tells whether the output fits in the cache
+            limit = max(limit, self._result_cache.config.max_output_chars + 1)
+        return limit
+
+    @property
+    def execution_history(self) -> Optional[ExecutionHistory]:
+        """
+        执行历史数据库，未启用执行历史时为`None`。
+        """
+        return self._history
+
     def _create_ui(self):
         self._config: FnExecuteWindowConfig
 
@@ -106,6 +306,7 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             self._on_execute_button_clicked
         )
         self._operation_area.sig_clear_requested.connect(self._on_clear_button_clicked)
+        self._operation_area.sig_batch_requested.connect(self._on_batch_button_clicked)
         self._operation_area.sig_cancel_requested.connect(
             self._on_cancel_button_clicked
         )
@@ -123,6 +324,11 @@ class FnExecuteWindow(BaseFnExecuteWindow):
         )
         self._output_dock.setWidget(self._output_area)
 
+        if self._config.log_view_config is not None:
+            self._log_dock = QDockWidget(self)
+            self._log_area = LogArea(self._log_dock, self._config.log_view_config)
+            self._log_dock.setWidget(self._log_area)
+
     # noinspection PyUnresolvedReferences
     def apply_configs(self):
         super().apply_configs()
@@ -161,6 +367,12 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             area=self._config.output_dock_initial_area,
         )
 
+        if self._log_dock is not None:
+            self._log_dock.setWindowTitle(self._config.log_dock_title)
+            self.addDockWidget(self.get_output_dock_area(), self._log_dock)
+            self.tabifyDockWidget(self._output_dock, self._log_dock)
+            self._output_dock.raise_()
+
         if self._config.initial_docks_state == "tabified":
             self.tabify_docks()
 
@@ -239,12 +451,47 @@ class FnExecuteWindow(BaseFnExecuteWindow):
 
     def clear_output(self) -> None:
         """
-        清除输出浏览器内容
+        清除输出浏览器内容。若启用了日志视图，日志视图中的内容也将被清除。
 
         Returns:
             无返回值
         """
         self._output_area.clear_output()
+        self.clear_logs()
+
+    def is_log_view_enabled(self) -> bool:
+        """
+        检查是否启用了日志视图
+
+        Returns:
+            启用了日志视图时返回`True`，否则返回`False`
+        """
+        return self._log_area is not None
+
+    def append_logs(self, records: List[LogRecord]) -> None:
+        """
+        把日志记录追加到日志视图中。未启用日志视图时，不执行任何操作。
+
+        Args:
+            records: 日志记录，格式为`(timestamp, level, message, color)`
+
+        Returns:
+            无返回值
+        """
+        if self._log_area is None:
+            return
+        self._log_area.append_logs(records)
+
+    def clear_logs(self) -> None:
+        """
+        清除日志视图中的内容
+
+        Returns:
+            无返回值
+        """
+        if self._log_area is None:
+            return
+        self._log_area.clear_logs()
 
     def set_document(
         self, document: str, document_format: Literal["markdown", "html", "plaintext"]
@@ -977,6 +1224,39 @@ class FnExecuteWindow(BaseFnExecuteWindow):
         else:
             self._executor.try_cancel()
 
+    def execute_batch(
+        self,
+        arguments_list: List[Dict[str, Any]],
+        parallelism: Optional[int] = None,
+    ) -> List[int]:
+        """
+        批量执行函数。每组参数将作为一个作业提交给执行器并发执行，执行的结果汇总在`Jobs停靠窗口`中。
+        仅在函数执行器支持并发执行（例如`ConcurrentProcessFunctionExecutor`）时可用。
+
+        Args:
+            arguments_list: 各次执行的函数参数
+            parallelism: 并行度，即同时执行的作业的最大数量。为`None`时不修改执行器当前的并行度。
+
+        Returns:
+            作业ID列表
+        """
+        if not self._executor.is_concurrent:
+            raise RuntimeError(
+                f"batch execution requires a concurrent executor, "
+                f"but {type(self._executor).__name__} is not concurrent"
+            )
+        if parallelism is not None:
+            self._executor.set_max_workers(parallelism)
+        # jobs may fail while being submitted, they are reported as part of the batch rather than one dialog per job
+        self._job_area.begin_batch()
+        job_ids = []
+        try:
+            job_ids = self._executor.submit_many(self._bundle.fn_info, arguments_list)
+        finally:
+            self._job_area.start_batch(job_ids)
+        self._job_dock.raise_()
+        return job_ids
+
     def activate_parameter_group(self, group_name: str) -> None:
         """
         激活展开指定参数分组。
@@ -1043,10 +1323,27 @@ class FnExecuteWindow(BaseFnExecuteWindow):
     def before_execute(self, fn_info: FnInfo, arguments: Dict[str, Any]) -> None:
         self._config: FnExecuteWindowConfig
         super().before_execute(fn_info, arguments)
+        self._stream_item_count = 0
+        if self._execution_started_at is None:
+            self._execution_started_at = (time.time(), time.perf_counter())
+            self._execution_error = None
+            self._execution_status = STATUS_SUCCEEDED
+            self._execution_result = None
+            self._execution_error_detail = None
+            # drop what was counted outside any execution
+            # noinspection PyProtectedMember
+            ucontext._take_execution_stats()
+            if self._history is not None or self._result_cache is not None:
+                # noinspection PyProtectedMember
+                ucontext._take_captured_output()
+        # noinspection PyProtectedMember
+        ucontext._begin_signal_profile(fn_info.display_name)
         if self._operation_area.is_clear_checkbox_checked():
             self.clear_output()
-        self._operation_area.set_execute_button_enabled(False)
-        if self._config.disable_widgets_on_execute:
+        # a concurrent executor accepts new executions while running
+        if not self._executor.is_concurrent:
+            self._operation_area.set_execute_button_enabled(False)
+        if self._config.disable_widgets_on_execute and not self._executor.is_concurrent:
             self._parameter_area.disable_parameter_widgets(True)
         self._operation_area.set_cancel_button_enabled(False)
         self._parameter_area.clear_parameter_error(None)
@@ -1061,6 +1358,30 @@ class FnExecuteWindow(BaseFnExecuteWindow):
     def on_execute_finish(self, fn_info: FnInfo, arguments: Dict[str, Any]) -> None:
         self._config: FnExecuteWindowConfig
         super().on_execute_finish(fn_info, arguments)
+        # noinspection PyProtectedMember
+        ucontext._flush_output()
+        # make sure the final progress value is delivered
+        # noinspection PyProtectedMember
+        ucontext._flush_progress()
+        # noinspection PyProtectedMember
+        profile = ucontext._end_signal_profile()
+        if profile is not None and self._diagnostics_area is not None:
+            self._diagnostics_area.add_profile(profile.to_dict())
+        metrics = self._collect_execution_metrics(fn_info)
+        if metrics is not None:
+            self._last_execution_metrics = metrics
+            if self._config.execution_metrics_in_statusbar:
+                self.show_statusbar_message(metrics.summary(), 0)
+            if self._metrics_area is not None:
+                self._metrics_area.add_record(metrics)
+            captured, truncated = [], False
+            if self._history is not None or self._result_cache is not None:
+                # noinspection PyProtectedMember
+                captured, truncated = ucontext._take_captured_output()
+            if self._pending_cache_key is not None:
+                self._store_cached_result(captured, truncated)
+            if self._history is not None:
+                self._record_history(arguments, metrics, captured, truncated)
         self._operation_area.set_execute_button_enabled(True)
         if self._config.disable_widgets_on_execute:
             self._parameter_area.disable_parameter_widgets(False)
@@ -1068,13 +1389,147 @@ class FnExecuteWindow(BaseFnExecuteWindow):
 
         self.dismiss_progress_dialog()
 
-        if isinstance(self._bundle.window_listener, FnExecuteWindowEventListener):
-            self._bundle.window_listener.on_execute_finish(self)
+        listener = self._bundle.window_listener
+        if isinstance(listener, FnExecuteWindowEventListener):
+            if _accepts_metrics(listener.on_execute_finish):
+                listener.on_execute_finish(self, metrics)
+            else:
+                listener.on_execute_finish(self)
+
+    def _record_history(
+        self,
+        arguments: Dict[str, Any],
+        metrics: ExecutionMetrics,
+        captured: List[Tuple[str, bool]],
+        truncated: bool,
+    ):
+        self._config: FnExecuteWindowConfig
+        record = HistoryRecord(
+            fn_key=self._history_fn_key,
+            fn_name=metrics.fn_name,
+            started_at=metrics.started_at,
+            wall_time=metrics.wall_time,
+            cpu_time=metrics.cpu_time,
+            status=self._execution_status,
+            error=self._execution_error_detail,
+            arguments=snapshot_arguments(arguments),
+            result=self._execution_result,
+            output=_captured_text(
+                captured, truncated, self._config.history_max_output_chars
+            ),
+        )
+        self._execution_result = None
+        # the record is written by a background thread
+        self._history.record(record)
+        if self._history_area is not None:
+            self._history_area.add_record(record)
+
+    def _store_cached_result(self, captured: List[Tuple[str, bool]], truncated: bool):
+        key = self._pending_cache_key
+        result = self._pending_cache_result
+        self._pending_cache_key = None
+        self._pending_cache_result = None
+        if self._execution_status != STATUS_SUCCEEDED:
+            return
+        max_chars = self._result_cache.config.max_output_chars
+        if truncated or sum(len(text) for text, _ in captured) > max_chars:
+            # the output could not be replayed in full
+            return
+        self._result_cache.put(key, result, captured)
+
+    def _try_replay_cached(self, fn_info: FnInfo, arguments: Dict[str, Any]) -> bool:
+        key = self._result_cache.make_key(arguments)
+        if key is None:
+            return False
+        entry = self._result_cache.get(key)
+        if entry is None:
+            self._pending_cache_key = key
+            return False
+        self._replay_cached(fn_info, arguments, entry)
+        return True
+
+    def _replay_cached(
+        self, fn_info: FnInfo, arguments: Dict[str, Any], entry: CacheEntry
+    ):
+        # the function is not called, the listener sees an execution as usual
+        self._replaying = True
+        try:
+            self.before_execute(fn_info, arguments)
+            self.on_execute_start(fn_info, arguments)
+            for text, html in entry.output:
+                uoutput.uprint(text, end="", html=html)
+            # every hit gets a copy of its own, or changes made to the result would corrupt the cache
+            self.on_execute_result(fn_info, arguments, copy.deepcopy(entry.result))
+        except BaseException as e:
+            self.on_execute_error(fn_info, arguments, e)
+        finally:
+            self.on_execute_finish(fn_info, arguments)
+            self._replaying = False
+
+    def _fill_history_arguments(self, record: HistoryRecord) -> bool:
+        self._config: FnExecuteWindowConfig
+        values, unrestorable = record.restore_arguments()
+        parameter_names = set(self._parameter_area.get_parameter_names())
+        values = {
+            name: value for name, value in values.items() if name in parameter_names
+        }
+        try:
+            self.set_parameter_values(values)
+        except Exception as e:
+            messagebox.show_exception_messagebox(
+                self, exception=e, message="failed to restore arguments: "
+            )
+            return False
+        if unrestorable:
+            messagebox.show_warning_message(
+                self,
+                self._config.history_unrestorable_message.format(
+                    ", ".join(unrestorable)
+                ),
+            )
+            return False
+        return True
+
+    def _rerun_history_arguments(self, record: HistoryRecord):
+        if self._fill_history_arguments(record):
+            self._on_execute_button_clicked()
+
+    def _collect_execution_metrics(self, fn_info: FnInfo) -> Optional[ExecutionMetrics]:
+        if self._execution_started_at is None:
+            return None
+        started_at, started = self._execution_started_at
+        self._execution_started_at = None
+        # noinspection PyProtectedMember
+        output_writes, output_chars, progress_updates = ucontext._take_execution_stats()
+        usage = None if self._replaying else self._executor.last_resource_usage
+        return ExecutionMetrics(
+            fn_name=fn_info.display_name,
+            started_at=started_at,
+            wall_time=time.perf_counter() - started,
+            cpu_time=None if usage is None else usage.cpu_time,
+            peak_rss_delta=None if usage is None else usage.peak_rss_delta,
+            output_writes=output_writes,
+            output_chars=output_chars,
+            progress_updates=progress_updates,
+            error=self._execution_error,
+            cached=self._replaying,
+        )
 
     def on_execute_result(
         self, fn_info: FnInfo, arguments: Dict[str, Any], result: Any
     ) -> None:
         self._config: FnExecuteWindowConfig
+        if self._history is not None:
+            self._execution_result = snapshot_result(result)
+        if self._pending_cache_key is not None:
+            # the listeners get the result itself, changes they make to it must not reach the cache
+            try:
+                self._pending_cache_result = copy.deepcopy(result)
+            except Exception:
+                self._pending_cache_key = None
+        # make sure the output of the function is printed before its result
+        # noinspection PyProtectedMember
+        ucontext._flush_output()
         # if callable(self._bundle.on_execute_result):
         #     self._bundle.on_execute_result(result, arguments.copy())
         #     return
@@ -1085,12 +1540,17 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             if not should_continue:
                 return
 
-        result_str = self._config.function_result_message.format(result)
+        if _is_stream_fn(fn_info):
+            # the result of a generator function is the number of items it yielded
+            result_str = self._config.stream_result_message.format(result)
+        else:
+            result_str = self._config.function_result_message.format(result)
 
         if self._config.print_function_result:
             self.append_output(result_str, scroll_to_bottom=True)
 
-        if self._config.show_function_result:
+        # results of a batch are collected in the job list rather than shown one dialog per job
+        if self._config.show_function_result and not self._is_batch_running():
             messagebox.show_info_message(
                 self, result_str, title=self._config.result_dialog_title
             )
@@ -1098,8 +1558,16 @@ class FnExecuteWindow(BaseFnExecuteWindow):
     def on_execute_error(
         self, fn_info: FnInfo, arguments: Dict[str, Any], error: BaseException
     ):
+        self._execution_error = type(error).__name__
+        self._execution_error_detail = f"{type(error).__name__}: {error}"
+        if isinstance(error, FunctionCancelledError):
+            self._execution_status = STATUS_CANCELLED
+        else:
+            self._execution_status = STATUS_FAILED
 
         self._config: FnExecuteWindowConfig
+        # noinspection PyProtectedMember
+        ucontext._flush_output()
 
         if isinstance(self._bundle.window_listener, FnExecuteWindowEventListener):
             should_continue = self._bundle.window_listener.on_execute_error(self, error)
@@ -1112,6 +1580,15 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             del error
             return
 
+        # the function stopped on a cancel request, which is not an error
+        if isinstance(error, FunctionCancelledError):
+            if self._config.print_function_error:
+                self.append_output(
+                    self._config.function_cancelled_message, scroll_to_bottom=True
+                )
+            del error
+            return
+
         # if callable(self._bundle.on_execute_error):
         #     self._bundle.on_execute_error(error, arguments.copy())
         #     del error
@@ -1125,7 +1602,7 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             else:
                 self.append_output(get_traceback(error) + "\n", scroll_to_bottom=True)
 
-        if self._config.show_function_error:
+        if self._config.show_function_error and not self._is_batch_running():
             if not self._config.function_error_traceback:
                 messagebox.show_critical_message(
                     self, error_msg, title=self._config.error_dialog_title
@@ -1136,6 +1613,12 @@ class FnExecuteWindow(BaseFnExecuteWindow):
                 )
         del error
 
+    def on_stream_items(self, count: int) -> None:
+        self._config: FnExecuteWindowConfig
+        self._stream_item_count += count
+        if self._config.stream_progress and self._output_area.is_progressbar_visible():
+            self._output_area.advance_progress(count)
+
     def _on_close(self) -> bool:
         self._config: FnExecuteWindowConfig
         if self._executor.is_executing:
@@ -1149,6 +1632,10 @@ class FnExecuteWindow(BaseFnExecuteWindow):
         super()._on_cleanup()
         self._parameter_area.clear_parameters()
         self.dismiss_progress_dialog()
+        self._executor.shutdown()
+        if self._history is not None:
+            self._history.close()
+            self._history = None
 
     def _on_destroy(self):
         super()._on_destroy()
@@ -1170,7 +1657,7 @@ class FnExecuteWindow(BaseFnExecuteWindow):
 
     def _on_execute_button_clicked(self):
         self._config: FnExecuteWindowConfig
-        if self._executor.is_executing:
+        if self._executor.is_executing and not self._executor.is_concurrent:
             messagebox.show_warning_message(
                 self, self._config.function_executing_message
             )
@@ -1179,8 +1666,52 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             arguments = self.get_parameter_values()
         except ParameterError as e:
             self._parameter_area.process_parameter_error(e)
-        else:
-            self._executor.execute(self._bundle.fn_info, arguments)
+            return
+        self._pending_cache_key = None
+        self._pending_cache_result = None
+        if self._result_cache is not None and self._try_replay_cached(
+            self._bundle.fn_info, arguments
+        ):
+            return
+        self._executor.execute(self._bundle.fn_info, arguments)
+
+    def _on_batch_button_clicked(self):
+        self._config: FnExecuteWindowConfig
+        try:
+            base_arguments = self.get_parameter_values()
+        except ParameterError as e:
+            self._parameter_area.process_parameter_error(e)
+            return
+        batch = BatchDialog.get_batch(
+            self,
+            base_arguments,
+            self._executor.max_workers or os.cpu_count() or 1,
+            title=self._config.batch_dialog_title,
+            max_parallelism=(os.cpu_count() or 1) * 4,
+            validator=self._validate_batch_arguments,
+        )
+        if batch is None:
+            return
+        arguments_list, parallelism = batch
+        self.execute_batch(arguments_list, parallelism)
+
+    def _validate_batch_arguments(
+        self, arguments_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # the arguments of each run go through the parameter widgets, which convert and validate them like the
+        # arguments of a single execution, the current values are restored afterwards
+        current_values = self.get_parameter_values()
+        try:
+            validated = []
+            for arguments in arguments_list:
+                self.set_parameter_values(arguments)
+                validated.append(self.get_parameter_values())
+            return validated
+        finally:
+            self.set_parameter_values(current_values)
+
+    def _is_batch_running(self) -> bool:
+        return self._job_area is not None and self._job_area.is_batch_running()
 
     # noinspection PyMethodMayBeStatic
     def _on_clear_button_clicked(self):
@@ -1210,3 +1741,22 @@ class FnExecuteWindow(BaseFnExecuteWindow):
             calc[1] = None
 
         return calc[0], calc[1]
+
+
+def _captured_text(
+    captured: List[Tuple[str, bool]], truncated: bool, max_chars: int
+) -> str:
+    texts = [
+        QTextDocumentFragment.fromHtml(text).toPlainText() + "\n" if html else text
+        for text, html in captured
+    ]
+    text = "".join(texts)
+    if truncated or len(text) > max_chars:
+        text = text[:max_chars] + "\n...(truncated)"
+    return text
+
+
+def _is_stream_fn(fn_info: FnInfo) -> bool:
+    return inspect.isgeneratorfunction(fn_info.fn) or inspect.isasyncgenfunction(
+        fn_info.fn
+    )
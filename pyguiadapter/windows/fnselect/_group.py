@@ -1,6 +1,5 @@
 from typing import Tuple, List, Union, Optional
 
-import qtawesome as qta
 from qtpy.QtCore import QSize, Qt, Signal, QModelIndex
 from qtpy.QtWidgets import (
     QVBoxLayout,
@@ -159,7 +158,7 @@ class FnGroupPage(QWidget):
 
     def _create_bundle_item(self, bundle: FnBundle) -> QListWidgetItem:
         fn = bundle.fn_info
-        icon = get_icon(fn.icon) or qta.icon(DEFAULT_FN_ICON)
+        icon = get_icon(fn.icon) or get_icon(DEFAULT_FN_ICON)
         item = QListWidgetItem(icon, fn.display_name, self._fn_list_widget)
         item.setData(Qt.UserRole, bundle)
         return item
@@ -1,7 +1,7 @@
 import dataclasses
 from typing import Tuple, Dict, Literal, List, Union, Optional
 
-from qtpy.QtCore import QSize, Qt
+from qtpy.QtCore import QSize, Qt, QTimer
 from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import (
     QSplitter,
@@ -70,6 +70,7 @@ class FnSelectWindow(BaseWindow):
         menus: Optional[List[Union[Menu, Separator]]] = None,
     ):
         self._initial_bundles = bundles.copy()
+        self._unresolved_bundles: List[FnBundle] = []
         self._group_pages: Dict[str, FnGroupPage] = {}
         self._current_exec_window: Optional[FnSelectWindow] = None
         self._fn_group_toolbox: Optional[QToolBox] = None
@@ -199,6 +200,26 @@ class FnSelectWindow(BaseWindow):
         del self._initial_bundles
         self._fn_group_toolbox.setCurrentIndex(0)
         self.show()
+        # functions registered lazily are parsed one by one when the event loop is idle
+        self._unresolved_bundles = [
+            bundle for bundle in self._get_all_bundles() if not bundle.resolved
+        ]
+        if self._unresolved_bundles:
+            QTimer.singleShot(0, self._resolve_next_bundle)
+
+    def _resolve_next_bundle(self):
+        while self._unresolved_bundles:
+            bundle = self._unresolved_bundles.pop(0)
+            if bundle.resolved:
+                continue
+            try:
+                bundle.resolve()
+            except Exception:
+                # the error will be reported when the function is selected
+                pass
+            break
+        if self._unresolved_bundles:
+            QTimer.singleShot(0, self._resolve_next_bundle)
 
     def _add_bundle(self, bundle: FnBundle):
         fn = bundle.fn_info
@@ -226,6 +247,16 @@ class FnSelectWindow(BaseWindow):
 
     def _start_exec_window(self, bundle: FnBundle):
         assert isinstance(bundle, FnBundle)
+        try:
+            bundle.resolve()
+        except Exception as e:
+            messagebox.show_exception_messagebox(
+                self,
+                exception=e,
+                message=f"failed to parse function {bundle.fn_info.display_name}: ",
+                detail=True,
+            )
+            return
         self._current_exec_window = FnExecuteWindow(self, bundle)
         self._current_exec_window.setWindowModality(Qt.ApplicationModal)
         self._current_exec_window.setAttribute(Qt.WA_DeleteOnClose, True)
@@ -250,8 +281,14 @@ class FnSelectWindow(BaseWindow):
         doc = ""
         doc_format = "plaintext"
         if bundle is not None:
-            doc = bundle.fn_info.document
-            doc_format = bundle.fn_info.document_format
+            try:
+                bundle.resolve()
+            except Exception as e:
+                # reported again when the function is opened
+                doc = f"failed to parse function {bundle.fn_info.display_name}: {e}"
+            else:
+                doc = bundle.fn_info.document
+                doc_format = bundle.fn_info.document_format
         # noinspection PyTypeChecker
         self._update_document(doc, doc_format)
 
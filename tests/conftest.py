@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+# the tests never need a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from qtpy.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def make_window(qapp):
+    """
+    Return a factory that adds a function to a new GUIAdapter and creates its FnExecuteWindow. Like in the
+    application, creating a window closes the previous one, and the last one is closed after the test.
+    """
+    from pyguiadapter.adapter import GUIAdapter, ucontext
+    from pyguiadapter.windows.fnexec import FnExecuteWindow, FnExecuteWindowConfig
+
+    def factory(fn, window_config=None, **kwargs):
+        adapter = GUIAdapter()
+        adapter.add(
+            fn,
+            window_config=window_config
+            or FnExecuteWindowConfig(
+                show_function_error=False, print_function_result=False
+            ),
+            **kwargs,
+        )
+        # noinspection PyProtectedMember
+        return FnExecuteWindow(None, bundle=adapter._bundles[fn])
+
+    yield factory
+
+    # noinspection PyProtectedMember
+    window = ucontext._context.current_window
+    if window is not None:
+        window.close()
+    qapp.processEvents()
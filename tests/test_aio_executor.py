@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.adapter import uasync, ucontext
+from pyguiadapter.cancellation import CancellationToken, _set_current_token
+from pyguiadapter.exceptions import FunctionCancelledError
+from pyguiadapter.executor import ExecuteStateListener
+from pyguiadapter.executors import AsyncioFunctionExecutor
+from pyguiadapter.fn import FnInfo
+
+
+class _Listener(ExecuteStateListener):
+    def __init__(self):
+        self.started = 0
+        self.results = []
+        self.errors = []
+        self.finished = 0
+
+    def on_execute_start(self, fn_info, arguments):
+        self.started += 1
+
+    def on_execute_result(self, fn_info, arguments, result):
+        self.results.append(result)
+
+    def on_execute_error(self, fn_info, arguments, exception):
+        self.errors.append(exception)
+
+    def on_execute_finish(self, fn_info, arguments):
+        self.finished += 1
+
+
+def _wait_until(qapp, predicate, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def executor(qapp):
+    listener = _Listener()
+    executor = AsyncioFunctionExecutor(None, listener)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def yielded(monkeypatch):
+    # items of a stream, collected instead of being written to a window
+    items = []
+    # noinspection PyProtectedMember
+    monkeypatch.setattr(ucontext._context, "yield_result", items.append)
+    return items
+
+
+def _execute(qapp, executor, fn, **arguments):
+    # noinspection PyProtectedMember
+    listener = executor._listener
+    finished = listener.finished
+    executor.execute(FnInfo(fn=fn, display_name=fn.__name__), arguments)
+    _wait_until(qapp, lambda: listener.finished > finished)
+    return listener
+
+
+async def _one():
+    return 1
+
+
+def test_coroutine_result(qapp, executor):
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("failed")
+
+    listener = _execute(qapp, executor, add, a=1, b=2)
+    assert listener.results == [3]
+    listener = _execute(qapp, executor, fail)
+    assert len(listener.errors) == 1
+    assert isinstance(listener.errors[0], ValueError)
+    assert listener.started == listener.finished == 2
+
+
+def test_cancelled_task_is_reported_as_cancelled(qapp, executor):
+    reached = threading.Event()
+
+    async def wait_forever():
+        reached.set()
+        await asyncio.sleep(30)
+        return "not cancelled"
+
+    # noinspection PyProtectedMember
+    listener = executor._listener
+    executor.execute(FnInfo(fn=wait_forever, display_name="wait_forever"), {})
+    assert reached.wait(10)
+    start = time.perf_counter()
+    executor.try_cancel()
+    _wait_until(qapp, lambda: listener.finished == 1)
+    assert time.perf_counter() - start < 10
+    assert listener.results == []
+    # the asyncio.CancelledError is not reported as an error of the function
+    assert len(listener.errors) == 1
+    assert isinstance(listener.errors[0], FunctionCancelledError)
+    assert not executor.is_executing
+    # the loop is still usable after a cancellation
+    assert _execute(qapp, executor, _one).results == [1]
+
+
+def test_async_generator_is_streamed(qapp, executor, yielded):
+    closed = []
+
+    async def stream(n):
+        try:
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+        finally:
+            closed.append(True)
+
+    listener = _execute(qapp, executor, stream, n=5)
+    # the number of items becomes the result, the items themselves are not collected
+    assert listener.results == [5]
+    assert listener.errors == []
+    assert yielded == [0, 1, 2, 3, 4]
+    assert closed == [True]
+
+
+def test_async_generator_is_closed_on_cancel(qapp, executor, yielded):
+    closed = []
+
+    async def endless():
+        try:
+            i = 0
+            while True:
+                await asyncio.sleep(0.01)
+                yield i
+                i += 1
+        finally:
+            closed.append(True)
+
+    # noinspection PyProtectedMember
+    listener = executor._listener
+    executor.execute(FnInfo(fn=endless, display_name="endless"), {})
+    _wait_until(qapp, lambda: len(yielded) >= 3)
+    executor.try_cancel()
+    _wait_until(qapp, lambda: listener.finished == 1)
+    assert listener.results == []
+    assert isinstance(listener.errors[0], FunctionCancelledError)
+    assert closed == [True]
+    assert yielded == list(range(len(yielded)))
+
+
+def _run_sleep(token, seconds):
+    async def main():
+        _set_current_token(token)
+        try:
+            start = time.perf_counter()
+            woken = await uasync.sleep(seconds)
+            return woken, time.perf_counter() - start
+        finally:
+            _set_current_token(None)
+
+    return asyncio.run(main())
+
+
+def test_sleep_times_out():
+    token = CancellationToken()
+    woken, elapsed = _run_sleep(token, 0.05)
+    assert woken is False
+    assert elapsed >= 0.04
+    # the wakeup callback is removed
+    # noinspection PyProtectedMember
+    assert token._callbacks == []
+
+
+def test_sleep_wakes_up_on_cancel():
+    token = CancellationToken()
+    # cancelled from another thread, like a cancel request from the GUI thread
+    threading.Timer(0.05, token.cancel).start()
+    woken, elapsed = _run_sleep(token, 30)
+    assert woken is True
+    assert elapsed < 10
+
+
+def test_sleep_returns_right_away_if_cancelled():
+    token = CancellationToken()
+    token.cancel()
+    woken, elapsed = _run_sleep(token, 30)
+    assert woken is True
+    assert elapsed < 1
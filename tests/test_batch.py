@@ -0,0 +1,208 @@
+import time
+
+import pytest
+from qtpy.QtWidgets import QDialog
+
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.exceptions import ParameterError
+from pyguiadapter.executors.pool import JOB_FAILED
+from pyguiadapter.utils import messagebox
+from pyguiadapter.widgets import IntSpinBoxConfig
+from pyguiadapter.windows.fnexec import FnExecuteWindowConfig
+from pyguiadapter.windows.fnexec._batch_dialog import (
+    BatchDialog,
+    expand_grid,
+    parse_csv,
+    parse_grid,
+    parse_value,
+)
+
+
+def _wait_until(qapp, predicate, timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.01)
+
+
+def test_jobs_failed_at_submit_are_part_of_the_batch(make_window, qapp, monkeypatch):
+    dialogs = []
+    monkeypatch.setattr(
+        messagebox, "show_critical_message", lambda *args, **kwargs: dialogs.append(1)
+    )
+    monkeypatch.setattr(
+        messagebox,
+        "show_exception_messagebox",
+        lambda *args, **kwargs: dialogs.append(1),
+    )
+
+    # a local function cannot be pickled and sent to the worker process
+    def local_fn(a: int = 0):
+        return a
+
+    window = make_window(
+        local_fn,
+        window_config=FnExecuteWindowConfig(
+            show_function_error=True, print_function_result=False
+        ),
+        batch=True,
+    )
+    job_ids = window.execute_batch([{"a": i} for i in range(5)], parallelism=1)
+    # noinspection PyProtectedMember
+    executor = window._executor
+    _wait_until(qapp, lambda: not executor.is_executing)
+    assert [executor.get_job(job_id).state for job_id in job_ids] == [JOB_FAILED] * 5
+    # no error dialog for each of the failed jobs
+    assert dialogs == []
+    # noinspection PyProtectedMember
+    job_area = window._job_area
+    assert not job_area.is_batch_running()
+    # noinspection PyProtectedMember
+    assert job_area._batch_total == 5
+    # noinspection PyProtectedMember
+    assert job_area._batch_counts[JOB_FAILED] == 5
+
+
+def test_parse_value():
+    assert parse_value(" 1 ") == 1
+    assert parse_value("1.5") == 1.5
+    assert parse_value("'x'") == "x"
+    assert parse_value("[1, 2]") == [1, 2]
+    assert parse_value("None") is None
+    # anything that is not a literal is a string
+    assert parse_value(" hello world ") == "hello world"
+    assert parse_value("os.getcwd()") == "os.getcwd()"
+    assert parse_value("") == ""
+
+
+def test_parse_grid():
+    grid = parse_grid({"a": "[1, 2]", "b": "", "c": "(3, 'x')", "d": "'y'", "e": " "})
+    assert grid == {"a": [1, 2], "c": [3, "x"], "d": ["y"]}
+    assert list(grid.keys()) == ["a", "c", "d"]
+    # a single value that is not a list
+    assert parse_grid({"a": "{'k': 1}"}) == {"a": [{"k": 1}]}
+
+
+@pytest.mark.parametrize("text", ["[]", "()", " [ ] "])
+def test_parse_grid_rejects_empty_lists(text):
+    with pytest.raises(ValueError):
+        parse_grid({"a": text})
+
+
+def test_expand_grid():
+    base = {"a": 0, "b": 0, "c": "base"}
+    arguments_list = expand_grid(base, {"a": [1, 2], "b": [3, 4, 5]})
+    assert [(args["a"], args["b"]) for args in arguments_list] == [
+        (1, 3),
+        (1, 4),
+        (1, 5),
+        (2, 3),
+        (2, 4),
+        (2, 5),
+    ]
+    assert all(args["c"] == "base" for args in arguments_list)
+    assert all(list(args.keys()) == ["a", "b", "c"] for args in arguments_list)
+    # the base arguments are not modified
+    assert base == {"a": 0, "b": 0, "c": "base"}
+    # no grid, a single run with the base arguments
+    assert expand_grid(base, {}) == [base]
+
+
+def test_parse_csv():
+    base = {"a": 0, "b": "base", "c": None}
+    text = "a, b\n1,'x'\n\n2,\n,\"'y, z'\"\n"
+    assert parse_csv(base, text, list(base.keys())) == [
+        {"a": 1, "b": "x", "c": None},
+        # blank cells keep the base value
+        {"a": 2, "b": "base", "c": None},
+        {"a": 0, "b": "y, z", "c": None},
+    ]
+    assert parse_csv(base, "", list(base.keys())) == []
+    assert parse_csv(base, "a,b\n", list(base.keys())) == []
+    # fewer cells than the header
+    assert parse_csv(base, "a,b\n1\n", list(base.keys())) == [
+        {"a": 1, "b": "base", "c": None}
+    ]
+
+
+def test_parse_csv_errors():
+    base = {"a": 0, "b": 0}
+    with pytest.raises(ValueError, match="unknown parameter"):
+        parse_csv(base, "a,x\n1,2\n", list(base.keys()))
+    with pytest.raises(ValueError, match="line 3: too many values"):
+        parse_csv(base, "a,b\n1,2\n1,2,3\n", list(base.keys()))
+
+
+def fn(s: str = "text", n: int = 1, x: float = 1.0):
+    pass
+
+
+def _batch_window(make_window):
+    return make_window(
+        fn,
+        widget_configs={"n": IntSpinBoxConfig(default_value=1, max_value=100)},
+        batch=True,
+    )
+
+
+def test_batch_arguments_go_through_the_widgets(make_window):
+    window = _batch_window(make_window)
+    current = window.get_parameter_values()
+    # noinspection PyProtectedMember
+    validated = window._validate_batch_arguments(
+        expand_grid(current, parse_grid({"s": "[1, 'a']", "n": "[5, 500]", "x": "2"}))
+    )
+    assert validated == [
+        {"s": "1", "n": 5, "x": 2.0},
+        {"s": "1", "n": 100, "x": 2.0},
+        {"s": "a", "n": 5, "x": 2.0},
+        {"s": "a", "n": 100, "x": 2.0},
+    ]
+    assert all(type(args["x"]) is float for args in validated)
+    # the current values are restored
+    assert window.get_parameter_values() == current
+
+
+def test_invalid_batch_arguments_raise_parameter_error(make_window):
+    window = _batch_window(make_window)
+    current = window.get_parameter_values()
+    with pytest.raises(ParameterError) as exc_info:
+        # noinspection PyProtectedMember
+        window._validate_batch_arguments([{"n": 2}, {"n": "not a number"}])
+    assert exc_info.value.parameter_name == "n"
+    assert window.get_parameter_values() == current
+
+
+def test_batch_dialog_shows_validation_errors(qapp):
+    def validator(arguments_list):
+        raise ParameterError("n", "invalid value")
+
+    dialog = BatchDialog(None, {"n": 1}, 1, validator=validator)
+    # noinspection PyProtectedMember
+    dialog._grid_editors["n"].setText("[1, 2]")
+    assert len(dialog.arguments_list) == 2
+    dialog.accept()
+    assert dialog.result() != QDialog.Accepted
+    # noinspection PyProtectedMember
+    assert dialog._summary_label.text() == "n: invalid value"
+    dialog.deleteLater()
+
+
+def test_batch_dialog_returns_validated_arguments(qapp):
+    dialog = BatchDialog(
+        None,
+        {"n": 1},
+        1,
+        validator=lambda arguments_list: [
+            {"n": args["n"] * 10} for args in arguments_list
+        ],
+    )
+    # noinspection PyProtectedMember
+    dialog._grid_editors["n"].setText("[1, 2]")
+    dialog.accept()
+    assert dialog.result() == QDialog.Accepted
+    assert dialog.arguments_list == [{"n": 10}, {"n": 20}]
+    dialog.deleteLater()
@@ -0,0 +1,62 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+SUITE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "suite.py",
+)
+
+
+@pytest.fixture(scope="module")
+def suite():
+    # benchmarks is not a package, the suite is loaded from its file
+    spec = importlib.util.spec_from_file_location("bench_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _results(**medians):
+    return {
+        "results": {
+            name: {"median": median, "min": median, "max": median, "runs": 1}
+            for name, median in medians.items()
+        }
+    }
+
+
+def test_compare_reports_regressions(suite):
+    baseline = _results(a=1.0, b=1.0, c=2.0)
+    results = _results(a=1.5, b=1.1, c=1.0)
+    assert suite.compare(results, baseline, 0.25) == [("a", 1.0, 1.5, 1.5)]
+    assert suite.compare(results, baseline, 0.05) == [
+        ("a", 1.0, 1.5, 1.5),
+        ("b", 1.0, 1.1, pytest.approx(1.1)),
+    ]
+
+
+def test_compare_tolerance_is_exclusive(suite):
+    baseline = _results(a=1.0)
+    assert suite.compare(_results(a=1.25), baseline, 0.25) == []
+    assert suite.compare(_results(a=1.2500001), baseline, 0.25) != []
+
+
+def test_compare_skips_missing_and_invalid_baselines(suite):
+    results = _results(a=10.0, b=10.0, c=10.0)
+    assert suite.compare(results, _results(b=0.0, c=-1.0), 0.25) == []
+    assert suite.compare(results, {}, 0.25) == []
+    # cases only in the baseline are ignored
+    assert suite.compare(_results(), _results(a=1.0), 0.25) == []
+
+
+def test_compare_with_saved_results(suite, tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(_results(a=0.001)), encoding="utf-8")
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    assert suite.compare(_results(a=0.002), baseline, suite.DEFAULT_TOLERANCE) == [
+        ("a", 0.001, 0.002, 2.0)
+    ]
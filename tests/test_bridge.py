@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from pyguiadapter.adapter._bridge import BridgeChannel
+
+
+class _Worker(threading.Thread):
+    """
+    Runs work() in a worker thread and keeps its result or exception.
+    """
+
+    def __init__(self, work):
+        super().__init__(daemon=True)
+        self._work = work
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self._work()
+        except BaseException as e:
+            self.error = e
+
+
+def _wait_for(qapp, worker, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while worker.is_alive():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+def _run_in_worker(qapp, work):
+    worker = _Worker(work)
+    worker.start()
+    _wait_for(qapp, worker)
+    return worker
+
+
+@pytest.fixture
+def channel(qapp):
+    channel = BridgeChannel(None)
+    yield channel
+    channel.deleteLater()
+
+
+def _gui_thread_ident():
+    return threading.get_ident()
+
+
+def test_call_round_trip(qapp, channel):
+    worker = _run_in_worker(
+        qapp, lambda: [channel.call(lambda a, b: a + b, i, 1) for i in range(100)]
+    )
+    assert worker.error is None
+    assert worker.result == list(range(1, 101))
+    # the calls are executed in the GUI thread
+    worker = _run_in_worker(qapp, lambda: channel.call(_gui_thread_ident))
+    assert worker.result == threading.get_ident()
+
+
+def test_call_in_gui_thread_is_direct(channel):
+    # no event loop is needed
+    assert channel.call(lambda a: a * 2, 21) == 42
+    assert channel.call_many([(str, (1,)), (_gui_thread_ident, ())]) == [
+        "1",
+        threading.get_ident(),
+    ]
+
+
+def test_call_many(qapp, channel):
+    calls = [(lambda a: a * 2, (i,)) for i in range(10)] + [(_gui_thread_ident, ())]
+    worker = _run_in_worker(qapp, lambda: channel.call_many(calls))
+    assert worker.error is None
+    assert worker.result == [i * 2 for i in range(10)] + [threading.get_ident()]
+    worker = _run_in_worker(qapp, lambda: channel.call_many([]))
+    assert worker.result == []
+
+
+def test_exception_reaches_the_caller(qapp, channel):
+    called = []
+
+    def fail(message):
+        raise ValueError(message)
+
+    def work():
+        with pytest.raises(ValueError, match="from the GUI thread"):
+            channel.call(fail, "from the GUI thread")
+        with pytest.raises(ValueError, match="second"):
+            channel.call_many(
+                [(called.append, (1,)), (fail, ("second",)), (called.append, (2,))]
+            )
+        # the slot is still usable after an exception
+        return channel.call(lambda: "ok")
+
+    worker = _run_in_worker(qapp, work)
+    assert worker.error is None
+    assert worker.result == "ok"
+    # the calls after the failed one are not executed
+    assert called == [1]
+
+
+def test_timeout_before_the_request_is_handled(qapp, channel):
+    called = []
+    timed_out = threading.Event()
+
+    def work():
+        try:
+            channel.call(called.append, "late", timeout=0.05)
+        except TimeoutError:
+            timed_out.set()
+        return channel.call(lambda: "second")
+
+    worker = _Worker(work)
+    worker.start()
+    # the GUI thread doesn't process events until the first call has timed out
+    assert timed_out.wait(10.0)
+    _wait_for(qapp, worker)
+    assert worker.error is None
+    assert worker.result == "second"
+    # the abandoned request is never executed
+    qapp.processEvents()
+    assert called == []
+
+
+def test_late_reply_is_not_delivered_to_the_next_call(qapp, channel):
+    timed_out = threading.Event()
+
+    def slow():
+        # the GUI thread is still busy with the request when the caller gives up, e.g. a dialog is open
+        assert timed_out.wait(10.0)
+        return "late"
+
+    def work():
+        try:
+            channel.call(slow, timeout=0.05)
+        except TimeoutError:
+            timed_out.set()
+        else:
+            return "no timeout"
+        # the next call on the same thread gets its own reply, not the late one
+        return [channel.call(lambda: "second"), channel.call_many([(str, (3,))])]
+
+    worker = _run_in_worker(qapp, work)
+    assert worker.error is None
+    assert worker.result == ["second", ["3"]]
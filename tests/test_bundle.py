@@ -0,0 +1,87 @@
+import pytest
+
+from pyguiadapter.adapter import GUIAdapter
+
+
+def fn(a: int = 1, b: str = "text"):
+    """
+    A function.
+
+    Args:
+        a: the first parameter
+        b: the second parameter
+    """
+    pass
+
+
+def _bundle(adapter: GUIAdapter, fn_):
+    # noinspection PyProtectedMember
+    return adapter._bundles[fn_]
+
+
+def test_eager_registration_is_resolved():
+    adapter = GUIAdapter()
+    adapter.add(fn)
+    bundle = _bundle(adapter, fn)
+    assert bundle.resolved
+    assert list(bundle.fn_info.parameters.keys()) == ["a", "b"]
+
+
+def test_lazy_registration_is_resolved_on_demand():
+    adapter = GUIAdapter(lazy_registration=True)
+    adapter.add(fn, display_name="Function", group="Group")
+    bundle = _bundle(adapter, fn)
+    assert not bundle.resolved
+    # what the function select window needs is known without parsing
+    assert bundle.fn_info.display_name == "Function"
+    assert bundle.fn_info.group == "Group"
+    assert bundle.fn_info.parameters == {}
+    assert bundle.widget_configs == {}
+
+    bundle.resolve()
+    assert bundle.resolved
+    assert bundle.fn_info.display_name == "Function"
+    assert bundle.fn_info.parameters["b"].description == "the second parameter"
+    assert list(bundle.widget_configs.keys()) == ["a", "b"]
+
+    fn_info = bundle.fn_info
+    bundle.resolve()
+    assert bundle.fn_info is fn_info
+
+
+def test_lazy_registration_matches_eager_registration():
+    eager = GUIAdapter()
+    eager.add(fn)
+    lazy = GUIAdapter(lazy_registration=True)
+    lazy.add(fn)
+    eager_bundle = _bundle(eager, fn)
+    lazy_bundle = _bundle(lazy, fn)
+    lazy_bundle.resolve()
+    assert lazy_bundle.fn_info == eager_bundle.fn_info
+    assert {
+        name: (cls, config)
+        for name, (cls, config) in lazy_bundle.widget_configs.items()
+    } == dict(eager_bundle.widget_configs)
+
+
+def test_failed_resolve_is_retried():
+    adapter = GUIAdapter(lazy_registration=True)
+    adapter.add(fn)
+    bundle = _bundle(adapter, fn)
+    resolver = bundle.resolver
+    calls = []
+
+    def failing_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("failed")
+        return resolver()
+
+    bundle.resolver = failing_once
+    with pytest.raises(RuntimeError):
+        bundle.resolve()
+    assert not bundle.resolved
+    bundle.resolve()
+    assert bundle.resolved
+    assert len(calls) == 2
+    assert list(bundle.fn_info.parameters.keys()) == ["a", "b"]
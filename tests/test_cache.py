@@ -0,0 +1,222 @@
+import enum
+import os
+import time
+
+import pytest
+
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter import cache as cache_module
+from pyguiadapter.cache import (
+    ResultCache,
+    ResultCacheConfig,
+    UnstableArgumentError,
+    stable_hash,
+)
+from pyguiadapter.windows.fnexec import FnExecuteWindowEventListener
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Opaque(object):
+    pass
+
+
+class FailingRepr(object):
+    def __repr__(self):
+        raise ValueError("no repr")
+
+
+def _cache(**kwargs) -> ResultCache:
+    return ResultCache("tests:fn", ResultCacheConfig(**kwargs))
+
+
+def test_stable_hash_ignores_dict_and_set_order():
+    assert stable_hash({"a": 1, "b": 2}) == stable_hash({"b": 2, "a": 1})
+    assert stable_hash({3, 1, 2}) == stable_hash({2, 3, 1})
+    assert stable_hash({"x": {1, 2}}) == stable_hash({"x": {2, 1}})
+    assert stable_hash([1, 2]) != stable_hash([2, 1])
+
+
+def test_stable_hash_keeps_types_apart():
+    hashes = {stable_hash(value) for value in (1, 1.0, True, "1", b"1", None)}
+    assert len(hashes) == 6
+    assert stable_hash([1, 2]) != stable_hash((1, 2))
+    assert stable_hash({1, 2}) != stable_hash([1, 2])
+    assert stable_hash(Color.RED) != stable_hash(Color.GREEN)
+    assert stable_hash("ab") != stable_hash(["a", "b"])
+
+
+def test_stable_hash_rejects_default_repr():
+    with pytest.raises(UnstableArgumentError):
+        stable_hash(Opaque())
+
+
+def test_make_key_is_stable():
+    cache = _cache()
+    assert cache.make_key({"a": 1, "b": {"x", "y"}}) == cache.make_key(
+        {"b": {"y", "x"}, "a": 1}
+    )
+    assert cache.make_key({"a": 1}) != cache.make_key({"a": 1.0})
+    assert cache.make_key({"a": 1}) != cache.make_key({"a": True})
+    other = ResultCache("tests:other", ResultCacheConfig())
+    assert cache.make_key({"a": 1}) != other.make_key({"a": 1})
+
+
+@pytest.mark.parametrize(
+    "value_factory",
+    [
+        Opaque,
+        FailingRepr,
+        lambda: [FailingRepr()],
+    ],
+)
+def test_make_key_returns_none_for_unhashable_arguments(value_factory):
+    assert _cache().make_key({"a": value_factory()}) is None
+
+
+def test_make_key_returns_none_for_self_referencing_list():
+    value = []
+    value.append(value)
+    assert _cache().make_key({"a": value}) is None
+
+
+def test_make_key_includes_file_stamps(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("one", encoding="utf-8")
+    cache = ResultCache("tests:fn", ResultCacheConfig(), path_parameters=["path"])
+    key = cache.make_key({"path": str(path)})
+    assert cache.make_key({"path": str(path)}) == key
+    path.write_text("one two", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.make_key({"path": str(path)}) != key
+
+    no_stamps = ResultCache(
+        "tests:fn", ResultCacheConfig(file_stamps=False), path_parameters=["path"]
+    )
+    key = no_stamps.make_key({"path": str(path)})
+    path.write_text("changed again", encoding="utf-8")
+    assert no_stamps.make_key({"path": str(path)}) == key
+
+
+def test_get_and_put():
+    cache = _cache()
+    assert cache.get("k") is None
+    cache.put("k", [1, 2], [("out", False)])
+    entry = cache.get("k")
+    assert entry.result == [1, 2]
+    assert entry.output == (("out", False),)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction():
+    cache = _cache(max_entries=2)
+    cache.put("a", 1, [])
+    cache.put("b", 2, [])
+    # a becomes the most recently used one
+    assert cache.get("a") is not None
+    cache.put("c", 3, [])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = _cache(ttl=10)
+    cache.put("k", 1, [])
+    now[0] += 5
+    assert cache.get("k") is not None
+    now[0] += 6
+    assert cache.get("k") is None
+
+
+def test_disk_tier(tmp_path):
+    config = ResultCacheConfig(disk_dir=str(tmp_path), max_disk_entries=2)
+    cache = ResultCache("tests:fn", config)
+    cache.put("a", {"x": 1}, [("<b>out</b>", True)])
+    # a new cache (e.g. after a restart) finds the result on disk
+    entry = ResultCache("tests:fn", config).get("a")
+    assert entry.result == {"x": 1}
+    assert entry.output == (("<b>out</b>", True),)
+    # but not the one of another function
+    assert ResultCache("tests:other", config).get("a") is None
+
+
+def test_disk_tier_is_pruned(tmp_path):
+    config = ResultCacheConfig(disk_dir=str(tmp_path), max_disk_entries=2)
+    cache = ResultCache("tests:fn", config)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, i, [])
+        # make the write order visible through the mtime
+        path = cache._disk_path(key)
+        os.utime(path, (time.time() + i, time.time() + i))
+    fresh = ResultCache("tests:fn", config)
+    assert fresh.get("a") is None
+    assert fresh.get("b") is not None
+    assert fresh.get("c") is not None
+
+
+def test_disk_tier_drops_corrupted_files(tmp_path):
+    config = ResultCacheConfig(disk_dir=str(tmp_path))
+    cache = ResultCache("tests:fn", config)
+    cache.put("a", 1, [])
+    path = cache._disk_path("a")
+    with open(path, "wb") as f:
+        f.write(b"not a pickle")
+    with pytest.warns(UserWarning):
+        assert ResultCache("tests:fn", config).get("a") is None
+    assert not os.path.exists(path)
+
+
+def test_clear(tmp_path):
+    config = ResultCacheConfig(disk_dir=str(tmp_path))
+    cache = ResultCache("tests:fn", config)
+    cache.put("a", 1, [])
+    cache.clear()
+    assert cache.get("a") is None
+    assert ResultCache("tests:fn", config).get("a") is None
+
+
+calls = []
+
+
+def make_list(n: int = 3):
+    calls.append(n)
+    return list(range(n))
+
+
+class _MutatingListener(FnExecuteWindowEventListener):
+    def __init__(self):
+        self.results = []
+
+    def on_execute_result(self, window, result) -> bool:
+        self.results.append(list(result))
+        result.append("changed by listener")
+        return True
+
+
+def _wait_until(qapp, predicate, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+
+
+def test_replayed_results_are_copies(qapp, make_window):
+    calls.clear()
+    listener = _MutatingListener()
+    window = make_window(make_list, cache=True, window_listener=listener)
+    window.show()
+    for _ in range(3):
+        # noinspection PyProtectedMember
+        window._on_execute_button_clicked()
+        _wait_until(qapp, lambda: not window.is_function_executing())
+    assert calls == [3]
+    assert listener.results == [[0, 1, 2]] * 3
@@ -0,0 +1,117 @@
+import threading
+
+import pytest
+
+from pyguiadapter.cancellation import (
+    CancellationToken,
+    get_current_token,
+    _set_current_token,
+)
+from pyguiadapter.exceptions import FunctionCancelledError
+
+
+def test_cancel():
+    token = CancellationToken()
+    assert not token.is_cancelled()
+    assert not token.cancelled
+    token.raise_if_cancelled()
+    token.cancel()
+    assert token.is_cancelled()
+    assert token.cancelled
+    with pytest.raises(FunctionCancelledError):
+        token.raise_if_cancelled()
+
+
+def test_wait():
+    token = CancellationToken()
+    assert token.wait(0.01) is False
+    threading.Timer(0.05, token.cancel).start()
+    assert token.wait(10) is True
+
+
+def test_callbacks_are_called_once_on_cancel():
+    token = CancellationToken()
+    calls = []
+    token.add_callback(lambda: calls.append("a"))
+    token.add_callback(lambda: calls.append("b"))
+    token.cancel()
+    token.cancel()
+    assert calls == ["a", "b"]
+
+
+def test_callback_added_after_cancel_is_called_right_away():
+    token = CancellationToken()
+    token.cancel()
+    calls = []
+    token.add_callback(lambda: calls.append(1))
+    assert calls == [1]
+
+
+def test_remove_callback():
+    token = CancellationToken()
+    calls = []
+
+    def callback():
+        calls.append(1)
+
+    token.add_callback(callback)
+    token.remove_callback(callback)
+    token.cancel()
+    assert calls == []
+
+
+def test_callback_errors_do_not_propagate(capsys):
+    token = CancellationToken()
+    calls = []
+
+    def failing():
+        raise ValueError("boom")
+
+    token.add_callback(failing)
+    token.add_callback(lambda: calls.append(1))
+    token.cancel()
+    assert calls == [1]
+    assert "ValueError: boom" in capsys.readouterr().err
+
+
+def test_watched_event_set_elsewhere_fires_callbacks():
+    event = threading.Event()
+    token = CancellationToken(event, watched=True)
+    fired = threading.Event()
+    token.add_callback(fired.set)
+    # set directly, as the GUI process does for a worker process
+    event.set()
+    assert fired.wait(5)
+    assert token.is_cancelled()
+
+
+def test_detach_keeps_the_final_state():
+    event = threading.Event()
+    token = CancellationToken(event, watched=True)
+    # noinspection PyProtectedMember
+    token._detach()
+    event.set()
+    assert not token.is_cancelled()
+
+    event = threading.Event()
+    event.set()
+    token = CancellationToken(event)
+    # noinspection PyProtectedMember
+    token._detach()
+    event.clear()
+    assert token.is_cancelled()
+
+
+def test_current_token_is_thread_local():
+    token = CancellationToken()
+    _set_current_token(token)
+    try:
+        assert get_current_token() is token
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_current_token()))
+        thread.start()
+        thread.join()
+        assert seen == [None]
+    finally:
+        _set_current_token(None)
+    assert get_current_token() is None
@@ -0,0 +1,20 @@
+import dataclasses
+
+from pyguiadapter.fn import FnInfo
+
+
+def test_new_fn_info_fields_are_appended():
+    # FnInfo is public, new fields must not shift the positional order of the existing ones
+    names = [field.name for field in dataclasses.fields(FnInfo)]
+    assert names[:9] == [
+        "fn",
+        "display_name",
+        "document",
+        "document_format",
+        "icon",
+        "group",
+        "parameters",
+        "cancelable",
+        "executor",
+    ]
+    assert names[9] == "capture_system_exit_exception"
@@ -0,0 +1,153 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from pyguiadapter.parser import fncache
+from pyguiadapter.parser.fncache import FnParseCache
+
+MODULE_SOURCE = '''
+import os
+
+
+def fn(a: int = 1, b: str = os.environ.get("PYGUIADAPTER_TEST_DEFAULT", "one")):
+    """
+    A function.
+
+    Args:
+        a: the first parameter
+        b: the second parameter
+    """
+'''
+
+
+@pytest.fixture
+def module_factory(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delenv("PYGUIADAPTER_TEST_DEFAULT", raising=False)
+    counter = [0]
+    names = []
+
+    def factory(source: str = MODULE_SOURCE):
+        counter[0] += 1
+        name = f"_fncache_test_module_{counter[0]}"
+        names.append(name)
+        (tmp_path / f"{name}.py").write_text(textwrap.dedent(source), encoding="utf-8")
+        return importlib.import_module(name)
+
+    yield factory
+
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def _parsed(value="doc"):
+    return value, {}, {}
+
+
+def test_hit(tmp_path, module_factory):
+    module = module_factory()
+    filename = str(tmp_path / "cache.pickle")
+    cache = FnParseCache(filename)
+    assert cache.get(module.fn) is None
+    cache.put(module.fn, _parsed())
+    cache.save()
+
+    cache = FnParseCache(filename)
+    assert cache.get(module.fn) == _parsed()
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_miss_on_salt(tmp_path, module_factory):
+    module = module_factory()
+    cache = FnParseCache(str(tmp_path / "cache.pickle"))
+    cache.put(module.fn, _parsed(), salt="a")
+    assert cache.get(module.fn, salt="a") == _parsed()
+    assert cache.get(module.fn, salt="b") is None
+
+
+def test_miss_on_edit(tmp_path, module_factory):
+    module = module_factory()
+    filename = str(tmp_path / "cache.pickle")
+    cache = FnParseCache(filename)
+    cache.put(module.fn, _parsed())
+    cache.save()
+
+    source_file = tmp_path / f"{module.__name__}.py"
+    source_file.write_text(
+        source_file.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8"
+    )
+    cache = FnParseCache(filename)
+    assert cache.get(module.fn) is None
+    assert cache.misses == 1
+
+
+def test_miss_on_schema_change(tmp_path, module_factory, monkeypatch):
+    module = module_factory()
+    filename = str(tmp_path / "cache.pickle")
+    cache = FnParseCache(filename)
+    cache.put(module.fn, _parsed())
+    cache.save()
+
+    monkeypatch.setattr(fncache, "_FORMAT_VERSION", fncache._FORMAT_VERSION + 1)
+    assert FnParseCache(filename).get(module.fn) is None
+
+
+def test_miss_on_changed_default(tmp_path, module_factory, monkeypatch):
+    module = module_factory()
+    filename = str(tmp_path / "cache.pickle")
+    cache = FnParseCache(filename)
+    cache.put(module.fn, _parsed())
+    cache.save()
+
+    # the source file stays the same, but the default is evaluated to another value
+    monkeypatch.setenv("PYGUIADAPTER_TEST_DEFAULT", "two")
+    module = importlib.reload(module)
+    assert module.fn.__defaults__ == (1, "two")
+    assert FnParseCache(filename).get(module.fn) is None
+
+
+def test_unstable_default_is_never_a_hit(tmp_path, module_factory):
+    module = module_factory("def fn(a=object()):\n    pass\n")
+    filename = str(tmp_path / "cache.pickle")
+    cache = FnParseCache(filename)
+    cache.put(module.fn, _parsed())
+    cache.save()
+    module = importlib.reload(module)
+    assert FnParseCache(filename).get(module.fn) is None
+
+
+def test_corrupted_file_is_ignored(tmp_path, module_factory):
+    module = module_factory()
+    filename = tmp_path / "cache.pickle"
+    filename.write_bytes(b"not a pickle")
+    with pytest.warns(UserWarning):
+        assert FnParseCache(str(filename)).get(module.fn) is None
+
+
+def test_adapter_uses_the_live_default(tmp_path, module_factory, monkeypatch):
+    from pyguiadapter.adapter import GUIAdapter
+
+    module = module_factory()
+    filename = str(tmp_path / "cache.pickle")
+
+    def parameters_of(fn):
+        adapter = GUIAdapter(parse_cache=filename)
+        adapter.add(fn)
+        # noinspection PyProtectedMember
+        adapter._parse_cache.save()
+        # noinspection PyProtectedMember
+        return adapter._bundles[fn].fn_info.parameters, adapter._parse_cache
+
+    parameters, _ = parameters_of(module.fn)
+    assert parameters["b"].default_value == "one"
+    parameters, parse_cache = parameters_of(module.fn)
+    assert parse_cache.hits == 1
+    assert parameters["b"].description == "the second parameter"
+
+    monkeypatch.setenv("PYGUIADAPTER_TEST_DEFAULT", "two")
+    module = importlib.reload(module)
+    parameters, parse_cache = parameters_of(module.fn)
+    assert parse_cache.hits == 0
+    assert parameters["b"].default_value == "two"
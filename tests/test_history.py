@@ -0,0 +1,165 @@
+import pytest
+
+from pyguiadapter.adapter._output_buffer import OutputBuffer
+from pyguiadapter.history import (
+    ExecutionHistory,
+    HistoryRecord,
+    STATUS_SUCCEEDED,
+    STATUS_FAILED,
+    function_key,
+    snapshot_arguments,
+    snapshot_result,
+)
+
+
+def _record(fn_key: str, started_at: float, status: str = STATUS_SUCCEEDED):
+    return HistoryRecord(
+        fn_key=fn_key,
+        fn_name=fn_key,
+        started_at=started_at,
+        wall_time=0.5,
+        cpu_time=None,
+        status=status,
+        error=None if status == STATUS_SUCCEEDED else "ValueError: boom",
+        arguments={"a": "1", "b": "'text'"},
+        result="3",
+        output="hello\n",
+    )
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = ExecutionHistory(str(tmp_path / "history.sqlite3"), max_records=5)
+    yield history
+    history.close()
+
+
+def test_record_and_query(history):
+    history.record(_record("foo", 1.0))
+    history.record(_record("foo", 2.0, STATUS_FAILED))
+    history.record(_record("bar", 3.0))
+    history.flush()
+    records = history.query("foo")
+    assert [record.started_at for record in records] == [2.0, 1.0]
+    assert all(record.id is not None for record in records)
+    failed = records[0]
+    assert failed.status == STATUS_FAILED
+    assert failed.error == "ValueError: boom"
+    assert failed.arguments == {"a": "1", "b": "'text'"}
+    assert failed.output == "hello\n"
+
+
+def test_query_by_status_and_limit(history):
+    for i in range(4):
+        history.record(
+            _record("foo", float(i), STATUS_FAILED if i % 2 else "succeeded")
+        )
+    history.flush()
+    assert [r.started_at for r in history.query("foo", status=STATUS_FAILED)] == [
+        3.0,
+        1.0,
+    ]
+    assert [r.started_at for r in history.query("foo", limit=1)] == [3.0]
+
+
+def test_prune_keeps_the_latest_records_of_each_function(history):
+    for i in range(8):
+        history.record(_record("foo", float(i)))
+    history.record(_record("bar", 100.0))
+    history.flush()
+    assert [r.started_at for r in history.query("foo")] == [7.0, 6.0, 5.0, 4.0, 3.0]
+    assert len(history.query("bar")) == 1
+
+
+def test_delete_and_clear(history):
+    for i in range(3):
+        history.record(_record("foo", float(i)))
+    history.record(_record("bar", 0.0))
+    history.flush()
+    history.delete(history.query("foo")[0].id)
+    assert [r.started_at for r in history.query("foo")] == [1.0, 0.0]
+    history.clear("foo")
+    assert history.query("foo") == []
+    assert len(history.query("bar")) == 1
+    history.clear()
+    assert history.query("bar") == []
+
+
+def test_records_survive_reopening(tmp_path):
+    filename = str(tmp_path / "history.sqlite3")
+    history = ExecutionHistory(filename)
+    history.record(_record("foo", 1.0))
+    history.close()
+    with pytest.raises(RuntimeError):
+        history.record(_record("foo", 2.0))
+    history = ExecutionHistory(filename)
+    try:
+        assert len(history.query("foo")) == 1
+    finally:
+        history.close()
+
+
+def test_restore_arguments():
+    record = HistoryRecord(
+        fn_key="foo",
+        fn_name="foo",
+        started_at=0.0,
+        wall_time=None,
+        cpu_time=None,
+        status=STATUS_SUCCEEDED,
+        error=None,
+        arguments=snapshot_arguments({"a": [1, 2.0, "x"], "b": object()}),
+        result=None,
+        output="",
+    )
+    values, unrestorable = record.restore_arguments()
+    assert values == {"a": [1, 2.0, "x"]}
+    assert unrestorable == ["b"]
+
+
+def test_snapshots_never_raise():
+    class Unrepresentable(object):
+        def __repr__(self):
+            raise ValueError("no repr")
+
+    assert snapshot_arguments({"x": Unrepresentable()})["x"].startswith(
+        "<unrepresentable Unrepresentable"
+    )
+    assert "Unrepresentable" in snapshot_result(Unrepresentable())
+    assert len(snapshot_result("x" * 100000)) < 1100
+
+
+def test_function_key():
+    assert function_key(test_function_key).endswith(":test_function_key")
+    assert function_key(test_function_key) != function_key(test_restore_arguments)
+
+
+def test_output_capture_is_truncated_at_the_limit():
+    buffer = OutputBuffer()
+    buffer.set_capture_limit(10)
+    buffer.put("12345", False, False)
+    buffer.put("<b>html</b>", True, False)
+    buffer.put("67890abc", False, False)
+    captured, truncated = buffer.take_captured()
+    # a truncated html chunk is dropped as a whole, plain text is cut at the limit
+    assert captured == [("12345", False), ("67890", False)]
+    assert truncated is True
+    assert buffer.take_captured() == ([], False)
+
+
+def test_output_capture_is_independent_of_flushing():
+    buffer = OutputBuffer()
+    buffer.set_capture_limit(100)
+    buffer.put("a", False, False)
+    buffer.take(0)
+    buffer.put("<i>b</i>", True, False)
+    buffer.clear()
+    captured, truncated = buffer.take_captured()
+    assert captured == [("a", False), ("<i>b</i>", True)]
+    assert truncated is False
+
+
+def test_output_capture_disabled_by_default():
+    buffer = OutputBuffer()
+    buffer.put("a", False, False)
+    assert buffer.take_captured() == ([], False)
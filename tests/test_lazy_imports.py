@@ -0,0 +1,187 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from pyguiadapter.exceptions import AlreadyRegisteredError
+from pyguiadapter.paramwidget import is_parameter_widget_class
+from pyguiadapter.widgets.builtin import BUILTIN_WIDGETS_MAP
+from pyguiadapter.widgets.factory import ParameterWidgetRegistry
+
+LAZY_PACKAGES = [
+    "pyguiadapter.widgets",
+    "pyguiadapter.widgets.basic",
+    "pyguiadapter.widgets.extend",
+    "pyguiadapter.utils",
+    "pyguiadapter.codeeditor",
+]
+
+LINE_EDIT = "pyguiadapter.widgets.basic.lineedit:LineEdit"
+INT_SPIN_BOX = "pyguiadapter.widgets.basic.intspin:IntSpinBox"
+
+
+def _lazy_items(package_name):
+    package = importlib.import_module(package_name)
+    # noinspection PyProtectedMember
+    return package, list(package._LAZY_ATTRS.items())
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_lazy_attrs_point_to_defining_modules(package_name):
+    package, items = _lazy_items(package_name)
+    assert items
+    for name, relative_path in items:
+        module = importlib.import_module(relative_path, package_name)
+        assert getattr(package, name) is getattr(module, name), name
+        # the value is cached in the package after the first access
+        assert name in vars(package)
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_all_names_are_importable(package_name):
+    package = importlib.import_module(package_name)
+    assert len(set(package.__all__)) == len(package.__all__)
+    namespace = {}
+    exec(f"from {package_name} import *", namespace)
+    for name in package.__all__:
+        assert namespace[name] is getattr(package, name), name
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_lazy_attrs_are_listed(package_name):
+    package, items = _lazy_items(package_name)
+    names = dir(package)
+    for name, _ in items:
+        assert name in names
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_unknown_attr_raises_attribute_error(package_name):
+    package = importlib.import_module(package_name)
+    with pytest.raises(AttributeError) as exc_info:
+        getattr(package, "NoSuchName")
+    assert package_name in str(exc_info.value)
+    assert not hasattr(package, "NoSuchName")
+
+
+def test_lazy_import_helpers_are_not_exported():
+    namespace = {}
+    exec("from pyguiadapter.utils import *", namespace)
+    for name in ("TYPE_CHECKING", "lazy_module_attrs"):
+        assert name not in namespace
+    # names exported before the lazy imports were introduced are still exported
+    for name in ("get_icon", "show_info_message", "read_text_file", "input_integer"):
+        assert name in namespace
+
+
+def test_lazy_submodules():
+    import pyguiadapter.codeeditor
+    import pyguiadapter.utils
+
+    for package, name in (
+        (pyguiadapter.utils, "inputdialog"),
+        (pyguiadapter.utils, "editor"),
+        (pyguiadapter.codeeditor, "formatters"),
+    ):
+        assert getattr(package, name) is importlib.import_module(
+            f"{package.__name__}.{name}"
+        )
+
+
+def test_widget_modules_are_imported_on_first_access():
+    # a fresh interpreter, the tests above have imported everything already
+    code = "\n".join(
+        [
+            "import sys",
+            "import pyguiadapter.widgets as widgets",
+            "assert 'pyguiadapter.widgets.basic.lineedit' not in sys.modules",
+            "assert 'pyguiadapter.widgets.extend.textedit' not in sys.modules",
+            "widgets.LineEdit",
+            "assert 'pyguiadapter.widgets.basic.lineedit' in sys.modules",
+            "assert 'pyguiadapter.widgets.extend.textedit' not in sys.modules",
+            "import pyguiadapter.utils",
+            "assert 'pyguiadapter.utils.inputdialog' not in sys.modules",
+            "import pyguiadapter.codeeditor",
+            "assert 'pyguiadapter.codeeditor.editor' not in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_builtin_widgets_map_paths():
+    registry = ParameterWidgetRegistry()
+    for typename, widget_class_path in BUILTIN_WIDGETS_MAP.items():
+        widget_class = registry.find_by_typename(typename)
+        assert is_parameter_widget_class(widget_class), typename
+        module_name, _, class_name = widget_class_path.partition(":")
+        module = importlib.import_module(module_name)
+        assert getattr(module, class_name) is widget_class
+
+
+def test_register_lazy_resolves_on_lookup():
+    registry = ParameterWidgetRegistry()
+    registry.register_lazy("lazy_a", LINE_EDIT)
+    registry.register_lazy("lazy_b", LINE_EDIT)
+    assert registry.is_registered("lazy_a")
+    # noinspection PyProtectedMember
+    assert registry._registry["lazy_a"] == LINE_EDIT
+
+    from pyguiadapter.widgets.basic.lineedit import LineEdit
+
+    assert registry.find_by_typename("lazy_a") is LineEdit
+    # the other typenames registered with the same path are resolved at the same time
+    # noinspection PyProtectedMember
+    assert registry._registry["lazy_b"] is LineEdit
+    assert registry.unregister("lazy_b") is LineEdit
+    assert not registry.is_registered("lazy_b")
+
+
+def test_register_lazy_find_by_widget_class_name():
+    from pyguiadapter.widgets.basic.intspin import IntSpinBox
+
+    registry = ParameterWidgetRegistry()
+    registry.unregister_all(list(BUILTIN_WIDGETS_MAP.keys()))
+    registry.register_lazy("lazy", INT_SPIN_BOX)
+    assert registry.find_by_widget_class_name("IntSpinBox") is IntSpinBox
+    assert registry.find_by_widget_class_name("LineEdit") is None
+
+
+def test_register_lazy_replace():
+    from pyguiadapter.widgets.basic.intspin import IntSpinBox
+
+    registry = ParameterWidgetRegistry()
+    registry.register_lazy("lazy", LINE_EDIT)
+    with pytest.raises(AlreadyRegisteredError):
+        registry.register_lazy("lazy", INT_SPIN_BOX)
+    registry.register_lazy("lazy", INT_SPIN_BOX, replace=True)
+    assert registry.find_by_typename("lazy") is IntSpinBox
+
+
+@pytest.mark.parametrize(
+    "widget_class_path",
+    ["", "pyguiadapter.widgets.basic.lineedit", ":LineEdit", "LineEdit:"],
+)
+def test_register_lazy_invalid_path(widget_class_path):
+    registry = ParameterWidgetRegistry()
+    with pytest.raises(ValueError):
+        registry.register_lazy("lazy", widget_class_path)
+    assert not registry.is_registered("lazy")
+
+
+def test_register_lazy_errors_on_lookup():
+    registry = ParameterWidgetRegistry()
+    registry.register_lazy("missing_module", "pyguiadapter.no_such_module:Widget")
+    registry.register_lazy("missing_class", "pyguiadapter.widgets.basic.lineedit:No")
+    registry.register_lazy(
+        "not_widget", "pyguiadapter.widgets.basic.lineedit:LineEditConfig"
+    )
+    with pytest.raises(ImportError):
+        registry.find_by_typename("missing_module")
+    with pytest.raises(ImportError):
+        registry.find_by_typename("missing_class")
+    with pytest.raises(TypeError):
+        registry.find_by_typename("not_widget")
+    # a failed lookup leaves the path registered
+    # noinspection PyProtectedMember
+    assert registry._registry["not_widget"].endswith(":LineEditConfig")
@@ -0,0 +1,129 @@
+import pytest
+
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.exceptions import ParameterError
+from pyguiadapter.widgets import IntSpinBoxConfig
+from pyguiadapter.windows.fnexec import FnExecuteWindowConfig
+from pyguiadapter.windows.fnexec._parameter_area.virtual import (
+    VirtualParameterGroupPage,
+)
+
+
+def fn(a: int = 1, x: float = 1, n: int = 500, s: str = "text", flag: bool = True):
+    pass
+
+
+def _widget_configs(group):
+    # n's default is out of range, the widget clamps it
+    return {
+        "x": {"group": group},
+        "n": IntSpinBoxConfig(default_value=500, max_value=100, group=group),
+        "s": {"group": group},
+        "flag": {"group": group},
+    }
+
+
+MODES = ["eager", "lazy", "virtual"]
+
+
+def _window(make_window, mode: str):
+    config = FnExecuteWindowConfig(
+        show_function_error=False,
+        print_function_result=False,
+        lazy_parameter_widgets=mode == "lazy",
+        # the Hidden group uses a VirtualParameterGroupPage
+        virtual_parameter_page_threshold=1 if mode == "virtual" else None,
+    )
+    # the parameters are in a group that is never shown
+    return make_window(
+        fn, window_config=config, widget_configs=_widget_configs("Hidden")
+    )
+
+
+@pytest.mark.parametrize("mode", ["lazy", "virtual"])
+def test_lazy_values_are_the_same_as_eager_values(make_window, mode):
+    eager = _window(make_window, "eager").get_parameter_values()
+    lazy = _window(make_window, mode).get_parameter_values()
+    assert lazy == eager
+    assert [type(value) for value in lazy.values()] == [
+        type(value) for value in eager.values()
+    ]
+    assert type(lazy["x"]) is float
+    assert lazy["n"] == 100
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_single_value_goes_through_the_widget(make_window, mode):
+    window = _window(make_window, mode)
+    assert window.get_parameter_value("x") == 1.0
+    assert type(window.get_parameter_value("x")) is float
+    assert window.get_parameter_value("n") == 100
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_set_value_is_validated(make_window, mode):
+    window = _window(make_window, mode)
+    with pytest.raises(ParameterError):
+        window.set_parameter_value("n", "not a number")
+    window.set_parameter_values({"n": 1000, "x": 2})
+    values = window.get_parameter_values()
+    assert values["n"] == 100
+    assert values["x"] == 2.0
+    assert type(values["x"]) is float
+
+
+def test_reading_values_builds_hidden_pages(make_window):
+    window = _window(make_window, "lazy")
+    window.show()
+    # noinspection PyProtectedMember
+    page = window._parameter_area.parameter_groupbox._get_parameter_group("Hidden")
+    # noinspection PyProtectedMember
+    assert not page._parameters
+    window.get_parameter_values()
+    # noinspection PyProtectedMember
+    assert list(page._parameters.keys()) == ["x", "n", "s", "flag"]
+
+
+def test_virtual_page_keeps_converted_values_without_editors(make_window):
+    window = _window(make_window, "virtual")
+    # noinspection PyProtectedMember
+    page = window._parameter_area.parameter_groupbox._get_parameter_group("Hidden")
+    assert isinstance(page, VirtualParameterGroupPage)
+    # the page has never been shown, so no row has an editor
+    assert page.get_parameter_widget("n") is None
+    with pytest.raises(ParameterError):
+        window.set_parameter_value("n", "not a number")
+    # a rejected value leaves the kept value unchanged
+    assert window.get_parameter_value("n") == 100
+    window.set_parameter_value("s", 1)
+    assert window.get_parameter_value("s") == "1"
+    window.set_parameter_value("x", 3)
+    assert type(window.get_parameter_value("x")) is float
+    assert window.get_parameter_values() == {
+        "a": 1,
+        "x": 3.0,
+        "n": 100,
+        "s": "1",
+        "flag": True,
+    }
+
+
+def test_virtual_page_values_with_editors(make_window, qapp):
+    window = _window(make_window, "virtual")
+    window.show()
+    window.activate_parameter_group("Hidden")
+    # noinspection PyProtectedMember
+    page = window._parameter_area.parameter_groupbox._get_parameter_group("Hidden")
+    for _ in range(10):
+        qapp.processEvents()
+    assert page.get_parameter_widget("n") is not None
+    window.set_parameter_value("x", 2)
+    assert window.get_parameter_values() == {
+        "a": 1,
+        "x": 2.0,
+        "n": 100,
+        "s": "text",
+        "flag": True,
+    }
@@ -0,0 +1,83 @@
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.constants.log import (
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_INFO,
+    LOG_LEVEL_WARNING,
+    LOG_LEVEL_CRITICAL,
+)
+from pyguiadapter.windows.fnexec._log_area.model import LogStore, LogListModel
+
+RECORDS = [
+    (1.0, LOG_LEVEL_DEBUG, "connecting to server", "#000000"),
+    (2.0, LOG_LEVEL_INFO, "Connected", "#00ff00"),
+    (3.0, LOG_LEVEL_WARNING, "slow response from SERVER", "#ffff00"),
+    (4.0, LOG_LEVEL_CRITICAL, "connection lost", "#ff0000"),
+    (5.0, LOG_LEVEL_INFO, "reconnected", "#00ff00"),
+]
+ALL_LEVELS = {LOG_LEVEL_DEBUG, LOG_LEVEL_INFO, LOG_LEVEL_WARNING, LOG_LEVEL_CRITICAL}
+
+
+def _store() -> LogStore:
+    store = LogStore()
+    for record in RECORDS:
+        store.append(record)
+    return store
+
+
+def test_append_and_read_back():
+    store = _store()
+    assert len(store) == len(RECORDS)
+    for i, (timestamp, level, message, color) in enumerate(RECORDS):
+        assert store.timestamp(i) == timestamp
+        assert store.level(i) == level
+        assert store.message(i) == message
+        assert store.color(store.color_id(i)) == color
+    # each color is only stored once
+    assert store.color_id(1) == store.color_id(4)
+
+
+def test_filter_by_level():
+    store = _store()
+    assert list(store.filter(ALL_LEVELS, "")) == [0, 1, 2, 3, 4]
+    assert list(store.filter({LOG_LEVEL_INFO}, "")) == [1, 4]
+    assert list(store.filter(set(), "")) == []
+
+
+def test_filter_by_keyword_is_case_insensitive():
+    store = _store()
+    assert list(store.filter(ALL_LEVELS, "server")) == [0, 2]
+    assert list(store.filter(ALL_LEVELS, "CONNECT")) == [0, 1, 3, 4]
+    assert list(store.filter({LOG_LEVEL_CRITICAL}, "connect")) == [3]
+
+
+def test_filter_from_start():
+    store = _store()
+    assert list(store.filter(ALL_LEVELS, "", start=3)) == [3, 4]
+    assert list(store.filter({LOG_LEVEL_INFO}, "", start=2)) == [4]
+
+
+def test_clear():
+    store = _store()
+    store.clear()
+    assert len(store) == 0
+    assert list(store.filter(ALL_LEVELS, "")) == []
+
+
+def test_model_applies_filters_to_new_and_existing_records(qapp):
+    model = LogListModel()
+    model.append_records(RECORDS[:3])
+    assert model.rowCount() == 3
+    model.set_level_visible(LOG_LEVEL_DEBUG, False)
+    assert model.rowCount() == 2
+    model.set_keyword("connect")
+    assert model.rowCount() == 1
+    model.append_records(RECORDS[3:])
+    assert model.rowCount() == 3
+    assert model.record_count() == len(RECORDS)
+    model.set_keyword("")
+    model.set_level_visible(LOG_LEVEL_DEBUG, True)
+    assert model.rowCount() == len(RECORDS)
+    model.clear()
+    assert model.rowCount() == 0
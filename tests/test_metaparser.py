@@ -0,0 +1,197 @@
+import tomllib
+
+import pytest
+
+from pyguiadapter.parser.metaparser import (
+    FLAT,
+    TOMLKIT,
+    TOMLLIB,
+    UnsupportedSyntaxError,
+    get_metadata_parser,
+    parse_flat_toml,
+    parse_metadata,
+)
+
+# each document is parsed by the flat parser and by the reference parsers (tomllib and tomlkit)
+DOCUMENTS = [
+    # tables and scalar values
+    "[a]\nx = 1\ny = -2\nz = +3\nw = 1_000\n",
+    "[a]\nx = 0x1F\ny = 0o17\nz = 0b101\n",
+    "[a]\nx = 1.5\ny = -0.25\nz = 1e3\nw = 6.02E+23\nv = 1_0.5_0\n",
+    "[a]\nx = inf\ny = -inf\n",
+    "[a]\nx = true\ny = false\n",
+    "x = 1\n[a]\ny = 2\n",
+    '["quoted key"]\nx = 1\n',
+    "['literal key']\nx = 1\n",
+    "[a]\n\"quoted key\" = 1\n'literal key' = 2\n",
+    "[a]\nx = 1 # comment\n# comment\n\n   y = 2\n",
+    "[a]\nx = 1#comment\n",
+    # strings and escapes
+    "[a]\nx = \"plain\"\ny = 'C:\\path\\to'\n",
+    '[a]\nx = "\\b\\t\\n\\f\\r\\"\\\\"\n',
+    '[a]\nx = "\\u00e9\\u4e2d\\U0001F600"\n',
+    '[a]\nx = "tab\tinside"\n',
+    '[a]\nx = "# not a comment"\n',
+    '[a]\nx = "\\x41"\n',
+    '[a]\nx = "\\q"\n',
+    '[a]\nx = "\\u12"\n',
+    '[a]\nx = "\\uD800"\n',
+    '[a]\nx = "\\uDFFF"\n',
+    '[a]\nx = "\\U0000D800"\n',
+    '[a]\nx = "\\U00110000"\n',
+    '[a]\nx = "\\UFFFFFFFF"\n',
+    '[a]\nx = "\\U0010FFFF"\n',
+    '[a]\nx = "unterminated\n',
+    # arrays
+    "[a]\nx = [1, 2, 3]\ny = []\nz = [\"a\", 'b', 1.5, true]\n",
+    "[a]\nx = [1, 2, 3,]\ny = [ 1 , 2 , ]\n",
+    "[a]\nx = [[1, 2], [3]]\n",
+    "[a]\nx = [1,\n  2]\n",
+    "[a]\nx = [,]\n",
+    "[a]\nx = [1 2]\n",
+    # inline tables
+    '[a]\nx = {}\ny = {b = 1, "c" = "d", \'e\' = [1, 2]}\n',
+    '[a]\nx = {"a"="mdi6.numeric-1-circle", "b"="mdi6.numeric-2-circle"}\n',
+    "[a]\nx = {b = {c = 1}}\n",
+    "[a]\nx = {b = 1,}\n",
+    "[a]\nx = {b = 1, b = 2}\n",
+    "[a]\nx = {b.c = 1}\n",
+    "[a]\nx = {b = 1\n}\n",
+    # dotted keys
+    "[a]\nb.c = 1\n",
+    "[a.b]\nc = 1\n",
+    '[a]\n"b".c = 1\n',
+    # dates and times
+    "[a]\nx = 1979-05-27\n",
+    "[a]\nx = 07:32:00\n",
+    "[a]\nx = 1979-05-27T07:32:00Z\n",
+    "[a]\nx = 1979-05-27 07:32:00.999999-07:00\n",
+    # duplicates
+    "[a]\nx = 1\nx = 2\n",
+    "[a]\nx = 1\n[a]\ny = 2\n",
+    "a = 1\n[a]\nx = 1\n",
+    # other syntax outside of the flat subset
+    '[a]\nx = """multi\nline"""\n',
+    "[a]\nx = '''multi\nline'''\n",
+    "[[a]]\nx = 1\n",
+    # invalid documents
+    "[a]\nx = 01\n",
+    "[a]\nx = +0x1\n",
+    "[a]\nx = 1__0\n",
+    "[a]\nx = .5\n",
+    "[a]\nx = 1.\n",
+    "[a]\nx = TRUE\n",
+    "[a]\nx =\n",
+    "[a]\n= 1\n",
+    "[a]\nx = 1 y = 2\n",
+    "[a] x = 1\n",
+    "[a\nx = 1\n",
+]
+
+
+def _reference(text):
+    try:
+        return True, tomllib.loads(text)
+    except Exception as e:
+        return False, e
+
+
+def _tomlkit(text):
+    return get_metadata_parser(TOMLKIT)(text)
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_flat_parser_agrees_with_tomllib(text):
+    valid, expected = _reference(text)
+    try:
+        result = parse_flat_toml(text)
+    except UnsupportedSyntaxError:
+        # the next parser in the chain decides
+        return
+    except ValueError:
+        assert not valid, f"flat parser rejected a valid document: {text!r}"
+        return
+    assert valid, f"flat parser accepted an invalid document: {text!r}"
+    assert result == expected
+    assert [type(v) for v in result.values()] == [type(v) for v in expected.values()]
+
+
+def _tomlkit_or_error(text):
+    try:
+        return _tomlkit(text)
+    except Exception as e:
+        return e
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_default_parser_chain_agrees_with_tomllib(text):
+    valid, expected = _reference(text)
+    for parsers in (None, (FLAT, TOMLKIT)):
+        if valid:
+            assert parse_metadata(text, parsers) == expected
+            continue
+        # tomlkit is kept as the last, compatible fallback, so documents that only tomlkit accepts
+        # must parse to what tomlkit returns and everything else must fail
+        lenient = _tomlkit_or_error(text)
+        if isinstance(lenient, Exception):
+            with pytest.raises(Exception):
+                parse_metadata(text, parsers)
+        else:
+            assert parse_metadata(text, parsers) == lenient
+
+
+# invalid documents that tomlkit nevertheless accepts
+TOMLKIT_LENIENT = {
+    '[a]\nx = "\\x41"\n',
+    "[a]\nx = {b = 1,}\n",
+    "[a]\nx = {b = 1\n}\n",
+}
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_tomlkit_agrees_with_tomllib(text):
+    valid, expected = _reference(text)
+    if valid:
+        assert _tomlkit(text) == expected
+    elif text in TOMLKIT_LENIENT:
+        assert not isinstance(_tomlkit_or_error(text), Exception)
+    else:
+        with pytest.raises(Exception):
+            _tomlkit(text)
+
+
+@pytest.mark.parametrize(
+    "escape", ["\\uD800", "\\uDBFF", "\\uDC00", "\\uDFFF", "\\U0000D800", "\\U00110000"]
+)
+def test_flat_parser_rejects_invalid_code_points(escape):
+    with pytest.raises(ValueError) as exc_info:
+        parse_flat_toml(f'[a]\nx = "{escape}"\n')
+    assert not isinstance(exc_info.value, UnsupportedSyntaxError)
+    with pytest.raises(ValueError):
+        parse_flat_toml(f'["{escape}"]\nx = 1\n')
+
+
+def test_flat_parser_types():
+    result = parse_flat_toml("[a]\nx = 1\ny = 1.0\nz = true\nw = 0x10\n")
+    assert result == {"a": {"x": 1, "y": 1.0, "z": True, "w": 16}}
+    assert type(result["a"]["x"]) is int
+    assert type(result["a"]["y"]) is float
+    assert type(result["a"]["z"]) is bool
+
+
+def test_parse_metadata_falls_back_on_unsupported_syntax():
+    text = "[a]\nx = 1979-05-27\ny.z = 1\n"
+    with pytest.raises(UnsupportedSyntaxError):
+        parse_flat_toml(text)
+    assert parse_metadata(text) == tomllib.loads(text)
+    assert parse_metadata(text, parsers=(FLAT, TOMLKIT)) == tomllib.loads(text)
+
+
+def test_parse_metadata_raises_last_error():
+    with pytest.raises(UnsupportedSyntaxError):
+        parse_metadata("[a]\nx = 1979-05-27\n", parsers=(FLAT,))
+    with pytest.raises(ValueError):
+        parse_metadata("[a]\nx = 1\n", parsers=("unknown",))
+    assert parse_metadata("[a]\nx = 1\n", parsers=("unknown", TOMLLIB)) == {
+        "a": {"x": 1}
+    }
@@ -0,0 +1,175 @@
+import time
+
+import pytest
+
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter import metrics as metrics_module
+from pyguiadapter.metrics import ExecutionMetrics, ResourceUsage, UsageProbe
+from pyguiadapter.windows.fnexec import (
+    FnExecuteWindowEventListener,
+    SimpleFnExecuteWindowEventListener,
+)
+
+# noinspection PyProtectedMember
+from pyguiadapter.windows.fnexec._base import _accepts_metrics
+
+
+class _Clock(object):
+    def __init__(self, *values):
+        self._values = list(values)
+
+    def __call__(self):
+        return self._values.pop(0)
+
+
+def test_usage_probe_measures_with_its_clock():
+    usage = UsageProbe(_Clock(1.5, 4.0)).stop()
+    assert isinstance(usage, ResourceUsage)
+    assert usage.cpu_time == 2.5
+
+
+def test_usage_probe_measures_cpu_time():
+    probe = UsageProbe()
+    deadline = time.thread_time() + 0.05
+    while time.thread_time() < deadline:
+        pass
+    usage = probe.stop()
+    assert usage.cpu_time >= 0.05
+    if metrics_module.resource is not None:
+        assert usage.peak_rss_delta >= 0
+
+
+def test_usage_probe_without_peak_rss(monkeypatch):
+    monkeypatch.setattr(metrics_module, "_peak_rss", lambda: None)
+    assert UsageProbe(_Clock(0.0, 1.0)).stop() == ResourceUsage(1.0, None)
+
+
+def test_usage_probe_peak_rss_delta(monkeypatch):
+    peaks = [1000, 1500]
+    monkeypatch.setattr(metrics_module, "_peak_rss", lambda: peaks.pop(0))
+    assert UsageProbe(_Clock(0.0, 0.0)).stop().peak_rss_delta == 500
+
+
+class _Callbacks(object):
+    def window_only(self, window):
+        pass
+
+    def with_metrics(self, window, metrics):
+        pass
+
+
+def _window_only(window):
+    pass
+
+
+def _with_metrics(window, metrics=None):
+    pass
+
+
+def _variadic(*args):
+    pass
+
+
+def _too_many(window, metrics, extra):
+    pass
+
+
+@pytest.mark.parametrize(
+    "callback, expected",
+    [
+        (_window_only, False),
+        (lambda window: None, False),
+        (_Callbacks().window_only, False),
+        (_with_metrics, True),
+        (lambda window, metrics: None, True),
+        (_Callbacks().with_metrics, True),
+        (_variadic, True),
+        (_too_many, False),
+    ],
+)
+def test_accepts_metrics(callback, expected):
+    assert _accepts_metrics(callback) is expected
+
+
+def test_simple_listener_calls_old_style_callbacks_without_metrics():
+    metrics = _metrics()
+    calls = []
+    listener = SimpleFnExecuteWindowEventListener(
+        on_execute_finish=lambda window: calls.append(window)
+    )
+    listener.on_execute_finish("window", metrics)
+    listener = SimpleFnExecuteWindowEventListener(
+        on_execute_finish=lambda window, m: calls.append((window, m))
+    )
+    listener.on_execute_finish("window", metrics)
+    assert calls == ["window", ("window", metrics)]
+
+
+def _metrics() -> ExecutionMetrics:
+    return ExecutionMetrics(
+        fn_name="fn",
+        started_at=0.0,
+        wall_time=0.5,
+        cpu_time=0.25,
+        peak_rss_delta=2048,
+        output_writes=1,
+        output_chars=10,
+        progress_updates=0,
+    )
+
+
+def fn(n: int = 3):
+    return n
+
+
+class _OldStyleListener(FnExecuteWindowEventListener):
+    def __init__(self):
+        self.calls = []
+
+    # noinspection PyMethodOverriding
+    def on_execute_finish(self, window):
+        self.calls.append(window)
+
+
+class _NewStyleListener(FnExecuteWindowEventListener):
+    def __init__(self):
+        self.calls = []
+
+    def on_execute_finish(self, window, metrics=None):
+        self.calls.append((window, metrics))
+
+
+def _wait_until(qapp, predicate, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+
+
+def _execute(qapp, window, listener):
+    window.show()
+    # noinspection PyProtectedMember
+    window._on_execute_button_clicked()
+    _wait_until(qapp, lambda: listener.calls)
+
+
+def test_old_style_listener_is_called_without_metrics(qapp, make_window):
+    listener = _OldStyleListener()
+    window = make_window(fn, window_listener=listener)
+    _execute(qapp, window, listener)
+    assert listener.calls == [window]
+
+
+def test_new_style_listener_receives_metrics(qapp, make_window):
+    listener = _NewStyleListener()
+    window = make_window(fn, window_listener=listener)
+    _execute(qapp, window, listener)
+    assert len(listener.calls) == 1
+    called_window, metrics = listener.calls[0]
+    assert called_window is window
+    assert isinstance(metrics, ExecutionMetrics)
+    assert metrics.fn_name == "fn"
+    assert metrics.succeeded
+    assert metrics.wall_time >= 0
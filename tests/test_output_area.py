@@ -0,0 +1,168 @@
+import pytest
+from qtpy.QtGui import QTextCursor, QTextDocument
+from qtpy.QtWidgets import QWidget
+
+# the window package must be imported through the adapter package, or the imports will be circular
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.windows.fnexec._output_area.area import OutputArea
+from pyguiadapter.windows.fnexec._output_area.browser import (
+    OutputBrowserConfig,
+    OutputBrowser,
+    PlainOutputBrowser,
+    _Scrollback,
+)
+
+
+def test_auto_backend_is_the_default(qapp):
+    area = OutputArea(None, None)
+    # noinspection PyProtectedMember
+    assert isinstance(area._output_browser, PlainOutputBrowser)
+
+
+def test_auto_backend_switches_on_html_and_back_on_clear(qapp):
+    area = OutputArea(None, OutputBrowserConfig(backend="auto"))
+    area.append_output("plain\n")
+    area.append_output("<b>bold</b>", html=True)
+    # noinspection PyProtectedMember
+    browser = area._output_browser
+    assert isinstance(browser, OutputBrowser)
+    assert browser.toPlainText().startswith("plain\nbold")
+    area.clear_output()
+    # noinspection PyProtectedMember
+    assert isinstance(area._output_browser, PlainOutputBrowser)
+
+
+def test_richtext_backend(qapp):
+    area = OutputArea(None, OutputBrowserConfig(backend="richtext"))
+    # noinspection PyProtectedMember
+    assert isinstance(area._output_browser, OutputBrowser)
+
+
+def test_browsers_share_the_spill_handler(qapp, tmp_path):
+    config = OutputBrowserConfig(
+        backend="auto", max_blocks=10, spill_file=str(tmp_path / "spill.log")
+    )
+    area = OutputArea(None, config)
+    # noinspection PyProtectedMember
+    handler = area._output_browser._scrollback._spill_handler
+    assert handler is not None
+    for _ in range(3):
+        area.append_output("<b>html</b>", html=True)
+        area.clear_output()
+    # noinspection PyProtectedMember
+    assert area._output_browser._scrollback._spill_handler is handler
+    for i in range(100):
+        area.append_output(f"line {i}\n")
+    area.deleteLater()
+    qapp.processEvents()
+    assert "line 0" in (tmp_path / "spill.log").read_text(encoding="utf-8")
+
+
+def _lines(start, stop):
+    return [f"line {i}" for i in range(start, stop)]
+
+
+def _document(lines):
+    document = QTextDocument()
+    document.setPlainText("\n".join(lines))
+    return document
+
+
+def _document_lines(document):
+    return document.toPlainText().split("\n")
+
+
+def test_scrollback_trims_in_bulk(qapp, tmp_path):
+    owner = QWidget()
+    spill_file = tmp_path / "spill.log"
+    scrollback = _Scrollback(
+        owner, OutputBrowserConfig(max_blocks=100, spill_file=str(spill_file))
+    )
+    assert scrollback.spill_enabled
+    # within the 10% slack, nothing is removed
+    document = _document(_lines(0, 110))
+    scrollback.trim(document)
+    assert document.blockCount() == 110
+    assert not spill_file.exists()
+    # beyond it, the document is trimmed down to max_blocks at once
+    document = _document(_lines(0, 111))
+    scrollback.trim(document)
+    assert document.blockCount() == 100
+    assert _document_lines(document) == _lines(11, 111)
+    # the removed blocks are spilled, nothing more and nothing less
+    owner.deleteLater()
+    qapp.processEvents()
+    assert spill_file.read_text(encoding="utf-8") == "\n".join(_lines(0, 11)) + "\n"
+
+
+def test_scrollback_spills_everything_it_removes(qapp, tmp_path):
+    owner = QWidget()
+    spill_file = tmp_path / "spill.log"
+    scrollback = _Scrollback(
+        owner, OutputBrowserConfig(max_blocks=20, spill_file=str(spill_file))
+    )
+    document = QTextDocument()
+    block_counts = []
+    for i in range(500):
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(f"line {i}\n")
+        scrollback.trim(document)
+        block_counts.append(document.blockCount())
+    # the trailing newline leaves an empty last block
+    assert max(block_counts) == 20 + 2
+    assert min(block_counts[100:]) == 20
+    # trimming is done in bulk, not on every append
+    trims = sum(1 for a, b in zip(block_counts, block_counts[1:]) if b < a)
+    assert trims == len(range(22, 500, 3))
+    owner.deleteLater()
+    qapp.processEvents()
+    spilled = spill_file.read_text(encoding="utf-8").split("\n")[:-1]
+    assert spilled + _document_lines(document)[:-1] == _lines(0, 500)
+
+
+def test_scrollback_without_spill_file(qapp):
+    owner = QWidget()
+    scrollback = _Scrollback(owner, OutputBrowserConfig(max_blocks=10))
+    assert not scrollback.spill_enabled
+    document = _document(_lines(0, 50))
+    scrollback.trim(document)
+    assert _document_lines(document) == _lines(40, 50)
+    owner.deleteLater()
+
+
+@pytest.mark.parametrize("max_blocks", [0, -1])
+def test_scrollback_unlimited(qapp, tmp_path, max_blocks):
+    owner = QWidget()
+    scrollback = _Scrollback(
+        owner,
+        OutputBrowserConfig(
+            max_blocks=max_blocks, spill_file=str(tmp_path / "spill.log")
+        ),
+    )
+    # the spill file is not used without a limit
+    assert not scrollback.spill_enabled
+    document = _document(_lines(0, 1000))
+    scrollback.trim(document)
+    assert document.blockCount() == 1000
+    owner.deleteLater()
+
+
+@pytest.mark.parametrize("browser_class", [OutputBrowser, PlainOutputBrowser])
+def test_browsers_trim_and_spill(qapp, tmp_path, browser_class):
+    spill_file = tmp_path / "spill.log"
+    browser = browser_class(
+        None, OutputBrowserConfig(max_blocks=50, spill_file=str(spill_file))
+    )
+    for i in range(300):
+        browser.append_output(f"line {i}\n")
+        assert browser.document().blockCount() <= 50 + 5 + 1
+    text = browser.toPlainText()
+    browser.deleteLater()
+    qapp.processEvents()
+    remaining = [line for line in text.split("\n") if line]
+    spilled = [
+        line for line in spill_file.read_text(encoding="utf-8").split("\n") if line
+    ]
+    assert spilled + remaining == _lines(0, 300)
@@ -0,0 +1,77 @@
+from pyguiadapter.adapter._output_buffer import OutputBuffer
+
+
+def test_put_reports_empty_to_non_empty_transition():
+    buffer = OutputBuffer()
+    assert buffer.is_empty()
+    assert buffer.put("a", False, False) is True
+    assert buffer.put("b", False, False) is False
+    buffer.take(0)
+    assert buffer.is_empty()
+    assert buffer.put("c", False, False) is True
+
+
+def test_take_coalesces_adjacent_chunks_of_the_same_kind():
+    buffer = OutputBuffer()
+    buffer.put("a\n", False, False)
+    buffer.put("b\n", False, True)
+    buffer.put("<b>c</b>", True, False)
+    buffer.put("<i>d</i>", True, False)
+    buffer.put("e\n", False, False)
+    cleared, batches, has_more = buffer.take(0)
+    assert cleared is False
+    assert has_more is False
+    assert batches == [
+        ("a\nb\n", False, True),
+        ("<b>c</b></div><br /><div><i>d</i>", True, False),
+        ("e\n", False, False),
+    ]
+
+
+def test_take_respects_max_batch_size():
+    buffer = OutputBuffer()
+    for text in ("aaa", "bbb", "ccc"):
+        buffer.put(text, False, False)
+    _, batches, has_more = buffer.take(6)
+    assert batches == [("aaabbb", False, False)]
+    assert has_more is True
+    _, batches, has_more = buffer.take(6)
+    assert batches == [("ccc", False, False)]
+    assert has_more is False
+
+
+def test_take_returns_at_least_one_chunk():
+    buffer = OutputBuffer()
+    buffer.put("a" * 100, False, False)
+    buffer.put("b", False, False)
+    _, batches, has_more = buffer.take(10)
+    assert batches == [("a" * 100, False, False)]
+    assert has_more is True
+
+
+def test_clear_drops_pending_chunks():
+    buffer = OutputBuffer()
+    buffer.put("a", False, False)
+    assert buffer.clear() is False
+    buffer.put("b", False, False)
+    cleared, batches, _ = buffer.take(0)
+    assert cleared is True
+    assert batches == [("b", False, False)]
+    cleared, batches, _ = buffer.take(0)
+    assert cleared is False
+    assert batches == []
+
+
+def test_clear_on_empty_buffer_needs_a_flush():
+    buffer = OutputBuffer()
+    assert buffer.clear() is True
+    assert not buffer.is_empty()
+
+
+def test_discard():
+    buffer = OutputBuffer()
+    buffer.put("a", False, False)
+    buffer.clear()
+    buffer.discard()
+    assert buffer.is_empty()
+    assert buffer.take(0) == (False, [], False)
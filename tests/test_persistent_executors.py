@@ -0,0 +1,247 @@
+import os
+import threading
+import time
+
+from qtpy.QtCore import QObject, Signal
+
+from pyguiadapter.cancellation import get_current_token
+from pyguiadapter.executor import ExecuteStateListener
+from pyguiadapter.executors import (
+    PersistentProcessFunctionExecutor,
+    PersistentThreadFunctionExecutor,
+)
+from pyguiadapter.fn import FnInfo
+
+# tokens seen by the functions executed in the worker thread
+_tokens = []
+
+
+def get_thread_ident():
+    return threading.get_ident()
+
+
+def get_pid():
+    return os.getpid()
+
+
+def wait_for_cancel():
+    token = get_current_token()
+    _tokens.append(token)
+    deadline = time.perf_counter() + 30.0
+    while not token.is_cancelled():
+        assert time.perf_counter() < deadline, "not cancelled"
+        time.sleep(0.01)
+    return "cancelled"
+
+
+def is_cancelled():
+    token = get_current_token()
+    _tokens.append(token)
+    return token.is_cancelled()
+
+
+class _Listener(ExecuteStateListener):
+    def __init__(self):
+        self.started = 0
+        self.results = []
+        self.errors = []
+        self.finished = 0
+
+    def on_execute_start(self, fn_info, arguments):
+        self.started += 1
+
+    def on_execute_result(self, fn_info, arguments, result):
+        self.results.append(result)
+
+    def on_execute_error(self, fn_info, arguments, exception):
+        self.errors.append(exception)
+
+    def on_execute_finish(self, fn_info, arguments):
+        self.finished += 1
+
+
+def _wait_until(qapp, predicate, timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.01)
+
+
+def _execute(qapp, executor, listener, fn):
+    finished = listener.finished
+    executor.execute(FnInfo(fn=fn, display_name=fn.__name__), {})
+    _wait_until(qapp, lambda: listener.finished > finished)
+    return listener.results[-1]
+
+
+def _cancel_then_execute(qapp, executor, listener):
+    executor.execute(FnInfo(fn=wait_for_cancel, display_name="wait_for_cancel"), {})
+    _wait_until(qapp, lambda: listener.started == 1)
+    first_token = executor.cancellation_token
+    executor.try_cancel()
+    assert executor.is_cancelled
+    _wait_until(qapp, lambda: listener.finished == 1)
+    assert listener.results == ["cancelled"]
+    # the next job is not cancelled by the cancel request of the previous one
+    assert _execute(qapp, executor, listener, is_cancelled) is False
+    assert not executor.is_cancelled
+    return first_token
+
+
+def test_thread_worker_is_reused(qapp):
+    listener = _Listener()
+    executor = PersistentThreadFunctionExecutor(None, listener)
+    first = _execute(qapp, executor, listener, get_thread_ident)
+    # noinspection PyProtectedMember
+    worker = executor._persistent_worker
+    second = _execute(qapp, executor, listener, get_thread_ident)
+    assert first == second != threading.get_ident()
+    # noinspection PyProtectedMember
+    assert executor._persistent_worker is worker
+    assert worker.isRunning()
+    assert listener.started == listener.finished == 2
+    assert listener.errors == []
+    executor.shutdown()
+
+
+def test_thread_jobs_have_their_own_tokens(qapp):
+    _tokens.clear()
+    listener = _Listener()
+    executor = PersistentThreadFunctionExecutor(None, listener)
+    first_token = _cancel_then_execute(qapp, executor, listener)
+    assert _tokens[0] is first_token
+    assert _tokens[0] is not _tokens[1]
+    assert _tokens[0].is_cancelled()
+    assert not _tokens[1].is_cancelled()
+    # a token kept by a finished job doesn't affect the next one
+    executor.execute(FnInfo(fn=wait_for_cancel, display_name="wait_for_cancel"), {})
+    _wait_until(qapp, lambda: listener.started == 3)
+    _tokens[0].cancel()
+    assert not executor.is_cancelled
+    executor.try_cancel()
+    _wait_until(qapp, lambda: listener.finished == 3)
+    assert _tokens[2] is not _tokens[0]
+    assert listener.errors == []
+    executor.shutdown()
+
+
+def test_thread_stale_job_ids_are_ignored(qapp):
+    listener = _Listener()
+    executor = PersistentThreadFunctionExecutor(None, listener)
+    _execute(qapp, executor, listener, get_thread_ident)
+    # noinspection PyProtectedMember
+    stale_job_id = executor._next_job_id - 1
+    executor.execute(FnInfo(fn=wait_for_cancel, display_name="wait_for_cancel"), {})
+    _wait_until(qapp, lambda: listener.started == 2)
+    # late signals of the previous job
+    # noinspection PyProtectedMember
+    executor._on_job_started(stale_job_id)
+    # noinspection PyProtectedMember
+    executor._on_job_result_ready(stale_job_id, "stale")
+    # noinspection PyProtectedMember
+    executor._on_job_error_raised(stale_job_id, RuntimeError("stale"))
+    # noinspection PyProtectedMember
+    executor._on_job_finished(stale_job_id)
+    assert executor.is_executing
+    assert listener.started == 2
+    assert listener.finished == 1
+    assert "stale" not in listener.results
+    assert listener.errors == []
+    executor.try_cancel()
+    _wait_until(qapp, lambda: listener.finished == 2)
+    assert listener.results[-1] == "cancelled"
+    executor.shutdown()
+
+
+def test_thread_shutdown(qapp):
+    listener = _Listener()
+    executor = PersistentThreadFunctionExecutor(None, listener)
+    # nothing to shut down before the first execution
+    executor.shutdown()
+    first = _execute(qapp, executor, listener, get_thread_ident)
+    # noinspection PyProtectedMember
+    worker = executor._persistent_worker
+    executor.shutdown()
+    assert worker.isFinished()
+    # noinspection PyProtectedMember
+    assert executor._persistent_worker is None
+    # a new worker is started by the next execution
+    second = _execute(qapp, executor, listener, get_thread_ident)
+    # noinspection PyProtectedMember
+    assert executor._persistent_worker is not None
+    assert second != threading.get_ident()
+    assert listener.results == [first, second]
+    executor.shutdown()
+    executor.shutdown()
+
+
+def test_process_worker_is_reused(qapp):
+    listener = _Listener()
+    executor = PersistentProcessFunctionExecutor(None, listener)
+    first = _execute(qapp, executor, listener, get_pid)
+    # noinspection PyProtectedMember
+    worker = executor._worker
+    second = _execute(qapp, executor, listener, get_pid)
+    assert first == second != os.getpid()
+    # noinspection PyProtectedMember
+    assert executor._worker is worker
+    assert worker.is_alive()
+    # noinspection PyProtectedMember
+    assert executor._released_workers == []
+    assert listener.errors == []
+    executor.shutdown()
+
+
+def test_process_jobs_have_their_own_tokens(qapp):
+    listener = _Listener()
+    executor = PersistentProcessFunctionExecutor(None, listener)
+    _cancel_then_execute(qapp, executor, listener)
+    assert listener.results == ["cancelled", False]
+    assert listener.errors == []
+    executor.shutdown()
+
+
+class _StaleReader(QObject):
+    sig_messages_received = Signal(list)
+
+
+def test_process_stale_messages_are_ignored(qapp):
+    # noinspection PyProtectedMember
+    from pyguiadapter.executors.process import _MSG_DONE, _MSG_RESULT
+
+    listener = _Listener()
+    executor = PersistentProcessFunctionExecutor(None, listener)
+    executor.execute(FnInfo(fn=wait_for_cancel, display_name="wait_for_cancel"), {})
+    _wait_until(qapp, lambda: listener.started == 1)
+    # messages from a reader thread that doesn't belong to the current worker
+    reader = _StaleReader()
+    # noinspection PyProtectedMember,PyUnresolvedReferences
+    reader.sig_messages_received.connect(executor._on_messages_received)
+    # noinspection PyUnresolvedReferences
+    reader.sig_messages_received.emit([(_MSG_RESULT, "stale"), (_MSG_DONE, None)])
+    assert executor.is_executing
+    assert listener.results == []
+    assert listener.finished == 0
+    executor.try_cancel()
+    _wait_until(qapp, lambda: listener.finished == 1)
+    assert listener.results == ["cancelled"]
+    executor.shutdown()
+    reader.deleteLater()
+
+
+def test_process_shutdown(qapp):
+    listener = _Listener()
+    executor = PersistentProcessFunctionExecutor(None, listener)
+    first = _execute(qapp, executor, listener, get_pid)
+    # noinspection PyProtectedMember
+    worker = executor._worker
+    executor.shutdown()
+    # noinspection PyProtectedMember
+    assert executor._worker is None
+    # noinspection PyProtectedMember
+    assert executor._released_workers == []
+    assert not worker.is_alive()
+    second = _execute(qapp, executor, listener, get_pid)
+    assert second not in (first, os.getpid())
+    executor.shutdown()
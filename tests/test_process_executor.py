@@ -0,0 +1,115 @@
+import threading
+import time
+
+from pyguiadapter.executor import ExecuteStateListener
+from pyguiadapter.executors import (
+    ConcurrentProcessFunctionExecutor,
+    ProcessFunctionExecutor,
+)
+from pyguiadapter.executors.pool import JOB_FAILED
+from pyguiadapter.fn import FnInfo
+
+
+def add(a, b):
+    return a + b
+
+
+def leave_a_thread_running():
+    # keeps the worker process alive after the job is done
+    threading.Thread(target=time.sleep, args=(60,), daemon=False).start()
+    return "done"
+
+
+class _Listener(ExecuteStateListener):
+    def __init__(self):
+        self.results = []
+        self.errors = []
+        self.finished = False
+
+    def on_execute_result(self, fn_info, arguments, result):
+        self.results.append(result)
+
+    def on_execute_error(self, fn_info, arguments, exception):
+        self.errors.append(exception)
+
+    def on_execute_finish(self, fn_info, arguments):
+        self.finished = True
+
+
+def _wait_until(qapp, predicate, timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.01)
+
+
+def _execute(qapp, executor_class, fn, arguments):
+    listener = _Listener()
+    executor = executor_class(None, listener)
+    executor.execute(FnInfo(fn=fn, display_name=fn.__name__), arguments)
+    _wait_until(qapp, lambda: listener.finished)
+    return executor, listener
+
+
+def test_worker_is_released_without_blocking_the_gui_thread(qapp):
+    executor, listener = _execute(qapp, ProcessFunctionExecutor, add, {"a": 1, "b": 2})
+    assert listener.results == [3]
+    assert listener.errors == []
+    # the worker process is cleaned up once its reader thread has finished
+    # noinspection PyProtectedMember
+    _wait_until(qapp, lambda: not executor._released_workers)
+    executor.shutdown()
+
+
+def test_released_worker_kept_alive_is_terminated(qapp):
+    class _Executor(ProcessFunctionExecutor):
+        terminate_timeout = 200
+
+    start = time.perf_counter()
+    executor, listener = _execute(qapp, _Executor, leave_a_thread_running, {})
+    assert listener.results == ["done"]
+    # noinspection PyProtectedMember
+    _wait_until(qapp, lambda: not executor._released_workers, timeout=30.0)
+    assert time.perf_counter() - start < 30.0
+    executor.shutdown()
+
+
+def _submit_to_pool(qapp, executor, n_jobs):
+    updated = []
+    executor.sig_job_updated.connect(updated.append)
+    job_ids = executor.submit_many(
+        FnInfo(fn=lambda a: a, display_name="fn"), [{"a": i} for i in range(n_jobs)]
+    )
+    _wait_until(qapp, lambda: not executor.is_executing)
+    return job_ids, updated
+
+
+def test_pool_reports_jobs_failed_at_submit(qapp):
+    listener = _Listener()
+    executor = ConcurrentProcessFunctionExecutor(None, listener)
+    executor.max_workers = 1
+    # a lambda cannot be pickled and sent to the worker process
+    job_ids, updated = _submit_to_pool(qapp, executor, 2)
+    assert [executor.get_job(job_id).state for job_id in job_ids] == [
+        JOB_FAILED,
+        JOB_FAILED,
+    ]
+    assert sorted(set(updated)) == job_ids
+    assert len(listener.errors) == 2
+    assert listener.finished
+    executor.shutdown()
+
+
+def test_pool_reports_jobs_failed_to_spawn_a_worker(qapp):
+    class _Executor(ConcurrentProcessFunctionExecutor):
+        def _spawn_worker(self):
+            raise OSError("cannot spawn")
+
+    listener = _Listener()
+    executor = _Executor(None, listener)
+    job_ids, updated = _submit_to_pool(qapp, executor, 3)
+    assert all(executor.get_job(job_id).state == JOB_FAILED for job_id in job_ids)
+    assert sorted(set(updated)) == job_ids
+    assert [str(e) for e in listener.errors] == ["cannot spawn"] * 3
+    assert listener.finished
@@ -0,0 +1,83 @@
+from pyguiadapter.adapter._output_buffer import ProgressBuffer
+
+# noinspection PyProtectedMember
+from pyguiadapter.adapter.ucontext import _Context
+
+
+def test_progress_buffer_keeps_the_latest_value():
+    buffer = ProgressBuffer()
+    assert buffer.take() == (False, 0, None)
+    assert buffer.put(1, "one") is True
+    assert buffer.put(2, "two") is False
+    assert buffer.put(3, "three") is False
+    assert buffer.take() == (True, 3, "three")
+    assert buffer.is_empty()
+    assert buffer.take_stats() == 3
+    assert buffer.take_stats() == 0
+
+
+def test_progress_buffer_keeps_the_info_when_coalesced_with_none():
+    buffer = ProgressBuffer()
+    buffer.put(1, "info")
+    buffer.put(2, None)
+    assert buffer.take() == (True, 2, "info")
+
+
+def test_progress_buffer_discard():
+    buffer = ProgressBuffer()
+    buffer.put(1, "info")
+    buffer.discard()
+    assert buffer.is_empty()
+    assert buffer.take()[0] is False
+
+
+def _fn():
+    pass
+
+
+def _context_of(window) -> _Context:
+    context = _Context(None)
+    # noinspection PyProtectedMember
+    context._on_current_window_created(window)
+    return context
+
+
+def test_value_updated_after_show_progressbar_is_applied_to_the_new_bar(make_window):
+    window = make_window(_fn)
+    window.show()
+    context = _context_of(window)
+    # show_progressbar() is delivered through a queued signal, update_progress() is buffered right away, so the
+    # buffer already holds the new value when the bar is shown
+    context.update_progressbar(500, "halfway")
+    # noinspection PyProtectedMember
+    context._on_show_progressbar(
+        {"max_value": 1000, "show_info_label": True, "initial_info": "starting"}
+    )
+    context.flush_progress()
+    # noinspection PyProtectedMember
+    progressbar = window._output_area._progressbar
+    # noinspection PyProtectedMember
+    assert progressbar._progressbar.maximum() == 1000
+    # noinspection PyProtectedMember
+    assert progressbar._progressbar.value() == 500
+    # noinspection PyProtectedMember
+    assert progressbar._info_label.text() == "halfway"
+
+
+def test_value_updated_after_show_progress_dialog_is_applied_to_the_new_dialog(
+    make_window,
+):
+    window = make_window(_fn)
+    window.show()
+    context = _context_of(window)
+    context.update_progress_dialog(500, "halfway")
+    # noinspection PyProtectedMember
+    context._on_show_progress_dialog({"max_value": 1000, "modal": False})
+    context.flush_progress()
+    # noinspection PyProtectedMember
+    dialog = window._progress_dialog
+    # noinspection PyProtectedMember
+    assert dialog._progressbar.maximum() == 1000
+    # noinspection PyProtectedMember
+    assert dialog._progressbar.value() == 500
+    window.dismiss_progress_dialog()
@@ -0,0 +1,146 @@
+import asyncio
+import inspect
+import time
+
+import pytest
+
+# noinspection PyUnresolvedReferences
+import pyguiadapter.adapter  # noqa: F401
+from pyguiadapter.adapter import ucontext
+from pyguiadapter.cancellation import CancellationToken, _set_current_token
+from pyguiadapter.exceptions import FunctionCancelledError
+from pyguiadapter.executor import ExecuteStateListener
+from pyguiadapter.executors import ThreadFunctionExecutor
+from pyguiadapter.fn import FnInfo
+
+
+@pytest.fixture
+def yielded(monkeypatch):
+    # items of a stream, collected instead of being written to a window
+    items = []
+    # noinspection PyProtectedMember
+    monkeypatch.setattr(ucontext._context, "yield_result", items.append)
+    return items
+
+
+@pytest.fixture
+def token():
+    token = CancellationToken()
+    _set_current_token(token)
+    yield token
+    _set_current_token(None)
+
+
+def _stream(n, closed, cancel=None):
+    try:
+        for i in range(n):
+            if cancel is not None and i == cancel[0]:
+                cancel[1].cancel()
+            yield i
+    finally:
+        closed.append(True)
+
+
+async def _async_stream(n, closed, cancel=None):
+    try:
+        for i in range(n):
+            await asyncio.sleep(0)
+            if cancel is not None and i == cancel[0]:
+                cancel[1].cancel()
+            yield i
+    finally:
+        closed.append(True)
+
+
+def _consume(stream):
+    if inspect.isasyncgen(stream):
+        # noinspection PyProtectedMember
+        return asyncio.run(ucontext._consume_async_stream(stream))
+    # noinspection PyProtectedMember
+    return ucontext._consume_stream(stream)
+
+
+STREAMS = [_stream, _async_stream]
+
+
+@pytest.mark.parametrize("make_stream", STREAMS)
+def test_items_are_forwarded_and_counted(yielded, token, make_stream):
+    closed = []
+    assert _consume(make_stream(5, closed)) == 5
+    assert yielded == [0, 1, 2, 3, 4]
+    assert closed == [True]
+    assert _consume(make_stream(0, closed)) == 0
+    assert yielded == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("make_stream", STREAMS)
+def test_stream_without_token(yielded, make_stream):
+    closed = []
+    assert _consume(make_stream(3, closed)) == 3
+    assert yielded == [0, 1, 2]
+
+
+@pytest.mark.parametrize("make_stream", STREAMS)
+def test_cancel_stops_and_closes_the_stream(yielded, token, make_stream):
+    closed = []
+    with pytest.raises(FunctionCancelledError):
+        _consume(make_stream(100, closed, cancel=(2, token)))
+    # the item produced before the cancel request was noticed is still forwarded
+    assert yielded == [0, 1, 2]
+    assert closed == [True]
+
+
+@pytest.mark.parametrize("make_stream", STREAMS)
+def test_errors_of_the_stream_are_raised(yielded, token, make_stream, monkeypatch):
+    class _Error(Exception):
+        pass
+
+    def failing_yield(item):
+        if item == 1:
+            raise _Error()
+        yielded.append(item)
+
+    closed = []
+    # noinspection PyProtectedMember
+    monkeypatch.setattr(ucontext._context, "yield_result", failing_yield)
+    with pytest.raises(_Error):
+        _consume(make_stream(5, closed))
+    assert yielded == [0]
+    assert closed == [True]
+
+
+class _Listener(ExecuteStateListener):
+    def __init__(self):
+        self.results = []
+        self.errors = []
+        self.finished = False
+
+    def on_execute_result(self, fn_info, arguments, result):
+        self.results.append(result)
+
+    def on_execute_error(self, fn_info, arguments, exception):
+        self.errors.append(exception)
+
+    def on_execute_finish(self, fn_info, arguments):
+        self.finished = True
+
+
+@pytest.mark.parametrize("make_stream", STREAMS)
+def test_generator_functions_are_streamed_by_executors(qapp, yielded, make_stream):
+    closed = []
+
+    def fn(n):
+        return make_stream(n, closed)
+
+    listener = _Listener()
+    executor = ThreadFunctionExecutor(None, listener)
+    executor.execute(FnInfo(fn=fn, display_name="fn"), {"n": 4})
+    deadline = time.perf_counter() + 30.0
+    while not listener.finished:
+        assert time.perf_counter() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.01)
+    assert listener.results == [4]
+    assert listener.errors == []
+    assert yielded == [0, 1, 2, 3]
+    assert closed == [True]
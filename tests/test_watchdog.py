@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from pyguiadapter.watchdog import StallReport, StallWatchdog
+
+
+def _process_events(qapp, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def _block_gui_thread(seconds):
+    time.sleep(seconds)
+
+
+@pytest.fixture
+def watchdog(qapp):
+    watchdog = StallWatchdog(threshold=0.1, print_reports=False)
+    yield watchdog
+    watchdog.stop()
+    watchdog.deleteLater()
+
+
+def test_stall_is_reported(qapp, watchdog):
+    detected = []
+    # noinspection PyUnresolvedReferences
+    watchdog.sig_stall_detected.connect(detected.append)
+    watchdog.start()
+    assert watchdog.is_running()
+    _process_events(qapp, 0.3)
+    # a responsive event loop is not a stall
+    assert watchdog.reports() == []
+
+    started_at = time.time()
+    _block_gui_thread(0.6)
+    deadline = time.perf_counter() + 10.0
+    while not detected:
+        assert time.perf_counter() < deadline, "no stall reported"
+        qapp.processEvents()
+        time.sleep(0.005)
+
+    assert len(detected) == 1
+    report = detected[0]
+    assert watchdog.reports() == [report]
+    assert 0.4 <= report.duration < 5.0
+    assert abs(report.started_at - started_at) < 0.5
+    assert report.sample_count >= 1
+    # the stack that blocked the GUI thread is the one sampled most
+    assert "_block_gui_thread" in report.hottest_stack
+    counts = [count for _, count in report.samples]
+    assert counts == sorted(counts, reverse=True)
+
+    watchdog.stop()
+    assert not watchdog.is_running()
+
+
+def test_reports_are_printed(qapp, capsys):
+    watchdog = StallWatchdog(threshold=0.1, print_reports=True)
+    watchdog.start()
+    _process_events(qapp, 0.1)
+    _block_gui_thread(0.4)
+    deadline = time.perf_counter() + 10.0
+    while not watchdog.reports():
+        assert time.perf_counter() < deadline, "no stall reported"
+        qapp.processEvents()
+        time.sleep(0.005)
+    watchdog.stop()
+    watchdog.deleteLater()
+    assert watchdog.reports()[0].format() in capsys.readouterr().err
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        StallWatchdog(threshold=0)
+
+
+def test_report_format():
+    started_at = time.mktime((2026, 10, 17, 8, 30, 0, 0, 0, -1))
+    report = StallReport(
+        started_at=started_at,
+        duration=1.25,
+        samples=(("  File a.py, line 1\n    a()\n", 3), ("  File b.py, line 2\n", 1)),
+    )
+    assert report.sample_count == 4
+    assert report.hottest_stack == "  File a.py, line 1\n    a()\n"
+    assert report.format() == "\n".join(
+        [
+            "GUI thread stalled for 1.250s at 2026-10-17 08:30:00, 4 stack sample(s):",
+            "--- 3 sample(s) ---",
+            "  File a.py, line 1",
+            "    a()",
+            "--- 1 sample(s) ---",
+            "  File b.py, line 2",
+        ]
+    )
+    assert report.to_dict() == {
+        "started_at": started_at,
+        "duration": 1.25,
+        "samples": [
+            {"stack": "  File a.py, line 1\n    a()\n", "count": 3},
+            {"stack": "  File b.py, line 2\n", "count": 1},
+        ],
+    }
+
+
+def test_empty_report():
+    report = StallReport(started_at=0.0, duration=0.5, samples=())
+    assert report.sample_count == 0
+    assert report.hottest_stack == ""
+    assert report.format().endswith("0 stack sample(s):")